@@ -0,0 +1,164 @@
+"""Shared vs private memory of forked workers, with and without warmup.
+
+Each mode runs in a fresh interpreter: the parent optionally calls
+:func:`texthumanize.warmup`, forks ``--workers`` children, every child
+runs a small detect/humanize workload plus a full GC pass (what a
+long-lived worker eventually does), and the parent then reads each
+child's ``/proc/<pid>/smaps_rollup``:
+
+- ``shared``  — pages still shared with the parent/siblings;
+- ``private`` — pages the worker owns (copied or newly allocated);
+- ``pss``     — proportional set size, the fair per-worker cost.
+
+Modes: ``cold`` (each worker loads the same components itself after
+the fork, as lazily loading workers eventually do), ``warm`` (warmup without
+``gc.freeze``), ``frozen`` (warmup + ``gc.freeze``). Linux only.
+
+Usage:
+    python benchmarks/prefork_memory.py
+    python benchmarks/prefork_memory.py --workers 4 --langs en,ru
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Ensure local package is used
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MODES = ("cold", "warm", "frozen")
+
+TEXTS = {
+    "en": (
+        "The committee reviewed the proposal in detail. Furthermore, it is "
+        "important to note that the budget was approved after a long debate. "
+        "Several members raised concerns about the timeline, however."
+    ),
+    "ru": (
+        "Комитет подробно рассмотрел предложение. Кроме того, важно отметить, "
+        "что бюджет был утверждён после долгих обсуждений. Несколько членов "
+        "комиссии всё же высказали сомнения по поводу сроков."
+    ),
+}
+
+_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def _smaps(pid: int) -> dict[str, int]:
+    """KB per field from ``/proc/<pid>/smaps_rollup``."""
+    out = {}
+    with open(f"/proc/{pid}/smaps_rollup") as fh:
+        for line in fh:
+            key, _, rest = line.partition(":")
+            if key in _FIELDS:
+                out[key] = int(rest.split()[0])
+    return out
+
+
+def _workload(mode: str, langs: list[str]) -> None:
+    import gc
+
+    import texthumanize
+
+    if mode == "cold":
+        texthumanize.warmup(langs=langs, freeze=False)
+    for lang in langs:
+        text = TEXTS.get(lang, TEXTS["en"])
+        texthumanize.detect_ai(text, lang=lang)
+        texthumanize.humanize(text, lang=lang, seed=1)
+    gc.collect()
+
+
+def run_mode(mode: str, workers: int, langs: list[str]) -> dict:
+    """Fork ``workers`` children in this process and measure them."""
+    import texthumanize
+
+    if mode != "cold":
+        texthumanize.warmup(langs=langs, freeze=mode == "frozen")
+    parent = _smaps(os.getpid())
+
+    pids, pipes = [], []
+    for _ in range(workers):
+        done_r, done_w = os.pipe()
+        go_r, go_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(done_r)
+            os.close(go_w)
+            _workload(mode, langs)
+            os.write(done_w, b"1")
+            os.read(go_r, 1)  # stay alive until measured
+            os._exit(0)
+        os.close(done_w)
+        os.close(go_r)
+        pids.append(pid)
+        pipes.append((done_r, go_w))
+
+    for done_r, _ in pipes:
+        os.read(done_r, 1)
+    rows = [_smaps(pid) for pid in pids]
+    for (done_r, go_w), pid in zip(pipes, pids):
+        os.write(go_w, b"1")
+        os.close(done_r)
+        os.close(go_w)
+        os.waitpid(pid, 0)
+
+    def avg(key: str) -> float:
+        return sum(r[key] for r in rows) / len(rows)
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "parent_rss_kb": parent["Rss"],
+        "shared_kb": avg("Shared_Clean") + avg("Shared_Dirty"),
+        "private_kb": avg("Private_Clean") + avg("Private_Dirty"),
+        "pss_kb": avg("Pss"),
+        "total_pss_kb": parent["Pss"] + sum(r["Pss"] for r in rows),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--langs", default="en")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    parser.add_argument("--mode", help=argparse.SUPPRESS)  # child run
+    args = parser.parse_args()
+    langs = args.langs.split(",")
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("needs Linux /proc/<pid>/smaps_rollup", file=sys.stderr)
+        return 1
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.workers, langs)))
+        return 0
+
+    results = []
+    for mode in args.modes.split(","):
+        out = subprocess.run(
+            [sys.executable, __file__, "--mode", mode,
+             "--workers", str(args.workers), "--langs", args.langs],
+            capture_output=True, text=True, check=True, cwd=ROOT,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{args.workers} workers, langs={args.langs} (KB per worker)\n")
+    print(f"{'mode':<8} {'parent RSS':>11} {'shared':>9} {'private':>9} "
+          f"{'PSS':>9} {'total PSS':>10}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['parent_rss_kb']:>11,} {r['shared_kb']:>9,.0f} "
+              f"{r['private_kb']:>9,.0f} {r['pss_kb']:>9,.0f} {r['total_pss_kb']:>10,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
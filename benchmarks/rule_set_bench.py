@@ -0,0 +1,108 @@
+"""Micro-benchmark: compiled rule sets vs inline ``re.sub`` cascades.
+
+Compares the late-stage sanitization cascades and the sentence
+validator regex checks as they used to run (``re.sub``/``re.compile``
+with pattern strings on every call, one ``re.IGNORECASE`` scan per
+rule) against the shared :class:`~texthumanize.rule_sets.RuleSet`
+(gated on the lowered text, compiled once). A full pipeline pass uses
+more patterns than the ``re`` module caches, so the "cold" rows — with
+the ``re`` cache purged before each call — are closer to what the
+pipeline saw.
+
+Usage:
+    python benchmarks/rule_set_bench.py
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import timeit
+
+# Ensure local package is used
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from texthumanize.pipeline import _FINAL_SANITIZE, _LATE_CLEANUP
+from texthumanize.sentence_validator import _rules_for
+
+CLEAN = (
+    "The committee met on Tuesday to review the budget. Most of the "
+    "proposals were approved, although two were sent back for revision. "
+    "Nobody expected the vote to be close, but it was.\n\n"
+) * 20
+
+DIRTY = CLEAN + "It works and and it ships, and, but, however, fine and."
+
+
+def _inline_cascade(text: str) -> str:
+    """Final + late sanitization as inline ``re.sub`` calls."""
+    flags = re.IGNORECASE
+    conj = (
+        r'\b(and|but|or|yet|so|и|і|а|але|но|und|oder|aber'
+        r'|et|ou|mais|y|o|pero)\s+\1\b'
+    )
+    text = re.sub(conj, r'\1', text, flags=flags)
+    text = re.sub(r'(?:,\s*(?:and|but|or|however|moreover|also|and)\s*){2,}',
+                  ', ', text, flags=flags)
+    text = re.sub(conj, r'\1', text, flags=flags)
+    text = re.sub(r',?\s*\b(and|but|or|и|і|а|але|но)\b\s*([.!?;])',
+                  r'\2', text, flags=flags)
+    text = re.sub(r'(?:,\s*\b(?:and|but|or|however|moreover|also)\b\s*){2,}',
+                  ', ', text, flags=flags)
+    return text
+
+
+def _rule_set_cascade(text: str) -> str:
+    return _FINAL_SANITIZE.apply(_LATE_CLEANUP.apply(text))
+
+
+def _inline_checks(sentences: list[str]) -> int:
+    """Validator regex checks, one search per rule per sentence."""
+    rules = _rules_for("en")
+    hits = 0
+    for sent in sentences:
+        for rule in rules.rules:
+            if re.compile(rule.pattern, rule.flags).search(sent):
+                hits += 1
+                break
+    return hits
+
+
+def _gated_checks(sentences: list[str]) -> int:
+    rules = _rules_for("en")
+    return sum(1 for sent in sentences if rules.matches(sent))
+
+
+def _report(label: str, baseline, candidate, number: int) -> None:
+    base = min(timeit.repeat(baseline, number=number, repeat=5)) / number
+    cand = min(timeit.repeat(candidate, number=number, repeat=5)) / number
+    print(f"  {label:<28} {base * 1e6:>9.1f}µs {cand * 1e6:>9.1f}µs "
+          f"{base / cand:>6.1f}x")
+
+
+def main() -> None:
+    assert _inline_cascade(DIRTY) == _rule_set_cascade(DIRTY)
+    sentences = [s for s in re.split(r'(?<=[.!?])\s+', CLEAN) if s]
+
+    print("=" * 62)
+    print("Rule sets vs inline regex cascades")
+    print("=" * 62)
+    print(f"  {'case':<28} {'cascade':>11} {'rule set':>11} {'speedup':>7}")
+    print("-" * 62)
+    _report("sanitize / clean text", lambda: _inline_cascade(CLEAN),
+            lambda: _rule_set_cascade(CLEAN), 200)
+    _report("sanitize / dirty text", lambda: _inline_cascade(DIRTY),
+            lambda: _rule_set_cascade(DIRTY), 200)
+    _report("sanitize / clean, cold", lambda: (re.purge(), _inline_cascade(CLEAN)),
+            lambda: _rule_set_cascade(CLEAN), 50)
+    _report(f"validator / {len(sentences)} sentences",
+            lambda: _inline_checks(sentences),
+            lambda: _gated_checks(sentences), 50)
+    _report("validator / cold", lambda: (re.purge(), _inline_checks(sentences)),
+            lambda: _gated_checks(sentences), 20)
+    print("-" * 62)
+
+
+if __name__ == "__main__":
+    main()
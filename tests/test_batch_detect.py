@@ -0,0 +1,82 @@
+"""Tests for the batch AI detection engine."""
+
+from __future__ import annotations
+
+import pytest
+
+import texthumanize
+from texthumanize import detect_ai, detect_ai_batch, iter_detect_ai_batch
+from texthumanize.exceptions import ConfigError
+from texthumanize.neural_detector import NeuralAIDetector
+from texthumanize.neural_engine import build_mlp
+
+TEXTS = [
+    "The committee reviewed the proposal in detail. Furthermore, the budget "
+    "was approved after a long debate.",
+    "Комитет подробно рассмотрел предложение. Кроме того, бюджет был "
+    "утверждён после долгих обсуждений.",
+    "",
+    "honestly we just kinda winged it and it worked out fine in the end",
+]
+
+
+def _close(a, b):
+    """Reports equal, floats up to float32 rounding of batched stages."""
+    if isinstance(a, dict):
+        assert a.keys() == b.keys()
+        for key in a:
+            _close(a[key], b[key])
+    elif isinstance(a, float) and isinstance(b, float):
+        assert a == pytest.approx(b, rel=1e-5, abs=1e-6)
+    else:
+        assert a == b
+
+
+class TestBatchEngine:
+    def test_matches_detect_ai_in_order(self):
+        texts = [*TEXTS, TEXTS[0]]
+        batch = texthumanize.detect_ai_batch(texts)
+        assert len(batch) == len(texts)
+        for text, report in zip(texts, batch):
+            _close(report, detect_ai(text))
+        assert batch[0] == batch[-1] and batch[0] is not batch[-1]
+        assert batch[0]["metrics"] is not batch[-1]["metrics"]
+        assert [r.get("lang") for r in batch[:2]] == ["en", "ru"]
+
+    def test_process_pool_and_chunked_iterator(self):
+        inline = detect_ai_batch(TEXTS)
+        pooled = detect_ai_batch(TEXTS, workers=2)
+        chunked = list(iter_detect_ai_batch(iter(TEXTS), workers=2, chunk_size=3))
+        assert len(pooled) == len(chunked) == len(inline)
+        for report, a, b in zip(inline, pooled, chunked):
+            _close(a, report)
+            _close(b, report)
+
+    def test_errors_raised_before_scoring(self, monkeypatch):
+        from texthumanize import batch_detect
+
+        calls = []
+        monkeypatch.setattr(batch_detect, "_extract", calls.append)
+        with pytest.raises(ConfigError, match="Expected str"):
+            detect_ai_batch(["fine text here", 42])  # type: ignore[list-item]
+        assert calls == []
+        with pytest.raises(ConfigError, match="workers"):
+            detect_ai_batch(TEXTS, workers=0)
+        with pytest.raises(ConfigError, match="chunk_size"):
+            next(iter_detect_ai_batch(TEXTS, chunk_size=0))
+
+
+class TestBatchedModels:
+    def test_mlp_forward_batch(self):
+        net = build_mlp([4, 6, 2], seed=3)
+        xs = [[0.1, -0.2, 0.3, 0.4], [1.0, 0.0, -1.0, 0.5]]
+        for got, want in zip(net.forward_batch(xs), [net.forward(x) for x in xs]):
+            assert got == pytest.approx(want, rel=1e-5)
+        assert net.predict_proba_batch(xs) == pytest.approx([net.predict_proba(x) for x in xs])
+        assert net.forward_batch([]) == []
+
+    def test_detector_batch(self):
+        nd = NeuralAIDetector()
+        texts = [TEXTS[0], TEXTS[3]]
+        for got, want in zip(nd.detect_batch(texts, "en"), [nd.detect(t, "en") for t in texts]):
+            _close(got, want)
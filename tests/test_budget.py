@@ -0,0 +1,132 @@
+"""Tests for ComputeBudget, BudgetScheduler and budget threading."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from texthumanize import humanize, humanize_until_human
+from texthumanize.adversarial_play import AdversarialPlay
+from texthumanize.budget import BudgetScheduler, ComputeBudget
+from texthumanize.exceptions import ConfigError
+from texthumanize.pipeline import Pipeline
+from texthumanize.utils import HumanizeOptions
+
+_AI_TEXT = (
+    "Furthermore, it is important to note that the implementation of "
+    "artificial intelligence constitutes a significant paradigm shift. "
+    "Additionally, the utilization of machine learning facilitates "
+    "comprehensive optimization of various processes. Moreover, it is "
+    "essential to consider the implications of these technologies."
+)
+
+
+class TestComputeBudget:
+    def test_negative_limit_rejected(self):
+        with pytest.raises(ConfigError):
+            ComputeBudget(detector_calls=-1)
+
+    def test_unknown_unit_rejected(self):
+        with pytest.raises(ConfigError):
+            ComputeBudget().charge("tokens")
+
+    def test_unlimited_always_affords(self):
+        b = ComputeBudget()
+        b.charge("detector_calls", 1000)
+        assert b.can_afford(detector_calls=10**6)
+        assert not b.exhausted
+
+    def test_limits(self):
+        b = ComputeBudget(detector_calls=3)
+        assert b.can_afford(detector_calls=3)
+        b.charge("detector_calls", 2)
+        assert b.remaining()["detector_calls"] == 1
+        assert not b.can_afford(detector_calls=2)
+        b.charge("detector_calls")
+        assert b.exhausted
+        assert b.spent["detector_calls"] == 3
+
+    def test_seconds(self):
+        b = ComputeBudget(seconds=0.01)
+        time.sleep(0.02)
+        assert b.exhausted
+        assert b.remaining()["seconds"] == 0.0
+
+
+class TestBudgetScheduler:
+    def test_picks_best_value(self):
+        sched = BudgetScheduler(ComputeBudget(detector_calls=100))
+        sched.register("cheap", prior_gain=0.05, detector_calls=1)
+        sched.register("dear", prior_gain=0.10, detector_calls=20)
+        assert sched.choose() == "cheap"
+
+    def test_unaffordable_and_retired_steps_skipped(self):
+        sched = BudgetScheduler(ComputeBudget(detector_calls=5))
+        sched.register("big", prior_gain=0.5, detector_calls=10)
+        sched.register("once", prior_gain=0.1, detector_calls=1, repeatable=False)
+        assert sched.choose() == "once"
+        sched.record("once", 0.1)
+        assert sched.choose() is None
+
+    def test_observed_gain_lowers_priority(self):
+        sched = BudgetScheduler(ComputeBudget(detector_calls=100), min_gain=0.03)
+        sched.register("a", prior_gain=0.10, detector_calls=1)
+        sched.register("b", prior_gain=0.08, detector_calls=1)
+        for _ in range(3):
+            sched.record("a", 0.0)
+        assert sched.choose() == "b"
+        sched.retire("b")
+        assert sched.choose() is None  # "a" now below min_gain
+
+    def test_record_refines_cost(self):
+        sched = BudgetScheduler(ComputeBudget(detector_calls=10))
+        sched.register("s", prior_gain=0.1, detector_calls=1)
+        sched.record("s", 0.1, spent={"detector_calls": 20})
+        assert sched.choose() is None
+
+
+class TestBudgetThreading:
+    def test_pipeline_charges_passes(self):
+        b = ComputeBudget()
+        Pipeline(options=HumanizeOptions(lang="en", seed=1)).run(
+            _AI_TEXT, "en", compute_budget=b,
+        )
+        assert b.spent["pipeline_passes"] >= 1
+        assert b.spent["detector_calls"] >= 1
+
+    def test_spent_budget_still_produces_result(self):
+        b = ComputeBudget(detector_calls=0, pipeline_passes=0)
+        result = humanize(_AI_TEXT, lang="en", seed=2, compute_budget=b)
+        assert result.text
+        # Only the mandatory first pass runs.
+        assert b.spent == {"detector_calls": 0, "pipeline_passes": 1}
+
+    def test_until_human_respects_limit(self):
+        b = ComputeBudget(detector_calls=6)
+        result = humanize_until_human(
+            _AI_TEXT, lang="en", target_score=0.0, max_attempts=5,
+            seed=3, compute_budget=b,
+        )
+        assert result.text
+        # Optional steps are only started when they fit; the mandatory
+        # first attempt may overdraw by its own cost.
+        assert b.spent["detector_calls"] <= 6 + 2
+
+    def test_adversarial_play_stops_when_spent(self):
+        b = ComputeBudget(detector_calls=1)
+        res = AdversarialPlay(lang="en", seed=1).play(
+            _AI_TEXT, max_rounds=4, target_score=0.0, compute_budget=b,
+        )
+        assert res.rounds == 0
+        assert res.text == _AI_TEXT
+
+    def test_adversarial_play_reuses_scores(self, monkeypatch):
+        ap = AdversarialPlay(lang="en", seed=1)
+        calls = []
+        orig = ap._detect_score
+        monkeypatch.setattr(
+            ap, "_detect_score", lambda t: calls.append(t) or orig(t),
+        )
+        ap.play(_AI_TEXT, max_rounds=2, target_score=0.0)
+        assert len(calls) == len(set(calls))
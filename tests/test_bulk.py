@@ -0,0 +1,131 @@
+"""Tests for bulk corpus processing (texthumanize bulk)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from texthumanize.bulk import count_records, iter_records, run_bulk
+from texthumanize.cli import main
+from texthumanize.exceptions import ConfigError
+
+_DOCS = [
+    "The cat sat on the mat. It was warm.",
+    "Furthermore, it is important to note that the framework is robust.",
+    "I walked home in the rain, honestly.",
+    "Short one.",
+    "Moreover, stakeholders leverage comprehensive solutions.",
+]
+
+
+def _read(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    src = tmp_path / "corpus.jsonl"
+    src.write_text("".join(
+        json.dumps({"id": f"doc{i}", "text": t}) + "\n" for i, t in enumerate(_DOCS)
+    ))
+    return src
+
+
+class TestSources:
+    def test_directory_and_glob(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.txt").write_text(_DOCS[0])
+        (tmp_path / "sub" / "b.md").write_text(_DOCS[1])
+        (tmp_path / "skip.py").write_text("x = 1")
+        assert [r.id for r in iter_records(str(tmp_path))] == ["a.txt", "sub/b.md"]
+        assert count_records(str(tmp_path / "**" / "*.md")) == 1
+
+    def test_jsonl_and_csv(self, tmp_path, corpus):
+        assert [r.id for r in iter_records(str(corpus))][:2] == ["doc0", "doc1"]
+        csv_path = tmp_path / "c.csv"
+        csv_path.write_text('body,id\n"One, two.",\nThree.,x\n')
+        records = list(iter_records(str(csv_path), text_field="body"))
+        assert [(r.id, r.text) for r in records] == [("1", "One, two."), ("x", "Three.")]
+        with pytest.raises(ConfigError):
+            list(iter_records(str(csv_path)))
+        with pytest.raises(ConfigError):
+            list(iter_records(str(tmp_path / "missing.jsonl.gz")))
+
+    def test_csv_large_record(self, tmp_path, monkeypatch):
+        from texthumanize import bulk
+
+        big = "Word " * 40_000  # 200k chars, past the csv module default
+        csv_path = tmp_path / "big.csv"
+        csv_path.write_text(f'id,text\nbig,"{big}"\n')
+        assert [len(r.text) for r in iter_records(str(csv_path))] == [len(big)]
+        assert count_records(str(csv_path)) == 1
+        monkeypatch.setattr(bulk, "_CSV_FIELD_LIMIT", 1000)
+        with pytest.raises(ConfigError, match="malformed CSV"):
+            list(iter_records(str(csv_path)))
+        with pytest.raises(ConfigError, match="malformed CSV"):
+            count_records(str(csv_path))
+        monkeypatch.undo()
+        assert count_records(str(csv_path)) == 1  # restores the limit
+
+
+class TestRun:
+    def test_output_and_pool(self, tmp_path, corpus):
+        inline = tmp_path / "inline.jsonl"
+        stats = run_bulk(str(corpus), str(inline), op="analyze", workers=1)
+        assert (stats.total, stats.done, stats.errors) == (5, 5, 0)
+        rows = _read(inline)
+        assert [r["id"] for r in rows] == [f"doc{i}" for i in range(5)]
+        assert all("artificiality_score" in r for r in rows)
+
+        pooled = tmp_path / "pooled.jsonl"
+        run_bulk(str(corpus), str(pooled), op="analyze", workers=2)
+        assert sorted(_read(pooled), key=lambda r: r["id"]) == rows
+
+    def test_resume_after_interruption(self, tmp_path, corpus):
+        out = tmp_path / "out.jsonl"
+
+        def stop(stats):
+            if stats.done == 2:
+                raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            run_bulk(str(corpus), str(out), op="analyze", workers=1, on_progress=stop)
+        with out.open("a") as fh:
+            fh.write('{"id": "doc2", "torn')  # crashed mid-write
+        stats = run_bulk(str(corpus), str(out), op="analyze", workers=1)
+        assert (stats.skipped, stats.done) == (2, 3)
+        assert [r["id"] for r in _read(out)] == [f"doc{i}" for i in range(5)]
+
+        stats = run_bulk(str(corpus), str(out), op="analyze", workers=1)
+        assert (stats.skipped, stats.done) == (5, 0)
+        stats = run_bulk(str(corpus), str(out), op="analyze", workers=1, restart=True)
+        assert (stats.skipped, stats.done) == (0, 5)
+        assert len(_read(out)) == 5
+
+    def test_errors_and_config(self, tmp_path, corpus):
+        with pytest.raises(ConfigError):
+            run_bulk(str(corpus), None, op="translate")
+        with pytest.raises(ConfigError):
+            run_bulk(str(corpus), None, workers=0)
+        out = tmp_path / "out.jsonl"
+        with patch("texthumanize.bulk.process_record", side_effect=ValueError("bad")):
+            stats = run_bulk(str(corpus), str(out), op="analyze", workers=1)
+        assert stats.errors == 5
+        assert _read(out)[0] == {"id": "doc0", "error": "ValueError: bad"}
+
+
+class TestCLI:
+    def test_bulk_subcommand(self, tmp_path, corpus, capsys):
+        out = tmp_path / "out.jsonl"
+        argv = ["texthumanize", "bulk", str(corpus), "-o", str(out),
+                "--op", "detect", "-w", "1", "-l", "en"]
+        with patch.object(sys, "argv", argv):
+            main()
+        rows = _read(out)
+        assert len(rows) == 5
+        assert {"id", "score", "verdict"} <= set(rows[0])
+        assert "5/5 records" in capsys.readouterr().err
+        assert (tmp_path / "out.jsonl.checkpoint").exists()
@@ -0,0 +1,128 @@
+"""Tests for the bounded MemoCache framework and migrated helper caches."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from texthumanize import cache as cache_mod
+from texthumanize.cache import MemoCache, all_cache_stats, clear_all, memo_cache, memoize
+
+
+@pytest.fixture
+def restore_limit():
+    old = cache_mod._global_max_bytes
+    yield
+    cache_mod._global_max_bytes = old
+
+
+class TestMemoCache:
+    def test_lru_eviction_by_entries(self):
+        c = MemoCache("t.entries", max_entries=2)
+        c.put("a", 1)
+        c.put("b", 2)
+        assert c.get("a") == 1  # "a" now most recent
+        c.put("c", 3)
+        assert "b" not in c and "a" in c and "c" in c
+        assert c.stats()["evictions"] == 1
+
+    def test_byte_limit(self):
+        c = MemoCache("t.bytes", max_entries=1000, max_bytes=2000)
+        for i in range(100):
+            c.put(i, "x" * 100)
+        assert 0 < c.nbytes <= 2000
+        assert len(c) < 100
+
+    def test_get_or_compute_counts(self):
+        c = MemoCache("t.compute")
+        calls = []
+        for _ in range(3):
+            assert c.get_or_compute("k", lambda: calls.append(1) or 42) == 42
+        assert len(calls) == 1
+        st = c.stats()
+        assert (st["hits"], st["misses"]) == (2, 1)
+        assert st["hit_rate"] == pytest.approx(2 / 3, abs=1e-3)
+
+    def test_thread_safety(self):
+        c = MemoCache("t.threads", max_entries=50)
+
+        def work(base: int) -> None:
+            for i in range(500):
+                c.get_or_compute((base, i % 80), lambda i=i: i)
+
+        threads = [threading.Thread(target=work, args=(b,)) for b in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(c) <= 50
+        assert c.nbytes == sum(size for _, size in c._data.values())
+
+    def test_memoize_decorator(self):
+        calls = []
+
+        @memoize("t.memoize", max_entries=8)
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        assert square(3) == 9 and square(3) == 9
+        assert calls == [3]
+        assert square.cache.stats()["hits"] == 1
+
+
+class TestRegistry:
+    def test_get_or_create(self):
+        assert memo_cache("t.reg") is memo_cache("t.reg", max_entries=1)
+
+    def test_global_limit_trims(self, restore_limit):
+        big = memo_cache("t.global", max_entries=10_000)
+        big.clear()
+        for i in range(200):
+            big.put(i, "y" * 200)
+        cache_mod.set_global_limit(all_cache_stats()["total_bytes"] - 5000)
+        assert all_cache_stats()["total_bytes"] <= cache_mod._global_max_bytes
+
+    def test_clear_all(self):
+        c = memo_cache("t.clear")
+        c.put("k", "v")
+        clear_all()
+        assert len(c) == 0
+        stats = all_cache_stats()
+        assert "t.clear" in stats and "result_cache" in stats
+
+
+class TestMigratedCaches:
+    def test_helpers_registered_and_hit(self):
+        from texthumanize.hmm_tagger import get_hmm_tagger
+        from texthumanize.morphology import get_morphology
+        from texthumanize.sentence_split import split_sentences
+
+        clear_all()
+        text = "The cats were running. The dogs were running too."
+        for _ in range(2):
+            split_sentences(text, lang="en")
+            get_morphology("en").lemmatize("running")
+            get_hmm_tagger("en").tag(text)
+        stats = all_cache_stats()
+        for name in (
+            "sentence_split.split", "morphology.lemma",
+            "hmm_tagger.emissions",
+        ):
+            assert stats[name]["hits"] >= 1, name
+
+    def test_tagger_kept_per_language(self):
+        from texthumanize.hmm_tagger import get_hmm_tagger
+
+        en = get_hmm_tagger("en")
+        get_hmm_tagger("ru")
+        assert get_hmm_tagger("en") is en
+
+    def test_lemma_cache_shared_across_engines(self):
+        from texthumanize.morphology import MorphologyEngine
+
+        clear_all()
+        first = MorphologyEngine("en").lemmatize("walked")
+        assert MorphologyEngine("en").lemmatize("walked") == first
+        assert all_cache_stats()["morphology.lemma"]["hits"] == 1
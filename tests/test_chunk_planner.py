@@ -0,0 +1,89 @@
+"""Tests for the chunk planner and span-merged humanize_chunked."""
+
+from __future__ import annotations
+
+import pytest
+
+from texthumanize import humanize_chunked
+from texthumanize.chunk_planner import (
+    ChunkContext,
+    merge_chunks,
+    plan_chunks,
+)
+from texthumanize.exceptions import ConfigError
+
+_PARA = (
+    "Furthermore, it is important to note that the system is robust. "
+    "Additionally, the utilization of tools facilitates optimization."
+)
+
+
+def _doc(n: int, sep: str = "\n\n") -> str:
+    return sep.join(f"{_PARA} Section {i}." for i in range(n))
+
+
+class TestPlanChunks:
+    def test_spans_cover_text_without_overlap(self):
+        text = _doc(12)
+        spans = plan_chunks(text, 400, context=100)
+        assert spans[0].start == 0 and spans[-1].end == len(text)
+        for a, b in zip(spans, spans[1:]):
+            assert a.end <= b.start
+            assert text[a.end:b.start].strip() == ""
+
+    def test_identity_merge_roundtrip(self):
+        text = "  " + _doc(7, sep="\n \n\n") + "\n"
+        spans = plan_chunks(text, 300, context=50)
+        assert merge_chunks(text, spans, [s.text(text) for s in spans]) == text
+
+    def test_balanced_for_workers(self):
+        spans = plan_chunks(_doc(16), 800, workers=4)
+        assert len(spans) % 4 == 0
+        sizes = [s.end - s.start for s in spans]
+        assert max(sizes) <= 2 * min(sizes)
+
+    def test_oversized_paragraph_split_at_sentences(self):
+        text = " ".join(f"Sentence number {i} is here." for i in range(60))
+        spans = plan_chunks(text, 300)
+        assert len(spans) > 1
+        assert all(s.text(text).endswith(".") for s in spans)
+
+    def test_context_window(self):
+        text = _doc(6)
+        spans = plan_chunks(text, 300, context=40)
+        ctx = ChunkContext.for_span(text, spans[1])
+        assert 0 < len(ctx.left) <= 40 and 0 < len(ctx.right) <= 40
+        assert text.endswith(ctx.right) or ctx.right in text
+        chunk = spans[1].text(text)
+        assert ctx.window(chunk) == text[spans[1].context_start:spans[1].context_end]
+
+    def test_bad_arguments(self):
+        with pytest.raises(ConfigError):
+            plan_chunks("text", 0)
+        with pytest.raises(ConfigError):
+            merge_chunks("text", plan_chunks("text", 10), [])
+
+
+class TestHumanizeChunked:
+    @pytest.mark.timeout(300)
+    def test_no_duplicated_overlap(self):
+        text = _doc(8)
+        result = humanize_chunked(
+            text, chunk_size=300, overlap=150, lang="en", intensity=0, seed=1,
+        )
+        # intensity=0 keeps words; the old overlap logic repeated them.
+        assert len(result.text.split()) <= len(text.split()) + 2
+        assert result.metrics_before["chunks"] > 1
+        assert "artificiality_score" in result.metrics_after
+
+    @pytest.mark.timeout(300)
+    def test_chunk_separators_preserved(self):
+        text = _doc(8)
+        seq = humanize_chunked(text, chunk_size=300, lang="en", seed=4)
+        par = humanize_chunked(
+            text, chunk_size=300, lang="en", seed=4, max_workers=2,
+        )
+        # Separators between chunks are copied from the original.
+        assert seq.text.count("\n\n") >= seq.metrics_before["chunks"] - 1
+        assert par.metrics_before["chunks"] % 2 == 0
+        assert par.text.count("\n\n") >= par.metrics_before["chunks"] - 1
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from texthumanize.content_classifier import (
     ContentType,
     classify,
@@ -9,7 +11,9 @@ from texthumanize.content_classifier import (
 from texthumanize.grammar_guard import (
     GrammarGuard,
     GuardResult,
+    _FeatureExtractor,
     _mlp_forward,
+    _mlp_forward_batch,
     extract_sentence_features,
 )
 
@@ -312,6 +316,42 @@ class TestGrammarGuard:
         assert isinstance(result, str)
         assert guard.result.sentences_checked >= 1
 
+    def test_mlp_batch_matches_rows(self):
+        """Batched scoring equals per-row scoring."""
+        rows = [
+            extract_sentence_features(s, "Before it.", "After it.", lang="en")
+            for s in ("The cat sat.", "A long, winding sentence; with clauses.", "")
+        ]
+        batch = _mlp_forward_batch(rows)
+        assert batch == pytest.approx([_mlp_forward(r) for r in rows], abs=1e-12)
+        assert _mlp_forward_batch([]) == []
+
+    def test_shared_extractor_matches_function(self):
+        """One extractor reused across sentences gives the same features."""
+        ex = _FeatureExtractor("en")
+        sents = ["The cat sat on the mat.", "It was warm.", "The cat sat on the mat."]
+        for i, s in enumerate(sents):
+            before = sents[i - 1] if i else ""
+            after = sents[i + 1] if i < 2 else ""
+            assert ex.features(s, before, after) == extract_sentence_features(
+                s, before, after, lang="en",
+            )
+
+    def test_rollback_targets_its_own_occurrence(self, monkeypatch):
+        """A fix to a repeated sentence rewrites only that sentence."""
+        guard = GrammarGuard(lang="en", threshold=0.0)
+        text = "The cat sat there.  The dog ran off.\nThe cat sat there."
+        calls = []
+
+        def fake_rollback(self, sentence, *args, **kwargs):
+            calls.append(sentence)
+            return "The cat sat here." if len(calls) == 3 else sentence
+
+        monkeypatch.setattr(GrammarGuard, "_try_rollback", fake_rollback)
+        result = guard.process(text, text)
+        assert result == "The cat sat there.  The dog ran off.\nThe cat sat here."
+        assert guard.result.rollbacks_applied == 1
+
 
 # ── Integration Tests ────────────────────────────────────────
 
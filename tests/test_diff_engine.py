@@ -0,0 +1,89 @@
+"""Tests for the memoized word-level diff engine."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from texthumanize.cache import all_cache_stats
+from texthumanize.diff_engine import change_exceeds, change_ratio, matching_blocks, opcodes
+from texthumanize.utils import HumanizeResult
+
+
+def _lcs(a, b) -> int:
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b):
+            cur.append(prev[j] + 1 if x == y else max(prev[j + 1], cur[j]))
+        prev = cur
+    return prev[-1]
+
+
+class TestBlocks:
+    def test_random_sequences_valid(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            a = [rng.randint(0, 4) for _ in range(rng.randint(0, 20))]
+            b = [rng.randint(0, 4) for _ in range(rng.randint(0, 20))]
+            pi = pj = 0
+            for i, j, k in matching_blocks(a, b):
+                assert i >= pi and j >= pj and a[i:i + k] == b[j:j + k]
+                pi, pj = i + k, j + k
+            assert sum(k for *_, k in matching_blocks(a, b)) <= _lcs(a, b)
+
+    def test_opcodes_rebuild_target(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            a = [rng.choice("abcde") for _ in range(rng.randint(0, 15))]
+            b = [rng.choice("abcde") for _ in range(rng.randint(0, 15))]
+            out: list[str] = []
+            for tag, i1, i2, j1, j2 in opcodes(a, b):
+                out += a[i1:i2] if tag == "equal" else b[j1:j2]
+            assert out == b
+
+    def test_opcode_format(self):
+        assert opcodes(["a", "b", "c"], ["a", "x", "c"]) == [
+            ("equal", 0, 1, 0, 1),
+            ("replace", 1, 2, 1, 2),
+            ("equal", 2, 3, 2, 3),
+        ]
+
+
+class TestChangeRatio:
+    def test_basic_values(self):
+        assert change_ratio("", "x") == 0.0
+        assert change_ratio("a b c d", "a b c d") == 0.0
+        assert change_ratio("a b c d", "a x c d") == pytest.approx(0.25)
+        assert change_ratio("a b", "c d") == 1.0
+
+    def test_memoized(self):
+        a = "one two three four five six"
+        b = "one two 3 four five 6"
+        before = all_cache_stats()["diff.change_ratio"]["hits"]
+        change_ratio(a, b)
+        change_ratio(a, b)
+        assert all_cache_stats()["diff.change_ratio"]["hits"] == before + 1
+
+    def test_exceeds_matches_ratio(self):
+        rng = random.Random(11)
+        words = [f"w{i}" for i in range(30)]
+        for _ in range(50):
+            a = " ".join(rng.choice(words) for _ in range(40))
+            b = " ".join(w if rng.random() > 0.3 else "z" for w in a.split())
+            for th in (0.05, 0.2, 0.5):
+                assert change_exceeds(a, b, th) == (change_ratio(a, b) > th)
+
+    def test_long_rewrite_is_fast_and_sane(self):
+        rng = random.Random(5)
+        a = [f"w{rng.randint(0, 3000)}" for _ in range(5000)]
+        b = [w if rng.random() > 0.3 else "the" for w in a]
+        ratio = change_ratio(" ".join(a), " ".join(b))
+        assert 0.2 < ratio < 0.4
+
+    def test_result_property_uses_engine(self):
+        r = HumanizeResult(
+            original="a b c d", text="a x c d", lang="en", profile="web", intensity=50,
+        )
+        assert r.change_ratio == pytest.approx(0.25)
@@ -0,0 +1,53 @@
+"""Tests for the import-cost audit and the lazy import surface."""
+
+from __future__ import annotations
+
+import json
+
+from texthumanize.import_audit import audit, main
+from texthumanize.lang import LANGUAGES, get_lang_pack
+
+_HEAVY = (
+    "texthumanize.pipeline",
+    "texthumanize.analyzer",
+    "texthumanize._word_freq_data",
+    "texthumanize._replacement_data",
+    "importlib.metadata",
+)
+
+
+class TestImportSurface:
+    def test_core_import_is_light(self):
+        report = audit("texthumanize.core", repeat=1, memory=False)
+        loaded = set(report.loaded())
+        assert "texthumanize.core" in loaded
+        assert not loaded & set(_HEAVY)
+        assert report.loaded("texthumanize.lang.") == []
+
+    def test_detect_ai_loads_one_language(self):
+        report = audit(
+            statement="import texthumanize; "
+            "texthumanize.detect_ai('The cat sat on the mat. It was warm.', lang='en')",
+            repeat=1,
+        )
+        assert report.loaded("texthumanize.lang.") == ["texthumanize.lang.en"]
+        assert "texthumanize.detectors" in report.loaded()  # via import_module
+        assert "texthumanize.pipeline" not in report.loaded()
+        assert report.retained_kb > 0
+
+    def test_lazy_language_packs(self):
+        assert len(LANGUAGES) == 25 and "id" in LANGUAGES and "xx" not in LANGUAGES
+        assert get_lang_pack("de")["code"] == "de"
+        assert "de" in LANGUAGES.loaded()
+        from texthumanize.lang import LANG_ID
+        assert LANG_ID is LANGUAGES["id"]
+
+
+class TestCLI:
+    def test_json_and_budget(self, capsys):
+        assert main(["texthumanize.exceptions", "--json", "--repeat", "1", "--no-memory"]) == 0
+        data = json.loads(capsys.readouterr().out)
+        assert data["statement"] == "import texthumanize.exceptions"
+        assert "texthumanize" in [m["name"] for m in data["modules"]]
+        assert main(["texthumanize", "--max-ms", "0", "--repeat", "1", "--no-memory"]) == 1
+        assert "import budget exceeded" in capsys.readouterr().err
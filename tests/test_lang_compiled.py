@@ -0,0 +1,64 @@
+"""Tests for compiled (frozen, precomputed) language packs."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from texthumanize.decancel import Debureaucratizer
+from texthumanize.lang import (
+    CompiledPack,
+    compile_pack,
+    get_compiled_pack,
+    get_lang_pack,
+)
+from texthumanize.structure import StructureDiversifier
+
+
+class TestCompiledPack:
+    def test_memoized_frozen_and_faithful(self):
+        lex = get_compiled_pack("en")
+        assert get_compiled_pack("en") is lex
+        assert compile_pack(get_lang_pack("en")) is lex
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            lex.code = "ru"  # type: ignore[misc]
+
+        pack = get_lang_pack("en")
+        assert lex.stop_words == frozenset(pack["stop_words"])
+        assert lex.trigrams == frozenset(pack["trigrams"])
+        assert [e.text for e in lex.bureaucratic] == list(pack["bureaucratic"])
+        first = lex.ai_connectors[0]
+        assert first.lower == first.text.lower()
+        assert first.replacements == tuple(pack["ai_connectors"][first.text])
+        lengths = [len(e.text) for e in lex.phrases_by_length]
+        assert lengths == sorted(lengths, reverse=True)
+
+    def test_modified_copies_and_unknown_languages(self):
+        pack = dict(get_lang_pack("en"))
+        pack["ai_connectors"] = {"Moreover": ["Also"]}
+        lex = compile_pack(pack)
+        assert lex is not get_compiled_pack("en")
+        assert [e.text for e in lex.ai_connectors] == ["Moreover"]
+
+        unknown = get_compiled_pack("xx")
+        assert isinstance(unknown, CompiledPack) and unknown.code == "xx"
+        assert unknown.bureaucratic == () and unknown.stop_words == frozenset()
+
+
+class TestConsumers:
+    TEXT = (
+        "Moreover, teams utilize many tools every day. Furthermore, "
+        "this will facilitate the rollout. MOREOVER it ships."
+    )
+
+    def test_patched_lang_pack_is_honoured(self):
+        s = StructureDiversifier(lang="en", intensity=100, seed=0)
+        s.lang_pack = {"ai_connectors": {"Moreover": ["also"]}}
+        result = s._replace_ai_connectors(self.TEXT, 1.0)
+        assert result.startswith("Also,")
+        assert "MOREOVER" in result  # case-sensitive match only
+
+        dec = Debureaucratizer("en", seed=0)
+        dec.lang_pack = {"bureaucratic": {"utilize": ["use"], "absent": ["x"]}}
+        assert "teams use many tools" in dec._replace_words(self.TEXT, 1.0)
@@ -0,0 +1,212 @@
+"""Tests for the pooled LLM transport, response cache and mock server."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+
+import pytest
+
+from texthumanize.ai_backend import _RESPONSES, AIBackend, _OllamaProvider, fan_out
+from texthumanize.exceptions import AIBackendUnavailableError
+from texthumanize.llm_mock_server import MockLLMServer
+from texthumanize.llm_transport import HTTPStatusError, HTTPTransport
+from texthumanize.pipeline import Pipeline
+from texthumanize.sentence_graph import SentenceGraph
+from texthumanize.utils import HumanizeOptions
+
+_AI = (
+    "Furthermore, it is important to note that the implementation of "
+    "comprehensive strategies facilitates optimal outcomes. Moreover, the "
+    "utilization of innovative methodologies ensures significant improvements "
+    "in overall efficiency. Additionally, stakeholders must leverage robust "
+    "frameworks to achieve sustainable growth. In conclusion, a holistic "
+    "approach plays a crucial role in the modern landscape."
+)
+_HUMAN = (
+    "I missed the bus again this morning, so I walked. It rained. My shoes "
+    "are still wet, honestly, and the cat won't stop staring at me. "
+    "Whatever. Tomorrow I'll leave early, or maybe not."
+)
+_DOC = f"{_AI}\n\n{_HUMAN}\n\n{_AI}"
+
+
+@pytest.fixture
+def server():
+    _RESPONSES.clear()
+    with MockLLMServer(responder=lambda system, text: text.upper()) as srv:
+        yield srv
+
+
+def _ollama(srv: MockLLMServer, transport: HTTPTransport, **kw) -> AIBackend:
+    return AIBackend(
+        enable_ollama=True, ollama_url=srv.url, prefer="ollama",
+        transport=transport, **kw,
+    )
+
+
+class TestTransport:
+    def test_connections_are_reused(self, server):
+        transport = HTTPTransport()
+        ai = _ollama(server, transport, cache_responses=False)
+        for i in range(5):
+            assert ai.paraphrase(f"text {i}") == f"TEXT {i}"
+        assert ai.active_backend() == "ollama"
+        # availability ping + 5 calls over one keep-alive connection
+        assert server.connections == 1
+        assert transport.connections_opened == 1
+        transport.close()
+        assert transport.idle_connections() == 0
+
+    def test_openai_compatible_endpoint(self, server):
+        ai = AIBackend(
+            openai_api_key="sk-test", openai_url=server.openai_url,
+            prefer="openai", transport=HTTPTransport(),
+        )
+        assert ai.rewrite_sentence("make it so") == "MAKE IT SO"
+        assert ai.active_backend() == "openai"
+        path, payload = server.requests[-1]
+        assert path == "/v1/chat/completions"
+        assert payload["messages"][1]["content"] == "make it so"
+
+    def test_errors(self, server):
+        transport = HTTPTransport()
+        server.fail_with.append(503)
+        with pytest.raises(HTTPStatusError) as err:
+            transport.post_json(server.url + "/api/chat", {"messages": []})
+        assert err.value.code == 503
+        with pytest.raises(AIBackendUnavailableError):
+            transport.post_json("http://127.0.0.1:9/api/chat", {}, timeout=2.0)
+        with pytest.raises(ValueError):
+            HTTPTransport(max_per_host=0)
+
+    def test_http_error_falls_back_to_builtin(self, server):
+        ai = _ollama(server, HTTPTransport())
+        assert ai.available_backends() == ["ollama", "builtin"]
+        server.fail_with.append(500)
+        out = ai.rewrite_sentence("The results were good.")
+        assert ai.active_backend() == "builtin"
+        assert isinstance(out, str)
+        with pytest.raises(RuntimeError, match="HTTP 502"):
+            server.fail_with.append(502)
+            _OllamaProvider(url=server.url, transport=HTTPTransport()).call("s", "t")
+
+
+class TestCacheAndConcurrency:
+    def test_responses_cached_per_prompt(self, server):
+        ai = _ollama(server, HTTPTransport())
+        assert ai.paraphrase("same text") == ai.paraphrase("same text") == "SAME TEXT"
+        ai.improve_naturalness("same text")  # other prompt → new request
+        assert len(server.requests) == 2
+        uncached = _ollama(server, HTTPTransport(), cache_responses=False)
+        uncached.paraphrase("same text")
+        assert len(server.requests) == 3
+
+    def test_identical_requests_coalesced(self, server):
+        server.delay = 0.2
+        ai = _ollama(server, HTTPTransport())
+        results = fan_out([lambda: ai.paraphrase("one prompt")] * 4)
+        assert results == ["ONE PROMPT"] * 4
+        assert len(server.requests) == 1
+
+    def test_fan_out_is_concurrent_and_bounded(self, server):
+        active = peak = 0
+        lock = threading.Lock()
+
+        def responder(system: str, text: str) -> str:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.2)
+            with lock:
+                active -= 1
+            return text[::-1]
+
+        server.responder = responder
+        ai = _ollama(server, HTTPTransport(max_per_host=2))
+        t0 = time.perf_counter()
+        results = fan_out([lambda i=i: ai.paraphrase(f"t{i}") for i in range(4)])
+        elapsed = time.perf_counter() - t0
+        assert results == ["0t", "1t", "2t", "3t"]
+        assert peak == 2
+        assert elapsed < 0.75  # two rounds of 0.2 s, not four
+
+    def test_fan_out_returns_exceptions(self):
+        def boom() -> str:
+            raise RuntimeError("no")
+
+        ok, err = fan_out([lambda: "ok", boom])
+        assert ok == "ok"
+        assert isinstance(err, RuntimeError)
+
+
+def _numbered(system: str, text: str) -> str:
+    """Answer a span prompt with one short sentence per number."""
+    numbers = re.findall(r'^\[(\d+)\]', text, re.MULTILINE)
+    return "\n".join(f"[{n}] Span {n} was rewritten." for n in numbers)
+
+
+class TestSpanRewrite:
+    def test_only_flagged_spans_sent(self, server):
+        server.responder = _numbered
+        graph = SentenceGraph(_DOC, "en")
+        runs = graph.segments(graph.flagged(0.65))
+        ai = _ollama(server, HTTPTransport())
+        out = ai.rewrite_flagged(_DOC, "en")
+        assert (out.sentences, out.spans, out.batches) == (13, len(runs), 1)
+        assert len(runs) > 1 and out.flagged < out.sentences
+        assert out.fallback_spans == 0
+        assert out.text == graph.replace({
+            run: f"Span {n} was rewritten." for n, run in enumerate(runs, 1)
+        })
+        ((path, payload),) = server.requests
+        sent = payload["messages"][1]["content"]
+        assert path == "/api/chat"
+        assert "missed the bus" not in sent
+        assert "missed the bus" in out.text
+        assert out.chars_sent < len(_DOC)
+
+    def test_batches_bounded_and_concurrent(self, server):
+        server.responder = _numbered
+        server.delay = 0.2
+        ai = _ollama(server, HTTPTransport())
+        t0 = time.perf_counter()
+        out = ai.rewrite_flagged(_DOC, "en", max_batch_chars=100)
+        elapsed = time.perf_counter() - t0
+        assert out.batches == out.spans <= 4  # every batch in flight at once
+        # the first and last paragraphs are identical: sent once
+        assert len(server.requests) == out.batches - 1
+        assert elapsed < 0.35
+
+    def test_failed_batch_falls_back_per_span(self, server):
+        server.responder = _numbered
+        server.fail_with.append(503)
+        ai = _ollama(server, HTTPTransport(), cache_responses=False)
+        out = ai.rewrite_flagged(_DOC, "en", max_batch_chars=100)
+        assert out.spans > 1
+        assert out.fallback_spans == 1
+        assert out.text.count("was rewritten.") == out.spans - 1
+        assert "missed the bus" in out.text
+
+    def test_malformed_reply_falls_back(self, server):
+        server.responder = lambda system, text: "[1] only one"
+        graph = SentenceGraph(_DOC, "en")
+        ai = _ollama(server, HTTPTransport())
+        out = ai.rewrite_flagged(_DOC, "en", graph=graph)
+        assert out.fallback_spans == out.spans > 1
+        assert "only one" not in out.text
+        assert AIBackend().rewrite_flagged(_HUMAN, "en").text == _HUMAN
+
+    def test_pipeline_span_mode(self, server):
+        server.responder = _numbered
+        ai = _ollama(server, HTTPTransport())
+        pipeline = Pipeline(HumanizeOptions(lang="en", seed=1))
+        assert pipeline._llm_span_rewrite(ai, _AI, "en") is None  # short text
+        span = pipeline._llm_span_rewrite(ai, _DOC, "en")
+        assert span is not None and span.spans > 1
+        off = Pipeline(HumanizeOptions(
+            lang="en", seed=1, constraints={"llm_span_mode": False},
+        ))
+        assert off._llm_span_rewrite(ai, _DOC, "en") is None
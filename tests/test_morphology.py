@@ -121,3 +121,39 @@ class TestGetMorphology:
         """Неизвестный язык — не должен падать."""
         m = get_morphology("xx")
         assert isinstance(m, MorphologyEngine)
+
+
+class TestLookupStructures:
+    """Суффиксные индексы, общие кэши и пакетная лемматизация."""
+
+    def test_suffix_index_longest_match(self):
+        from texthumanize.morphology import _SuffixIndex
+
+        index = _SuffixIndex({"ом": "a", "ого": "b", "м": "c"})
+        assert index.match("красивого", 2) == ("ого", "b")
+        assert index.match("домом", 2) == ("ом", "a")
+        # Основа должна остаться длиннее min_stem
+        assert index.match("того", 2) is None
+        assert index.match("того", 0) == ("ого", "b")
+        assert index.match("ого", -1) == ("ого", "b")
+
+    def test_lemmatize_many(self):
+        morph = get_morphology("ru")
+        tokens = ["Красивого", "красивая", "делает", "красивого"]
+        assert morph.lemmatize_many(tokens) == [morph.lemmatize(t) for t in tokens]
+        assert morph.lemmatize_many([]) == []
+
+    def test_forms_cache_returns_copies(self):
+        morph = get_morphology("en")
+        forms = morph.generate_forms("walk")
+        forms.append("bogus")
+        assert "bogus" not in morph.generate_forms("walk")
+
+    def test_synonym_form_cache_shared(self):
+        from texthumanize.cache import all_cache_stats, clear_all
+
+        clear_all()
+        first = MorphologyEngine("ru").find_synonym_form("красивого", "хороший")
+        assert first == "хорошого"
+        assert MorphologyEngine("ru").find_synonym_form("красивого", "хороший") == first
+        assert all_cache_stats()["morphology.synonym_form"]["hits"] == 1
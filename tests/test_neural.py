@@ -451,6 +451,36 @@ class TestWordEmbeddings:
         wv2 = get_word_vec()
         assert wv1 is wv2
 
+    def test_sentence_vector_matches_reference(self) -> None:
+        from texthumanize.word_embeddings import WordVec
+        wv = WordVec()
+        text = "The cat sat on the mat and the cat slept"
+        tokens = text.lower().split()
+        weights = [wv._weight(t, True) for t in tokens]
+        ref = [
+            sum(w * wv.word_vector(t)[d] for w, t in zip(weights, tokens))
+            for d in range(50)
+        ]
+        norm = math.sqrt(sum(v * v for v in ref))
+        got = wv.sentence_vector(text)
+        assert got == pytest.approx([v / norm for v in ref], abs=1e-9)
+
+    def test_preservation_pairs_all_sentences(self) -> None:
+        from texthumanize.word_embeddings import WordVec
+        wv = WordVec()
+        orig = " ".join(f"Sentence number {i} talks about topic {i}." for i in range(40))
+        result = wv.semantic_preservation(orig, orig)
+        assert result["avg_sentence_similarity"] == pytest.approx(1.0, abs=1e-4)
+        assert result["min_sentence_similarity"] == pytest.approx(1.0, abs=1e-4)
+        assert result["n_sentences_original"] == 40
+
+    def test_best_match_band(self) -> None:
+        from texthumanize.word_embeddings import WordVec
+        wv = WordVec()
+        sims = wv._best_matches(["Alpha beta gamma."], ["Delta.", "Alpha beta gamma."])
+        assert sims == [pytest.approx(1.0)]
+        assert wv._best_matches(["Alpha beta gamma."], []) == [0.0]
+
 
 # ═══════════════════════════════════════════════════════════════
 #  HMM Tagger Tests
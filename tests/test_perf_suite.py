@@ -0,0 +1,101 @@
+"""Tests for the performance regression suite."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from texthumanize.perf_suite import (
+    LANGS,
+    Measurement,
+    PerfReport,
+    build_corpus,
+    build_document,
+    compare,
+    format_comparison,
+    main,
+    min_pvalue,
+    permutation_pvalue,
+    run_suite,
+    word_count,
+)
+
+
+class TestCorpus:
+    def test_every_language_and_size(self):
+        assert len(LANGS) == 25
+        corpus = build_corpus(LANGS, [100])
+        for (lang, size), text in corpus.items():
+            assert size <= word_count(text, lang) < size + 60, lang
+        assert build_document("zh", 1000) == build_document("zh", 1000)
+        assert word_count(build_document("en", 50_000), "en") >= 50_000
+
+
+class TestStatistics:
+    def test_permutation_pvalue(self):
+        assert permutation_pvalue([1, 2, 3], [1, 2, 3]) == 1.0
+        assert permutation_pvalue([1.0] * 5, [2.0] * 5) < 0.01
+        # sampled (not enumerated) splits stay in range
+        p = permutation_pvalue(list(range(30)), list(range(5, 35)), rounds=500)
+        assert 0 < p <= 1
+
+    def test_compare_flags_only_significant_regressions(self):
+        base = PerfReport(results={
+            "api/slow": Measurement([1.0, 1.01, 0.99, 1.0, 1.02]),
+            "api/noisy": Measurement([1.0, 3.0, 0.5, 2.0, 1.0]),
+            "api/fast": Measurement([1.0, 1.01, 0.99, 1.0, 1.02]),
+            "memory/x": Measurement([100.0], unit="bytes"),
+            "throughput/x": Measurement([10.0, 10.1, 9.9, 10.0, 10.2], better="higher"),
+        })
+        new = PerfReport(results={
+            "api/slow": Measurement([1.3, 1.31, 1.29, 1.3, 1.32]),
+            "api/noisy": Measurement([1.5, 2.5, 1.0, 3.0, 1.2]),
+            "api/fast": Measurement([0.5, 0.51, 0.49, 0.5, 0.52]),
+            "memory/x": Measurement([150.0], unit="bytes"),
+            "throughput/x": Measurement([5.0, 5.1, 4.9, 5.0, 5.2], better="higher"),
+        })
+        rows = {r.key: r for r in compare(base, new)}
+        assert rows["api/slow"].regression
+        assert not rows["api/noisy"].regression  # worse median, but noise
+        assert rows["api/fast"].improvement
+        assert rows["memory/x"].regression and rows["memory/x"].p_value is None
+        assert rows["throughput/x"].regression
+
+    def test_too_few_samples_are_reported(self, capsys):
+        # 3 vs 3 samples: p >= 2/C(6, 3) = 0.1 even for a 2x slowdown
+        assert permutation_pvalue([1, 1.01, 1.02], [2, 2.01, 2.02]) == min_pvalue(3, 3) == 0.1
+        base = PerfReport(results={"api/x": Measurement([1.0, 1.01, 1.02])})
+        new = PerfReport(results={"api/x": Measurement([2.0, 2.01, 2.02])})
+        (row,) = compare(base, new)
+        assert row.insufficient and not row.regression
+        assert "insufficient samples" in format_comparison([row], only_changes=True)
+        assert not compare(base, base, alpha=0.5)[0].insufficient
+
+        with pytest.raises(SystemExit):
+            main(["run", "--repeat", "3"])
+        assert "at least 4" in capsys.readouterr().err
+
+
+class TestRun:
+    def test_run_save_and_compare(self, tmp_path, capsys):
+        report = run_suite(
+            langs=["en", "ja"], sizes=[100], apis=["humanize", "detect_ai"],
+            repeat=2, memory=False,
+        )
+        assert {"api/humanize/en/100", "api/detect_ai/ja/100"} <= set(report.results)
+        assert "errors" not in report.meta
+        traced = run_suite(langs=["ja"], sizes=[100], apis=["analyze"], repeat=1)
+        assert traced.results["memory/analyze/ja/100"].median > 0
+        assert any(k.startswith("stage/en/100/") for k in report.results)
+
+        base, new = tmp_path / "base.json", tmp_path / "new.json"
+        report.save(str(base))
+        assert PerfReport.load(str(base)).to_dict() == report.to_dict()
+        data = json.loads(base.read_text())
+        key = "api/detect_ai/en/100"
+        data["results"][key]["samples"] = [s * 10 for s in data["results"][key]["samples"]]
+        new.write_text(json.dumps(data))
+        assert main(["compare", str(base), str(base)]) == 0
+        assert main(["compare", str(base), str(new), "--alpha", "0.5"]) == 1
+        assert "REGRESSION" in capsys.readouterr().out
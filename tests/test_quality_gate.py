@@ -0,0 +1,114 @@
+"""Tests for the parallel, cached quality gate runner."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from texthumanize import quality_gate
+from texthumanize.quality_gate import (
+    GateCache,
+    GateConfig,
+    check_file,
+    check_files,
+    iter_check_files,
+    main,
+)
+
+_TEXTS = {
+    "ai.md": (
+        "Furthermore, it is important to note that the implementation of "
+        "comprehensive strategies facilitates optimal outcomes. Moreover, "
+        "stakeholders must leverage robust frameworks."
+    ),
+    "human.txt": "I missed the bus again, so I walked.\r\nIt rained. Whatever.",
+    "wm.md": "Plain\u200b text with a zero\u200b width space.",
+    "empty.md": "   \n",
+}
+
+
+@pytest.fixture
+def docs(tmp_path):
+    paths = []
+    for name, text in _TEXTS.items():
+        path = tmp_path / name
+        path.write_bytes(text.encode("utf-8"))
+        paths.append(str(path))
+    return paths
+
+
+def _count_checks(monkeypatch) -> list[str]:
+    seen: list[str] = []
+    real = quality_gate.check_text
+
+    def spy(text, config=None, path=""):
+        seen.append(path)
+        return real(text, config, path)
+
+    monkeypatch.setattr(quality_gate, "check_text", spy)
+    return seen
+
+
+class TestRunner:
+    def test_parallel_matches_serial(self, docs):
+        serial = [check_file(p) for p in docs]
+        assert check_files(docs) == serial
+        assert check_files(docs, workers=2) == serial
+        assert serial[2].watermark_count > 0
+
+    def test_streaming_yields_every_file(self, docs):
+        missing = docs[0] + ".missing"
+        results = list(iter_check_files([missing, *docs], workers=2))
+        assert sorted(r.path for r in results) == sorted([missing, *docs])
+        assert results[0].path == missing  # ready before any analysis
+        assert not results[0].passed
+
+
+class TestCache:
+    def test_unchanged_files_not_rechecked(self, docs, tmp_path, monkeypatch):
+        seen = _count_checks(monkeypatch)
+        cache_path = str(tmp_path / "cache.json")
+        first = check_files(docs, cache=GateCache(cache_path))
+        assert len(seen) == 3  # the empty file is never analysed
+        assert check_files(docs, cache=GateCache(cache_path)) == first
+        assert len(seen) == 3
+
+        (tmp_path / "ai.md").write_text("Changed text, short and plain.")
+        check_files(docs, cache=GateCache(cache_path))
+        assert seen[3:] == [docs[0]]
+
+        check_files(docs, GateConfig(ai_threshold=10), cache=GateCache(cache_path))
+        assert len(seen) == 7  # other thresholds: new keys
+
+    def test_version_and_corruption(self, docs, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        check_files(docs, cache=GateCache(str(cache_path)))
+        assert len(GateCache(str(cache_path))) == 3
+        data = json.loads(cache_path.read_text())
+        data["version"] = "0.0.0"
+        cache_path.write_text(json.dumps(data))
+        assert len(GateCache(str(cache_path))) == 0
+        cache_path.write_text("{broken")
+        assert len(GateCache(str(cache_path))) == 0
+
+
+class TestCLI:
+    def test_jsonl_streaming_and_cache(self, docs, tmp_path, capsys):
+        cache_path = str(tmp_path / "gate.json")
+        code = main([*docs, "--format", "jsonl", "-j", "2", "--cache", cache_path])
+        out = capsys.readouterr().out
+        records = [json.loads(line) for line in out.splitlines() if line.startswith("{")]
+        assert sorted(r["path"] for r in records) == sorted(docs)
+        assert code == 1  # the watermarked file fails
+        assert len(GateCache(cache_path)) == 3
+
+    def test_defaults_no_cache_no_pool(self, docs, tmp_path, capsys, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(quality_gate, "ProcessPoolExecutor", None)
+        before = sorted(os.listdir(tmp_path))
+        main([*docs, "--format", "json"])
+        data = json.loads(capsys.readouterr().out.split("\n\nquality-gate")[0])
+        assert sorted(r["path"] for r in data) == sorted(docs)
+        assert sorted(os.listdir(tmp_path)) == before
@@ -0,0 +1,134 @@
+"""Tests for compiled regex rule sets."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from texthumanize.analyzer import TextAnalyzer
+from texthumanize.pipeline import _FINAL_SANITIZE, _LATE_CLEANUP
+from texthumanize.rule_sets import Rule, RuleSet, compiled, folds_like_lower, word_pattern
+from texthumanize.sentence_validator import SentenceValidator, _rules_for
+
+_RULES = RuleSet([
+    Rule("double_word", r'\b(and|so)\s+\1\b', r'\1', re.IGNORECASE),
+    Rule("dangling", r',?\s*\b(and|but)\b\s*([.!?])', r'\2', re.IGNORECASE),
+    Rule("dash", r'—\s*—', '—'),
+    Rule("check_only", r'\bTODO\b'),
+])
+
+
+def _cascade(text: str) -> str:
+    text = re.sub(r'\b(and|so)\s+\1\b', r'\1', text, flags=re.IGNORECASE)
+    text = re.sub(r',?\s*\b(and|but)\b\s*([.!?])', r'\2', text, flags=re.IGNORECASE)
+    return re.sub(r'—\s*—', '—', text)
+
+
+class TestRuleSet:
+    @pytest.mark.parametrize("text", [
+        "Nothing to clean here.",
+        "It works And and ships.",
+        "It works and and.",  # second rule only matches after the first
+        "Wait — — what, but!",
+        "So so ſo ſo, and.",  # 'ſ' folds to 's' only under IGNORECASE
+        "TODO: nothing to substitute",
+    ])
+    def test_apply_matches_cascade(self, text):
+        assert _RULES.apply(text) == _cascade(text)
+
+    def test_gate_and_dispatch(self):
+        assert not _RULES.matches("clean text")
+        assert _RULES.matches("ſo ſo")
+        assert _RULES.matches("see TODO")
+        assert not _RULES.matches("see todo")  # case-sensitive rule
+        assert _RULES.first("x —— and and") == "dash"
+        assert _RULES.first("x, but. ——") == "dangling"
+        assert _RULES.first("clean") is None
+
+    def test_backreferences_renumbered(self):
+        rules = RuleSet([
+            Rule("a", r'(x)\1', flags=re.IGNORECASE),
+            Rule("b", r'(y)(z)\2'),
+        ])
+        assert rules.matches("yzz")
+        assert not rules.matches("yz xy")
+
+    def test_invalid_rules(self):
+        with pytest.raises(ValueError):
+            RuleSet([])
+        with pytest.raises(ValueError):
+            RuleSet([Rule("a", "x"), Rule("a", "y")])
+        with pytest.raises(ValueError):
+            RuleSet([Rule("upper", r'\bAnd\b', flags=re.IGNORECASE)])
+
+
+class TestSharedRuleSets:
+    def test_pipeline_cascades(self):
+        text = "Fine and and good, and. Then, and, but, however it went."
+        assert _LATE_CLEANUP.apply("clean text") == "clean text"
+        out = _FINAL_SANITIZE.apply(_LATE_CLEANUP.apply(text))
+        assert "and and" not in out
+        assert ", and." not in out
+
+    def test_validator_rules_shared_per_language(self):
+        assert _rules_for("en") is _rules_for("en")
+        assert _rules_for("de") is not _rules_for("en")
+        assert "missing_noun" in {r.name for r in _rules_for("en").rules}
+        assert "de_article_verb" in {r.name for r in _rules_for("de").rules}
+
+    def test_validator_checks(self):
+        en = SentenceValidator(lang="en")
+        assert en._check_sentence("The cat sat on the mat.", "") is None
+        assert en._check_sentence("He went to the of house.", "").startswith("missing_noun")
+        assert en._check_sentence("Good y y bad.", "").startswith("double_conj")
+        de = SentenceValidator(lang="de")
+        assert de._check_sentence("Wir sehen die Beachten heute.", "").startswith(
+            "de_article_verb"
+        )
+        assert de._check_sentence("Wir sehen die Ordnung heute.", "") is None
+
+
+class TestPatternCache:
+    def test_patterns_compiled_once(self):
+        assert word_pattern("moreover") is word_pattern("moreover")
+        assert word_pattern("moreover", 0) is not word_pattern("moreover")
+        assert word_pattern("e.g.").pattern == r'\be\.g\.\b'
+        assert compiled(r'\d+', re.I) is compiled(r'\d+', re.I)
+
+    def test_folds_like_lower(self):
+        assert folds_like_lower("Plain text, Привет")
+        assert not folds_like_lower("ſome text")
+        assert not folds_like_lower("ΛΟΓΟΣ")
+
+    @pytest.mark.parametrize("text", [
+        "Moreover, it works. MOREOVER it ships.",
+        "Moreover, we ſubſequently UTILIZE it.",  # 'ſ' folds to 's'
+        "Nothing here at all, really.",
+    ])
+    def test_analyzer_prefilter_matches_full_scan(self, text):
+        analyzer = TextAnalyzer(lang="en")
+        words = text.split()
+        bureaucratic = analyzer.lang_pack.get("bureaucratic", {})
+        expected = [w for w in bureaucratic if re.search(
+            r'\b' + re.escape(w) + r'\b', text, re.IGNORECASE,
+        )]
+        found = analyzer._find_bureaucratic_words(text)
+        assert [w for w in found if w in bureaucratic] == expected
+        connectors = analyzer.lang_pack.get("ai_connectors", {})
+        hits = sum(
+            len(re.findall(r'\b' + re.escape(c) + r'\b', text, re.IGNORECASE))
+            for c in connectors
+        )
+        assert analyzer._calc_connector_ratio(text, [text]) == min(hits, 1)
+        phrase_hits = sum(
+            text.lower().count(p.lower()) * len(p.split())
+            for p in analyzer.lang_pack.get("bureaucratic_phrases", {})
+        )
+        word_hits = sum(
+            len(re.findall(r'\b' + re.escape(w) + r'\b', text, re.IGNORECASE))
+            for w in bureaucratic
+        )
+        assert analyzer._calc_bureaucratic_ratio(text, words) == min(
+            (phrase_hits + word_hits) / len(words), 1.0,
+        )
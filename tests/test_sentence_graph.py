@@ -0,0 +1,142 @@
+"""Tests for the sentence graph and the incremental detector loop."""
+
+from __future__ import annotations
+
+from texthumanize.detectors import AIDetector
+from texthumanize.pipeline import Pipeline, SharedContext
+from texthumanize.repetitions import RepetitionReducer
+from texthumanize.sentence_graph import SentenceGraph
+from texthumanize.sentence_validator import SentenceValidator
+from texthumanize.utils import HumanizeOptions
+
+TEXT = (
+    "The cat sat down.  The dog ran off.\n"
+    "It rained.\n\n"
+    "The cat sat down. Then we went home!"
+)
+
+_HUMAN = [
+    "I tried it last week and honestly it broke twice.",
+    "My cat sat on the keyboard, so who knows.",
+    "We fixed the thing by Friday, mostly by luck.",
+    "Dinner was late again.",
+    "Tom laughed at the whole mess.",
+    "The bus never came, so I walked.",
+]
+_AI = (
+    "Furthermore, it is important to note that the implementation leverages "
+    "a comprehensive framework. Moreover, the system utilizes robust "
+    "methodologies to facilitate optimal outcomes. Additionally, it is crucial "
+    "to emphasize the significance of seamless integration."
+)
+
+
+def _long_document() -> str:
+    paras = [" ".join(_HUMAN[(i + k) % 6] for k in range(5)) for i in range(20)]
+    paras.insert(10, _AI)
+    return "\n\n".join(paras)
+
+
+class TestSentenceGraph:
+    def test_nodes_and_paragraphs(self):
+        g = SentenceGraph(TEXT, "en")
+        assert [n.text for n in g] == [
+            "The cat sat down.", "The dog ran off.", "It rained.",
+            "The cat sat down.", "Then we went home!",
+        ]
+        assert [n.paragraph for n in g] == [0, 0, 0, 1, 1]
+        for n in g:
+            assert TEXT[n.start:n.end] == n.text
+        assert g.nodes[0].id != g.nodes[3].id  # same text, other occurrence
+
+    def test_dirty_flags_against_previous(self):
+        g1 = SentenceGraph(TEXT, "en")
+        edited = TEXT.replace("The dog ran off.", "A dog ran away.")
+        g2 = SentenceGraph(edited, "en", previous=g1)
+        assert g2.dirty == [1]
+        assert [n.id for i, n in enumerate(g2) if i != 1] == [
+            n.id for i, n in enumerate(g1) if i != 1
+        ]
+
+    def test_segments_stay_inside_paragraphs(self):
+        g = SentenceGraph(TEXT, "en")
+        assert g.segments([4, 0, 1, 2, 3]) == [(0, 2), (3, 4)]
+        assert g.segment_text((0, 1)) == "The cat sat down.  The dog ran off."
+
+    def test_replace_keeps_surrounding_text(self):
+        g = SentenceGraph(TEXT, "en")
+        out = g.replace({(3, 3): "A cat slept."})
+        assert out == TEXT.replace("The cat sat down. Then", "A cat slept. Then")
+
+    def test_scores_match_detect_sentences(self):
+        text = _long_document()
+        g = SentenceGraph(text, "en")
+        expected = [s.ai_probability for s in AIDetector("en").detect_sentences(text)]
+        assert [round(s, 4) for s in g.scores()] == expected
+
+
+class TestIncrementalLoop:
+    @staticmethod
+    def _pipeline() -> Pipeline:
+        p = Pipeline(HumanizeOptions(lang="en", seed=3, intensity=60))
+        p._shared = SharedContext()
+        p._check_deadline = lambda: None
+        return p
+
+    def test_only_flagged_runs_rewritten(self, monkeypatch):
+        text = _long_document()
+        p = self._pipeline()
+        seen: list[str] = []
+        real_run = Pipeline._run_pipeline
+
+        def spy(self, txt, lang, *, intensity_factor=1.0):
+            seen.append(txt)
+            return real_run(self, txt, lang, intensity_factor=intensity_factor)
+
+        monkeypatch.setattr(Pipeline, "_run_pipeline", spy)
+        result = p._incremental_loop_pass(p, text, "en")
+        assert result is not None
+        assert result.changes[0]["type"] == "incremental_loop"
+        assert seen and all(len(s) < len(text) / 3 for s in seen)
+        # Paragraphs without flagged sentences are untouched
+        first_para = text.split("\n\n")[0]
+        assert result.text.startswith(first_para)
+        assert result.text.count("\n\n") == text.count("\n\n")
+
+    def test_short_text_uses_full_pass(self):
+        p = self._pipeline()
+        assert p._incremental_loop_pass(p, _AI, "en") is None
+
+    def test_constraint_disables_incremental_pass(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("incremental pass used")
+
+        monkeypatch.setattr(Pipeline, "_incremental_loop_pass", fail)
+        opts = HumanizeOptions(
+            lang="en", seed=3, intensity=60,
+            constraints={"incremental_loop": False, "max_detection_loops": 1},
+        )
+        result = Pipeline(opts).run(_AI, "en")
+        assert "incremental_loop" not in {c["type"] for c in result.changes}
+
+
+class TestParagraphSafeStages:
+    def test_repetitions_keep_paragraphs(self):
+        text = (
+            "The report covers the report findings. The report is long.\n\n"
+            "The report ends here. The report was read."
+        )
+        out = RepetitionReducer(lang="en", intensity=100, seed=1).process(text)
+        assert out != text
+        assert out.count("\n\n") == 1
+
+    def test_validator_skips_unchanged_paragraphs(self, monkeypatch):
+        sv = SentenceValidator(lang="en")
+        calls: list[str] = []
+        real = sv._check_sentence
+        monkeypatch.setattr(sv, "_check_sentence", lambda a, b: calls.append(a) or real(a, b))
+        before = "Same text here. Nothing changed.\n\nOld sentence one. Old two."
+        after = "Same text here. Nothing changed.\n\nNew sentence one. Old two."
+        sv.validate(before, after)
+        assert calls == ["New sentence one.", "Old two."]
+        assert sv.last_result.sentences_checked == 4
@@ -103,3 +103,51 @@ class TestSentenceSplitter:
         s = SentenceSplitter(lang="en")
         result = s.split_spans("Hello. Bye.")
         assert len(result) >= 2
+
+
+class TestParagraphCache:
+    """Разбор по абзацам с кэшем совпадает с разбором всего текста."""
+
+    @staticmethod
+    def _whole(text: str, lang: str) -> list[tuple[str, int, int]]:
+        """Эталон: один проход по всему тексту, без групп абзацев."""
+        breaks = SentenceSplitter(lang=lang)._scan_breaks(text)
+        bounds = zip([0, *breaks], [*breaks, len(text)])
+        return [(text[a:b].strip(), a, b) for a, b in bounds if text[a:b].strip()]
+
+    def test_matches_whole_text_scan(self):
+        text = (
+            "B.Dr. went home.\n\n"
+            "Он сказал «Привет.\n\nКак дела?» и ушёл. Ok (see\n\nit.) Fine.\n\n"
+            'She said "Stop.\n\nNow." Then 5.\n\nthe end... Done!\n\n'
+            "Version 3.5\n\nM. Smith left. Last one"
+        )
+        for lang in ("en", "ru", "de"):
+            s = SentenceSplitter(lang=lang)
+            got = [(sp.text, sp.start, sp.end) for sp in s.split_spans(text)]
+            assert got == self._whole(text, lang)
+
+    def test_edit_reuses_other_paragraphs(self):
+        from texthumanize.cache import all_cache_stats
+
+        paras = [
+            f"Paragraph {i} starts here. It has Dr. Smith in it. It ends now, "
+            "after a while."
+            for i in range(6)
+        ]
+        s = SentenceSplitter(lang="en")
+        s.split_spans("\n\n".join(paras))
+        before = all_cache_stats()["sentence_split.paragraph"]["hits"]
+        paras[3] = "Paragraph 3 was edited. Only this one changed. Really."
+        s.split_spans("\n\n".join(paras))
+        assert all_cache_stats()["sentence_split.paragraph"]["hits"] >= before + 5
+
+    def test_protected_zone_lookup(self):
+        s = SentenceSplitter(lang="en")
+        text = 'He paid 3.14 (approx. "ok." fine) today.'
+        zones = s._build_protected_zones(text)
+        assert zones == sorted(zones)
+        assert all(a[1] < b[0] for a, b in zip(zones, zones[1:]))
+        for pos in range(len(text)):
+            brute = any(a <= pos < b for a, b in zones)
+            assert s._in_protected(pos, zones) is brute
@@ -0,0 +1,98 @@
+"""Tests for the warm data snapshot."""
+
+from __future__ import annotations
+
+import pytest
+
+from texthumanize import snapshot, word_embeddings, word_lm
+from texthumanize.snapshot import ENV_DIR, ENV_ENABLED, cached, clear, info, main
+
+
+@pytest.fixture
+def snap_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(ENV_DIR, str(tmp_path / "snap"))
+    return tmp_path / "snap"
+
+
+def _counting_builder(value):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return value
+
+    return build, calls
+
+
+class TestCached:
+    def test_built_once_then_loaded(self, snap_dir, tmp_path):
+        source = tmp_path / "data.txt"
+        source.write_text("v1")
+        build, calls = _counting_builder({"a": [1, 2], "b": frozenset("xy")})
+        assert cached("t", build, [str(source)]) == {"a": [1, 2], "b": frozenset("xy")}
+        assert cached("t", build, [str(source)]) == {"a": [1, 2], "b": frozenset("xy")}
+        assert len(calls) == 1
+        assert [e["file"] for e in info()] == ["t.snapshot"]
+
+        snapshot._file_hashes.clear()  # new process after an upgrade
+        source.write_text("v2")
+        cached("t", build, [str(source)])
+        assert len(calls) == 2
+
+    def test_corrupt_disabled_and_unwritable(self, snap_dir, tmp_path, monkeypatch):
+        build, calls = _counting_builder([1])
+        cached("t", build)
+        (snap_dir / "t.snapshot").write_bytes(b"{garbage")
+        assert cached("t", build) == [1] and len(calls) == 2
+        assert cached("t", build) == [1] and len(calls) == 2  # rewritten
+
+        monkeypatch.setenv(ENV_ENABLED, "0")
+        cached("t", build)
+        assert len(calls) == 3
+
+        monkeypatch.delenv(ENV_ENABLED)
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv(ENV_DIR, str(blocker / "sub"))
+        assert cached("t", build) == [1]  # cannot write: still works
+
+    def test_word_lm_tables_round_trip(self, snap_dir, monkeypatch):
+        text = "The quick brown fox jumps over the lazy dog near the river bank."
+        monkeypatch.setattr(word_lm, "_tables", {})
+        cold = word_lm.WordLanguageModel("en").perplexity(text)
+        monkeypatch.setattr(word_lm, "_tables", {})
+        warm = word_lm.WordLanguageModel("en")
+        assert warm.perplexity(text) == cold
+        assert (snap_dir / "word_lm-en.snapshot").exists()
+
+
+class TestCLI:
+    def test_build_info_clear(self, snap_dir, capsys, monkeypatch):
+        monkeypatch.setattr(word_lm, "_tables", {})
+        monkeypatch.setattr(word_embeddings, "_CLUSTER_EMBEDDINGS", None)
+        assert main(["build", "--only", "embeddings,word_lm"]) == 0
+        assert "embeddings.snapshot" in capsys.readouterr().out
+        assert len(info()) >= 2
+        with pytest.raises(SystemExit):
+            main(["build", "--only", "nope"])
+        assert main(["clear"]) == 0
+        assert info() == [] and clear() == 0
+
+    def test_default_directory_is_opt_in(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(ENV_DIR, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        build, calls = _counting_builder([1])
+        cached("t", build)
+        cached("t", build)
+        assert len(calls) == 2 and not snapshot.enabled()
+        assert not (tmp_path / "texthumanize").exists()
+
+        monkeypatch.setattr(word_lm, "_tables", {})
+        assert main(["build", "--only", "word_lm"]) == 0
+        assert snapshot.enabled() and info()
+        cached("t", build)
+        cached("t", build)
+        assert len(calls) == 3
+
+        assert main(["clear"]) == 0
+        assert not snapshot.enabled()
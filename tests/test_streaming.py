@@ -0,0 +1,117 @@
+"""Tests for the incremental humanize_stream / StreamHumanizer."""
+
+from __future__ import annotations
+
+import io
+import re
+
+import pytest
+
+from texthumanize import humanize, humanize_stream
+from texthumanize.exceptions import ConfigError
+from texthumanize.streaming import (
+    BoundarySmoother,
+    StreamHumanizer,
+    _iter_chunks,
+    _iter_paragraphs,
+)
+
+_PARAS = [
+    "Furthermore, it is important to note that the implementation is robust.",
+    "Additionally, the utilization of machine learning facilitates optimization.",
+    "Moreover, it is essential to consider the implications of these changes.",
+    "The results demonstrate a significant improvement in overall performance.",
+]
+_TEXT = "\n\n".join(_PARAS)
+
+
+class TestSegmentation:
+    @pytest.mark.parametrize("step", [1, 3, 7, 50])
+    def test_paragraphs_match_regex_split(self, step):
+        text = "a\n\n\nb\n \n c\n\nd \n"
+        pieces = [text[i:i + step] for i in range(0, len(text), step)]
+        got = [p for p, _ in _iter_paragraphs(pieces, 10**6)]
+        assert got == re.split(r"\n\s*\n", text)
+
+    def test_chunk_grouping(self):
+        chunks = list(_iter_chunks(_iter_paragraphs([_TEXT], 10**6), 100))
+        assert chunks == ["\n\n".join(_PARAS[:2]), "\n\n".join(_PARAS[2:])]
+
+    def test_long_paragraph_is_cut_at_line_break(self):
+        text = "\n".join(["line"] * 100)
+        parts = list(_iter_paragraphs([text], 50))
+        assert all(len(p) <= 50 for p, _ in parts)
+        assert "".join(p + sep for p, sep in parts) == text
+
+
+class TestStream:
+    def test_chunks_match_humanize(self):
+        out = list(humanize_stream(_TEXT, lang="en", seed=5, chunk_size=100))
+        assert [c["chunk_index"] for c in out] == [0, 1]
+        assert out[0]["chunk"] == humanize(out[0]["original_chunk"], lang="en", seed=5).text
+        assert out[-1]["is_last"] and out[-1]["progress"] == 1.0
+        assert all(c["total_chunks"] == 2 for c in out)
+
+    def test_file_and_iterable_sources(self):
+        expected = [c["original_chunk"] for c in humanize_stream(
+            _TEXT, lang="en", seed=1, chunk_size=100)]
+        from_file = list(humanize_stream(
+            io.StringIO(_TEXT), lang="en", seed=1, chunk_size=100))
+        from_bytes = list(humanize_stream(
+            io.BytesIO(_TEXT.encode()), lang="en", seed=1, chunk_size=100))
+        from_lines = list(humanize_stream(
+            io.StringIO(_TEXT).readlines(), lang="en", seed=1, chunk_size=100))
+        for out in (from_file, from_bytes, from_lines):
+            assert [c["original_chunk"] for c in out] == expected
+        # Unsized sources learn the total only at the end.
+        assert from_lines[0]["total_chunks"] is None
+        assert from_lines[0]["progress"] is None
+
+    def test_file_progress_counts_bytes(self, tmp_path):
+        text = "\n\n".join(["Это длинное предложение на русском языке."] * 6)
+        path = tmp_path / "ru.txt"
+        path.write_text(text, encoding="utf-8")
+        for mode, kw in (("r", {"encoding": "utf-8"}), ("rb", {})):
+            with open(path, mode, **kw) as f:
+                out = list(humanize_stream(f, lang="ru", seed=1, chunk_size=100))
+            done = len(out[0]["original_chunk"].encode("utf-8"))
+            assert out[0]["progress"] == pytest.approx(done / len(text.encode("utf-8")))
+            progress = [c["progress"] for c in out]
+            assert progress == sorted(progress) and progress[-1] == 1.0
+
+    def test_change_ratio_covers_smoothed_chunk(self):
+        from texthumanize.diff_engine import change_ratio
+
+        for c in humanize_stream(_TEXT, lang="en", seed=3, chunk_size=60):
+            assert c["change_ratio"] == round(
+                change_ratio(c["original_chunk"], c["chunk"]), 4)
+
+    def test_pool_preserves_order_and_output(self):
+        seq = list(humanize_stream(_TEXT, lang="en", seed=2, chunk_size=60))
+        par = list(humanize_stream(
+            _TEXT, lang="en", seed=2, chunk_size=60, max_workers=3,
+        ))
+        assert [c["chunk"] for c in seq] == [c["chunk"] for c in par]
+
+    def test_language_detected_once(self, monkeypatch):
+        import texthumanize.lang_detect as ld
+        calls = []
+        orig = ld.detect_language
+        monkeypatch.setattr(
+            ld, "detect_language", lambda t: calls.append(t) or orig(t),
+        )
+        out = list(humanize_stream(_TEXT, chunk_size=60))
+        assert len(calls) == 1
+        assert {c["lang"] for c in out} == {"en"}
+
+    def test_boundary_starter_varied(self):
+        seams = BoundarySmoother("en", seed=0)
+        seams.smooth("Intro. It works.")
+        assert seams.last_starter == "It"
+        assert not seams.smooth("It is fine.").startswith("It ")
+
+    def test_bad_config(self):
+        with pytest.raises(ConfigError):
+            StreamHumanizer(executor="gpu")
+        with pytest.raises(ConfigError):
+            StreamHumanizer(chunk_size=0)
@@ -461,6 +461,34 @@ class TestWordLanguageModel(unittest.TestCase):
             pp = lm.perplexity("some random text with enough words")
             self.assertIsInstance(pp, float)
 
+    def test_tables_match_interpolation(self):
+        import math
+
+        from texthumanize.word_lm import WordLanguageModel, _tokenize
+        for lang in ("en", "de", "ar"):
+            lm = WordLanguageModel(lang=lang)
+            tokens = _tokenize("the of and new house zzqx the the")
+            log_sum = sum(
+                math.log(max(lm._p_interp(a, b), 1e-20))
+                for a, b in zip(tokens, tokens[1:])
+            )
+            expected = math.exp(-log_sum / (len(tokens) - 1))
+            self.assertAlmostEqual(lm._tables.perplexity(tokens), expected, places=9)
+
+    def test_perplexities_batch(self):
+        from texthumanize.word_lm import WordLanguageModel
+        lm = WordLanguageModel(lang="en")
+        sents = ["The cat sat on the mat.", "Hi", "The cat sat on the mat."]
+        self.assertEqual(
+            lm.perplexities(sents), [lm.perplexity(s) for s in sents],
+        )
+
+    def test_shared_model_and_tables(self):
+        from texthumanize.word_lm import WordLanguageModel, get_word_lm
+        self.assertIs(get_word_lm("ru"), get_word_lm("ru"))
+        self.assertIs(WordLanguageModel("ru")._tables, get_word_lm("ru")._tables)
+        self.assertEqual(WordLanguageModel("xx").lang, "en")
+
 
 # ═══════════════════════════════════════════════════════════════
 #  CollocEngine
@@ -0,0 +1,138 @@
+"""Tests for the shared-prefix variant engine and SharedContext."""
+
+from __future__ import annotations
+
+import pickle
+import threading
+
+import pytest
+
+from texthumanize import humanize, humanize_variants, spin_variants
+from texthumanize.exceptions import ConfigError, InputTooLargeError
+from texthumanize.pipeline import Pipeline, SharedContext
+from texthumanize.spinner import ContentSpinner
+from texthumanize.variant_engine import SEED_STEP, VariantEngine
+
+_AI_TEXT = (
+    "Furthermore, it is important to note that the implementation of "
+    "artificial intelligence constitutes a significant paradigm shift. "
+    "Additionally, the utilization of machine learning facilitates "
+    "comprehensive optimization of various processes."
+)
+
+
+class TestSharedContext:
+    def test_memo_builds_once(self):
+        ctx = SharedContext()
+        calls = []
+        for _ in range(3):
+            assert ctx.memo(("k",), lambda: calls.append(1) or 42) == 42
+        assert calls == [1]
+
+    def test_memo_concurrent_requests_coalesce(self):
+        ctx = SharedContext()
+        calls = []
+        gate = threading.Event()
+
+        def build():
+            calls.append(1)
+            gate.wait(1.0)
+            return "v"
+
+        threads = [
+            threading.Thread(target=ctx.memo, args=(("k",), build))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        gate.set()
+        for t in threads:
+            t.join()
+        assert calls == [1]
+
+    def test_memo_failure_not_cached(self):
+        ctx = SharedContext()
+
+        def boom():
+            raise ValueError("x")
+
+        with pytest.raises(ValueError):
+            ctx.memo(("k",), boom)
+        assert ctx.memo(("k",), lambda: 1) == 1
+
+    def test_pickle_keeps_completed_entries(self):
+        ctx = SharedContext()
+        ctx.memo(("k",), lambda: [1, 2])
+        clone = pickle.loads(pickle.dumps(ctx))
+        assert clone.memo(("k",), lambda: None) == [1, 2]
+
+
+class TestVariantEngine:
+    def test_variants_match_single_humanize(self):
+        results = humanize_variants(_AI_TEXT, lang="en", variants=2, seed=10)
+        for r in results:
+            single = humanize(_AI_TEXT, lang="en", seed=r["seed_used"])
+            assert r["text"] == single.text
+
+    def test_seeds_use_prime_step(self):
+        results = humanize_variants(_AI_TEXT, lang="en", variants=2, seed=5)
+        assert sorted(r["seed_used"] for r in results) == [5, 5 + SEED_STEP]
+
+    def test_first_k_stops_early(self):
+        results = humanize_variants(
+            _AI_TEXT, lang="en", variants=4, seed=1,
+            target_score=1.0, first_k=1,
+        )
+        assert len(results) == 1
+        assert results[0]["variant_id"] == 1
+
+    def test_thread_pool_order_independent(self):
+        seq = humanize_variants(_AI_TEXT, lang="en", variants=2, seed=3)
+        par = humanize_variants(
+            _AI_TEXT, lang="en", variants=2, seed=3, max_workers=2,
+        )
+        assert [r["text"] for r in seq] == [r["text"] for r in par]
+
+    def test_first_k_requires_target(self):
+        with pytest.raises(ConfigError):
+            VariantEngine(lang="en").generate(_AI_TEXT, first_k=1)
+
+    def test_input_contract_matches_humanize(self, monkeypatch):
+        with pytest.raises(ConfigError, match="Expected str"):
+            humanize_variants(None)  # type: ignore[arg-type]
+        with pytest.raises(InputTooLargeError):
+            humanize_variants("a" * 1_000_001, lang="en")
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("blank input must not be processed")
+
+        monkeypatch.setattr(Pipeline, "prime", _fail)
+        out = VariantEngine(lang="en").generate("  \n ", variants=2, seed=1)
+        assert [r["text"] for r in out] == ["  \n ", "  \n "]
+        assert {r["ai_score"] for r in out} == {0.0}
+        assert [r["seed_used"] for r in out] == [1, 1 + SEED_STEP]
+
+    def test_bad_executor(self):
+        with pytest.raises(ConfigError):
+            VariantEngine(executor="gpu")
+
+
+class TestSpinVariants:
+    def test_compiled_template_matches_resolver(self):
+        spintax = "We {use|apply} good {tools|kits} daily."
+        a = ContentSpinner(lang="en", seed=7)
+        b = ContentSpinner(lang="en", seed=7)
+        template = a._compile_spintax(spintax)
+        rendered = "".join(
+            p if isinstance(p, str) else a.rng.choice(p) for p in template
+        )
+        assert rendered == b.resolve_spintax(spintax)
+
+    def test_nested_spintax_not_compiled(self):
+        assert ContentSpinner._compile_spintax("{{a|b}} c") is None
+
+    def test_seeded_spin_variants_reproducible(self):
+        text = "We use good tools to improve the important results."
+        a = spin_variants(text, count=3, lang="en", seed=11)
+        b = spin_variants(text, count=3, lang="en", seed=11)
+        assert a == b
@@ -0,0 +1,71 @@
+"""Tests for the pre-fork warmup and packed model weights."""
+
+from __future__ import annotations
+
+import gc
+import os
+
+import pytest
+
+import texthumanize
+from texthumanize import api, neural_lm
+from texthumanize.exceptions import ConfigError
+from texthumanize.neural_engine import build_mlp
+from texthumanize.warmup import COMPONENTS, warmup
+
+
+def _param_count(config: dict) -> int:
+    return sum(
+        len(layer["weights"]) * len(layer["weights"][0]) + len(layer["bias"])
+        for layer in config["layers"]
+    )
+
+
+class TestPack:
+    def test_mlp_outputs_and_config_unchanged(self):
+        net = build_mlp([6, 8, 2], seed=7)
+        x = [0.1, -0.4, 0.3, 0.9, -0.2, 0.05]
+        before, config = net.forward(x), net.to_config()
+        net.pack()
+        assert net.forward(x) == before
+        packed = net.to_config()  # float32-rounded with NumPy
+        assert packed["layers"][0]["weights"][0] == pytest.approx(config["layers"][0]["weights"][0])
+        assert _param_count(packed) == _param_count(config)
+        assert net.layers[0].in_features == 6 and net.param_count == _param_count(config)
+
+    def test_lstm_lm_perplexity_unchanged(self):
+        lm = neural_lm.NeuralPerplexity()
+        text = "The committee reviewed the proposal and approved it."
+        before = lm.perplexity(text)
+        lm.pack()
+        assert lm.perplexity(text) == before
+        assert not isinstance(lm._lstm.wf[0], list)
+
+
+class TestWarmup:
+    def test_loads_components_and_freezes(self):
+        report = texthumanize.warmup(langs=["en"], components=["lang", "detector", "hmm"])
+        try:
+            assert set(report.seconds) == {"lang", "detector", "hmm"}
+            assert report.frozen > 0 and gc.get_freeze_count() > 0
+            assert gc.isenabled()
+        finally:
+            gc.unfreeze()
+
+    def test_optional_and_unknown_components(self):
+        report = warmup(components=["transformer"], freeze=False)
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            assert "transformer" in report.skipped
+        else:
+            assert "transformer" in report.seconds
+        assert report.frozen == 0
+        with pytest.raises(ConfigError, match="nope"):
+            warmup(components=["lang", "nope"])
+        assert "synonyms" in COMPONENTS
+
+    def test_prefork_server_needs_fork(self, monkeypatch):
+        monkeypatch.delattr(os, "fork", raising=False)
+        with pytest.raises(ConfigError, match="fork"):
+            api.run_server(port=0, workers=2)
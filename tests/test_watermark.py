@@ -93,3 +93,36 @@ class TestModuleFunctions:
         report = detect_watermarks(text, lang="en")
         assert report.has_watermarks
         assert len(report.watermark_types) >= 1
+
+
+class TestSingleScan:
+    """Один проход по символам даёт те же отчёты, что и раздельные проверки."""
+
+    def test_combined_markers_positions(self):
+        text = "Te​st аnd⁦ “q” ａ"
+        report = WatermarkDetector(lang="en").detect(text)
+        assert report.watermark_types[:3] == [
+            "zero_width_characters", "homoglyph_substitution", "invisible_unicode",
+        ]
+        # Positions refer to the text without zero-width characters.
+        assert report.homoglyphs_found == [("а", "a", 5), ("ａ", "a", 14)]
+        assert report.cleaned_text == 'Test and "q" a'
+        assert report.characters_removed == 1 + 2 + 1
+
+    def test_latin_lookalike_in_cyrillic_text(self):
+        report = WatermarkDetector(lang="ru").detect("Пpивет мир")
+        assert report.homoglyphs_found == [("p", "р", 1)]
+        assert report.cleaned_text == "Привет мир"
+
+    def test_kirchenbauer_counts_each_bigram(self):
+        import math
+
+        from texthumanize.watermark import _green
+
+        words = ("alpha beta gamma delta " * 20).split()
+        report = WatermarkReport()
+        WatermarkDetector()._detect_kirchenbauer(" ".join(words), report)
+        green = sum(_green(a, b, 0.25) for a, b in zip(words, words[1:]))
+        total = len(words) - 1
+        z = (green - 0.25 * total) / math.sqrt(0.25 * 0.75 * total)
+        assert report.kirchenbauer_score == round(z, 3)
@@ -40,11 +40,6 @@ import sys as _sys
 import types as _types
 from typing import Any
 
-try:
-    from importlib.metadata import version as _meta_version
-    __version__ = _meta_version("texthumanize")
-except Exception:
-    __version__ = "0.27.1"
 __author__ = "TextHumanize Contributors"
 __license__ = "Personal Use Only"
 
@@ -79,6 +74,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "detect_ai": ("texthumanize.core", "detect_ai"),
     "detect_ai_fast": ("texthumanize.core", "detect_ai_fast"),
     "detect_ai_batch": ("texthumanize.core", "detect_ai_batch"),
+    "iter_detect_ai_batch": ("texthumanize.batch_detect", "iter_detect_ai_batch"),
     "detect_ai_sentences": ("texthumanize.core", "detect_ai_sentences"),
     "detect_ai_mixed": ("texthumanize.core", "detect_ai_mixed"),
     "build_author_profile": ("texthumanize.core", "build_author_profile"),
@@ -104,6 +100,13 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "DetectionMetrics": ("texthumanize.utils", "DetectionMetrics"),
     # pipeline.py
     "Pipeline": ("texthumanize.pipeline", "Pipeline"),
+    # budget.py
+    "ComputeBudget": ("texthumanize.budget", "ComputeBudget"),
+    "BudgetScheduler": ("texthumanize.budget", "BudgetScheduler"),
+    # cache.py
+    "MemoCache": ("texthumanize.cache", "MemoCache"),
+    "all_cache_stats": ("texthumanize.cache", "all_cache_stats"),
+    "clear_all_caches": ("texthumanize.cache", "clear_all"),
     # async_api.py
     "async_humanize": ("texthumanize.async_api", "async_humanize"),
     "async_detect_ai": ("texthumanize.async_api", "async_detect_ai"),
@@ -170,6 +173,8 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "WordLanguageModel": ("texthumanize.word_lm", "WordLanguageModel"),
     "word_perplexity": ("texthumanize.word_lm", "word_perplexity"),
     "word_naturalness": ("texthumanize.word_lm", "word_naturalness"),
+    # warmup.py
+    "warmup": ("texthumanize.warmup", "warmup"),
     # neural_engine.py
     "FeedForwardNet": ("texthumanize.neural_engine", "FeedForwardNet"),
     "LSTMCell": ("texthumanize.neural_engine", "LSTMCell"),
@@ -276,8 +281,21 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
 }
 
 
+def _resolve_version() -> str:
+    # importlib.metadata costs more to import than the whole package,
+    # so ``__version__`` is resolved on first access.
+    try:
+        from importlib.metadata import version as _meta_version
+        return _meta_version("texthumanize")
+    except Exception:
+        return "0.27.1"
+
+
 def __getattr__(name: str) -> Any:
     """PEP 562: lazy-load heavy modules on first attribute access."""
+    if name == "__version__":
+        val = globals()["__version__"] = _resolve_version()
+        return val
     if name in _LAZY_IMPORTS:
         module_path, attr = _LAZY_IMPORTS[name]
         import importlib
@@ -327,10 +345,11 @@ _sys.modules[__name__].__class__ = _LazyModule
 
 def __dir__() -> list[str]:
     """Include lazy-loaded names in dir() output."""
-    return list(set(globals().keys()) | set(_LAZY_IMPORTS.keys()))
+    return list(set(globals().keys()) | set(_LAZY_IMPORTS.keys()) | {"__version__"})
 
 __all__ = [
     "HMM",
+    "MemoCache",
     "STYLE_PRESETS",
     "ASH_PRESETS",
     "ASHEngine",
@@ -347,10 +366,12 @@ __all__ = [
     "BenchmarkReport",
     "BenchmarkResult",
     "BenchmarkSuite",
+    "BudgetScheduler",
     "CJKSegmenter",
     "CognitiveModeler",
     "CognitiveResult",
     "CollocEngine",
+    "ComputeBudget",
     "ConfigError",
     "ContentHealthReport",
     "DetectionError",
@@ -407,6 +428,7 @@ __all__ = [
     "adjust_tone",
     "adversarial_calibrate",
     "adversarial_humanize",
+    "all_cache_stats",
     "analyze",
     "analyze_coherence",
     "analyze_tone",
@@ -425,6 +447,7 @@ __all__ = [
     "check_grammar",
     "check_originality",
     "clean_watermarks",
+    "clear_all_caches",
     "collocation_score",
     "compare_fingerprint",
     "compare_originality",
@@ -461,6 +484,7 @@ __all__ = [
     "humanize_variants",
     "import_markers_from_json",
     "is_cjk_text",
+    "iter_detect_ai_batch",
     "list_ash_presets",
     "load_ai_markers",
     "load_all_markers",
@@ -485,6 +509,7 @@ __all__ = [
     "transfer_signature",
     "uniqueness_score",
     "update_markers",
+    "warmup",
     "word_naturalness",
     "word_perplexity",
     # PHANTOM™
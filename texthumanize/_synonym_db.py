@@ -34,6 +34,20 @@ _DATA_DIR = Path(__file__).parent / "_data"
 _COMPRESSED_FILE = _DATA_DIR / "synonyms.json.gz"
 
 
+def _snapshot_sources() -> list[str]:
+    """Files the ranked database is derived from (snapshot key)."""
+    here = Path(__file__).parent
+    return [str(p) for p in (
+        Path(__file__),
+        _COMPRESSED_FILE,
+        _DATA_DIR / "word_freq.json.gz",
+        here / "_curated_synonyms.py",
+        here / "_massive_synonyms.py",
+        here / "_wikt_synonyms.py",
+        here / "_word_freq_data.py",
+    )]
+
+
 class SynonymDB:
     """Unified synonym database with lazy loading and frequency filtering.
 
@@ -52,13 +66,23 @@ class SynonymDB:
 
     def __init__(self) -> None:
         if not self._loaded:
-            self._data: dict[str, dict[str, list[str]]] = {"en": {}, "ru": {}, "uk": {}}
-            self._freq: dict[str, dict[str, float]] = {}
-            self._load()
-            self._load_frequencies()
-            self._filter_and_rank_all()
+            from texthumanize.snapshot import cached
+
+            self._data: dict[str, dict[str, list[str]]] = cached(
+                "synonyms", self._build, sources=_snapshot_sources(),
+            )
             SynonymDB._loaded = True
 
+    def _build(self) -> dict[str, dict[str, list[str]]]:
+        """Load, merge, filter and rank all sources (seconds of work)."""
+        self._data = {"en": {}, "ru": {}, "uk": {}}
+        self._freq: dict[str, dict[str, float]] = {}
+        self._load()
+        self._load_frequencies()
+        self._filter_and_rank_all()
+        del self._freq
+        return self._data
+
     def _load(self) -> None:
         """Load synonym data — prefers compressed archive, falls back to .py."""
         if _COMPRESSED_FILE.exists():
@@ -30,10 +30,13 @@ import logging
 import random
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from texthumanize.sentence_split import split_sentences
 
+if TYPE_CHECKING:
+    from texthumanize.budget import ComputeBudget
+
 logger = logging.getLogger(__name__)
 
 
@@ -235,6 +238,8 @@ class AdversarialPlay:
         intensity: float = 0.5,
         max_rounds: int = 4,
         target_score: float = 0.35,
+        *,
+        compute_budget: ComputeBudget | None = None,
     ) -> PlayResult:
         """Run adversarial self-play iterations.
 
@@ -248,6 +253,9 @@ class AdversarialPlay:
             Max iteration rounds (default 4).
         target_score : float
             Stop if combined AI score ≤ this.
+        compute_budget : ComputeBudget, optional
+            Shared compute allowance; document-level scoring is charged
+            as detector calls and rounds stop once one no longer fits.
 
         Returns
         -------
@@ -256,12 +264,28 @@ class AdversarialPlay:
         if not text or not text.strip():
             return PlayResult(text=text, original_text=text)
 
+        # Document scores by text: the score of the accepted text is
+        # reused as the next round's "before" and as the final score.
+        scores: dict[str, float] = {}
+
+        def _score(t: str) -> float:
+            if t not in scores:
+                if compute_budget is not None:
+                    compute_budget.charge("detector_calls")
+                scores[t] = self._detect_score(t)
+            return scores[t]
+
         current = text
         history: list[dict[str, Any]] = []
-        initial_score = self._detect_score(current)
+        initial_score = _score(current)
         total_modified = 0
 
         for rnd in range(1, max_rounds + 1):
+            if compute_budget is not None and not compute_budget.can_afford(
+                detector_calls=1,
+            ):
+                logger.info("Round %d: compute budget spent, stopping.", rnd)
+                break
             escalated = min(1.0, intensity + 0.1 * (rnd - 1))
 
             # Build problem map (adaptive: uses initial score)
@@ -276,8 +300,8 @@ class AdversarialPlay:
             modified, n_fixed = self._apply_fixes(current, problem_map, escalated)
 
             # Score after
-            new_score = self._detect_score(modified)
-            prev_score = self._detect_score(current)
+            new_score = _score(modified)
+            prev_score = _score(current)
 
             round_info = {
                 "round": rnd,
@@ -308,7 +332,7 @@ class AdversarialPlay:
                 logger.info("Target score reached (%.3f ≤ %.3f)", new_score, target_score)
                 break
 
-        final_score = self._detect_score(current)
+        final_score = _score(current)
 
         return PlayResult(
             text=current,
@@ -29,20 +29,45 @@ Usage:
         lang="en",
         style="casual",
     )
+
+HTTP providers share one keep-alive connection pool
+(:mod:`texthumanize.llm_transport`). Replies of external backends are
+cached by (provider, model, prompt hash), and identical requests in
+flight at the same time are sent once. :func:`fan_out` runs several
+backend calls concurrently. :mod:`texthumanize.llm_mock_server` is a
+local OpenAI-/Ollama-compatible server for offline testing.
+
+For long documents :meth:`AIBackend.rewrite_flagged` sends only the
+sentences flagged by per-sentence detection, in size-bounded batches.
 """
 
 from __future__ import annotations
 
-import json
+import functools
+import hashlib
 import logging
+import re
 import threading
 import time
-import urllib.error
-import urllib.request
-from typing import Any
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from texthumanize.cache import memo_cache
+from texthumanize.exceptions import AIBackendUnavailableError
+from texthumanize.llm_transport import HTTPStatusError, HTTPTransport, get_transport
+
+if TYPE_CHECKING:
+    from texthumanize.sentence_graph import SentenceGraph
 
 logger = logging.getLogger(__name__)
 
+# Replies of external backends, keyed by (provider, model, prompt hash)
+_RESPONSES = memo_cache("ai_backend.responses", max_entries=4096)
+_inflight: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
 # ───────────────────────────────────────────────────────
 #  Prompt templates
 # ───────────────────────────────────────────────────────
@@ -69,6 +94,17 @@ _PROMPT_NATURALNESS = (
     "Only output the improved text."
 )
 
+_PROMPT_SPANS = (
+    "Rewrite each numbered passage below to sound natural "
+    "and human-written in {lang}, preserving its meaning. "
+    "Answer with the same numbers in the same order, one "
+    "passage per line, formatted as [n] rewritten passage. "
+    "Do not add explanations."
+)
+
+# "[n] text" lines of a batched span reply
+_SPAN_LINE_RE = re.compile(r'^\s*\[(\d+)\]\s*(.*)$')
+
 # ───────────────────────────────────────────────────────
 #  Priority order for backend fallback
 # ───────────────────────────────────────────────────────
@@ -80,7 +116,7 @@ _FALLBACK_ORDER = ("openai", "ollama", "oss", "builtin")
 # ═══════════════════════════════════════════════════════
 
 class _OpenAIProvider:
-    """Calls OpenAI Chat Completions API via urllib."""
+    """Calls OpenAI Chat Completions API over the shared transport."""
 
     _API_URL = (
         "https://api.openai.com/v1/chat/completions"
@@ -92,11 +128,21 @@ class _OpenAIProvider:
         model: str = "gpt-4o-mini",
         temperature: float = 0.7,
         timeout: float = 30.0,
+        *,
+        api_url: str | None = None,
+        transport: HTTPTransport | None = None,
     ) -> None:
         self._api_key = api_key
         self._model = model
         self._temperature = temperature
         self._timeout = timeout
+        self._url = api_url or self._API_URL
+        self._transport = transport or get_transport()
+
+    @property
+    def cache_id(self) -> tuple:
+        """Identity of the endpoint/model for the response cache."""
+        return ("openai", self._url, self._model, self._temperature)
 
     # ── public ──────────────────────────────────────
 
@@ -125,34 +171,18 @@ class _OpenAIProvider:
                 {"role": "user", "content": user_text},
             ],
         }
-        body = json.dumps(payload).encode("utf-8")
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._api_key}",
-        }
-        req = urllib.request.Request(
-            self._API_URL,
-            data=body,
-            headers=headers,
-            method="POST",
-        )
+        headers = {"Authorization": f"Bearer {self._api_key}"}
         try:
-            with urllib.request.urlopen(
-                req, timeout=self._timeout
-            ) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:
-            detail = ""
-            try:
-                detail = exc.read().decode("utf-8", "replace")
-            except Exception:
-                pass
+            data = self._transport.post_json(
+                self._url, payload, headers, timeout=self._timeout,
+            )
+        except HTTPStatusError as exc:
             raise RuntimeError(
-                f"OpenAI API HTTP {exc.code}: {detail}"
+                f"OpenAI API HTTP {exc.code}: {exc.body}"
             ) from exc
-        except urllib.error.URLError as exc:
+        except AIBackendUnavailableError as exc:
             raise RuntimeError(
-                f"OpenAI API connection error: {exc.reason}"
+                f"OpenAI API connection error: {exc}"
             ) from exc
         except Exception as exc:
             raise RuntimeError(
@@ -191,13 +221,21 @@ class _OllamaProvider:
         url: str | None = None,
         timeout: float = 120.0,
         temperature: float = 0.7,
+        *,
+        transport: HTTPTransport | None = None,
     ) -> None:
         self._model = model
         self._base_url = (url or self._DEFAULT_URL).rstrip("/")
         self._timeout = timeout
         self._temperature = temperature
+        self._transport = transport or get_transport()
         self._available: bool | None = None  # lazy ping
 
+    @property
+    def cache_id(self) -> tuple:
+        """Identity of the endpoint/model for the response cache."""
+        return ("ollama", self._base_url, self._model, self._temperature)
+
     # ── availability check ─────────────────────────
 
     @property
@@ -206,12 +244,10 @@ class _OllamaProvider:
         if self._available is not None:
             return self._available
         try:
-            req = urllib.request.Request(
-                f"{self._base_url}/api/tags",
-                method="GET",
+            status, _ = self._transport.request(
+                "GET", f"{self._base_url}/api/tags", timeout=5.0,
             )
-            with urllib.request.urlopen(req, timeout=5.0) as resp:
-                self._available = resp.status == 200
+            self._available = status == 200
         except Exception:
             self._available = False
         return self._available
@@ -258,30 +294,19 @@ class _OllamaProvider:
                 "temperature": self._temperature,
             },
         }
-        body = json.dumps(payload).encode("utf-8")
-        headers = {"Content-Type": "application/json"}
-        req = urllib.request.Request(
-            url, data=body, headers=headers, method="POST",
-        )
         try:
-            with urllib.request.urlopen(
-                req, timeout=self._timeout
-            ) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:
-            detail = ""
-            try:
-                detail = exc.read().decode("utf-8", "replace")
-            except Exception:
-                pass
+            data = self._transport.post_json(
+                url, payload, timeout=self._timeout,
+            )
+        except HTTPStatusError as exc:
             self._available = None  # re-check next time
             raise RuntimeError(
-                f"Ollama API HTTP {exc.code}: {detail}"
+                f"Ollama API HTTP {exc.code}: {exc.body}"
             ) from exc
-        except urllib.error.URLError as exc:
+        except AIBackendUnavailableError as exc:
             self._available = None
             raise RuntimeError(
-                f"Ollama connection error: {exc.reason}"
+                f"Ollama connection error: {exc}"
             ) from exc
         except Exception as exc:
             self._available = None
@@ -328,6 +353,7 @@ class _OSSProvider:
         timeout: float = 90.0,
         *,
         api_url: str | None = None,
+        transport: HTTPTransport | None = None,
     ) -> None:
         base = api_url or self._DEFAULT_BASE
         # Strip trailing /api/predict or /api/chat if user passed full URL
@@ -337,11 +363,17 @@ class _OSSProvider:
         self._base_url = base
         self._rate_limit = rate_limit
         self._timeout = timeout
+        self._transport = transport or get_transport()
         self._lock = threading.Lock()
         self._last_request_ts: float = 0.0
         self._consecutive_failures: int = 0
         self._circuit_open_ts: float = 0.0
 
+    @property
+    def cache_id(self) -> tuple:
+        """Identity of the endpoint for the response cache."""
+        return ("oss", self._base_url)
+
     # ── circuit breaker ────────────────────────────
 
     @property
@@ -450,23 +482,10 @@ class _OSSProvider:
             for attempt in range(
                 1, self._MAX_RETRIES + 1
             ):
-                body = json.dumps(payload).encode("utf-8")
-                headers = {
-                    "Content-Type": "application/json",
-                }
-                req = urllib.request.Request(
-                    url,
-                    data=body,
-                    headers=headers,
-                    method="POST",
-                )
                 try:
-                    with urllib.request.urlopen(
-                        req, timeout=self._timeout
-                    ) as resp:
-                        data = json.loads(
-                            resp.read().decode("utf-8")
-                        )
+                    data = self._transport.post_json(
+                        url, payload, timeout=self._timeout,
+                    )
                     # Parse response — try multiple formats
                     result = self._extract_text(data)
                     if result:
@@ -479,7 +498,7 @@ class _OSSProvider:
                         )
                         return result
                     raise ValueError("empty response")
-                except urllib.error.HTTPError as exc:
+                except HTTPStatusError as exc:
                     last_err = exc
                     code = exc.code
                     if code == 404:
@@ -493,7 +512,7 @@ class _OSSProvider:
                         continue
                     if attempt >= self._MAX_RETRIES:
                         break
-                except urllib.error.URLError as exc:
+                except AIBackendUnavailableError as exc:
                     last_err = exc
                     if attempt < self._MAX_RETRIES:
                         time.sleep(2.0 * attempt)
@@ -608,6 +627,131 @@ class _BuiltinProvider:
         )
         return result.text
 
+# ═══════════════════════════════════════════════════════
+#  Response cache and concurrent calls
+# ═══════════════════════════════════════════════════════
+
+def _cached_call(
+    provider: Any,
+    system_prompt: str,
+    user_text: str,
+) -> str:
+    """Provider call through the response cache.
+
+    Concurrent calls with the same key wait for the
+    first one instead of sending the prompt again.
+    Failures are not cached.
+    """
+    digest = hashlib.sha256(
+        f"{system_prompt}\0{user_text}".encode()
+    ).hexdigest()
+    key = (*provider.cache_id, digest)
+    hit = _RESPONSES.get(key)
+    if hit is not None:
+        return str(hit)
+    with _inflight_lock:
+        fut = _inflight.get(key)
+        owner = fut is None
+        if fut is None:
+            fut = _inflight[key] = Future()
+    if not owner:
+        return str(fut.result())
+    try:
+        result = str(provider.call(system_prompt, user_text))
+    except BaseException as exc:
+        fut.set_exception(exc)
+        raise
+    else:
+        _RESPONSES.put(key, result)
+        fut.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def fan_out(
+    calls: Sequence[Callable[[], Any]],
+    max_workers: int = 4,
+) -> list[Any]:
+    """Run backend calls concurrently.
+
+    Args:
+        calls: Zero-argument callables, e.g.
+            ``lambda: ai.paraphrase(text)``.
+        max_workers: Thread limit (the transport
+            bounds connections per host separately).
+
+    Returns:
+        One entry per call, in order: its result, or
+        the exception it raised.
+    """
+    if len(calls) <= 1 or max_workers <= 1:
+        out: list[Any] = []
+        for fn in calls:
+            try:
+                out.append(fn())
+            except Exception as exc:
+                out.append(exc)
+        return out
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(calls)),
+        thread_name_prefix="ai-backend",
+    ) as pool:
+        futures = [pool.submit(fn) for fn in calls]
+    return [
+        f.exception() if f.exception() is not None
+        else f.result()
+        for f in futures
+    ]
+
+
+@dataclass
+class SpanRewrite:
+    """Result of :meth:`AIBackend.rewrite_flagged`."""
+
+    text: str
+    sentences: int = 0  # sentences in the document
+    flagged: int = 0  # sentences selected for rewriting
+    spans: int = 0  # runs of neighbouring flagged sentences
+    batches: int = 0  # prompts sent to external backends
+    fallback_spans: int = 0  # spans rewritten by the built-in provider
+    chars_sent: int = 0  # span characters sent to external backends
+
+
+def _batch_spans(
+    spans: list[str], max_chars: int,
+) -> list[list[int]]:
+    """Group span indices into batches of at most ``max_chars``."""
+    batches: list[list[int]] = []
+    size = 0
+    for i, span in enumerate(spans):
+        if batches and size + len(span) <= max_chars:
+            batches[-1].append(i)
+            size += len(span)
+        else:
+            batches.append([i])
+            size = len(span)
+    return batches
+
+
+def _parse_spans(reply: str, count: int) -> list[str] | None:
+    """Split a numbered reply into ``count`` passages (None if malformed)."""
+    found: dict[int, list[str]] = {}
+    current: list[str] | None = None
+    for line in reply.splitlines():
+        m = _SPAN_LINE_RE.match(line)
+        if m:
+            current = found.setdefault(int(m.group(1)), [])
+            current.append(m.group(2))
+        elif current is not None and line.strip():
+            current.append(line.strip())
+    out = [" ".join(found.get(n, [])).strip() for n in range(1, count + 1)]
+    if len(found) != count or not all(out):
+        return None
+    return out
+
+
 # ═══════════════════════════════════════════════════════
 #  Main AIBackend facade
 # ═══════════════════════════════════════════════════════
@@ -638,6 +782,12 @@ class AIBackend:
             ``"openai"``, ``"ollama"``, ``"oss"``,
             ``"builtin"`` force a specific backend
             (with fallback).
+        openai_url: Chat Completions endpoint (for
+            OpenAI-compatible servers).
+        cache_responses: Reuse replies of external
+            backends for identical prompts.
+        transport: HTTP transport (default: the shared
+            process-wide pool).
     """
 
     _VALID_PREFER = (
@@ -655,6 +805,10 @@ class AIBackend:
         oss_rate_limit: float = 10.0,
         oss_api_url: str | None = None,
         prefer: str = "auto",
+        *,
+        openai_url: str | None = None,
+        cache_responses: bool = True,
+        transport: HTTPTransport | None = None,
     ) -> None:
         if prefer not in self._VALID_PREFER:
             raise ValueError(
@@ -663,6 +817,7 @@ class AIBackend:
             )
 
         self._prefer = prefer
+        self._cache_responses = cache_responses
         self._builtin = _BuiltinProvider()
 
         # OpenAI provider
@@ -671,6 +826,8 @@ class AIBackend:
             self._openai = _OpenAIProvider(
                 api_key=openai_api_key,
                 model=openai_model,
+                api_url=openai_url,
+                transport=transport,
             )
 
         # Ollama provider
@@ -679,6 +836,7 @@ class AIBackend:
             self._ollama = _OllamaProvider(
                 model=ollama_model,
                 url=ollama_url,
+                transport=transport,
             )
 
         # OSS provider
@@ -687,6 +845,7 @@ class AIBackend:
             self._oss = _OSSProvider(
                 rate_limit=oss_rate_limit,
                 api_url=oss_api_url,
+                transport=transport,
             )
 
         # Resolved active backend name (cached)
@@ -773,19 +932,21 @@ class AIBackend:
         Returns:
             Response text, or None on failure.
         """
+        provider: Any = {
+            "openai": self._openai,
+            "ollama": self._ollama,
+            "oss": self._oss,
+        }.get(backend)
+        if provider is None:
+            return None
         try:
-            if backend == "openai" and self._openai:
-                return self._openai.call(
-                    system_prompt, user_text
-                )
-            if backend == "ollama" and self._ollama:
-                return self._ollama.call(
-                    system_prompt, user_text
-                )
-            if backend == "oss" and self._oss:
-                return self._oss.call(
-                    system_prompt, user_text
+            if self._cache_responses:
+                return _cached_call(
+                    provider, system_prompt, user_text
                 )
+            return str(provider.call(
+                system_prompt, user_text
+            ))
         except RuntimeError:
             logger.debug(
                 "Backend %s failed, falling back",
@@ -929,3 +1090,115 @@ class AIBackend:
                 )
             ),
         )
+
+    def rewrite_flagged(
+        self,
+        text: str,
+        lang: str = "en",
+        *,
+        threshold: float = 0.65,
+        max_batch_chars: int = 2000,
+        max_workers: int = 4,
+        graph: SentenceGraph | None = None,
+    ) -> SpanRewrite:
+        """Rewrite only the sentences that read as AI-generated.
+
+        Sentences scoring at or above ``threshold`` (the
+        sliding-window score of ``detect_ai_sentences``)
+        are grouped into runs of neighbours inside a
+        paragraph. The runs are packed into numbered
+        prompts of at most ``max_batch_chars`` characters,
+        which are sent concurrently; the replies are
+        spliced back by span, so the rest of the text is
+        kept byte-for-byte. Spans whose batch fails (or
+        comes back malformed) are rewritten by the
+        built-in provider instead.
+
+        Args:
+            text: Text to rewrite.
+            lang: Language code.
+            threshold: Sentence AI probability to rewrite.
+            max_batch_chars: Span characters per prompt.
+            max_workers: Prompts in flight at once.
+            graph: Prebuilt sentence graph of ``text``.
+
+        Returns:
+            :class:`SpanRewrite` with the new text and
+            counters.
+        """
+        from texthumanize.sentence_graph import SentenceGraph
+
+        if graph is None:
+            graph = SentenceGraph(text, lang)
+        flagged = graph.flagged(threshold)
+        result = SpanRewrite(
+            text=text, sentences=len(graph), flagged=len(flagged),
+        )
+        if not flagged:
+            return result
+        runs = graph.segments(flagged)
+        sources = [
+            " ".join(graph.segment_text(run).split())
+            for run in runs
+        ]
+        batches = _batch_spans(sources, max_batch_chars)
+        prompt = _PROMPT_SPANS.format(lang=lang)
+        external = [
+            b for b in self._resolve_order() if b != "builtin"
+        ]
+
+        def _send(batch: list[int]) -> list[str] | None:
+            user_text = "\n".join(
+                f"[{n}] {sources[i]}"
+                for n, i in enumerate(batch, 1)
+            )
+            for name in external:
+                reply = self._call_external(
+                    name, prompt, user_text,
+                )
+                parsed = (
+                    _parse_spans(reply, len(batch))
+                    if reply is not None else None
+                )
+                if parsed is not None:
+                    with self._lock:
+                        self._last_used = name
+                    return parsed
+            return None
+
+        replies = fan_out(
+            [functools.partial(_send, b) for b in batches],
+            max_workers=max_workers,
+        ) if external else [None] * len(batches)
+
+        rewritten: dict[tuple[int, int], str] = {}
+        for batch, reply in zip(batches, replies):
+            if isinstance(reply, list):
+                result.batches += 1
+                result.chars_sent += sum(
+                    len(sources[i]) for i in batch
+                )
+                for i, new in zip(batch, reply):
+                    rewritten[runs[i]] = new
+                continue
+            if external:
+                result.batches += 1
+                result.chars_sent += sum(
+                    len(sources[i]) for i in batch
+                )
+            for i in batch:
+                result.fallback_spans += 1
+                try:
+                    new = self._builtin.rewrite_sentence(
+                        sources[i], lang=lang,
+                    )
+                except Exception:
+                    logger.debug(
+                        "Built-in rewrite failed", exc_info=True,
+                    )
+                    continue
+                if new and new.strip():
+                    rewritten[runs[i]] = new.strip()
+        result.spans = len(runs)
+        result.text = graph.replace(rewritten)
+        return result
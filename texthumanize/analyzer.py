@@ -6,8 +6,9 @@ import logging
 import re
 from collections import Counter
 
-from texthumanize.lang import get_lang_pack
+from texthumanize.lang import compile_pack, get_lang_pack
 from texthumanize.perplexity import PerplexityEstimator
+from texthumanize.rule_sets import folds_like_lower, word_pattern
 from texthumanize.sentence_split import split_sentences
 from texthumanize.utils import AnalysisReport
 
@@ -128,22 +129,21 @@ class TextAnalyzer:
         if not words:
             return 0.0
 
-        bureaucratic = self.lang_pack.get("bureaucratic", {})
-        phrases = self.lang_pack.get("bureaucratic_phrases", {})
+        lex = compile_pack(self.lang_pack)
         text_lower = text.lower()
 
         hits = 0
 
         # Фразовые канцеляризмы
-        for phrase in phrases:
-            count = text_lower.count(phrase.lower())
-            hits += count * len(phrase.split())
+        for phrase in lex.bureaucratic_phrases:
+            hits += text_lower.count(phrase.lower) * phrase.n_words
 
-        # Однословные канцеляризмы
-        for word in bureaucratic:
-            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(text)
-            hits += len(matches)
+        # Однословные канцеляризмы (слово, которого нет в тексте
+        # даже как подстроки, не ищем)
+        exact = not folds_like_lower(text)
+        for word in lex.bureaucratic:
+            if exact or word.lower in text_lower or not word.folds:
+                hits += len(word_pattern(word.text).findall(text))
 
         return min(hits / len(words), 1.0) if words else 0.0
 
@@ -152,12 +152,13 @@ class TextAnalyzer:
         if not sentences:
             return 0.0
 
-        connectors = self.lang_pack.get("ai_connectors", {})
         hits = 0
+        text_lower = text.lower()
+        exact = not folds_like_lower(text)
 
-        for connector in connectors:
-            pattern = re.compile(r'\b' + re.escape(connector) + r'\b', re.IGNORECASE)
-            hits += len(pattern.findall(text))
+        for connector in compile_pack(self.lang_pack).ai_connectors:
+            if exact or connector.lower in text_lower or not connector.folds:
+                hits += len(word_pattern(connector.text).findall(text))
 
         return min(hits / len(sentences), 1.0)
 
@@ -166,7 +167,7 @@ class TextAnalyzer:
         if len(words) < 10:
             return 0.0
 
-        stop_words = self.lang_pack.get("stop_words", set())
+        stop_words = compile_pack(self.lang_pack).stop_words
 
         # Считаем повторение контентных слов
         content_words = [
@@ -306,28 +307,30 @@ class TextAnalyzer:
     def _find_bureaucratic_words(self, text: str) -> list[str]:
         """Найти все канцеляризмы в тексте."""
         result = []
-        bureaucratic = self.lang_pack.get("bureaucratic", {})
-        phrases = self.lang_pack.get("bureaucratic_phrases", {})
+        lex = compile_pack(self.lang_pack)
+
+        text_lower = text.lower()
 
-        for phrase in phrases:
-            if phrase.lower() in text.lower():
-                result.append(phrase)
+        for phrase in lex.bureaucratic_phrases:
+            if phrase.lower in text_lower:
+                result.append(phrase.text)
 
-        for word in bureaucratic:
-            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-            if pattern.search(text):
-                result.append(word)
+        exact = not folds_like_lower(text)
+        for word in lex.bureaucratic:
+            if ((exact or word.lower in text_lower or not word.folds)
+                    and word_pattern(word.text).search(text)):
+                result.append(word.text)
 
         return result
 
     def _find_ai_connectors(self, text: str) -> list[str]:
         """Найти все ИИ-связки в тексте."""
         result = []
-        connectors = self.lang_pack.get("ai_connectors", {})
+        text_lower = text.lower()
 
-        for connector in connectors:
-            if connector.lower() in text.lower():
-                result.append(connector)
+        for connector in compile_pack(self.lang_pack).ai_connectors:
+            if connector.lower in text_lower:
+                result.append(connector.text)
 
         return result
 
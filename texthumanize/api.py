@@ -20,13 +20,19 @@
     # или
     from texthumanize.api import create_app, run_server
     run_server(port=8080)
+
+    # pre-fork: прогрев моделей в родителе, 4 воркера на общем сокете
+    python -m texthumanize.api --port 8080 --workers 4 --warmup en,ru
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import signal
 import time
+from collections.abc import Sequence
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Any
 
@@ -46,6 +52,7 @@ from texthumanize.core import (
     spin,
     spin_variants,
 )
+from texthumanize.exceptions import ConfigError
 
 logger = logging.getLogger(__name__)
 
@@ -374,17 +381,69 @@ def create_app(host: str = "0.0.0.0", port: int = 8080) -> HTTPServer:
     """Создать HTTP-сервер."""
     return HTTPServer((host, port), TextHumanizeHandler)
 
-def run_server(host: str = "0.0.0.0", port: int = 8080) -> None:
-    """Запустить HTTP-сервер."""
+def run_server(
+    host: str = "0.0.0.0",
+    port: int = 8080,
+    workers: int = 1,
+    warmup_langs: Sequence[str] | None = None,
+) -> None:
+    """Запустить HTTP-сервер.
+
+    Args:
+        workers: Число процессов-воркеров. При ``workers > 1`` (только
+            POSIX) родитель прогревает модели и форкает воркеров, которые
+            принимают соединения с общего сокета; прогретые данные
+            делятся между ними copy-on-write.
+        warmup_langs: Языки для прогрева (:func:`texthumanize.warmup`);
+            по умолчанию ``en`` при ``workers > 1``, иначе без прогрева.
+    """
+    if workers > 1 and not hasattr(os, "fork"):
+        raise ConfigError("workers > 1 requires os.fork() (POSIX)")
     server = create_app(host, port)
+    if warmup_langs or workers > 1:
+        from texthumanize.warmup import warmup
+
+        report = warmup(langs=warmup_langs or ("en",))
+        print(f"Warmed up in {report.total:.1f}s ({report.frozen} objects frozen)")
     print(f"TextHumanize API v{__version__} running on http://{host}:{port}")
     print(f"Endpoints: {', '.join(sorted(ROUTES.keys()))}")
+    if workers > 1:
+        _serve_prefork(server, workers)
+        return
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nShutting down...")
         server.shutdown()
 
+def _serve_prefork(server: HTTPServer, workers: int) -> None:
+    """Форкнуть ``workers`` процессов на общем сокете и ждать их."""
+    children: list[int] = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os._exit(0)
+        children.append(pid)
+    print(f"Workers: {', '.join(map(str, children))}")
+    try:
+        for pid in children:
+            os.waitpid(pid, 0)
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+    finally:
+        server.server_close()
+
 # ─── CLI ──────────────────────────────────────────────────────
 
 if __name__ == "__main__":
@@ -392,5 +451,12 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="TextHumanize API Server")
     parser.add_argument("--host", default="0.0.0.0", help="Bind host")
     parser.add_argument("--port", type=int, default=8080, help="Bind port")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Pre-forked worker processes (POSIX)")
+    parser.add_argument("--warmup", default="",
+                        help="Comma-separated languages to load before serving")
     args = parser.parse_args()
-    run_server(host=args.host, port=args.port)
+    run_server(
+        host=args.host, port=args.port, workers=args.workers,
+        warmup_langs=[x for x in args.warmup.split(",") if x] or None,
+    )
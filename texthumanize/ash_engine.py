@@ -30,7 +30,10 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from texthumanize.budget import ComputeBudget
 
 logger = logging.getLogger(__name__)
 
@@ -202,6 +205,7 @@ class ASHEngine:
         adversarial_rounds: int | None = None,
         adversarial_target: float | None = None,
         use_pipeline: bool = True,
+        compute_budget: ComputeBudget | None = None,
     ) -> ASHResult:
         """Run the full ASH™ pipeline.
 
@@ -220,6 +224,10 @@ class ASHEngine:
             Override max adversarial rounds.
         adversarial_target : float or None
             Override adversarial target score.
+        compute_budget : ComputeBudget or None
+            Shared compute allowance for the base pipeline's optional
+            passes and Adversarial Self-Play™ rounds. The base pass
+            always runs; self-play is skipped once the budget is spent.
 
         Returns
         -------
@@ -308,7 +316,9 @@ class ASHEngine:
                     seed=self.seed,
                 )
                 pipe = Pipeline(options=opts)
-                pipe_result = pipe.run(current, self.lang)
+                pipe_result = pipe.run(
+                    current, self.lang, compute_budget=compute_budget,
+                )
                 if pipe_result.text and pipe_result.text.strip():
                     current = pipe_result.text
                     steps.append("base_pipeline")
@@ -350,7 +360,9 @@ class ASHEngine:
                 logger.warning("ASH: Cognitive Modeling™ failed", exc_info=True)
 
         # ── Step 6: Adversarial Ensemble Self-Play™ ──
-        if cfg["enable_adversarial"]:
+        if cfg["enable_adversarial"] and (
+            compute_budget is None or compute_budget.can_afford(detector_calls=2)
+        ):
             try:
                 from texthumanize.adversarial_play import AdversarialPlay
                 ap = AdversarialPlay(lang=self.lang, seed=self.seed)
@@ -359,6 +371,7 @@ class ASHEngine:
                     intensity=cfg["intensity"],
                     max_rounds=cfg["adversarial_rounds"],
                     target_score=cfg["adversarial_target"],
+                    compute_budget=compute_budget,
                 )
                 current = adv_result.text
                 steps.append("adversarial_play")
@@ -494,6 +507,7 @@ def ash_humanize(
     use_pipeline: bool = True,
     pipeline_intensity: int = 60,
     pipeline_profile: str = "web",
+    compute_budget: ComputeBudget | None = None,
 ) -> ASHResult:
     """Humanize text using the full ASH™ pipeline.
 
@@ -520,6 +534,8 @@ def ash_humanize(
         Intensity for the base pipeline (0-100).
     pipeline_profile : str
         Profile for the base pipeline ("web", "chat", "formal", etc.).
+    compute_budget : ComputeBudget or None
+        Shared compute allowance (see :class:`~texthumanize.budget.ComputeBudget`).
     """
     return ASHEngine(
         lang=lang, seed=seed,
@@ -527,7 +543,7 @@ def ash_humanize(
         pipeline_profile=pipeline_profile,
     ).humanize(
         text, preset=preset, intensity=intensity,
-        use_pipeline=use_pipeline,
+        use_pipeline=use_pipeline, compute_budget=compute_budget,
     )
 
 
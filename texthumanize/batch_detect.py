@@ -0,0 +1,255 @@
+"""Batch AI detection — the engine behind :func:`detect_ai_batch`.
+
+:func:`~texthumanize.core.detect_ai` combines four scorers per text:
+heuristic metrics, the statistical detector, the neural MLP over 35
+features and the character-LSTM perplexity. Over many texts the batch
+engine splits the work into stages:
+
+1. identical texts are scored once (language detection included);
+2. per-text feature extraction — heuristic metrics, statistical
+   detector, MLP features, all plain-Python and CPU-bound — runs in a
+   process pool when ``workers > 1``;
+3. texts are grouped by language (features are normalized per
+   language) and the MLP scores each group in one batched pass;
+4. the LSTM steps all texts together (:meth:`NeuralPerplexity.perplexity_batch`).
+
+Stages 3–4 are batched only with NumPy; without it they would still be
+a per-text loop, so they run inside stage 2 (in the workers). The
+transformer detector, when loaded, scores text by text in stage 2.
+
+Results come back in input order and equal what ``detect_ai`` returns
+for each text (up to float32 rounding in the batched NumPy stages).
+:func:`iter_detect_ai_batch` processes an iterable chunk by chunk, for
+inputs too large to hold all reports in memory.
+
+Usage::
+
+    from texthumanize import detect_ai_batch, iter_detect_ai_batch
+
+    reports = detect_ai_batch(texts, lang="en", workers=4)
+    for report in iter_detect_ai_batch(open("corpus.txt"), workers=None):
+        ...
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import itertools
+import logging
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from texthumanize.exceptions import ConfigError
+from texthumanize.utils import DetectionReport
+
+logger = logging.getLogger(__name__)
+
+# Texts per chunk in iter_detect_ai_batch()
+DEFAULT_CHUNK_SIZE = 256
+
+
+@dataclass
+class _Parts:
+    """Stage-2 output for one distinct text."""
+
+    lang: str
+    result: Any  # detectors.DetectionResult
+    stat_prob: float | None
+    neural: dict | None = None  # scored in the worker
+    normed: list[float] | None = None  # MLP features, scored in batch
+    ppl: float | None = None
+
+
+@dataclass(frozen=True)
+class _Plan:
+    """Which neural stages are batched in the parent process."""
+
+    mlp: bool
+    lm: bool
+
+
+def _plan() -> _Plan:
+    from texthumanize import core
+    from texthumanize.neural_engine import _HAS_NUMPY
+
+    if not _HAS_NUMPY:
+        return _Plan(mlp=False, lm=False)
+    try:
+        has_transformer = core._get_neural_detector()._get_transformer() is not None
+    except Exception:
+        has_transformer = False
+    return _Plan(mlp=not has_transformer, lm=True)
+
+
+def _extract(job: tuple[str, str, _Plan]) -> _Parts:
+    """Stage 2 for one text (runs in a worker process when workers > 1)."""
+    from texthumanize import core
+
+    text, lang, plan = job
+    if lang == "auto":
+        lang = core.detect_language(text)
+    parts = _Parts(
+        lang=lang,
+        result=core._get_detectors().detect_ai(text, lang=lang),
+        stat_prob=core._stat_probability(text, lang),
+    )
+    if plan.mlp:
+        try:
+            nd_mod = core._get_neural_detector()
+            parts.normed = nd_mod.normalize_features(
+                nd_mod.extract_features(text, lang), lang=lang,
+            )
+        except Exception:
+            pass
+    else:
+        parts.neural = core._neural_detection(text, lang)
+    if not plan.lm:
+        parts.ppl = core._neural_perplexity(text)
+    return parts
+
+
+def _score_mlp(texts: Sequence[str], parts: list[_Parts]) -> None:
+    """Stage 3: one batched MLP pass per language group."""
+    from texthumanize import core
+
+    groups: dict[str, list[int]] = {}
+    for i, p in enumerate(parts):
+        if p.normed is not None:
+            groups.setdefault(p.lang, []).append(i)
+    for lang, idx in groups.items():
+        try:
+            nd = core._get_neural_detector().NeuralAIDetector()
+            results = nd.detect_batch(
+                [texts[i] for i in idx], lang, normed=[parts[i].normed for i in idx],
+            )
+        except Exception as e:
+            logger.debug("batch MLP failed for %s: %s", lang, e)
+            continue
+        for i, res in zip(idx, results):
+            parts[i].neural = res
+
+
+def _score_lm(texts: Sequence[str], parts: list[_Parts]) -> None:
+    """Stage 4: LSTM perplexity of all texts, stepped together."""
+    from texthumanize import core
+
+    try:
+        ppls = core._get_neural_lm().get_neural_lm().perplexity_batch(
+            list(texts), max_chars=500,
+        )
+    except Exception as e:
+        logger.debug("batch LSTM failed: %s", e)
+        return
+    for p, ppl in zip(parts, ppls):
+        p.ppl = ppl
+
+
+def _run(texts: Sequence[str], lang: str, pool: Executor | None) -> list[DetectionReport]:
+    from texthumanize import core
+
+    # Validate everything before doing any work
+    keep = [core._check_detect_input(t) for t in texts]
+
+    # Distinct texts, in order of first occurrence
+    slots: dict[str, int] = {}
+    for t, ok in zip(texts, keep):
+        if ok and t not in slots:
+            slots[t] = len(slots)
+    unique = list(slots)
+
+    plan = _plan()
+    jobs = [(t, lang, plan) for t in unique]
+    if pool is not None and len(jobs) > 1:
+        parts = list(pool.map(_extract, jobs, chunksize=max(1, len(jobs) // 16)))
+    else:
+        parts = [_extract(job) for job in jobs]
+    if plan.mlp:
+        _score_mlp(unique, parts)
+    if plan.lm:
+        _score_lm(unique, parts)
+
+    reports = [
+        core._detection_report(p.result, p.lang, p.stat_prob, p.neural, p.ppl)
+        for p in parts
+    ]
+    out: list[DetectionReport] = []
+    used = [False] * len(reports)
+    for t, ok in zip(texts, keep):
+        if not ok:
+            out.append(core._empty_detection())
+            continue
+        i = slots[t]
+        # Repeated texts get their own copy of the report
+        out.append(copy.deepcopy(reports[i]) if used[i] else reports[i])
+        used[i] = True
+    return out
+
+
+def _resolve_workers(workers: int | None) -> int:
+    jobs = workers if workers is not None else (os.cpu_count() or 1)
+    if jobs < 1:
+        raise ConfigError(f"workers must be >= 1, got {workers}")
+    return jobs
+
+
+def detect_ai_batch(
+    texts: Sequence[str],
+    lang: str = "auto",
+    *,
+    workers: int | None = 1,
+) -> list[DetectionReport]:
+    """Run :func:`~texthumanize.core.detect_ai` over many texts.
+
+    Args:
+        texts: Texts to check.
+        lang: Language code, or ``'auto'`` to detect it per text.
+        workers: Worker processes for feature extraction (``None`` =
+            CPU count, 1 = inline).
+
+    Returns:
+        One report per text, in input order.
+
+    Raises:
+        ConfigError: A text is not a ``str``, or ``workers < 1``.
+        InputTooLargeError: A text exceeds the detect_ai() size limit.
+            Inputs are validated before any text is scored.
+    """
+    jobs = _resolve_workers(workers)
+    texts = list(texts)
+    if jobs == 1 or len(texts) < 2:
+        return _run(texts, lang, None)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(texts))) as pool:
+        return _run(texts, lang, pool)
+
+
+def iter_detect_ai_batch(
+    texts: Iterable[str],
+    lang: str = "auto",
+    *,
+    workers: int | None = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[DetectionReport]:
+    """Chunked :func:`detect_ai_batch` for large or streamed inputs.
+
+    Reads ``chunk_size`` texts at a time from ``texts`` and yields their
+    reports in input order; one process pool is reused for all chunks.
+    Validation errors surface when the chunk containing the bad text is
+    reached, after the reports of earlier chunks were yielded.
+    """
+    if chunk_size < 1:
+        raise ConfigError(f"chunk_size must be >= 1, got {chunk_size}")
+    jobs = _resolve_workers(workers)
+    it = iter(texts)
+    with contextlib.ExitStack() as stack:
+        pool = None
+        if jobs > 1:
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+        while True:
+            chunk = list(itertools.islice(it, chunk_size))
+            if not chunk:
+                return
+            yield from _run(chunk, lang, pool)
@@ -0,0 +1,270 @@
+"""Compute budget for nested optimization loops.
+
+``humanize_until_human`` → ``humanize`` → ``Pipeline.run`` (retries,
+detection loops, regression guard) → PHANTOM™ each have their own
+iteration caps, so the worst case multiplies across layers. A
+:class:`ComputeBudget` is a single allowance shared by all layers:
+
+- ``seconds`` — wall-clock limit;
+- ``detector_calls`` — full or fast ``detect_ai`` evaluations;
+- ``pipeline_passes`` — ``Pipeline._run_pipeline`` passes.
+
+Every layer checks :meth:`ComputeBudget.can_afford` before an *optional*
+step and returns its best result so far when the answer is no. The
+mandatory first pass always runs, so a result is always produced.
+
+:class:`BudgetScheduler` decides which step to spend the remainder on,
+ranking candidates by observed score improvement per unit of budget.
+
+Usage:
+    >>> from texthumanize import humanize_until_human
+    >>> from texthumanize.budget import ComputeBudget
+    >>> budget = ComputeBudget(seconds=5.0, detector_calls=20)
+    >>> result = humanize_until_human(text, compute_budget=budget)
+    >>> budget.spent
+    {'detector_calls': 14, 'pipeline_passes': 6}
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from texthumanize.exceptions import ConfigError
+
+logger = logging.getLogger(__name__)
+
+UNITS = ("detector_calls", "pipeline_passes")
+
+
+class ComputeBudget:
+    """Thread-safe shared allowance of time, detector calls and passes.
+
+    Any limit left as ``None`` is unlimited. The clock starts when the
+    budget is created.
+
+    Args:
+        seconds: Wall-clock limit.
+        detector_calls: Maximum number of detector evaluations.
+        pipeline_passes: Maximum number of full pipeline passes.
+    """
+
+    def __init__(
+        self,
+        *,
+        seconds: float | None = None,
+        detector_calls: int | None = None,
+        pipeline_passes: int | None = None,
+    ) -> None:
+        for name, value in (
+            ("seconds", seconds),
+            ("detector_calls", detector_calls),
+            ("pipeline_passes", pipeline_passes),
+        ):
+            if value is not None and value < 0:
+                raise ConfigError(f"{name} must be >= 0, got {value!r}")
+        self.seconds = seconds
+        self.limits: dict[str, int | None] = {
+            "detector_calls": detector_calls,
+            "pipeline_passes": pipeline_passes,
+        }
+        self._spent: dict[str, int] = dict.fromkeys(UNITS, 0)
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+
+    # ── Accounting ──
+
+    def charge(self, unit: str, n: int = 1) -> None:
+        """Record *n* units of *unit* as spent (may overdraw)."""
+        if unit not in self._spent:
+            raise ConfigError(f"Unknown budget unit: {unit!r}")
+        with self._lock:
+            self._spent[unit] += n
+
+    @property
+    def spent(self) -> dict[str, int]:
+        """Units spent so far."""
+        with self._lock:
+            return dict(self._spent)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the budget was created."""
+        return time.monotonic() - self._start
+
+    def remaining(self) -> dict[str, float | None]:
+        """Remaining allowance per unit (``None`` = unlimited)."""
+        out: dict[str, float | None] = {
+            "seconds": (
+                None if self.seconds is None
+                else max(0.0, self.seconds - self.elapsed)
+            ),
+        }
+        with self._lock:
+            for unit, limit in self.limits.items():
+                out[unit] = None if limit is None else max(0, limit - self._spent[unit])
+        return out
+
+    def can_afford(
+        self,
+        *,
+        seconds: float = 0.0,
+        detector_calls: int = 0,
+        pipeline_passes: int = 0,
+    ) -> bool:
+        """True if the given cost fits into what is left.
+
+        A zero cost still fails once a limit has been reached, so
+        ``can_afford()`` doubles as an "anything left?" check.
+        """
+        rem = self.remaining()
+        for unit, need in (
+            ("seconds", seconds),
+            ("detector_calls", detector_calls),
+            ("pipeline_passes", pipeline_passes),
+        ):
+            left = rem[unit]
+            if left is None:
+                continue
+            if left <= 0 or need > left:
+                return False
+        return True
+
+    @property
+    def exhausted(self) -> bool:
+        """True once any limit has been reached."""
+        return not self.can_afford()
+
+    def __repr__(self) -> str:
+        limits = ", ".join(
+            f"{k}={v}" for k, v in
+            (("seconds", self.seconds), *self.limits.items()) if v is not None
+        )
+        return f"ComputeBudget({limits or 'unlimited'}, spent={self.spent})"
+
+
+@dataclass
+class _StepStats:
+    """Running estimate of one schedulable step."""
+
+    prior_gain: float
+    cost: dict[str, float]
+    runs: int = 0
+    total_gain: float = 0.0
+    total_seconds: float = 0.0
+    repeatable: bool = True
+
+    @property
+    def expected_gain(self) -> float:
+        # Prior counts as one pseudo-observation.
+        return (self.prior_gain + self.total_gain) / (1 + self.runs)
+
+    @property
+    def expected_seconds(self) -> float:
+        return self.total_seconds / self.runs if self.runs else 0.0
+
+
+class BudgetScheduler:
+    """Allocate the remaining budget to the step with the best payoff.
+
+    Each step is registered with a cost estimate (units per run) and a
+    prior expected score improvement. After each run the caller reports
+    the observed improvement; :meth:`choose` returns the affordable step
+    with the highest expected improvement per fraction of remaining
+    budget, or ``None`` when nothing worthwhile is affordable.
+
+    Args:
+        budget: Shared budget to draw on.
+        min_gain: Steps expected to improve the score by less than this
+            are never chosen.
+    """
+
+    def __init__(self, budget: ComputeBudget, *, min_gain: float = 0.005) -> None:
+        self.budget = budget
+        self.min_gain = min_gain
+        self._steps: dict[str, _StepStats] = {}
+
+    def register(
+        self,
+        name: str,
+        *,
+        prior_gain: float,
+        detector_calls: int = 0,
+        pipeline_passes: int = 0,
+        repeatable: bool = True,
+    ) -> None:
+        """Declare a candidate step and its per-run cost estimate."""
+        self._steps[name] = _StepStats(
+            prior_gain=prior_gain,
+            cost={
+                "detector_calls": float(detector_calls),
+                "pipeline_passes": float(pipeline_passes),
+            },
+            repeatable=repeatable,
+        )
+
+    def retire(self, name: str) -> None:
+        """Exclude *name* from further :meth:`choose` results."""
+        st = self._steps[name]
+        st.repeatable = False
+        st.runs = max(st.runs, 1)
+
+    def record(
+        self,
+        name: str,
+        gain: float,
+        *,
+        seconds: float = 0.0,
+        spent: dict[str, int] | None = None,
+    ) -> None:
+        """Report the outcome of one run of *name*.
+
+        Args:
+            gain: Observed score improvement (negative values count as 0).
+            seconds: Wall-clock time the run took.
+            spent: Units actually spent by the run; refines the estimate.
+        """
+        st = self._steps[name]
+        st.runs += 1
+        st.total_gain += max(0.0, gain)
+        st.total_seconds += seconds
+        if spent:
+            for unit, n in spent.items():
+                if unit in st.cost:
+                    # Moving average of the observed per-run cost.
+                    st.cost[unit] += (n - st.cost[unit]) / st.runs
+
+    def _fraction(self, st: _StepStats) -> float | None:
+        """Cost of one run as a fraction of what is left (None = unaffordable)."""
+        rem = self.budget.remaining()
+        need = {"seconds": st.expected_seconds, **st.cost}
+        frac = 0.0
+        for unit, amount in need.items():
+            left = rem.get(unit)
+            if left is None:
+                continue
+            if left <= 0 or amount > left:
+                return None
+            frac = max(frac, amount / left)
+        return frac
+
+    def choose(self) -> str | None:
+        """Return the best affordable step, or None."""
+        best: tuple[float, str] | None = None
+        for name, st in self._steps.items():
+            if st.runs and not st.repeatable:
+                continue
+            gain = st.expected_gain
+            if gain < self.min_gain:
+                continue
+            frac = self._fraction(st)
+            if frac is None:
+                continue
+            value = gain / max(frac, 1e-6)
+            if best is None or value > best[0]:
+                best = (value, name)
+        if best is not None:
+            logger.debug("BudgetScheduler: chose %s (value=%.3f)", best[1], best[0])
+        return best[1] if best else None
@@ -0,0 +1,428 @@
+"""Bulk corpus processing — ``texthumanize bulk``.
+
+Streams records from a directory, a glob, a JSONL or CSV file, runs
+``humanize``, ``detect`` or ``analyze`` on them in a process pool and
+writes one JSON line per record as soon as it is done. Worker processes
+import the library and load their models once, instead of once per
+document as with a shell loop over the CLI.
+
+A checkpoint file (``<output>.checkpoint`` by default) lists the IDs
+already written together with the output size after each one. An
+interrupted job started again with the same arguments truncates the
+output to the last checkpointed record and continues with the records
+that are not done yet.
+
+Usage::
+
+    texthumanize bulk docs/ -o out.jsonl --op detect --workers 8
+    texthumanize bulk corpus.jsonl -o out.jsonl --text-field body -l en
+    texthumanize bulk "posts/**/*.md" -o out.jsonl --restart
+
+    from texthumanize.bulk import run_bulk
+    stats = run_bulk("corpus.csv", "out.jsonl", op="analyze", workers=4)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import IO, Any
+
+from texthumanize.exceptions import ConfigError
+
+OPERATIONS = ("humanize", "detect", "analyze")
+
+# Files picked up from a directory source
+TEXT_EXTENSIONS = (".txt", ".md", ".rst", ".html", ".adoc")
+
+# A CSV field holds a whole document: lift the csv module's 128 KiB
+# default (largest value a C long takes on every platform).
+_CSV_FIELD_LIMIT = 2**31 - 1
+
+
+@dataclass
+class BulkRecord:
+    """One input document."""
+
+    id: str
+    text: str
+    index: int = 0  # position in the source (seed offset)
+
+
+@dataclass
+class BulkStats:
+    """Progress of a bulk run."""
+
+    total: int | None = None  # records in the source, if known
+    skipped: int = 0  # done in an earlier run (checkpoint)
+    done: int = 0  # processed in this run
+    errors: int = 0
+    chars: int = 0
+    started: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self) -> float:
+        """Records per second in this run."""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Seconds left, if the total is known."""
+        if self.total is None or not self.rate:
+            return None
+        left = self.total - self.skipped - self.done
+        return max(left, 0) / self.rate
+
+    def summary(self) -> str:
+        total = "?" if self.total is None else str(self.total)
+        line = (
+            f"{self.skipped + self.done}/{total} records · "
+            f"{self.rate:.1f} rec/s · {self.chars / max(self.elapsed, 1e-9):,.0f} chars/s"
+        )
+        if self.errors:
+            line += f" · {self.errors} errors"
+        eta = self.eta
+        if eta is not None and self.skipped + self.done < (self.total or 0):
+            line += f" · ETA {_format_seconds(eta)}"
+        return line
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, sec = divmod(int(seconds + 0.5), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    if minutes:
+        return f"{minutes}m{sec:02d}s"
+    return f"{sec}s"
+
+
+# ─────────────────────────────────────────────────────────────
+#  Sources
+# ─────────────────────────────────────────────────────────────
+
+def _source_kind(source: str) -> str:
+    if source == "-":
+        return "jsonl"
+    if os.path.isdir(source):
+        return "dir"
+    if glob.has_magic(source):
+        return "glob"
+    lower = source.lower()
+    if lower.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if lower.endswith(".csv"):
+        return "csv"
+    if os.path.isfile(source):
+        return "file"
+    raise ConfigError(f"Bulk source not found: {source!r}")
+
+
+def _source_files(source: str, kind: str) -> list[str]:
+    if kind == "dir":
+        files = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(source)
+            for name in names
+            if name.lower().endswith(TEXT_EXTENSIONS)
+        ]
+    elif kind == "glob":
+        files = [p for p in glob.glob(source, recursive=True) if os.path.isfile(p)]
+    else:
+        files = [source]
+    return sorted(files)
+
+
+def _file_id(path: str, source: str, kind: str) -> str:
+    if kind == "dir":
+        return os.path.relpath(path, source).replace(os.sep, "/")
+    return path
+
+
+def _open_source(source: str) -> contextlib.AbstractContextManager[IO[str]]:
+    if source == "-":
+        return contextlib.nullcontext(sys.stdin)
+    return open(source, encoding="utf-8", newline="")
+
+
+def _csv_rows(fh: IO[str], source: str) -> Iterator[dict[str, Any]]:
+    csv.field_size_limit(_CSV_FIELD_LIMIT)
+    try:
+        yield from csv.DictReader(fh)
+    except csv.Error as e:
+        raise ConfigError(f"{source}: malformed CSV: {e}") from e
+
+
+def iter_records(
+    source: str,
+    *,
+    text_field: str = "text",
+    id_field: str = "id",
+) -> Iterator[BulkRecord]:
+    """Stream the records of ``source``.
+
+    ``source`` is a directory (every text file below it), a glob, a
+    JSONL/CSV file (``-`` = JSONL on stdin) or a single text file.
+    JSONL/CSV rows without ``id_field`` are numbered from 1.
+
+    Raises:
+        ConfigError: The source does not exist, a CSV source is
+            malformed, or a row has no ``text_field``.
+    """
+    kind = _source_kind(source)
+    if kind in ("jsonl", "csv"):
+        with _open_source(source) as fh:
+            if kind == "csv":
+                rows: Iterator[Any] = _csv_rows(fh, source)
+            else:
+                rows = (json.loads(line) for line in fh if line.strip())
+            for index, row in enumerate(rows):
+                text = row.get(text_field) if isinstance(row, dict) else None
+                if not isinstance(text, str):
+                    raise ConfigError(
+                        f"{source}: record {index + 1} has no {text_field!r} field",
+                    )
+                rid = row.get(id_field)
+                yield BulkRecord(
+                    id=str(rid) if rid not in (None, "") else str(index + 1),
+                    text=text,
+                    index=index,
+                )
+        return
+    for index, path in enumerate(_source_files(source, kind)):
+        with open(path, encoding="utf-8", errors="replace") as fh:
+            text = fh.read()
+        yield BulkRecord(id=_file_id(path, source, kind), text=text, index=index)
+
+
+def count_records(source: str) -> int | None:
+    """Number of records in ``source`` (None for stdin)."""
+    kind = _source_kind(source)
+    if source == "-":
+        return None
+    if kind == "jsonl":
+        with open(source, encoding="utf-8") as fh:
+            return sum(1 for line in fh if line.strip())
+    if kind == "csv":
+        with open(source, encoding="utf-8", newline="") as fh:
+            return sum(1 for _ in _csv_rows(fh, source))
+    return len(_source_files(source, kind))
+
+
+# ─────────────────────────────────────────────────────────────
+#  Checkpoint
+# ─────────────────────────────────────────────────────────────
+
+def _load_checkpoint(path: str) -> tuple[set[str], int]:
+    """IDs already written and the output size after the last one."""
+    done: set[str] = set()
+    offset = 0
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    rid, size = json.loads(line)
+                except ValueError:
+                    break  # torn last line
+                done.add(str(rid))
+                offset = int(size)
+    except FileNotFoundError:
+        pass
+    return done, offset
+
+
+# ─────────────────────────────────────────────────────────────
+#  Worker
+# ─────────────────────────────────────────────────────────────
+
+def process_record(op: str, text: str, options: dict[str, Any]) -> dict[str, Any]:
+    """Run one operation and return its JSON-serializable result."""
+    from texthumanize import core
+
+    lang = options.get("lang", "auto")
+    if op == "humanize":
+        result = core.humanize(
+            text,
+            lang=lang,
+            profile=options.get("profile", "web"),
+            intensity=options.get("intensity", 60),
+            seed=options.get("seed"),
+        )
+        return {
+            "text": result.text,
+            "lang": result.lang,
+            "profile": result.profile,
+            "change_ratio": round(result.change_ratio, 4),
+            "changes_count": len(result.changes),
+        }
+    if op == "detect":
+        return dict(core.detect_ai(text, lang=lang))
+    if op == "analyze":
+        report = core.analyze(text, lang=lang)
+        return {
+            "lang": report.lang,
+            "total_words": report.total_words,
+            "total_sentences": report.total_sentences,
+            "avg_sentence_length": round(report.avg_sentence_length, 2),
+            "burstiness_score": round(report.burstiness_score, 4),
+            "artificiality_score": round(report.artificiality_score, 4),
+            "flesch_kincaid_grade": round(report.flesch_kincaid_grade, 2),
+            "coleman_liau_index": round(report.coleman_liau_index, 2),
+        }
+    raise ConfigError(f"Unknown bulk operation {op!r}, expected one of {OPERATIONS}")
+
+
+def _run_one(op: str, record: BulkRecord, options: dict[str, Any]) -> dict[str, Any]:
+    opts = dict(options)
+    if opts.get("seed") is not None:
+        opts["seed"] = opts["seed"] + record.index
+    try:
+        return {"id": record.id, **process_record(op, record.text, opts)}
+    except Exception as exc:
+        return {"id": record.id, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def _warm_worker() -> None:
+    import texthumanize.core  # noqa: F401
+
+
+# ─────────────────────────────────────────────────────────────
+#  Runner
+# ─────────────────────────────────────────────────────────────
+
+def run_bulk(
+    source: str,
+    output: str | None,
+    *,
+    op: str = "humanize",
+    workers: int | None = None,
+    checkpoint: str | None = None,
+    restart: bool = False,
+    text_field: str = "text",
+    id_field: str = "id",
+    lang: str = "auto",
+    profile: str = "web",
+    intensity: int = 60,
+    seed: int | None = None,
+    on_progress: Callable[[BulkStats], None] | None = None,
+) -> BulkStats:
+    """Process every record of ``source`` and write JSONL to ``output``.
+
+    Args:
+        source: Directory, glob, JSONL/CSV file or single text file.
+        output: Output JSONL path (``None`` or ``-`` = stdout, no
+            checkpoint).
+        op: ``"humanize"``, ``"detect"`` or ``"analyze"``.
+        workers: Worker processes (``None`` = CPU count, 1 = inline).
+        checkpoint: Checkpoint path (default: ``<output>.checkpoint``).
+        restart: Ignore an existing checkpoint and start over.
+        text_field: Text column of JSONL/CSV records.
+        id_field: ID column of JSONL/CSV records.
+        lang: Language code.
+        profile: Humanize profile.
+        intensity: Humanize intensity.
+        seed: Base seed; record ``i`` uses ``seed + i``.
+        on_progress: Called with the stats after each record.
+
+    Returns:
+        :class:`BulkStats` of the run.
+
+    Raises:
+        ConfigError: Unknown operation, bad worker count or source.
+    """
+    if op not in OPERATIONS:
+        raise ConfigError(f"Unknown bulk operation {op!r}, expected one of {OPERATIONS}")
+    jobs = workers if workers is not None else (os.cpu_count() or 1)
+    if jobs < 1:
+        raise ConfigError(f"workers must be >= 1, got {workers}")
+
+    stats = BulkStats(total=count_records(source), started=time.monotonic())
+    records = iter_records(source, text_field=text_field, id_field=id_field)
+    options = {"lang": lang, "profile": profile, "intensity": intensity, "seed": seed}
+
+    to_stdout = output in (None, "-")
+    ckpt_path = None if to_stdout else (checkpoint or f"{output}.checkpoint")
+    done_ids: set[str] = set()
+    offset = 0
+    if ckpt_path and not restart:
+        done_ids, offset = _load_checkpoint(ckpt_path)
+
+    if to_stdout:
+        out: IO[str] = sys.stdout
+    else:
+        assert output is not None
+        if done_ids and os.path.exists(output):
+            out = open(output, "r+", encoding="utf-8")
+            out.truncate(offset)  # drop records written after the checkpoint
+            out.seek(offset)
+        else:
+            done_ids = set()
+            out = open(output, "w", encoding="utf-8")
+    ckpt = open(ckpt_path, "a" if done_ids else "w", encoding="utf-8") if ckpt_path else None
+
+    def _write(row: dict[str, Any], chars: int) -> None:
+        out.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+        out.flush()
+        if ckpt is not None:
+            ckpt.write(json.dumps([row["id"], out.tell()]) + "\n")
+            ckpt.flush()
+        stats.done += 1
+        stats.chars += chars
+        if "error" in row:
+            stats.errors += 1
+        if on_progress is not None:
+            on_progress(stats)
+
+    def _pending() -> Iterator[BulkRecord]:
+        for record in records:
+            if record.id in done_ids:
+                stats.skipped += 1
+            else:
+                yield record
+
+    try:
+        if jobs == 1:
+            for record in _pending():
+                _write(_run_one(op, record, options), len(record.text))
+            return stats
+
+        limit = 2 * jobs
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_warm_worker) as pool:
+            running: dict[Future, int] = {}
+            todo = _pending()
+            exhausted = False
+            try:
+                while running or not exhausted:
+                    while not exhausted and len(running) < limit:
+                        pending: BulkRecord | None = next(todo, None)
+                        if pending is None:
+                            exhausted = True
+                            break
+                        running[pool.submit(_run_one, op, pending, options)] = len(pending.text)
+                    if not running:
+                        break
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        _write(fut.result(), running.pop(fut))
+            finally:
+                for fut in running:
+                    fut.cancel()
+        return stats
+    finally:
+        if ckpt is not None:
+            ckpt.close()
+        if not to_stdout:
+            out.close()
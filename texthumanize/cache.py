@@ -1,8 +1,15 @@
-"""Thread-safe LRU result cache for TextHumanize.
+"""Thread-safe caches for TextHumanize.
 
-Caches results of expensive operations (humanize, detect_ai, analyze)
-keyed by (text_hash, params). Uses SHA-256 hash of text content for
-memory efficiency — full texts are never stored in the cache.
+Two kinds of cache live here:
+
+- ``result_cache`` — LRU of expensive top-level results (humanize,
+  detect_ai, analyze) keyed by (text_hash, params). Uses SHA-256 hash
+  of text content — full texts are never stored as keys.
+- :class:`MemoCache` — bounded memo caches for hot NLP helpers
+  (lemmas, sentence splits, POS emissions, syllables, ...). Every
+  instance is registered by name, estimates its size in bytes, keeps
+  hit/miss/eviction counters and counts towards a process-wide byte
+  cap (``TEXTHUMANIZE_CACHE_MAX_MB``, default 256).
 
 Usage:
     from texthumanize.cache import result_cache, cache_stats
@@ -13,20 +20,33 @@ Usage:
 
     # To check stats:
     print(cache_stats())  # {"hits": 42, "misses": 10, "size": 52}
+
+    # Helper caches:
+    from texthumanize.cache import all_cache_stats, clear_all, memo_cache
+    lemmas = memo_cache("morphology.lemma", max_entries=50_000)
+    lemma = lemmas.get_or_compute(("ru", word), lambda: slow_lemma(word))
+    print(all_cache_stats()["morphology.lemma"]["hit_rate"])
+    clear_all()
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
+import os
+import sys
 import threading
 from collections import OrderedDict
-from typing import Any
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_MAX_SIZE = 256
 
+T = TypeVar("T")
+
 
 class _LRUCache:
     """Thread-safe LRU cache with configurable max size."""
@@ -91,3 +111,221 @@ result_cache = _LRUCache(max_size=_DEFAULT_MAX_SIZE)
 def cache_stats() -> dict[str, int]:
     """Return current cache statistics."""
     return result_cache.stats()
+
+
+# ═══════════════════════════════════════════════════════════════
+#  BOUNDED MEMO CACHES FOR NLP HELPERS
+# ═══════════════════════════════════════════════════════════════
+
+_registry: dict[str, MemoCache] = {}
+_registry_lock = threading.Lock()
+_global_max_bytes: int = int(
+    float(os.environ.get("TEXTHUMANIZE_CACHE_MAX_MB", "256")) * 1024 * 1024,
+)
+
+
+def estimate_size(obj: Any) -> int:
+    """Rough size of *obj* in bytes (containers one level deep)."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list, frozenset, set)):
+        size += sum(sys.getsizeof(x) for x in obj)
+    elif isinstance(obj, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in obj.items())
+    return size
+
+
+class MemoCache:
+    """Bounded, thread-safe LRU memo cache with size accounting.
+
+    Args:
+        name: Registry name (shown in :func:`all_cache_stats`).
+        max_entries: Entry limit.
+        max_bytes: Optional byte limit for this cache alone.
+        sizeof: Size estimator for ``(key, value)``; defaults to
+            :func:`estimate_size` of both.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int = 4096,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any, Any], int] | None = None,
+    ) -> None:
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda k, v: estimate_size(k) + estimate_size(v))
+        self._data: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes held."""
+        return self._bytes
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (refreshing its recency) or *default*."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return item[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store *value*, evicting least recently used entries if needed."""
+        size = self._sizeof(key, value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._trim(self.max_entries, self.max_bytes)
+        if _global_max_bytes and self._bytes > 0:
+            _enforce_global_limit()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached value for *key*, computing it on a miss.
+
+        *compute* runs outside the lock; concurrent misses on the same
+        key may compute twice, which is harmless for pure helpers.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return item[0]
+            self._misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def _trim(self, max_entries: int, max_bytes: int | None) -> None:
+        # Caller holds self._lock.
+        while self._data and (
+            len(self._data) > max_entries
+            or (max_bytes is not None and self._bytes > max_bytes)
+        ):
+            _, (_, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+    def shrink_by(self, nbytes: int) -> int:
+        """Evict LRU entries until *nbytes* are freed; return bytes freed."""
+        with self._lock:
+            target = max(0, self._bytes - nbytes)
+            before = self._bytes
+            self._trim(self.max_entries, target)
+            return before - self._bytes
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters and current size."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"MemoCache({self.name!r}, size={len(self._data)}/{self.max_entries}, "
+            f"bytes={self._bytes})"
+        )
+
+
+def memo_cache(name: str, **kwargs: Any) -> MemoCache:
+    """Get the registered cache *name*, creating it with *kwargs* if new."""
+    with _registry_lock:
+        cache = _registry.get(name)
+        if cache is None:
+            cache = _registry[name] = MemoCache(name, **kwargs)
+        return cache
+
+
+def memoize(
+    name: str, *, max_entries: int = 4096, max_bytes: int | None = None,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator: memoize a pure function of hashable positional args."""
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        cache = memo_cache(name, max_entries=max_entries, max_bytes=max_bytes)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any) -> T:
+            return cache.get_or_compute(args, lambda: fn(*args))
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+    return decorator
+
+
+def set_global_limit(max_bytes: int) -> None:
+    """Set the process-wide byte cap across all memo caches (0 = none)."""
+    global _global_max_bytes
+    _global_max_bytes = max(0, int(max_bytes))
+    if _global_max_bytes:
+        _enforce_global_limit()
+
+
+def _enforce_global_limit() -> None:
+    with _registry_lock:
+        caches = list(_registry.values())
+    total = sum(c.nbytes for c in caches)
+    excess = total - _global_max_bytes
+    if excess <= 0:
+        return
+    # Largest caches give back first.
+    for cache in sorted(caches, key=lambda c: c.nbytes, reverse=True):
+        excess -= cache.shrink_by(excess)
+        if excess <= 0:
+            break
+    logger.debug("Cache global cap: trimmed to %d bytes", total - max(excess, 0))
+
+
+def all_cache_stats() -> dict[str, Any]:
+    """Stats of every memo cache plus the result cache and totals."""
+    with _registry_lock:
+        caches = dict(_registry)
+    out: dict[str, Any] = {name: c.stats() for name, c in sorted(caches.items())}
+    out["result_cache"] = result_cache.stats()
+    out["total_bytes"] = sum(c.nbytes for c in caches.values())
+    out["global_max_bytes"] = _global_max_bytes
+    return out
+
+
+def clear_all() -> None:
+    """Clear every memo cache and the result cache."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    for c in caches:
+        c.clear()
+    result_cache.clear()
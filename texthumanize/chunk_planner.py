@@ -0,0 +1,225 @@
+"""Chunk planner for ``humanize_chunked``.
+
+Splits a large document into spans at paragraph (or, for oversized
+paragraphs, sentence) boundaries, balanced for the number of workers,
+and merges the processed chunks back by span so that the original
+separators between chunks survive unchanged.
+
+Each chunk is processed with a read-only :class:`ChunkContext`:
+
+- ``left`` / ``right`` — neighbouring original text. The pipeline
+  scores the chunk inside this window (a detector sees the chunk the
+  way it sits in the document) but never emits it;
+- ``document`` — analysis and content classification of the whole
+  document, computed once. Adaptive intensity and content-type caps
+  then agree across chunks instead of being re-derived from each
+  (much noisier) chunk.
+
+Usage:
+    >>> from texthumanize.chunk_planner import plan_chunks, merge_chunks
+    >>> spans = plan_chunks(text, chunk_size=5000, context=200, workers=4)
+    >>> outputs = [process(text[s.start:s.end]) for s in spans]
+    >>> merged = merge_chunks(text, spans, outputs)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from texthumanize.exceptions import ConfigError
+
+if TYPE_CHECKING:
+    from texthumanize.content_classifier import ContentProfile
+    from texthumanize.utils import AnalysisReport
+
+_PARA_SEP = re.compile(r'\n\s*\n')
+_SENT_BOUNDARY = re.compile(r'(?<=[.!?…])\s+(?=\S)')
+
+
+@dataclass(frozen=True)
+class ChunkSpan:
+    """One planned chunk: ``text[start:end]`` plus its context window."""
+
+    index: int
+    start: int
+    end: int
+    context_start: int
+    context_end: int
+
+    def text(self, source: str) -> str:
+        return source[self.start:self.end]
+
+
+@dataclass(frozen=True)
+class DocumentContext:
+    """Whole-document statistics shared (read-only) by every chunk."""
+
+    metrics: AnalysisReport
+    content: ContentProfile
+
+    @classmethod
+    def build(cls, text: str, lang: str) -> DocumentContext:
+        from texthumanize.analyzer import TextAnalyzer
+        from texthumanize.content_classifier import classify as classify_content
+
+        return cls(
+            metrics=TextAnalyzer(lang=lang).analyze(text),
+            content=classify_content(text, lang=lang),
+        )
+
+
+@dataclass(frozen=True)
+class ChunkContext:
+    """Read-only context a chunk is processed with (never re-emitted)."""
+
+    left: str = ""
+    right: str = ""
+    document: DocumentContext | None = None
+
+    def window(self, chunk: str) -> str:
+        """The chunk embedded in its neighbouring text."""
+        if not self.left and not self.right:
+            return chunk
+        return self.left + chunk + self.right
+
+    @classmethod
+    def for_span(
+        cls, source: str, span: ChunkSpan,
+        document: DocumentContext | None = None,
+    ) -> ChunkContext:
+        return cls(
+            left=source[span.context_start:span.start],
+            right=source[span.end:span.context_end],
+            document=document,
+        )
+
+
+def _units(text: str, max_unit: int) -> list[tuple[int, int]]:
+    """Non-blank paragraph spans; paragraphs above *max_unit* become sentences."""
+    units: list[tuple[int, int]] = []
+    pos = 0
+    bounds = [(m.start(), m.end()) for m in _PARA_SEP.finditer(text)]
+    bounds.append((len(text), len(text)))
+    for sep_start, sep_end in bounds:
+        seg = text[pos:sep_start]
+        stripped = seg.strip()
+        if stripped:
+            a = pos + seg.index(stripped[0])
+            b = a + len(stripped)
+            if b - a > max_unit:
+                s = a
+                for m in _SENT_BOUNDARY.finditer(text, a, b):
+                    units.append((s, m.start()))
+                    s = m.end()
+                units.append((s, b))
+            else:
+                units.append((a, b))
+        pos = sep_end
+    return units
+
+
+def _snap_left(text: str, lo: int, hi: int) -> int:
+    """Move *lo* forward to the start of a word (never past *hi*)."""
+    if lo <= 0:
+        return 0
+    if text[lo - 1].isspace():
+        return lo
+    m = re.search(r'\s', text[lo:hi])
+    return lo + m.end() if m else hi
+
+
+def _snap_right(text: str, lo: int, hi: int) -> int:
+    """Move *hi* back to the end of a word (never before *lo*)."""
+    if hi >= len(text):
+        return len(text)
+    if text[hi].isspace():
+        return hi
+    cut = max(text.rfind(" ", lo, hi), text.rfind("\n", lo, hi))
+    return cut if cut > lo else lo
+
+
+def plan_chunks(
+    text: str,
+    chunk_size: int,
+    *,
+    context: int = 0,
+    workers: int | None = None,
+) -> list[ChunkSpan]:
+    """Plan chunk spans for *text*.
+
+    Args:
+        text: Document to split.
+        chunk_size: Target (maximum average) chunk size in characters.
+        context: Characters of read-only context on each side.
+        workers: Parallel workers; the chunk count is rounded up to a
+            multiple of it so that no worker idles on the last wave.
+
+    Returns:
+        Spans in document order. Text between consecutive spans is
+        separator whitespace only.
+    """
+    if chunk_size <= 0:
+        raise ConfigError(f"chunk_size must be > 0, got {chunk_size!r}")
+    units = _units(text, chunk_size)
+    if not units:
+        return []
+
+    n = math.ceil(len(text) / chunk_size)
+    if workers and workers > 1 and n > 1:
+        n = math.ceil(n / workers) * workers
+    n = max(1, min(n, len(units)))
+
+    # Cut after the unit whose end is nearest to each ideal position.
+    ends = [b for _, b in units]
+    cuts: list[int] = []
+    first_free = 0
+    for k in range(1, n):
+        ideal = k * len(text) / n
+        j = bisect_left(ends, ideal)
+        best = None
+        for c in (j - 1, j):
+            if first_free <= c <= len(units) - 2 and (
+                best is None or abs(ends[c] - ideal) < abs(ends[best] - ideal)
+            ):
+                best = c
+        if best is not None:
+            cuts.append(best)
+            first_free = best + 1
+
+    spans: list[ChunkSpan] = []
+    lo = 0
+    for i, c in enumerate([*cuts, len(units) - 1]):
+        start, end = units[lo][0], units[c][1]
+        spans.append(ChunkSpan(
+            index=i,
+            start=start,
+            end=end,
+            context_start=_snap_left(text, max(0, start - context), start),
+            context_end=_snap_right(text, end, min(len(text), end + context)),
+        ))
+        lo = c + 1
+    return spans
+
+
+def merge_chunks(text: str, spans: list[ChunkSpan], outputs: list[str]) -> str:
+    """Replace each span of *text* with its processed output.
+
+    Everything outside the spans (leading/trailing whitespace and the
+    separators between chunks) is copied from the original.
+    """
+    if len(spans) != len(outputs):
+        raise ConfigError(
+            f"{len(outputs)} outputs for {len(spans)} chunk spans"
+        )
+    parts: list[str] = []
+    pos = 0
+    for span, out in zip(spans, outputs):
+        parts.append(text[pos:span.start])
+        parts.append(out)
+        pos = span.end
+    parts.append(text[pos:])
+    return "".join(parts)
@@ -12,7 +12,7 @@ import sys
 import time
 from typing import Any
 
-from texthumanize import __version__
+import texthumanize
 from texthumanize.core import (
     adjust_tone,
     analyze,
@@ -93,12 +93,30 @@ _BANNER = r"""[th.brand]
 """
 
 
+class _VersionAction(argparse.Action):
+    """``--version`` that resolves the version only when it is requested.
+
+    ``action="version"`` needs the string while the parser is built,
+    which would import ``importlib.metadata`` on every invocation.
+    """
+
+    def __init__(self, option_strings: list[str], dest: str = argparse.SUPPRESS,
+                 default: str = argparse.SUPPRESS, help: str | None = None) -> None:
+        super().__init__(option_strings=option_strings, dest=dest,
+                         default=default, nargs=0, help=help)
+
+    def __call__(self, parser: argparse.ArgumentParser, namespace: argparse.Namespace,
+                 values: Any, option_string: str | None = None) -> None:
+        print(f"texthumanize {texthumanize.__version__}")
+        parser.exit()
+
+
 def _print_banner() -> None:
     if _HAS_RICH and _con:
-        _con.print(_BANNER.format(ver=__version__))
+        _con.print(_BANNER.format(ver=texthumanize.__version__))
     else:
         print(f"\n{'=' * 50}", file=sys.stderr)
-        print(f"  TextHumanize  v{__version__}", file=sys.stderr)
+        print(f"  TextHumanize  v{texthumanize.__version__}", file=sys.stderr)
         print("  Algorithmic Text Humanization", file=sys.stderr)
         print(f"{'=' * 50}\n", file=sys.stderr)
 
@@ -612,7 +630,7 @@ def _handle_benchmark_plain(args: argparse.Namespace, remaining: list[str]) -> N
 
     if not use_json:
         print("=" * 60)
-        print(f"  TextHumanize Benchmark \u2014 v{__version__}")
+        print(f"  TextHumanize Benchmark \u2014 v{texthumanize.__version__}")
         print(f"  Language: {lang}")
         print("=" * 60)
 
@@ -679,7 +697,7 @@ def _handle_benchmark_plain(args: argparse.Namespace, remaining: list[str]) -> N
     )
 
     summary = {
-        "version": __version__,
+        "version": texthumanize.__version__,
         "lang": lang,
         "total_chars": total_chars,
         "total_humanize_ms": round(total_time_h * 1000, 1),
@@ -909,6 +927,59 @@ def _handle_detect_command(args: argparse.Namespace, remaining: list[str]) -> No
             _display_detection_plain(result, verbose=verbose)
 
 
+def _handle_bulk_command(args: argparse.Namespace, remaining: list[str]) -> None:
+    """Handle 'bulk' subcommand."""
+    from texthumanize.bulk import OPERATIONS, BulkStats, run_bulk
+    from texthumanize.exceptions import ConfigError
+
+    parser = argparse.ArgumentParser(
+        prog="texthumanize bulk",
+        description="Process a directory, glob, JSONL or CSV corpus into JSONL",
+    )
+    parser.add_argument("source", help="Directory, glob, .jsonl/.csv file or '-' (JSONL on stdin)")
+    parser.add_argument("--op", choices=OPERATIONS, default="humanize", help="Operation (default: humanize)")
+    parser.add_argument("-w", "--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint)")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start over")
+    parser.add_argument("--text-field", default="text", help="Text field of JSONL/CSV records")
+    parser.add_argument("--id-field", default="id", help="ID field of JSONL/CSV records")
+    parser.add_argument("--quiet", action="store_true", help="No progress output")
+    bulk_args = parser.parse_args(remaining)
+
+    last = 0.0
+
+    def _progress(stats: BulkStats) -> None:
+        nonlocal last
+        now = time.monotonic()
+        if now - last >= 1.0:
+            last = now
+            print(f"\r  {stats.summary()}", end="", file=sys.stderr, flush=True)
+
+    try:
+        stats = run_bulk(
+            bulk_args.source,
+            args.output,
+            op=bulk_args.op,
+            workers=bulk_args.workers,
+            checkpoint=bulk_args.checkpoint,
+            restart=bulk_args.restart,
+            text_field=bulk_args.text_field,
+            id_field=bulk_args.id_field,
+            lang=args.lang,
+            profile=args.profile,
+            intensity=args.intensity,
+            seed=args.seed,
+            on_progress=None if bulk_args.quiet else _progress,
+        )
+    except (ConfigError, OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not bulk_args.quiet:
+        print(f"\r  {stats.summary()} · {stats.elapsed:.1f}s", file=sys.stderr)
+    if stats.errors:
+        sys.exit(1)
+
+
 # ═══════════════════════════════════════════════════════════════
 # MAIN
 # ═══════════════════════════════════════════════════════════════
@@ -933,6 +1004,8 @@ Examples:
   texthumanize detect input.txt --verbose
   texthumanize train --samples 1000 --epochs 30
   texthumanize benchmark --lang en
+  texthumanize bulk docs/ -o out.jsonl --op detect --workers 8
+  texthumanize snapshot build
   echo "Text" | texthumanize detect -
   echo "Text" | texthumanize -
         """,
@@ -940,7 +1013,7 @@ Examples:
 
     parser.add_argument(
         "input",
-        help="Input file ('-' for stdin), or subcommand: detect, train, benchmark",
+        help="Input file ('-' for stdin), or subcommand: detect, train, benchmark, bulk, snapshot",
     )
     parser.add_argument("-o", "--output", help="Output file (default: stdout)")
     parser.add_argument(
@@ -1022,7 +1095,8 @@ Examples:
         "--no-color", action="store_true", help="Disable rich formatting"
     )
     parser.add_argument(
-        "-v", "--version", action="version", version=f"texthumanize {__version__}"
+        "-v", "--version", action=_VersionAction,
+        help="show program's version number and exit",
     )
 
     args, remaining = parser.parse_known_args()
@@ -1040,6 +1114,13 @@ Examples:
     if args.input == "train":
         _handle_train_command(args, remaining)
         return
+    if args.input == "bulk":
+        _handle_bulk_command(args, remaining)
+        return
+    if args.input == "snapshot":
+        from texthumanize.snapshot import main as snapshot_main
+
+        sys.exit(snapshot_main(remaining, prog="texthumanize snapshot"))
     if args.input == "benchmark":
         if _HAS_RICH and _con and not getattr(args, 'json', False):
             _handle_benchmark_rich(args, remaining)
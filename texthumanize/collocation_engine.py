@@ -21,6 +21,7 @@ import re
 from typing import Any
 
 from texthumanize._colloc_data import get_collocations
+from texthumanize.cache import memo_cache
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +29,14 @@ logger = logging.getLogger(__name__)
 # 2500+ collocations across 9 languages.
 # Data compressed in _colloc_data.py (auto-generated).
 
-_COLLOCS_CACHE: dict[str, dict[tuple[str, str], float]] = {}
+_COLLOCS_CACHE = memo_cache("collocation.tables", max_entries=16)
 _SUPPORTED_LANGS = frozenset({
     "en", "ru", "de", "fr", "es", "it", "pt", "pl", "uk",
 })
 
 def _get_collocs(lang: str) -> dict[tuple[str, str], float]:
     """Get collocation dict for a language (lazy-loaded)."""
-    if lang not in _COLLOCS_CACHE:
-        _COLLOCS_CACHE[lang] = get_collocations(lang)
-    return _COLLOCS_CACHE[lang]
+    return _COLLOCS_CACHE.get_or_compute(lang, lambda: get_collocations(lang))
 
 _TOK_RE = re.compile(r"[\w'']+", re.UNICODE)
 
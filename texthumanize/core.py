@@ -3,22 +3,23 @@
 from __future__ import annotations
 
 import logging
-import re
+import math
 import threading
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Any, cast
 
-from texthumanize.analyzer import TextAnalyzer
+from texthumanize.budget import BudgetScheduler, ComputeBudget
 from texthumanize.cache import result_cache
 from texthumanize.exceptions import ConfigError, InputTooLargeError
 from texthumanize.lang_detect import detect_language
-from texthumanize.pipeline import Pipeline
 from texthumanize.utils import AnalysisReport, DetectionReport, HumanizeOptions, HumanizeResult
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
+    from typing import IO
 
+    from texthumanize.pipeline import Pipeline
     from texthumanize.stylistic import StylisticFingerprint
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,16 @@ def _lazy_import(module_path: str) -> object:
         return mod
 
 
+def _get_pipeline() -> Any:
+    # The pipeline imports every stage module; detection-only callers
+    # never pay for it.
+    return _lazy_import("texthumanize.pipeline")
+
+
+def _get_analyzer() -> Any:
+    return _lazy_import("texthumanize.analyzer")
+
+
 def _get_detectors() -> Any:
     return _lazy_import("texthumanize.detectors")
 
@@ -99,6 +110,31 @@ def _get_hmm_tagger() -> Any:
     return _lazy_import("texthumanize.hmm_tagger")
 
 
+_MAX_TEXT_LENGTH = 1_000_000  # 1M chars safety limit
+
+
+def _check_humanize_input(text: object) -> bool:
+    """Validate a humanize() input; False for an empty/blank text."""
+    if not isinstance(text, str):
+        raise ConfigError(f"Expected str, got {type(text).__name__}")
+    if not text or not text.strip():
+        return False
+    if len(text) > _MAX_TEXT_LENGTH:
+        raise InputTooLargeError(len(text), _MAX_TEXT_LENGTH)
+    return True
+
+
+def _empty_humanize_result(
+    text: str, lang: str, profile: str, intensity: int,
+) -> HumanizeResult:
+    """humanize() result for an empty/blank text: returned unchanged."""
+    return HumanizeResult(
+        original=text, text=text, lang=lang or "en",
+        profile=profile, intensity=intensity,
+        changes=[], metrics_before={}, metrics_after={},
+    )
+
+
 def humanize(
     text: str,
     lang: str = "auto",
@@ -123,6 +159,7 @@ def humanize(
     oss_api_url: str | None = None,
     ollama_model: str = "llama3.2",
     ollama_url: str | None = None,
+    compute_budget: ComputeBudget | None = None,
 ) -> HumanizeResult:
     """Гуманизировать текст — сделать его более естественным.
 
@@ -178,6 +215,10 @@ def humanize(
         oss_api_url: URL для OSS Gradio endpoint (по умолчанию amd/gpt-oss-120b-chatbot).
         ollama_model: Модель Ollama (по умолчанию 'llama3.2').
         ollama_url: URL сервера Ollama (по умолчанию 'http://localhost:11434').
+        compute_budget: Общий бюджет вычислений (время, вызовы детектора,
+            проходы пайплайна) на все вложенные циклы — retry, detection
+            loop, PHANTOM™. Первый проход выполняется всегда; дальнейшие
+            шаги — пока бюджет позволяет.
 
     Returns:
         HumanizeResult с полями:
@@ -206,17 +247,8 @@ def humanize(
         >>> result = humanize("AI text.", auto_evade=True, target_ai_score=0.25)
     """
     # Input sanitization
-    if not isinstance(text, str):
-        raise ConfigError(f"Expected str, got {type(text).__name__}")
-    if not text or not text.strip():
-        return HumanizeResult(
-            original=text, text=text, lang=lang or "en",
-            profile=profile, intensity=intensity,
-            changes=[], metrics_before={}, metrics_after={},
-        )
-    MAX_TEXT_LENGTH = 1_000_000  # 1M chars safety limit
-    if len(text) > MAX_TEXT_LENGTH:
-        raise InputTooLargeError(len(text), MAX_TEXT_LENGTH)
+    if not _check_humanize_input(text):
+        return _empty_humanize_result(text, lang, profile, intensity)
 
     # ── auto_evade shortcut ──────────────────────────────────────
     # Delegates to humanize_until_human() with adaptive strategy.
@@ -225,6 +257,7 @@ def humanize(
             text, lang=lang, profile=profile, intensity=intensity,
             target_score=target_ai_score, max_attempts=max_evade_attempts,
             intensity_step=8, seed=seed, strategy="adaptive",
+            compute_budget=compute_budget,
         )
 
     # ── AI backend routing ──────────────────────────────────────
@@ -279,7 +312,7 @@ def humanize(
             return cast(HumanizeResult, cached)
 
     # Запускаем пайплайн
-    pipeline = Pipeline(options=options)
+    pipeline = _get_pipeline().Pipeline(options=options)
 
     # ── Selective humanization ────────────────────────────────
     if only_flagged:
@@ -287,14 +320,18 @@ def humanize(
             text, detected_lang, pipeline, options,
         )
 
-    result = pipeline.run(text, detected_lang)
+    result = pipeline.run(text, detected_lang, compute_budget=compute_budget)
 
     # ── PHANTOM™ post-processing ─────────────────────────────
     # Gradient-guided neural optimization: fine-tunes the humanized text
     # to minimize detection score by targeting specific neural features.
     # Only runs if the base result still has a high detection score.
-    if phantom:
+    if phantom and (
+        compute_budget is None or compute_budget.can_afford(detector_calls=2)
+    ):
         try:
+            if compute_budget is not None:
+                compute_budget.charge("detector_calls")
             current_det = detect_ai(result.text, lang=detected_lang)
             current_combined = current_det.get("combined_score", current_det.get("score", 0.5))
             if current_combined > phantom_target:
@@ -306,6 +343,7 @@ def humanize(
                     budget=phantom_budget,
                     max_iterations=15,
                     seed=seed,
+                    compute_budget=compute_budget,
                 )
                 if phantom_result.final_score < current_combined:
                     result = HumanizeResult(
@@ -326,44 +364,7 @@ def humanize(
     # ── Grammar post-processing for Slavic languages ──────────
     # Applied regardless of whether PHANTOM ran,
     # fixes agreement/government issues from dictionary replacements.
-    # Uses paragraph-safe grammar fixes (not full _cleanup_text which
-    # may collapse paragraph structure).
-    if detected_lang in ("ru", "uk"):
-        try:
-            from texthumanize.phantom import (
-                _fix_grammar_slavic,
-                _fix_sentence_caps,
-            )
-            lines = result.text.split("\n")
-            fixed_lines = []
-            in_code_block = False
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith("```"):
-                    in_code_block = not in_code_block
-                    fixed_lines.append(line)
-                    continue
-                if in_code_block:
-                    fixed_lines.append(line)
-                    continue
-                if stripped:
-                    line = _fix_grammar_slavic(line, detected_lang)
-                    line = _fix_sentence_caps(line)
-                fixed_lines.append(line)
-            fixed_text = "\n".join(fixed_lines)
-            if fixed_text != result.text:
-                result = HumanizeResult(
-                    original=result.original,
-                    text=fixed_text,
-                    lang=result.lang,
-                    profile=result.profile,
-                    intensity=result.intensity,
-                    changes=result.changes,
-                    metrics_before=result.metrics_before,
-                    metrics_after=result.metrics_after,
-                )
-        except Exception:
-            pass  # Grammar cleanup is best-effort
+    result = _fix_slavic_grammar(result, detected_lang)
 
     # ── Cache result (only deterministic calls with seed) ─────
     if seed is not None:
@@ -375,6 +376,53 @@ def humanize(
     return result
 
 
+def _fix_slavic_grammar(result: HumanizeResult, lang: str) -> HumanizeResult:
+    """Paragraph-safe grammar fixes for ru/uk output.
+
+    Uses paragraph-safe grammar fixes (not full _cleanup_text which
+    may collapse paragraph structure). Best-effort: returns *result*
+    unchanged on any failure.
+    """
+    if lang not in ("ru", "uk"):
+        return result
+    try:
+        from texthumanize.phantom import (
+            _fix_grammar_slavic,
+            _fix_sentence_caps,
+        )
+        lines = result.text.split("\n")
+        fixed_lines = []
+        in_code_block = False
+        for line in lines:
+            stripped = line.strip()
+            if stripped.startswith("```"):
+                in_code_block = not in_code_block
+                fixed_lines.append(line)
+                continue
+            if in_code_block:
+                fixed_lines.append(line)
+                continue
+            if stripped:
+                line = _fix_grammar_slavic(line, lang)
+                line = _fix_sentence_caps(line)
+            fixed_lines.append(line)
+        fixed_text = "\n".join(fixed_lines)
+        if fixed_text != result.text:
+            return HumanizeResult(
+                original=result.original,
+                text=fixed_text,
+                lang=result.lang,
+                profile=result.profile,
+                intensity=result.intensity,
+                changes=result.changes,
+                metrics_before=result.metrics_before,
+                metrics_after=result.metrics_after,
+            )
+    except Exception:
+        pass  # Grammar cleanup is best-effort
+    return result
+
+
 # ── AI-backend humanization helper ──────────────────────────
 
 def _humanize_via_backend(
@@ -548,7 +596,7 @@ def _humanize_flagged_only(
     combined = "".join(parts)
 
     # Analyze before/after
-    analyzer_obj = TextAnalyzer(lang=lang)
+    analyzer_obj = _get_analyzer().TextAnalyzer(lang=lang)
     metrics_before = analyzer_obj.analyze(text)
     metrics_after = analyzer_obj.analyze(combined)
 
@@ -614,7 +662,7 @@ def analyze(text: str, lang: str = "auto") -> AnalysisReport:
     if lang == "auto":
         detected_lang = detect_language(text)
 
-    analyzer = TextAnalyzer(lang=detected_lang)
+    analyzer = _get_analyzer().TextAnalyzer(lang=detected_lang)
     return analyzer.analyze(text)
 
 
@@ -715,6 +763,8 @@ def humanize_until_human(
     seed: int | None = None,
     verbose: bool = False,
     strategy: str = "adaptive",
+    *,
+    compute_budget: ComputeBudget | None = None,
 ) -> HumanizeResult:
     """Humanize text repeatedly until AI detection score drops below target.
 
@@ -734,6 +784,12 @@ def humanize_until_human(
         seed: Random seed for reproducibility.
         verbose: Log each attempt.
         strategy: ``"adaptive"`` (default) or ``"escalate"``.
+        compute_budget: Shared compute allowance for the whole call.
+            When given, a :class:`~texthumanize.budget.BudgetScheduler`
+            decides after each attempt whether another humanize round
+            or PHANTOM™ refinement is the better use of what is left,
+            and the best result so far is returned once it runs out.
+            ``max_attempts`` still caps the number of rounds.
 
     Returns:
         HumanizeResult from the best (lowest AI score) attempt.
@@ -741,6 +797,21 @@ def humanize_until_human(
     if lang == "auto":
         lang = detect_language(text)
 
+    scheduler: BudgetScheduler | None = None
+    if compute_budget is not None:
+        scheduler = BudgetScheduler(compute_budget)
+        # Priors: one round typically buys ~0.1 of score; PHANTOM™
+        # evaluates the detector once per FORGE iteration.
+        scheduler.register(
+            "humanize", prior_gain=0.10,
+            pipeline_passes=1, detector_calls=2,
+        )
+        scheduler.register(
+            "phantom", prior_gain=0.05,
+            detector_calls=16, repeatable=False,
+        )
+    run_phantom = compute_budget is None
+
     best_result: HumanizeResult | None = None
     best_score = float("inf")
     current_text = text
@@ -750,6 +821,14 @@ def humanize_until_human(
     _adapt_overrides: dict[str, int] = {}
 
     for attempt in range(max_attempts):
+        if scheduler is not None and attempt > 0:
+            step = scheduler.choose()
+            if step != "humanize":
+                run_phantom = step == "phantom"
+                break
+        spent_before = compute_budget.spent if compute_budget is not None else {}
+        prev_best = best_score
+
         # Build effective intensity for this round
         effective_intensity = current_intensity
         if strategy == "adaptive" and _adapt_overrides:
@@ -761,9 +840,12 @@ def humanize_until_human(
         result = humanize(
             current_text, lang=lang, profile=profile,
             intensity=effective_intensity, seed=seed,
+            compute_budget=compute_budget,
         )
 
         # Detect AI score on humanized text
+        if compute_budget is not None:
+            compute_budget.charge("detector_calls")
         detection = detect_ai(result.text, lang=lang)
         score = detection.get("combined_score", detection.get("score", 0.5))
 
@@ -779,6 +861,13 @@ def humanize_until_human(
             best_score = score
             best_result = result
 
+        if scheduler is not None and compute_budget is not None and attempt > 0:
+            spent_after = compute_budget.spent
+            scheduler.record(
+                "humanize", prev_best - best_score,
+                spent={u: spent_after[u] - spent_before[u] for u in spent_after},
+            )
+
         # Check if we've reached the target
         if score <= target_score:
             if verbose:
@@ -796,6 +885,11 @@ def humanize_until_human(
         current_intensity = min(current_intensity + intensity_step, 100)
         # Use the humanized text as input for next round
         current_text = result.text
+    else:
+        # Rounds ran out: PHANTOM™ is the only step left to consider.
+        if scheduler is not None:
+            scheduler.retire("humanize")
+            run_phantom = scheduler.choose() == "phantom"
 
     if best_result is None:
         # Should not happen, but fallback
@@ -804,7 +898,7 @@ def humanize_until_human(
     # ── PHANTOM™ final refinement ─────────────────────────────
     # If the naturalizer pipeline didn't reach target, apply PHANTOM™
     # gradient-guided optimization as a last-mile refinement.
-    if best_score > target_score:
+    if best_score > target_score and run_phantom:
         try:
             from texthumanize.phantom import get_phantom
             engine = get_phantom()
@@ -814,6 +908,7 @@ def humanize_until_human(
                 budget=1.0,
                 max_iterations=15,
                 seed=seed,
+                compute_budget=compute_budget,
             )
             if phantom_result.final_score < best_score:
                 best_result = HumanizeResult(
@@ -939,13 +1034,19 @@ def humanize_chunked(
 ) -> HumanizeResult:
     """Process large texts by splitting into manageable chunks.
 
-    Splits the text at paragraph or sentence boundaries, processes each
-    chunk independently (optionally in parallel), then reassembles.
+    Splits the text at paragraph (or sentence) boundaries into chunks
+    balanced for the worker count, processes each chunk (optionally in
+    parallel) with read-only context, then merges the results back by
+    span, keeping the original separators. Document-level analysis is
+    computed once and shared by all chunks; see
+    :mod:`texthumanize.chunk_planner`.
 
     Args:
         text: Text to process (any length).
         chunk_size: Target chunk size in characters (default 5000).
-        overlap: Character overlap between chunks to preserve context.
+        overlap: Characters of read-only context on each side of a chunk.
+            The context is used for scoring and never duplicated in
+            the output.
         lang: Language code ('auto' for auto-detection).
         profile: Processing profile.
         intensity: Processing intensity (0-100).
@@ -974,55 +1075,69 @@ def humanize_chunked(
             preserve=preserve, constraints=constraints, seed=seed,
         )
 
-    # Split into paragraph-based chunks (overlap applied between adjacent chunks)
-    chunks = _split_into_chunks(text, chunk_size, overlap=overlap)
-
     detected_lang = lang
     if lang == "auto":
         detected_lang = detect_language(text[:2000])
 
-    def _process_chunk(idx_chunk: tuple[int, str]) -> tuple[int, HumanizeResult]:
-        i, chunk = idx_chunk
-        chunk_seed = seed + i if seed is not None else None
-        result = humanize(
-            chunk,
-            lang=detected_lang,
-            profile=profile,
-            intensity=intensity,
-            preserve=preserve,
-            constraints=constraints,
-            seed=chunk_seed,
+    from texthumanize.chunk_planner import (
+        ChunkContext,
+        DocumentContext,
+        merge_chunks,
+        plan_chunks,
+    )
+    from texthumanize.streaming import BoundarySmoother
+
+    # Document statistics once; spans balanced for the worker count.
+    document = DocumentContext.build(text, detected_lang)
+    spans = plan_chunks(
+        text, chunk_size, context=overlap,
+        workers=max_workers if max_workers and max_workers >= 2 else None,
+    )
+
+    def _process_chunk(i: int) -> tuple[int, HumanizeResult]:
+        span = spans[i]
+        options = HumanizeOptions(
+            lang=detected_lang, profile=profile, intensity=intensity,
+            seed=seed + i if seed is not None else None,
         )
-        return (i, result)
+        if preserve:
+            options.preserve.update(preserve)
+        if constraints:
+            options.constraints.update(constraints)
+        result = _get_pipeline().Pipeline(options=options).run(
+            span.text(text), detected_lang,
+            context=ChunkContext.for_span(text, span, document),
+        )
+        return (i, _fix_slavic_grammar(result, detected_lang))
 
-    indexed_chunks = list(enumerate(chunks))
     results_map: dict[int, HumanizeResult] = {}
 
-    if max_workers and max_workers >= 2 and len(chunks) > 1:
+    if max_workers and max_workers >= 2 and len(spans) > 1:
         # Параллельная обработка
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {
-                executor.submit(_process_chunk, ic): ic[0]
-                for ic in indexed_chunks
+                executor.submit(_process_chunk, i): i
+                for i in range(len(spans))
             }
             for future in as_completed(futures):
                 idx, result = future.result()
                 results_map[idx] = result
     else:
         # Последовательная обработка
-        for ic in indexed_chunks:
-            idx, result = _process_chunk(ic)
+        for i in range(len(spans)):
+            idx, result = _process_chunk(i)
             results_map[idx] = result
 
-    # Собираем в порядке
-    ordered = [results_map[i] for i in range(len(chunks))]
-    all_processed = [r.text for r in ordered]
+    # Собираем по спанам: разделители между фрагментами — из оригинала.
+    ordered = [results_map[i] for i in range(len(spans))]
+    seams = BoundarySmoother(detected_lang, seed)
+    outputs = [seams.smooth(r.text) for r in ordered]
+    processed_text = merge_chunks(text, spans, outputs)
     all_changes: list[dict] = []
     for r in ordered:
         all_changes.extend(r.changes)
 
-    processed_text = "\n\n".join(all_processed)
-
+    metrics_after = _get_analyzer().TextAnalyzer(lang=detected_lang).analyze(processed_text)
     return HumanizeResult(
         original=text,
         text=processed_text,
@@ -1030,9 +1145,32 @@ def humanize_chunked(
         profile=profile,
         intensity=intensity,
         changes=all_changes,
+        metrics_before=_report_metrics(document.metrics, {
+            "content_type": document.content.content_type.value,
+            "content_confidence": round(document.content.confidence, 3),
+            "chunks": len(spans),
+        }),
+        metrics_after=_report_metrics(metrics_after),
     )
 
 
+def _report_metrics(
+    report: AnalysisReport, extra: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Metrics dict in the shape Pipeline puts into HumanizeResult."""
+    return {
+        "artificiality_score": report.artificiality_score,
+        "avg_sentence_length": report.avg_sentence_length,
+        "bureaucratic_ratio": report.bureaucratic_ratio,
+        "connector_ratio": report.connector_ratio,
+        "repetition_score": report.repetition_score,
+        "typography_score": report.typography_score,
+        "predictability_score": report.predictability_score,
+        "vocabulary_richness": report.vocabulary_richness,
+        **(extra or {}),
+    }
+
+
 def humanize_batch(
     texts: list[str],
     lang: str = "auto",
@@ -1101,43 +1239,6 @@ def humanize_batch(
     return [results_map[i] for i in range(total)]
 
 
-def _split_into_chunks(text: str, chunk_size: int, overlap: int = 0) -> list[str]:
-    """Split text at paragraph boundaries, respecting chunk_size.
-
-    When *overlap* > 0, the last `overlap` characters of each chunk
-    are prepended to the next chunk to preserve cross-boundary context.
-    """
-    paragraphs = re.split(r'\n\s*\n', text)
-    chunks: list[str] = []
-    current: list[str] = []
-    current_len = 0
-
-    for para in paragraphs:
-        para = para.strip()
-        if not para:
-            continue
-        para_len = len(para)
-
-        if current_len + para_len > chunk_size and current:
-            chunks.append("\n\n".join(current))
-            # Overlap: carry trailing characters into next chunk
-            if overlap > 0:
-                tail = chunks[-1][-overlap:]
-                current = [tail]
-                current_len = len(tail)
-            else:
-                current = []
-                current_len = 0
-
-        current.append(para)
-        current_len += para_len
-
-    if current:
-        chunks.append("\n\n".join(current))
-
-    return chunks if chunks else [text]
-
-
 # ═══════════════════════════════════════════════════════════════
 #  НОВЫЕ API ФУНКЦИИ v0.4.0
 # ═══════════════════════════════════════════════════════════════
@@ -1165,36 +1266,89 @@ def detect_ai(text: str, lang: str = "auto") -> DetectionReport:
         >>> result = detect_ai("This is a remarkably compelling text.")
         >>> print(f"AI: {result['score']:.2f}, verdict: {result['verdict']}")
     """
-    if not isinstance(text, str):
-        raise ConfigError(f"Expected str, got {type(text).__name__}")
-    if not text or not text.strip():
-        return {"score": 0.0, "combined_score": 0.0, "stat_probability": None,
-                "verdict": "human", "confidence": 0.0, "metrics": {}}
-    MAX_DETECT_LENGTH = 1_000_000
-    if len(text) > MAX_DETECT_LENGTH:
-        raise InputTooLargeError(len(text), MAX_DETECT_LENGTH)
+    if not _check_detect_input(text):
+        return _empty_detection()
 
     if lang == "auto":
         lang = detect_language(text)
 
     det = _get_detectors()
     result = det.detect_ai(text, lang=lang)
+    return _detection_report(
+        result,
+        lang,
+        stat_prob=_stat_probability(text, lang),
+        neural_result=_neural_detection(text, lang),
+        neural_ppl=_neural_perplexity(text),
+    )
+
 
-    # Enhance with statistical detector
+_MAX_DETECT_LENGTH = 1_000_000
+
+
+def _check_detect_input(text: object) -> bool:
+    """Validate a detect_ai() input; False for an empty/blank text."""
+    if not isinstance(text, str):
+        raise ConfigError(f"Expected str, got {type(text).__name__}")
+    if not text or not text.strip():
+        return False
+    if len(text) > _MAX_DETECT_LENGTH:
+        raise InputTooLargeError(len(text), _MAX_DETECT_LENGTH)
+    return True
+
+
+def _empty_detection() -> DetectionReport:
+    return {"score": 0.0, "combined_score": 0.0, "stat_probability": None,
+            "verdict": "human", "confidence": 0.0, "metrics": {}}
+
+
+def _stat_probability(text: str, lang: str) -> float | None:
+    """Statistical detector probability, None if it failed."""
     try:
         sd = _get_stat_detector()
         stat_result = sd.detect_ai_statistical(text, lang=lang)
-        stat_prob = stat_result.get("probability", 0.5)
+        return stat_result.get("probability", 0.5)
     except Exception:
-        stat_prob = None
+        return None
 
-    # Enhance with neural MLP detector (35→64→32→1)
-    neural_prob = None
-    neural_details: dict = {}
+
+def _neural_detection(text: str, lang: str) -> dict | None:
+    """Neural MLP detector (35→64→32→1) result, None if it failed."""
     try:
         nd_mod = _get_neural_detector()
-        nd = nd_mod.NeuralAIDetector()
-        neural_result = nd.detect(text, lang=lang)
+        return nd_mod.NeuralAIDetector().detect(text, lang=lang)
+    except Exception:
+        return None
+
+
+def _neural_perplexity(text: str) -> float | None:
+    """Character-level LSTM perplexity, None if it failed.
+
+    max_chars=500 — sufficient for accurate perplexity estimation while
+    being ~4x faster than 2000.
+    """
+    try:
+        nlm_mod = _get_neural_lm()
+        return nlm_mod.get_neural_lm().perplexity(text, max_chars=500)
+    except Exception:
+        return None
+
+
+def _detection_report(
+    result: Any,
+    lang: str,
+    stat_prob: float | None,
+    neural_result: dict | None,
+    neural_ppl: float | None,
+) -> DetectionReport:
+    """Merge the heuristic, statistical and neural signals into a report.
+
+    Shared by detect_ai() and the batch engine, so both build identical
+    results from the same component outputs.
+    """
+    neural_prob = None
+    neural_details: dict = {}
+    if neural_result is not None:
         neural_prob = neural_result.get("score")
         neural_details = {
             "neural_score": neural_prob,
@@ -1202,24 +1356,15 @@ def detect_ai(text: str, lang: str = "auto") -> DetectionReport:
             "neural_confidence": neural_result.get("confidence"),
             "neural_top_features": neural_result.get("top_features"),
         }
-    except Exception:
-        pass
 
-    # Enhance with neural perplexity (character-level LSTM)
-    # Use max_chars=500 — sufficient for accurate perplexity estimation
-    # while being ~4x faster than 2000. Score is derived from perplexity
-    # without a second forward pass.
-    neural_ppl = None
+    # Score is derived from perplexity without a second forward pass.
     neural_ppl_score = None
-    try:
-        nlm_mod = _get_neural_lm()
-        nlm = nlm_mod.get_neural_lm()
-        neural_ppl = nlm.perplexity(text, max_chars=500)
-        # Inline score computation (avoids second forward pass)
-        neural_ppl_score = max(0.0, min(1.0,
-            1.0 / (1.0 + __import__('math').exp(0.8 * (neural_ppl - 4.5)))))
-    except Exception:
-        pass
+    if neural_ppl is not None:
+        try:
+            neural_ppl_score = max(0.0, min(1.0,
+                1.0 / (1.0 + math.exp(0.8 * (neural_ppl - 4.5)))))
+        except OverflowError:
+            neural_ppl_score = None
 
     # Ensemble: weighted merge of 3 signals
     # Neural trained MLP is most accurate for EN/RU (trained on those).
@@ -1323,17 +1468,30 @@ def detect_ai_fast(text: str, lang: str = "auto") -> dict:
     }
 
 
-def detect_ai_batch(texts: list[str], lang: str = "auto") -> list[DetectionReport]:
+def detect_ai_batch(
+    texts: list[str],
+    lang: str = "auto",
+    *,
+    workers: int | None = 1,
+) -> list[DetectionReport]:
     """Пакетная проверка текстов на AI-генерацию.
 
+    Одинаковые тексты проверяются один раз, извлечение признаков идёт
+    в пуле процессов (``workers > 1``), нейросетевые стадии (MLP по
+    языковым группам, LSTM) считаются пакетом — см.
+    :mod:`texthumanize.batch_detect`.
+
     Args:
         texts: Список текстов.
         lang: Код языка.
+        workers: Число процессов (``None`` = число CPU, 1 = без пула).
 
     Returns:
-        Список результатов detect_ai для каждого текста.
+        Список результатов detect_ai для каждого текста, в порядке входа.
     """
-    return [detect_ai(t, lang=lang) for t in texts]
+    from texthumanize.batch_detect import detect_ai_batch as _batch
+
+    return _batch(texts, lang, workers=workers)
 
 
 def detect_ai_sentences(
@@ -1553,14 +1711,19 @@ def spin_variants(
     count: int = 5,
     lang: str = "auto",
     intensity: float = 0.5,
+    seed: int | None = None,
 ) -> list[str]:
     """Сгенерировать несколько уникальных версий текста.
 
+    Spintax строится один раз, затем каждый вариант лишь выбирает
+    синонимы из уже разобранного шаблона.
+
     Args:
         text: Исходный текст.
         count: Количество вариантов.
         lang: Код языка.
         intensity: 0..1, доля слов для замены.
+        seed: Зерно RNG для воспроизводимости.
 
     Returns:
         Список уникальных версий.
@@ -1568,7 +1731,7 @@ def spin_variants(
     if lang == "auto":
         lang = detect_language(text)
     return list(_get_spinner().generate_variants(
-        text, count=count, lang=lang, intensity=intensity
+        text, count=count, lang=lang, intensity=intensity, seed=seed,
     ))
 
 
@@ -1621,7 +1784,7 @@ def full_readability(text: str, lang: str = "auto") -> dict:
     if lang == "auto":
         lang = detect_language(text)
 
-    analyzer = TextAnalyzer(lang=lang)
+    analyzer = _get_analyzer().TextAnalyzer(lang=lang)
     return analyzer.full_readability(text)
 
 
@@ -1946,6 +2109,10 @@ def humanize_variants(
     intensity: int = 60,
     preserve: dict | None = None,
     seed: int | None = None,
+    target_score: float | None = None,
+    first_k: int | None = None,
+    max_workers: int | None = None,
+    executor: str = "thread",
 ) -> list[dict]:
     """Generate multiple humanization variants for comparison.
 
@@ -1953,6 +2120,10 @@ def humanize_variants(
     producing different but valid humanizations. Results are sorted
     by quality score (best first).
 
+    The seed-independent part of the pipeline (analysis, watermark
+    cleaning, segmentation, typography, baseline detection) runs once
+    and is shared by all variants — see :mod:`texthumanize.variant_engine`.
+
     Args:
         text: Input text.
         lang: Language code.
@@ -1961,54 +2132,30 @@ def humanize_variants(
         intensity: Processing intensity (0-100).
         preserve: Preservation settings.
         seed: Base seed (variants derive from this).
+        target_score: AI score under which a variant counts as a hit.
+        first_k: Stop after this many hits (requires target_score);
+            fewer than ``variants`` results may be returned.
+        max_workers: Parallel workers (None/1 = sequential).
+        executor: ``"thread"`` or ``"process"`` pool for max_workers >= 2.
 
     Returns:
         List of dicts sorted by quality, each with: text, variant_id,
         seed_used, change_ratio, quality_score, ai_score, changes_count.
     """
-    import random as _rnd
-
-    variants = max(1, min(variants, 10))
+    from texthumanize.variant_engine import VariantEngine
 
-    if lang == "auto":
-        lang = detect_language(text)
-
-    base_seed = seed if seed is not None else _rnd.randint(0, 2**31)
-    results: list[dict[str, Any]] = []
-
-    for i in range(variants):
-        variant_seed = base_seed + i * 7919  # prime offset
-        result = humanize(
-            text,
-            lang=lang,
-            profile=profile,
-            intensity=intensity,
-            preserve=preserve,
-            seed=variant_seed,
-        )
-
-        # Score the variant
-        ai_check = detect_ai(result.text, lang=lang)
-
-        results.append({
-            "text": result.text,
-            "variant_id": i + 1,
-            "seed_used": variant_seed,
-            "change_ratio": round(result.change_ratio, 4),
-            "quality_score": round(result.quality_score, 4),
-            "ai_score": round(ai_check.get("score", 0.0), 4),
-            "changes_count": len(result.changes),
-            "metrics_after": result.metrics_after,
-        })
-
-    # Sort by quality: low AI score + high quality score
-    results.sort(key=lambda r: (r["ai_score"], -r["quality_score"]))
-
-    return results
+    engine = VariantEngine(
+        lang=lang, profile=profile, intensity=intensity, preserve=preserve,
+        max_workers=max_workers, executor=executor,
+    )
+    return engine.generate(
+        text, variants=variants, seed=seed,
+        target_score=target_score, first_k=first_k,
+    )
 
 
 def humanize_stream(
-    text: str,
+    text: str | Iterable[str] | IO[str],
     lang: str = "auto",
     *,
     profile: str = "web",
@@ -2016,77 +2163,49 @@ def humanize_stream(
     preserve: dict | None = None,
     seed: int | None = None,
     chunk_size: int = 500,
+    max_workers: int | None = None,
+    max_pending: int | None = None,
+    executor: str = "thread",
 ) -> Generator[dict[str, Any], None, None]:
     """Stream humanized text in chunks (generator).
 
-    Processes text paragraph-by-paragraph and yields results
-    incrementally. Useful for real-time UIs and chat integrations.
+    Reads the source incrementally, groups paragraphs into chunks and
+    yields each result as soon as it (and every chunk before it) is
+    done. Useful for real-time UIs, chat integrations and inputs too
+    large to hold in memory. See :mod:`texthumanize.streaming`.
 
     Args:
-        text: Input text.
-        lang: Language code.
+        text: Input text, an iterable of text pieces (e.g. lines) or a
+            file-like object opened in text or binary (UTF-8) mode.
+        lang: Language code ('auto' = detect once, on the first chunk).
         profile: Processing profile.
         intensity: Processing intensity (0-100).
         preserve: Preservation settings.
-        seed: Random seed.
+        seed: Random seed; chunk *i* uses ``seed + i``.
         chunk_size: Approximate characters per chunk.
+        max_workers: Parallel workers (None/1 = sequential).
+        max_pending: Chunks read ahead of the output (default
+            ``2 × max_workers``).
+        executor: ``"thread"`` (default) or ``"process"``.
 
     Yields:
-        Dict with: chunk, chunk_index, is_last, progress (0.0-1.0),
-        original_chunk.
+        Dict with: chunk, chunk_index, total_chunks, is_last, progress
+        (0.0-1.0; None while unknown for unsized sources),
+        original_chunk, change_ratio, lang.
     """
-    if lang == "auto":
-        lang = detect_language(text)
-
-    # Split into paragraphs
-    paragraphs = re.split(r'\n\s*\n', text)
-    if not paragraphs:
-        return
-
-    total_chars = len(text)
-    processed_chars = 0
-    chunk_index = 0
-
-    # Group paragraphs into chunks of approximate size
-    current_chunk = []
-    current_size = 0
-    chunks = []
-
-    for para in paragraphs:
-        current_chunk.append(para)
-        current_size += len(para)
-        if current_size >= chunk_size:
-            chunks.append("\n\n".join(current_chunk))
-            current_chunk = []
-            current_size = 0
+    from texthumanize.streaming import StreamHumanizer
 
-    if current_chunk:
-        chunks.append("\n\n".join(current_chunk))
-
-    total_chunks = len(chunks)
-
-    for i, chunk in enumerate(chunks):
-        result = humanize(
-            chunk,
-            lang=lang,
-            profile=profile,
-            intensity=intensity,
-            preserve=preserve,
-            seed=seed + i if seed is not None else None,
-        )
-
-        processed_chars += len(chunk)
-        chunk_index = i
-
-        yield {
-            "chunk": result.text,
-            "chunk_index": chunk_index,
-            "total_chunks": total_chunks,
-            "is_last": i == total_chunks - 1,
-            "progress": min(1.0, processed_chars / total_chars) if total_chars > 0 else 1.0,
-            "original_chunk": chunk,
-            "change_ratio": round(result.change_ratio, 4),
-        }
+    yield from StreamHumanizer(
+        lang,
+        profile=profile,
+        intensity=intensity,
+        preserve=preserve,
+        seed=seed,
+        chunk_size=chunk_size,
+        max_workers=max_workers,
+        max_pending=max_pending,
+        executor=executor,
+    ).stream(text)
 
 
 def anonymize_style(
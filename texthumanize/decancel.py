@@ -6,8 +6,9 @@ import logging
 import random
 import re
 
-from texthumanize.lang import get_lang_pack
+from texthumanize.lang import compile_pack, get_lang_pack
 from texthumanize.morphology import get_morphology
+from texthumanize.rule_sets import folds_like_lower, word_pattern
 from texthumanize.segmenter import has_placeholder
 from texthumanize.utils import coin_flip, get_profile, intensity_probability
 
@@ -217,12 +218,9 @@ class Debureaucratizer:
 
     def _replace_phrases(self, text: str, prob: float) -> str:
         """Заменить фразовые канцеляризмы."""
-        phrases = self.lang_pack.get("bureaucratic_phrases", {})
-
-        # Сортируем по длине (длинные фразы первыми)
-        sorted_phrases = sorted(phrases.items(), key=lambda x: len(x[0]), reverse=True)
-
-        for phrase, replacements in sorted_phrases:
+        # Длинные фразы первыми
+        for entry in compile_pack(self.lang_pack).phrases_by_length:
+            phrase, replacements = entry.text, entry.replacements
             # Проверяем бюджет замен
             if self._changes_made >= self._max_changes:
                 break
@@ -232,9 +230,7 @@ class Debureaucratizer:
 
             # Ищем фразу с учётом регистра первой буквы
             # \b предотвращает совпадение внутри слов (напр. "є" внутри "Немає")
-            pattern = re.compile(
-                r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE,
-            )
+            pattern = word_pattern(phrase)
             matches = list(pattern.finditer(text))
 
             for match in matches:
@@ -273,9 +269,11 @@ class Debureaucratizer:
 
     def _replace_words(self, text: str, prob: float) -> str:
         """Заменить однословные канцеляризмы."""
-        words = self.lang_pack.get("bureaucratic", {})
+        text_lower = text.lower()
+        exact = not folds_like_lower(text)
 
-        for word, replacements in words.items():
+        for entry in compile_pack(self.lang_pack).bureaucratic:
+            word, replacements = entry.text, entry.replacements
             # Проверяем бюджет замен
             if self._changes_made >= self._max_changes:
                 break
@@ -283,9 +281,15 @@ class Debureaucratizer:
             if not coin_flip(prob, self.rng):
                 continue
 
+            # Слова, которого нет в тексте даже как подстроки, не ищем
+            if not (exact or entry.lower in text_lower or not entry.folds):
+                continue
+
             # Паттерн: целое слово, с учётом регистра
-            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+            pattern = word_pattern(word)
             matches = list(pattern.finditer(text))
+            if not matches:
+                continue
 
             for match in reversed(matches):  # Обратный порядок, чтобы не сбить индексы
                 if self._changes_made >= self._max_changes:
@@ -329,4 +333,7 @@ class Debureaucratizer:
                     "replacement": replacement,
                 })
 
+            text_lower = text.lower()
+            exact = not folds_like_lower(text)
+
         return text
@@ -22,6 +22,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import math
 import re
@@ -31,11 +32,15 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 
+from texthumanize.cache import memo_cache
 from texthumanize.lang import get_lang_pack
 from texthumanize.sentence_split import split_sentences
 
 logger = logging.getLogger(__name__)
 
+# Sliding-window sentence scores: key (lang, blake2b(window sentences)).
+_WINDOW_CACHE = memo_cache("detectors.sentence_windows", max_entries=16384)
+
 # ═══════════════════════════════════════════════════════════════
 #  РЕЗУЛЬТАТ ДЕТЕКЦИИ
 # ═══════════════════════════════════════════════════════════════
@@ -495,7 +500,6 @@ class AIDetector:
                 for s in spans
             ]
 
-        _lang_pack = get_lang_pack(effective_lang)
         half = max(window // 2, 1)
 
         # Pre-compute fast per-sentence features
@@ -506,22 +510,7 @@ class AIDetector:
         for i, span in enumerate(spans):
             lo = max(0, i - half)
             hi = min(len(spans), i + half + 1)
-            win_sents = sent_texts[lo:hi]
-            win_text = " ".join(win_sents)
-            win_words = win_text.split()
-
-            # Compute subset of fast metrics on the window
-            entropy = self._calc_entropy(win_text, win_words)
-            pattern = self._calc_ai_patterns(
-                win_text, win_words, win_sents, effective_lang,
-            )
-            grammar = self._calc_grammar(win_text, win_sents)
-            voice = self._calc_voice(win_text, win_sents)
-
-            # Simple average of the subset
-            prob = (entropy * 0.20 + pattern * 0.40
-                    + grammar * 0.20 + voice * 0.20)
-            prob = max(0.0, min(1.0, prob))
+            prob = self.sentence_window_probability(sent_texts[lo:hi], effective_lang)
 
             if prob >= 0.65:
                 label = "ai"
@@ -537,6 +526,39 @@ class AIDetector:
 
         return results
 
+    def sentence_window_probability(self, sentences: list[str], lang: str) -> float:
+        """AI probability of one sliding window of sentences (memoized).
+
+        The window score depends only on its sentences, so it is cached
+        by their content: after an edit, only windows that contain a
+        changed sentence are scored again.
+        """
+        key = (
+            lang,
+            hashlib.blake2b(
+                "\x1f".join(sentences).encode("utf-8", "surrogatepass"),
+                digest_size=16,
+            ).digest(),
+        )
+        return _WINDOW_CACHE.get_or_compute(
+            key, lambda: self._window_probability(sentences, lang),
+        )
+
+    def _window_probability(self, win_sents: list[str], lang: str) -> float:
+        win_text = " ".join(win_sents)
+        win_words = win_text.split()
+
+        # Compute subset of fast metrics on the window
+        entropy = self._calc_entropy(win_text, win_words)
+        pattern = self._calc_ai_patterns(win_text, win_words, win_sents, lang)
+        grammar = self._calc_grammar(win_text, win_sents)
+        voice = self._calc_voice(win_text, win_sents)
+
+        # Simple average of the subset
+        prob = (entropy * 0.20 + pattern * 0.40
+                + grammar * 0.20 + voice * 0.20)
+        return max(0.0, min(1.0, prob))
+
     # ─── MIXED TEXT DETECTION ─────────────────────────────────
 
     @dataclass
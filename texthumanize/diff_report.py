@@ -19,6 +19,7 @@ import logging
 import re
 from typing import Any
 
+from texthumanize.diff_engine import opcodes
 from texthumanize.utils import HumanizeResult
 
 logger = logging.getLogger(__name__)
@@ -260,10 +261,9 @@ def _word_diff_html(original: str, modified: str) -> str:
     orig_words = re.findall(r'\S+|\s+', original)
     mod_words = re.findall(r'\S+|\s+', modified)
 
-    sm = difflib.SequenceMatcher(None, orig_words, mod_words)
     parts: list[str] = []
 
-    for tag, i1, i2, j1, j2 in sm.get_opcodes():
+    for tag, i1, i2, j1, j2 in opcodes(orig_words, mod_words):
         if tag == "equal":
             parts.append(esc("".join(orig_words[i1:i2])))
         elif tag == "delete":
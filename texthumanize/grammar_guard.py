@@ -16,12 +16,23 @@ from __future__ import annotations
 
 import logging
 import math
+import operator
 import os
 import re
 from dataclasses import dataclass, field
+from typing import Any
+
+from texthumanize.rule_sets import word_pattern
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+    np = None  # type: ignore[assignment]
+
 # ── Feature constants ─────────────────────────────────────────
 
 _WORD_RE = re.compile(r'[a-zA-Zа-яА-ЯёЁіїєґІЇЄҐüöäßÜÖÄ\'-]+')
@@ -69,6 +80,18 @@ def _bigram_pairs(tokens: list[str]) -> list[tuple[str, str]]:
     return [(tokens[i], tokens[i + 1]) for i in range(len(tokens) - 1)]
 
 
+_CONNECTORS = {
+    'en': {'however', 'therefore', 'furthermore', 'moreover', 'additionally',
+           'consequently', 'nevertheless', 'nonetheless', 'accordingly'},
+    'ru': {'однако', 'поэтому', 'следовательно', 'кроме того', 'более того',
+           'дополнительно', 'тем не менее', 'соответственно', 'таким образом'},
+    'uk': {'однак', 'тому', 'отже', 'крім того', 'більше того',
+           'додатково', 'тим не менш', 'відповідно', 'таким чином'},
+}
+
+_PUNCT_CHARS = frozenset('.,;:!?—–-()[]{}«»""\'')
+
+
 def extract_sentence_features(
     sentence: str,
     context_before: str,
@@ -91,148 +114,56 @@ def extract_sentence_features(
      10. connector_overuse   — connector/transition density
      11. syllable_uniformity — variance of syllable counts (low = robotic)
     """
-    tokens = _tokenize(sentence)
-    n_tokens = max(len(tokens), 1)
-    func_words = _get_func_words(lang)
-    content_tokens = [t for t in tokens if t not in func_words and len(t) > 2]
-    n_content = max(len(content_tokens), 1)
-
-    # ── 0. Collocation score ──────────────────────────────────
-    colloc_score = 0.0
-    try:
-        from texthumanize.collocation_engine import CollocEngine
-        ce = CollocEngine(lang=lang)
-        content_pairs = _bigram_pairs(content_tokens)
-        if content_pairs:
-            pmis = [ce.pmi(a, b) for a, b in content_pairs]
-            colloc_score = sum(pmis) / len(pmis)
-    except Exception:
-        pass
-
-    # ── 1. Frequency smoothness ───────────────────────────────
-    freq_smooth = 0.0
-    try:
-        from texthumanize._word_freq_data import get_word_freq
-        freq = get_word_freq(lang)
-        ranks = [float(freq.get(t, 0)) for t in content_tokens]
-        if len(ranks) >= 2:
-            mean_r = sum(ranks) / len(ranks)
-            freq_smooth = sum((r - mean_r) ** 2 for r in ranks) / len(ranks)
-            freq_smooth = math.log1p(freq_smooth)
-    except Exception:
-        pass
-
-    # ── 2. Bigram novelty ─────────────────────────────────────
-    bigram_novelty = 0.5  # default if no colloc data
-    try:
-        from texthumanize.collocation_engine import CollocEngine
-        ce = CollocEngine(lang=lang)
-        pairs = _bigram_pairs(content_tokens)
-        if pairs:
-            unknown = sum(1 for a, b in pairs if ce.pmi(a, b) == 0.0)
-            bigram_novelty = unknown / len(pairs)
-    except Exception:
-        pass
-
-    # ── 3. Word length variance ───────────────────────────────
-    word_lens = [len(t) for t in tokens]
-    if len(word_lens) >= 2:
-        wl_mean = sum(word_lens) / len(word_lens)
-        wl_var = sum((w - wl_mean) ** 2 for w in word_lens) / len(word_lens)
-    else:
-        wl_var = 0.0
-
-    # ── 4. Rare word ratio ────────────────────────────────────
-    rare_ratio = 0.0
-    try:
-        from texthumanize._word_freq_data import get_word_freq
-        freq = get_word_freq(lang)
-        rare = sum(1 for t in content_tokens if freq.get(t, 0) == 0)
-        rare_ratio = rare / n_content
-    except Exception:
-        pass
-
-    # ── 5. Repetition with context ────────────────────────────
-    ctx_tokens = set(_tokenize(context_before + ' ' + context_after))
-    sent_set = set(content_tokens)
-    if ctx_tokens and sent_set:
-        overlap = len(sent_set & ctx_tokens) / max(len(sent_set), 1)
-    else:
-        overlap = 0.0
-
-    # ── 6. Sentence length z-score ────────────────────────────
-    all_ctx = context_before + ' ' + sentence + ' ' + context_after
-    ctx_sents = _SENT_RE.split(all_ctx)
-    ctx_lens = [len(_tokenize(s)) for s in ctx_sents if s.strip()]
-    if len(ctx_lens) >= 2:
-        ctx_mean = sum(ctx_lens) / len(ctx_lens)
-        ctx_std = (sum((x - ctx_mean) ** 2 for x in ctx_lens) / len(ctx_lens)) ** 0.5
-        sent_len_z = (n_tokens - ctx_mean) / max(ctx_std, 1.0)
-    else:
-        sent_len_z = 0.0
-
-    # ── 7. Punctuation density ────────────────────────────────
-    punct_count = sum(1 for c in sentence if c in '.,;:!?—–-()[]{}«»""\'')
-    punct_density = punct_count / n_tokens
-
-    # ── 8. Case anomaly ───────────────────────────────────────
-    # Unexpected capitals mid-sentence
-    words_raw = sentence.split()
-    case_anom = 0
-    for i, w in enumerate(words_raw):
-        if i == 0:
-            continue  # sentence start is expected
-        if w and w[0].isupper() and not w.isupper() and w.lower() not in func_words:
-            case_anom += 1
-    case_anomaly = case_anom / max(len(words_raw), 1)
-
-    # ── 9. Adj-noun distance (RU/UK heuristic) ───────────────
-    # For Slavic languages, check agreement proximity
-    adj_noun_dist = 0.0
-    if lang in ('ru', 'uk'):
-        adj_suffixes = ('ый', 'ий', 'ой', 'ая', 'яя', 'ое', 'ее',
-                        'ые', 'ие') if lang == 'ru' else (
-                        'ий', 'ій', 'а', 'я', 'е', 'є', 'і')
-        noun_suffixes = ('ие', 'ия', 'ка', 'ок', 'ть', 'ст', 'ор') if lang == 'ru' else (
-                         'ія', 'ка', 'ок', 'ть', 'ст', 'ор')
-        positions_adj: list[int] = []
-        positions_noun: list[int] = []
-        for idx, t in enumerate(tokens):
-            if any(t.endswith(s) for s in adj_suffixes):
-                positions_adj.append(idx)
-            if any(t.endswith(s) for s in noun_suffixes):
-                positions_noun.append(idx)
-        if positions_adj and positions_noun:
-            dists = []
-            for a in positions_adj:
-                min_dist = min(abs(a - n) for n in positions_noun)
-                dists.append(min_dist)
-            adj_noun_dist = sum(dists) / len(dists)
-
-    # ── 10. Connector overuse ─────────────────────────────────
-    _CONNECTORS = {
-        'en': {'however', 'therefore', 'furthermore', 'moreover', 'additionally',
-               'consequently', 'nevertheless', 'nonetheless', 'accordingly'},
-        'ru': {'однако', 'поэтому', 'следовательно', 'кроме того', 'более того',
-               'дополнительно', 'тем не менее', 'соответственно', 'таким образом'},
-        'uk': {'однак', 'тому', 'отже', 'крім того', 'більше того',
-               'додатково', 'тим не менш', 'відповідно', 'таким чином'},
-    }
-    conn_set = _CONNECTORS.get(lang, _CONNECTORS['en'])
-    lower_sent = sentence.lower()
-    conn_count = sum(1 for c in conn_set if c in lower_sent)
-    conn_overuse = conn_count / n_tokens
-
-    # ── 11. Syllable uniformity ───────────────────────────────
-    _vowels = set('aeiouy') if lang == 'en' else (
-        set('аеёиоуыэюя') if lang == 'ru' else
-        set('аеіїоуєюя') if lang == 'uk' else set('aeiouy')
-    )
-    def _syllables(w: str) -> int:
+    return _FeatureExtractor(lang).features(sentence, context_before, context_after)
+
+
+class _FeatureExtractor:
+    """Feature extraction with per-language resources loaded once.
+
+    Token lists and context token counts are memoized per string, so a
+    batch over a document tokenizes each sentence once even though it
+    also appears as its neighbours' context.
+    """
+
+    def __init__(self, lang: str = "en") -> None:
+        self.lang = lang
+        self.func_words = _get_func_words(lang)
+        self.conn_set = _CONNECTORS.get(lang, _CONNECTORS['en'])
+        self.vowels = set('aeiouy') if lang == 'en' else (
+            set('аеёиоуыэюя') if lang == 'ru' else
+            set('аеіїоуєюя') if lang == 'uk' else set('aeiouy')
+        )
+        try:
+            from texthumanize.collocation_engine import CollocEngine
+            self.colloc: Any = CollocEngine(lang=lang)
+        except Exception:
+            self.colloc = None
+        try:
+            from texthumanize._word_freq_data import get_word_freq
+            self.freq: dict[str, Any] | None = get_word_freq(lang)
+        except Exception:
+            self.freq = None
+        self._tokens: dict[str, list[str]] = {}
+        self._counts: dict[str, int] = {}
+
+    def tokens(self, text: str) -> list[str]:
+        toks = self._tokens.get(text)
+        if toks is None:
+            toks = self._tokens[text] = _tokenize(text)
+        return toks
+
+    def _token_count(self, piece: str) -> int:
+        n = self._counts.get(piece)
+        if n is None:
+            n = self._counts[piece] = len(_WORD_RE.findall(piece))
+        return n
+
+    def _syllables(self, w: str) -> int:
+        vowels = self.vowels
         count = 0
         prev = False
         for c in w.lower():
-            if c in _vowels:
+            if c in vowels:
                 if not prev:
                     count += 1
                 prev = True
@@ -240,27 +171,130 @@ def extract_sentence_features(
                 prev = False
         return max(1, count)
 
-    syl_counts = [_syllables(t) for t in tokens]
-    if len(syl_counts) >= 2:
-        syl_mean = sum(syl_counts) / len(syl_counts)
-        syl_var = sum((s - syl_mean) ** 2 for s in syl_counts) / len(syl_counts)
-    else:
-        syl_var = 1.0  # single-token sentence, neutral
-
-    return [
-        colloc_score,       # 0
-        freq_smooth,        # 1
-        bigram_novelty,     # 2
-        wl_var,             # 3
-        rare_ratio,         # 4
-        overlap,            # 5 (repetition_context)
-        sent_len_z,         # 6
-        punct_density,      # 7
-        case_anomaly,       # 8
-        adj_noun_dist,      # 9
-        conn_overuse,       # 10
-        syl_var,            # 11
-    ]
+    def features(
+        self, sentence: str, context_before: str, context_after: str,
+    ) -> list[float]:
+        """Same features as :func:`extract_sentence_features`."""
+        lang = self.lang
+        tokens = self.tokens(sentence)
+        n_tokens = max(len(tokens), 1)
+        func_words = self.func_words
+        content_tokens = [t for t in tokens if t not in func_words and len(t) > 2]
+        n_content = max(len(content_tokens), 1)
+        content_pairs = _bigram_pairs(content_tokens)
+
+        # ── 0. Collocation score / 2. Bigram novelty ──────────────
+        colloc_score = 0.0
+        bigram_novelty = 0.5  # default if no colloc data
+        if self.colloc is not None and content_pairs:
+            try:
+                pmis = [self.colloc.pmi(a, b) for a, b in content_pairs]
+                colloc_score = sum(pmis) / len(pmis)
+                bigram_novelty = sum(1 for p in pmis if p == 0.0) / len(pmis)
+            except Exception:
+                pass
+
+        # ── 1. Frequency smoothness / 4. Rare word ratio ─────────
+        freq_smooth = 0.0
+        rare_ratio = 0.0
+        if self.freq is not None:
+            freq = self.freq
+            try:
+                ranks = [float(freq.get(t, 0)) for t in content_tokens]
+                if len(ranks) >= 2:
+                    mean_r = sum(ranks) / len(ranks)
+                    freq_smooth = sum((r - mean_r) ** 2 for r in ranks) / len(ranks)
+                    freq_smooth = math.log1p(freq_smooth)
+                rare = sum(1 for r in ranks if r == 0)
+                rare_ratio = rare / n_content
+            except Exception:
+                pass
+
+        # ── 3. Word length variance ───────────────────────────────
+        word_lens = [len(t) for t in tokens]
+        if len(word_lens) >= 2:
+            wl_mean = sum(word_lens) / len(word_lens)
+            wl_var = sum((w - wl_mean) ** 2 for w in word_lens) / len(word_lens)
+        else:
+            wl_var = 0.0
+
+        # ── 5. Repetition with context ────────────────────────────
+        ctx_tokens = {*self.tokens(context_before), *self.tokens(context_after)}
+        sent_set = set(content_tokens)
+        if ctx_tokens and sent_set:
+            overlap = len(sent_set & ctx_tokens) / max(len(sent_set), 1)
+        else:
+            overlap = 0.0
+
+        # ── 6. Sentence length z-score ────────────────────────────
+        all_ctx = context_before + ' ' + sentence + ' ' + context_after
+        ctx_lens = [
+            self._token_count(s) for s in _SENT_RE.split(all_ctx) if s.strip()
+        ]
+        if len(ctx_lens) >= 2:
+            ctx_mean = sum(ctx_lens) / len(ctx_lens)
+            ctx_std = (sum((x - ctx_mean) ** 2 for x in ctx_lens) / len(ctx_lens)) ** 0.5
+            sent_len_z = (n_tokens - ctx_mean) / max(ctx_std, 1.0)
+        else:
+            sent_len_z = 0.0
+
+        # ── 7. Punctuation density ────────────────────────────────
+        punct_count = sum(1 for c in sentence if c in _PUNCT_CHARS)
+        punct_density = punct_count / n_tokens
+
+        # ── 8. Case anomaly ───────────────────────────────────────
+        # Unexpected capitals mid-sentence
+        words_raw = sentence.split()
+        case_anom = 0
+        for w in words_raw[1:]:  # sentence start is expected
+            if w and w[0].isupper() and not w.isupper() and w.lower() not in func_words:
+                case_anom += 1
+        case_anomaly = case_anom / max(len(words_raw), 1)
+
+        # ── 9. Adj-noun distance (RU/UK heuristic) ───────────────
+        # For Slavic languages, check agreement proximity
+        adj_noun_dist = 0.0
+        if lang in ('ru', 'uk'):
+            adj_suffixes = ('ый', 'ий', 'ой', 'ая', 'яя', 'ое', 'ее',
+                            'ые', 'ие') if lang == 'ru' else (
+                            'ий', 'ій', 'а', 'я', 'е', 'є', 'і')
+            noun_suffixes = ('ие', 'ия', 'ка', 'ок', 'ть', 'ст', 'ор') if lang == 'ru' else (
+                             'ія', 'ка', 'ок', 'ть', 'ст', 'ор')
+            positions_adj = [i for i, t in enumerate(tokens) if t.endswith(adj_suffixes)]
+            positions_noun = [i for i, t in enumerate(tokens) if t.endswith(noun_suffixes)]
+            if positions_adj and positions_noun:
+                dists = [
+                    min(abs(a - n) for n in positions_noun) for a in positions_adj
+                ]
+                adj_noun_dist = sum(dists) / len(dists)
+
+        # ── 10. Connector overuse ─────────────────────────────────
+        lower_sent = sentence.lower()
+        conn_count = sum(1 for c in self.conn_set if c in lower_sent)
+        conn_overuse = conn_count / n_tokens
+
+        # ── 11. Syllable uniformity ───────────────────────────────
+        syl_counts = [self._syllables(t) for t in tokens]
+        if len(syl_counts) >= 2:
+            syl_mean = sum(syl_counts) / len(syl_counts)
+            syl_var = sum((s - syl_mean) ** 2 for s in syl_counts) / len(syl_counts)
+        else:
+            syl_var = 1.0  # single-token sentence, neutral
+
+        return [
+            colloc_score,       # 0
+            freq_smooth,        # 1
+            bigram_novelty,     # 2
+            wl_var,             # 3
+            rare_ratio,         # 4
+            overlap,            # 5 (repetition_context)
+            sent_len_z,         # 6
+            punct_density,      # 7
+            case_anomaly,       # 8
+            adj_noun_dist,      # 9
+            conn_overuse,       # 10
+            syl_var,            # 11
+        ]
 
 
 # ── MLP Artifact Detector ────────────────────────────────────
@@ -355,30 +389,38 @@ def _mlp_forward(features: list[float]) -> float:
         else:
             normed.append(0.0)
 
-    # Layer 1
-    h1 = []
-    for j in range(len(_W1)):
-        acc = _B1[j]
-        for i, x in enumerate(normed):
-            acc += _W1[j][i] * x
-        h1.append(_relu(acc))
+    # Layer 1 (sum() starts from the bias: same order as acc += w·x)
+    h1 = [_relu(sum(map(operator.mul, w, normed), b)) for w, b in zip(_W1, _B1)]
 
     # Layer 2
-    h2 = []
-    for j in range(len(_W2)):
-        acc = _B2[j]
-        for i, x in enumerate(h1):
-            acc += _W2[j][i] * x
-        h2.append(_relu(acc))
+    h2 = [_relu(sum(map(operator.mul, w, h1), b)) for w, b in zip(_W2, _B2)]
 
     # Layer 3 (output)
-    logit = _B3[0]
-    for i, x in enumerate(h2):
-        logit += _W3[0][i] * x
+    logit = sum(map(operator.mul, _W3[0], h2), _B3[0])
 
     return _sigmoid(logit)
 
 
+def _mlp_forward_batch(rows: list[list[float]]) -> list[float]:
+    """Score many feature rows at once (one matmul per layer with NumPy)."""
+    if not rows:
+        return []
+    if not _HAS_NUMPY:
+        return [_mlp_forward(r) for r in rows]
+    _ensure_weights()
+    x = np.asarray(rows, dtype=float)
+    mean = np.asarray(_FEAT_MEAN, dtype=float)
+    std = np.asarray(_FEAT_STD, dtype=float)
+    safe = np.where(std > 0, std, 1.0)
+    normed = np.where(std > 0, np.clip((x - mean) / safe, -3.0, 3.0), 0.0)
+    h1 = np.maximum(normed @ np.asarray(_W1, dtype=float).T + np.asarray(_B1), 0.0)
+    h2 = np.maximum(h1 @ np.asarray(_W2, dtype=float).T + np.asarray(_B2), 0.0)
+    logit = h2 @ np.asarray(_W3[0], dtype=float) + _B3[0]
+    out = 1.0 / (1.0 + np.exp(-np.clip(logit, -20.0, 20.0)))
+    out = np.where(logit > 20, 1.0, np.where(logit < -20, 0.0, out))
+    return out.tolist()
+
+
 # ── Synonym rollback engine ───────────────────────────────────
 
 @dataclass
@@ -432,30 +474,33 @@ class GrammarGuard:
         if not text or len(text.strip()) < 20:
             return text
 
-        from texthumanize.sentence_split import split_sentences
+        from texthumanize.sentence_split import (
+            split_sentences,
+            split_sentences_with_spans,
+        )
 
-        sentences = split_sentences(text, lang=self.lang)
-        if not sentences:
+        spans = split_sentences_with_spans(text, lang=self.lang)
+        if not spans:
             return text
+        sentences = [sp.text for sp in spans]
 
         self.result = GuardResult(sentences_checked=len(sentences))
 
-        # Build context windows
-        artifact_indices: list[int] = []
-        artifact_scores: list[float] = []
-
-        for i, sent in enumerate(sentences):
-            ctx_before = sentences[i - 1] if i > 0 else ""
-            ctx_after = sentences[i + 1] if i < len(sentences) - 1 else ""
-
-            features = extract_sentence_features(
-                sent, ctx_before, ctx_after, lang=self.lang,
+        # Features for all sentences (each tokenized once), one batched
+        # forward pass.
+        extractor = _FeatureExtractor(self.lang)
+        last = len(sentences) - 1
+        rows = [
+            extractor.features(
+                sent,
+                sentences[i - 1] if i > 0 else "",
+                sentences[i + 1] if i < last else "",
             )
-            score = _mlp_forward(features)
-
-            if score >= self.threshold:
-                artifact_indices.append(i)
-                artifact_scores.append(score)
+            for i, sent in enumerate(sentences)
+        ]
+        scores = _mlp_forward_batch(rows)
+        artifact_indices = [i for i, sc in enumerate(scores) if sc >= self.threshold]
+        artifact_scores = [scores[i] for i in artifact_indices]
 
         self.result.artifacts_found = len(artifact_indices)
 
@@ -474,7 +519,8 @@ class GrammarGuard:
                 fixed_sentences[idx],
                 original_sents[idx] if idx < len(original_sents) else "",
                 sentences[idx - 1] if idx > 0 else "",
-                sentences[idx + 1] if idx < len(sentences) - 1 else "",
+                sentences[idx + 1] if idx < last else "",
+                extractor=extractor,
             )
             if fixed != fixed_sentences[idx]:
                 self.result.rollbacks_applied += 1
@@ -487,13 +533,19 @@ class GrammarGuard:
                 })
                 fixed_sentences[idx] = fixed
 
-        # Reconstruct text preserving original whitespace
-        result = text
-        for idx in reversed(artifact_indices):
-            if fixed_sentences[idx] != sentences[idx]:
-                result = result.replace(sentences[idx], fixed_sentences[idx], 1)
-
-        return result
+        # Rebuild from sentence spans in one pass, keeping whitespace
+        parts: list[str] = []
+        pos = 0
+        for sp, fixed in zip(spans, fixed_sentences):
+            if fixed == sp.text:
+                continue
+            raw = text[sp.start:sp.end]
+            start = sp.start + len(raw) - len(raw.lstrip())
+            parts.append(text[pos:start])
+            parts.append(fixed)
+            pos = start + len(sp.text)
+        parts.append(text[pos:])
+        return "".join(parts)
 
     def _try_rollback(
         self,
@@ -501,6 +553,8 @@ class GrammarGuard:
         original_sentence: str,
         ctx_before: str,
         ctx_after: str,
+        *,
+        extractor: _FeatureExtractor | None = None,
     ) -> str:
         """Try targeted word-level rollbacks to reduce artifact score.
 
@@ -548,12 +602,11 @@ class GrammarGuard:
         if not candidates:
             return sentence
 
-        # Score each candidate rollback
-        base_features = extract_sentence_features(
-            sentence, ctx_before, ctx_after, self.lang,
-        )
-        base_score = _mlp_forward(base_features)
+        if extractor is None:
+            extractor = _FeatureExtractor(self.lang)
 
+        # Score the sentence and every single-word reversion in one batch
+        trials: list[str] = []
         for cand in candidates:
             # Try reverting this one word
             trial = sentence
@@ -561,7 +614,7 @@ class GrammarGuard:
             old_w = cand.current_word
             new_w = cand.original_word
             # Find the word in actual sentence text (case-sensitive)
-            pattern = re.compile(r'\b' + re.escape(old_w) + r'\b', re.IGNORECASE)
+            pattern = word_pattern(old_w)
             match = pattern.search(trial)
             if match:
                 # Preserve original casing pattern
@@ -571,11 +624,14 @@ class GrammarGuard:
                 else:
                     replacement = new_w
                 trial = trial[:match.start()] + replacement + trial[match.end():]
-
-            trial_features = extract_sentence_features(
-                trial, ctx_before, ctx_after, self.lang,
-            )
-            trial_score = _mlp_forward(trial_features)
+            trials.append(trial)
+
+        scores = _mlp_forward_batch([
+            extractor.features(t, ctx_before, ctx_after)
+            for t in (sentence, *trials)
+        ])
+        base_score = scores[0]
+        for cand, trial_score in zip(candidates, scores[1:]):
             cand.artifact_delta = base_score - trial_score
 
         # Apply best rollbacks (up to max_rollbacks)
@@ -591,7 +647,7 @@ class GrammarGuard:
 
             old_w = cand.current_word
             new_w = cand.original_word
-            pattern = re.compile(r'\b' + re.escape(old_w) + r'\b', re.IGNORECASE)
+            pattern = word_pattern(old_w)
             match = pattern.search(result)
             if match:
                 found = match.group()
@@ -603,10 +659,9 @@ class GrammarGuard:
                 applied += 1
 
         # Verify final score is lower
-        final_features = extract_sentence_features(
-            result, ctx_before, ctx_after, self.lang,
+        final_score = _mlp_forward(
+            extractor.features(result, ctx_before, ctx_after),
         )
-        final_score = _mlp_forward(final_features)
 
         if final_score < base_score:
             return result
@@ -23,6 +23,8 @@ import math
 import re
 from typing import Any
 
+from texthumanize.cache import memo_cache
+
 logger = logging.getLogger(__name__)
 
 # POS tagset
@@ -30,6 +32,9 @@ TAGS = ["NOUN", "VERB", "ADJ", "ADV", "DET", "PRON", "PREP", "CONJ", "NUM", "PUN
 _TAG2IDX = {t: i for i, t in enumerate(TAGS)}
 _N_TAGS = len(TAGS)
 
+# Log emission rows: (lang, word) -> log P(word | tag) for every tag.
+_EMISSION_CACHE = memo_cache("hmm_tagger.emissions", max_entries=50_000)
+
 # Word tokenizer
 _WORD_RE = re.compile(r"[a-zA-Zа-яА-ЯёЁіїєґІЇЄҐ]+|[0-9]+|[.,;:!?\"'()\-–—/]")
 
@@ -455,9 +460,18 @@ class HMMTagger:
 
     def _log_emission(self, word: str, tag_idx: int) -> float:
         """Log emission probability."""
-        tag = TAGS[tag_idx]
-        prob = _emission_prob(word, tag, self.lang)
-        return math.log(max(prob, 1e-10))
+        return self._emission_row(word)[tag_idx]
+
+    def _emission_row(self, word: str) -> tuple[float, ...]:
+        """Log emission probabilities of *word* for every tag (memoized)."""
+        lang = self.lang
+        return _EMISSION_CACHE.get_or_compute(
+            (lang, word),
+            lambda: tuple(
+                math.log(max(_emission_prob(word, tag, lang), 1e-10))
+                for tag in TAGS
+            ),
+        )
 
     def tag(self, text: str) -> list[tuple[str, str]]:
         """Tag text and return list of (word, tag) pairs.
@@ -476,13 +490,15 @@ class HMMTagger:
         backptr: list[list[int]] = [[0] * _N_TAGS for _ in range(n)]
 
         # Initialization
+        row = self._emission_row(tokens[0])
         for j in range(_N_TAGS):
-            viterbi[0][j] = self._log_init[j] + self._log_emission(tokens[0], j)
+            viterbi[0][j] = self._log_init[j] + row[j]
 
         # Forward pass
         for t in range(1, n):
+            row = self._emission_row(tokens[t])
             for j in range(_N_TAGS):
-                emit = self._log_emission(tokens[t], j)
+                emit = row[j]
                 best_score = float("-inf")
                 best_prev = 0
                 for i in range(_N_TAGS):
@@ -631,12 +647,10 @@ class HMMTagger:
 
 
 # Lazy singleton
-_HMM_TAGGER: HMMTagger | None = None
+# One tagger per language: alternating languages no longer rebuilds it.
+_TAGGERS = memo_cache("hmm_tagger.taggers", max_entries=16)
 
 
 def get_hmm_tagger(lang: str = "en") -> HMMTagger:
-    """Get or create the singleton HMMTagger."""
-    global _HMM_TAGGER
-    if _HMM_TAGGER is None or _HMM_TAGGER.lang != lang:
-        _HMM_TAGGER = HMMTagger(lang)
-    return _HMM_TAGGER
+    """Get or create the cached HMMTagger for *lang*."""
+    return _TAGGERS.get_or_compute(lang, lambda: HMMTagger(lang))
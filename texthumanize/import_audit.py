@@ -0,0 +1,265 @@
+"""Import-cost audit for TextHumanize.
+
+Shows what an import (or any short statement) costs in a fresh
+interpreter, module by module:
+
+- self and cumulative load time, like ``python -X importtime`` but
+  also counting ``importlib.import_module()`` (best of ``repeat`` runs);
+- memory still held by each module's own code after the statement
+  (traced allocations grouped by source file);
+- RSS growth of the whole process.
+
+Heavy modules should only show up under the call that needs them:
+``import texthumanize`` must not load the pipeline, and ``detect_ai``
+on English text must not load the other 24 language packs.
+
+Usage::
+
+    python -m texthumanize.import_audit
+    python -m texthumanize.import_audit texthumanize.cli --top 15
+    python -m texthumanize.import_audit -c "import texthumanize; texthumanize.detect_ai('Hi.')"
+    python -m texthumanize.import_audit --only texthumanize --sort memory
+    python -m texthumanize.import_audit --json > imports.json
+    python -m texthumanize.import_audit --max-ms 150   # exit 1 if slower
+
+    from texthumanize.import_audit import audit
+    report = audit("texthumanize.core")
+    print(report.total_ms, report.top(5))
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+
+_SORT_KEYS = {
+    "self": "self_ms",
+    "cumulative": "cumulative_ms",
+    "memory": "retained_kb",
+}
+
+# Times every module load and prints ``{"modules": [...], "rss": bytes}``.
+# ``-X importtime`` only sees ``import`` statements, not
+# ``importlib.import_module()``, which the lazy loaders use; both go
+# through ``_bootstrap._find_and_load``, so that is what gets wrapped.
+_TIME_CODE = """
+import json, os, sys, time
+import importlib._bootstrap as _bs
+def _rss():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+_rows, _stack, _orig = [], [], _bs._find_and_load
+def _find_and_load(name, import_):
+    if name in sys.modules:
+        return _orig(name, import_)
+    row = [name, 0.0, 0.0, len(_stack)]
+    _rows.append(row)
+    _stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        return _orig(name, import_)
+    finally:
+        total = time.perf_counter() - start
+        children = _stack.pop()
+        if _stack:
+            _stack[-1] += total
+        row[1], row[2] = total - children, total
+_before = _rss()
+_bs._find_and_load = _find_and_load
+try:
+    exec(_STMT)
+finally:
+    _bs._find_and_load = _orig
+print(json.dumps({"modules": _rows, "rss": max(_rss() - _before, 0) if _before else 0}))
+"""
+
+# Prints ``{module: bytes}`` of allocations still alive after ``_STMT``,
+# attributed to the file whose code made them.
+_MEMORY_CODE = """
+import json, sys, tracemalloc
+tracemalloc.start()
+exec(_STMT)
+_snap = tracemalloc.take_snapshot()
+tracemalloc.stop()
+_by_file = {s.traceback[0].filename: s.size for s in _snap.statistics("filename")}
+_out = {}
+for _name, _mod in list(sys.modules.items()):
+    _file = getattr(_mod, "__file__", None)
+    if _file and _file in _by_file:
+        _out[_name] = _by_file[_file]
+print(json.dumps(_out))
+"""
+
+
+@dataclass
+class ModuleCost:
+    """Import cost of one module."""
+
+    name: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int = 0
+    retained_kb: float = 0.0
+
+
+@dataclass
+class ImportAudit:
+    """Costs of one statement, modules in import order."""
+
+    statement: str
+    modules: list[ModuleCost] = field(default_factory=list)
+    rss_kb: float = 0.0
+
+    @property
+    def total_ms(self) -> float:
+        """Wall time of all top-level imports."""
+        return sum(m.cumulative_ms for m in self.modules if m.depth == 0)
+
+    @property
+    def retained_kb(self) -> float:
+        return sum(m.retained_kb for m in self.modules)
+
+    def loaded(self, prefix: str = "") -> list[str]:
+        """Names of the imported modules starting with ``prefix``."""
+        return [m.name for m in self.modules if m.name.startswith(prefix)]
+
+    def top(
+        self, n: int = 20, sort: str = "cumulative", only: str = "",
+    ) -> list[ModuleCost]:
+        """The ``n`` most expensive modules by ``self``, ``cumulative`` or ``memory``."""
+        key = _SORT_KEYS[sort]
+        rows = [m for m in self.modules if m.name.startswith(only)]
+        return sorted(rows, key=lambda m: getattr(m, key), reverse=True)[:n]
+
+    def to_dict(self) -> dict:
+        return {
+            "statement": self.statement,
+            "total_ms": round(self.total_ms, 3),
+            "rss_kb": round(self.rss_kb, 1),
+            "retained_kb": round(self.retained_kb, 1),
+            "modules": [asdict(m) for m in self.modules],
+        }
+
+
+def _run(code: str, statement: str) -> dict:
+    # Make the audited tree importable from any working directory.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", f"_STMT = {statement!r}\n{code}"],
+        capture_output=True, text=True, env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"audited statement failed: {statement!r}\n{result.stderr.strip()[-2000:]}"
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def audit(
+    target: str = "texthumanize",
+    *,
+    statement: str | None = None,
+    repeat: int = 3,
+    memory: bool = True,
+) -> ImportAudit:
+    """Measure ``import target`` (or ``statement``) in fresh interpreters.
+
+    Times are the best of ``repeat`` runs per module. With ``memory``,
+    one more run under ``tracemalloc`` attributes retained memory to
+    modules; it is kept separate because tracing slows imports down.
+    """
+    stmt = statement or f"import {target}"
+    best: dict[str, ModuleCost] = {}
+    order: list[str] = []
+    rss = []
+    for _ in range(max(repeat, 1)):
+        run = _run(_TIME_CODE, stmt)
+        rss.append(run["rss"])
+        for name, self_s, cumulative_s, depth in run["modules"]:
+            seen = best.get(name)
+            if seen is None:
+                best[name] = ModuleCost(name, self_s * 1000, cumulative_s * 1000, depth)
+                order.append(name)
+            else:
+                seen.self_ms = min(seen.self_ms, self_s * 1000)
+                seen.cumulative_ms = min(seen.cumulative_ms, cumulative_s * 1000)
+
+    report = ImportAudit(
+        statement=stmt, modules=[best[n] for n in order], rss_kb=min(rss) / 1024,
+    )
+    if memory:
+        retained = _run(_MEMORY_CODE, stmt)
+        for cost in report.modules:
+            cost.retained_kb = retained.get(cost.name, 0) / 1024
+    return report
+
+
+def format_audit(
+    report: ImportAudit, top: int = 25, sort: str = "cumulative", only: str = "",
+) -> str:
+    """Human-readable table of the most expensive modules."""
+    lines = [
+        f"{report.statement}",
+        f"  total {report.total_ms:.1f} ms · RSS +{report.rss_kb:.0f} KB · "
+        f"retained {report.retained_kb:.0f} KB · {len(report.modules)} modules",
+        "",
+        f"  {'self ms':>9} {'cumul ms':>9} {'kept KB':>9}  module",
+    ]
+    for m in report.top(top, sort=sort, only=only):
+        lines.append(
+            f"  {m.self_ms:9.2f} {m.cumulative_ms:9.2f} {m.retained_kb:9.1f}  "
+            f"{'  ' * m.depth}{m.name}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m texthumanize.import_audit",
+        description="Per-module import time and memory in a fresh interpreter",
+    )
+    parser.add_argument("module", nargs="?", default="texthumanize",
+                        help="Module to import (default: texthumanize)")
+    parser.add_argument("-c", dest="statement",
+                        help="Statement to audit instead of 'import MODULE'")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per measurement, best time is kept (default: 3)")
+    parser.add_argument("--top", type=int, default=25, help="Rows to show (default: 25)")
+    parser.add_argument("--sort", choices=sorted(_SORT_KEYS), default="cumulative")
+    parser.add_argument("--only", default="", metavar="PREFIX",
+                        help="Show only modules starting with PREFIX")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the tracemalloc run")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    parser.add_argument("--max-ms", type=float,
+                        help="Exit with status 1 if the total import time is higher")
+    args = parser.parse_args(argv)
+
+    report = audit(
+        args.module, statement=args.statement,
+        repeat=args.repeat, memory=not args.no_memory,
+    )
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(format_audit(report, top=args.top, sort=args.sort, only=args.only))
+    if args.max_ms is not None and report.total_ms > args.max_ms:
+        print(
+            f"import budget exceeded: {report.total_ms:.1f} ms > {args.max_ms:.1f} ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
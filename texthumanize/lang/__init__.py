@@ -6,60 +6,95 @@
 и любые другие языки через универсальный процессор.
 """
 
-from texthumanize.lang.ar import LANG_AR
-from texthumanize.lang.cs import LANG_CS
-from texthumanize.lang.da import LANG_DA
-from texthumanize.lang.de import LANG_DE
-from texthumanize.lang.en import LANG_EN
-from texthumanize.lang.es import LANG_ES
-from texthumanize.lang.fr import LANG_FR
-from texthumanize.lang.he import LANG_HE
-from texthumanize.lang.hi import LANG_HI
-from texthumanize.lang.hu import LANG_HU
-from texthumanize.lang.id_ import LANG_ID
-from texthumanize.lang.it import LANG_IT
-from texthumanize.lang.ja import LANG_JA
-from texthumanize.lang.ko import LANG_KO
-from texthumanize.lang.nl import LANG_NL
-from texthumanize.lang.pl import LANG_PL
-from texthumanize.lang.pt import LANG_PT
-from texthumanize.lang.ro import LANG_RO
-from texthumanize.lang.ru import LANG_RU
-from texthumanize.lang.sv import LANG_SV
-from texthumanize.lang.th import LANG_TH
-from texthumanize.lang.tr import LANG_TR
-from texthumanize.lang.uk import LANG_UK
-from texthumanize.lang.vi import LANG_VI
-from texthumanize.lang.zh import LANG_ZH
-
-LANGUAGES = {
-    "ar": LANG_AR,
-    "cs": LANG_CS,
-    "da": LANG_DA,
-    "ru": LANG_RU,
-    "uk": LANG_UK,
-    "en": LANG_EN,
-    "de": LANG_DE,
-    "fr": LANG_FR,
-    "es": LANG_ES,
-    "he": LANG_HE,
-    "hi": LANG_HI,
-    "hu": LANG_HU,
-    "id": LANG_ID,
-    "nl": LANG_NL,
-    "pl": LANG_PL,
-    "pt": LANG_PT,
-    "ro": LANG_RO,
-    "it": LANG_IT,
-    "sv": LANG_SV,
-    "th": LANG_TH,
-    "zh": LANG_ZH,
-    "ja": LANG_JA,
-    "ko": LANG_KO,
-    "tr": LANG_TR,
-    "vi": LANG_VI,
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+# Код языка → модуль пакета. Пакеты импортируются при первом обращении:
+# процессу, работающему с одним языком, не нужны словари остальных 24.
+_PACK_MODULES = {
+    "ar": "ar",
+    "cs": "cs",
+    "da": "da",
+    "ru": "ru",
+    "uk": "uk",
+    "en": "en",
+    "de": "de",
+    "fr": "fr",
+    "es": "es",
+    "he": "he",
+    "hi": "hi",
+    "hu": "hu",
+    "id": "id_",
+    "nl": "nl",
+    "pl": "pl",
+    "pt": "pt",
+    "ro": "ro",
+    "it": "it",
+    "sv": "sv",
+    "th": "th",
+    "zh": "zh",
+    "ja": "ja",
+    "ko": "ko",
+    "tr": "tr",
+    "vi": "vi",
 }
 
+
+class _LanguagePacks(Mapping):
+    """Словарь ``код → пакет`` с ленивой загрузкой модулей пакетов.
+
+    Ключи известны сразу (``in``, ``len``, итерация ничего не
+    импортируют); сам пакет импортируется при первом ``[lang]``.
+    """
+
+    def __init__(self, modules: dict[str, str]) -> None:
+        self._modules = modules
+        self._packs: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, lang: str) -> dict:
+        pack = self._packs.get(lang)
+        if pack is not None:
+            return pack
+        module = self._modules[lang]  # KeyError для неизвестных языков
+        with self._lock:
+            pack = self._packs.get(lang)
+            if pack is None:
+                mod = importlib.import_module(f"texthumanize.lang.{module}")
+                pack = getattr(mod, f"LANG_{lang.upper()}")
+                self._packs[lang] = pack
+        return pack
+
+    def __contains__(self, lang: object) -> bool:
+        return lang in self._modules
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def loaded(self) -> list[str]:
+        """Коды языков, пакеты которых уже импортированы."""
+        return list(self._packs)
+
+
+LANGUAGES: Mapping[str, dict] = _LanguagePacks(_PACK_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Обратная совместимость: ``from texthumanize.lang import LANG_EN``."""
+    if name.startswith("LANG_") and name[5:].lower() in _PACK_MODULES:
+        return LANGUAGES[name[5:].lower()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # ── Language tiers ─────────────────────────────────────────
 
 # Tier 1: Full detection + full humanization (deep grammar, syntax rewriting)
@@ -118,6 +153,122 @@ def get_lang_pack(lang: str) -> dict:
     return pack
 
 
+# ── Скомпилированные пакеты ────────────────────────────────
+
+
+@dataclass(frozen=True)
+class LexEntry:
+    """Словарная статья пакета с предвычисленными формами."""
+
+    text: str
+    lower: str
+    # ``re.IGNORECASE`` по ``text`` совпадает с ``str.lower()``
+    # (см. :func:`texthumanize.rule_sets.folds_like_lower`).
+    folds: bool
+    n_words: int
+    replacements: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class CompiledPack:
+    """Неизменяемый, предвычисленный вид языкового пакета.
+
+    Потребители раньше на каждом вызове строили из списков множества
+    (``set(pack["trigrams"])``), приводили статьи к нижнему регистру и
+    сортировали фразы по длине. Здесь это сделано один раз на язык:
+    множества — ``frozenset``, строки интернированы, статьи словарей —
+    :class:`LexEntry` в исходном порядке пакета.
+    """
+
+    code: str
+    stop_words: frozenset[str]
+    trigrams: frozenset[str]
+    # Аббревиатуры в нижнем регистре и без завершающей точки.
+    abbreviations: frozenset[str]
+    bureaucratic: tuple[LexEntry, ...]
+    bureaucratic_phrases: tuple[LexEntry, ...]
+    # Те же фразы, длинные первыми (порядок замены в decancel).
+    phrases_by_length: tuple[LexEntry, ...]
+    ai_connectors: tuple[LexEntry, ...]
+    colloquial_markers: tuple[str, ...]
+    conjunctions: tuple[str, ...]
+    split_conjunctions: tuple[str, ...]
+
+    @classmethod
+    def build(cls, pack: Mapping[str, Any]) -> CompiledPack:
+        """Скомпилировать словарь пакета (без кэширования)."""
+        phrases = _entries(pack.get("bureaucratic_phrases", {}))
+        return cls(
+            code=str(pack.get("code", "unknown")),
+            stop_words=_interned(pack.get("stop_words", ())),
+            trigrams=_interned(pack.get("trigrams", ())),
+            abbreviations=_interned(
+                a.lower().rstrip(".") for a in pack.get("abbreviations", ())
+            ),
+            bureaucratic=_entries(pack.get("bureaucratic", {})),
+            bureaucratic_phrases=phrases,
+            phrases_by_length=tuple(
+                sorted(phrases, key=lambda e: len(e.text), reverse=True)
+            ),
+            ai_connectors=_entries(pack.get("ai_connectors", {})),
+            colloquial_markers=tuple(pack.get("colloquial_markers", ())),
+            conjunctions=tuple(pack.get("conjunctions", ())),
+            split_conjunctions=tuple(pack.get("split_conjunctions", ())),
+        )
+
+
+def _interned(items: Iterable[str]) -> frozenset[str]:
+    return frozenset(sys.intern(x) for x in items)
+
+
+def _entries(lexicon: Mapping[str, Any] | Iterable[str]) -> tuple[LexEntry, ...]:
+    from texthumanize.rule_sets import folds_like_lower
+
+    get = lexicon.get if isinstance(lexicon, Mapping) else None
+    return tuple(
+        LexEntry(
+            text=word,
+            lower=sys.intern(word.lower()),
+            folds=folds_like_lower(word),
+            n_words=len(word.split()),
+            replacements=tuple(get(word) or ()) if get else (),
+        )
+        for word in lexicon
+    )
+
+
+_compiled_lock = threading.Lock()
+_compiled: dict[str, CompiledPack] = {}
+
+
+def get_compiled_pack(lang: str) -> CompiledPack:
+    """Скомпилированный пакет языка, один на процесс и язык.
+
+    Пакеты неизвестных языков (пустые) не кэшируются.
+    """
+    pack = _compiled.get(lang)
+    if pack is None:
+        if lang not in LANGUAGES:
+            return CompiledPack.build(get_lang_pack(lang))
+        built = CompiledPack.build(get_lang_pack(lang))
+        with _compiled_lock:
+            pack = _compiled.setdefault(lang, built)
+    return pack
+
+
+def compile_pack(pack: Mapping[str, Any]) -> CompiledPack:
+    """Скомпилированный вид ``pack``.
+
+    Для зарегистрированного пакета языка — общий экземпляр из
+    :func:`get_compiled_pack`; для изменённой копии или пакета
+    неизвестного языка компилируется заново.
+    """
+    code = pack.get("code")
+    if code in LANGUAGES and LANGUAGES[code] is pack:
+        return get_compiled_pack(code)
+    return CompiledPack.build(pack)
+
+
 def has_deep_support(lang: str) -> bool:
     """Проверить, есть ли для языка полный словарь (Tier 1)."""
     return lang in DEEP_LANGUAGES
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from collections import Counter
 
-from texthumanize.lang import LANGUAGES
+from texthumanize.lang import LANGUAGES, get_compiled_pack
 
 logger = logging.getLogger(__name__)
 
@@ -201,8 +201,7 @@ def _detect_latin_language(text: str) -> str:
         trigrams = _extract_trigrams(text)
         trigram_scores = {}
         for lang_code in LANGUAGES:
-            pack = LANGUAGES[lang_code]
-            lang_trigrams = set(pack.get("trigrams", []))
+            lang_trigrams = get_compiled_pack(lang_code).trigrams
             if lang_trigrams:
                 score = sum(trigrams.get(tri, 0) for tri in lang_trigrams)
                 trigram_scores[lang_code] = score
@@ -223,8 +222,7 @@ def _detect_latin_language(text: str) -> str:
         trigrams = _extract_trigrams(text)
         trigram_scores = {}
         for lang_code in LANGUAGES:
-            pack = LANGUAGES[lang_code]
-            lang_trigrams = set(pack.get("trigrams", []))
+            lang_trigrams = get_compiled_pack(lang_code).trigrams
             if lang_trigrams:
                 score = sum(trigrams.get(tri, 0) for tri in lang_trigrams)
                 trigram_scores[lang_code] = score
@@ -308,8 +306,7 @@ def detect_language(text: str) -> str:
         trigrams = _extract_trigrams(text)
         scores = {}
         for lang_code in ("ru", "uk"):
-            pack = LANGUAGES[lang_code]
-            lang_trigrams = set(pack.get("trigrams", []))
+            lang_trigrams = get_compiled_pack(lang_code).trigrams
             score = sum(trigrams.get(tri, 0) for tri in lang_trigrams)
             scores[lang_code] = score
 
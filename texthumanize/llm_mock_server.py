@@ -0,0 +1,207 @@
+"""Local stand-in for OpenAI- and Ollama-compatible LLM servers.
+
+Lets :class:`~texthumanize.ai_backend.AIBackend` and the HTTP transport
+be exercised offline (tests, benchmarks, demos) without an API key or a
+running Ollama:
+
+    POST /v1/chat/completions — OpenAI Chat Completions
+    POST /api/chat            — Ollama chat (``stream: false``)
+    GET  /api/tags            — Ollama availability ping
+    POST /api/predict         — Gradio (OSS provider, legacy format)
+
+Replies come from ``responder(system_prompt, user_text)``; the default
+one returns the user text unchanged. The server speaks HTTP/1.1 with
+keep-alive, records every request and counts TCP connections, so
+connection reuse and concurrency can be asserted.
+
+Usage:
+    from texthumanize.ai_backend import AIBackend
+    from texthumanize.llm_mock_server import MockLLMServer
+
+    with MockLLMServer(responder=lambda system, text: text.upper()) as srv:
+        ai = AIBackend(enable_ollama=True, ollama_url=srv.url, prefer="ollama")
+        ai.paraphrase("hello there")   # → "HELLO THERE"
+
+    python -m texthumanize.llm_mock_server --port 11434
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+Responder = Callable[[str, str], str]
+
+
+def _echo(system_prompt: str, user_text: str) -> str:
+    return user_text
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.mock.lock:
+            self.server.mock.connections += 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, data: Any, status: int = 200) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/api/tags":
+            self._reply({"models": [{"name": self.server.mock.model}]})
+        else:
+            self._reply({"error": "not found"}, 404)
+
+    def do_POST(self) -> None:
+        mock = self.server.mock
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._reply({"error": "invalid JSON"}, 400)
+            return
+        with mock.lock:
+            mock.requests.append((self.path, payload))
+            failure = mock.fail_with.pop(0) if mock.fail_with else None
+        if mock.delay:
+            time.sleep(mock.delay)
+        if failure is not None:
+            self._reply({"error": "injected failure"}, failure)
+            return
+
+        if self.path == "/api/predict":
+            data = payload.get("data") or [""]
+            self._reply({"data": [mock.responder("", str(data[0]))]})
+            return
+        messages = payload.get("messages") or []
+        system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        user = next((m["content"] for m in messages if m.get("role") == "user"), "")
+        if self.path == "/v1/chat/completions":
+            content = mock.responder(system, user)
+            self._reply({
+                "object": "chat.completion",
+                "model": payload.get("model", mock.model),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+            })
+        elif self.path == "/api/chat":
+            content = mock.responder(system, user)
+            self._reply({
+                "model": payload.get("model", mock.model),
+                "message": {"role": "assistant", "content": content},
+                "done": True,
+            })
+        else:
+            self._reply({"error": "not found"}, 404)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    mock: MockLLMServer
+
+
+class MockLLMServer:
+    """OpenAI-/Ollama-compatible HTTP server on a background thread.
+
+    Args:
+        responder: ``(system_prompt, user_text) -> reply``.
+        host: Interface to bind.
+        port: Port (0 = any free port).
+        delay: Seconds to wait before answering each POST.
+        model: Model name reported by ``/api/tags``.
+    """
+
+    def __init__(
+        self,
+        responder: Responder | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        delay: float = 0.0,
+        model: str = "llama3.2",
+    ) -> None:
+        self.responder: Responder = responder or _echo
+        self.delay = delay
+        self.model = model
+        self.lock = threading.Lock()
+        self.requests: list[tuple[str, Any]] = []
+        self.connections = 0
+        # HTTP status codes to answer the next POST requests with
+        self.fail_with: list[int] = []
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.mock = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL, e.g. ``http://127.0.0.1:54321``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def openai_url(self) -> str:
+        """OpenAI Chat Completions endpoint of this server."""
+        return f"{self.url}/v1/chat/completions"
+
+    def start(self) -> MockLLMServer:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, args=(0.05,),
+                name="mock-llm", daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> MockLLMServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Local OpenAI-/Ollama-compatible mock LLM server (echoes the input)",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11434)
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="seconds to wait before each reply")
+    args = parser.parse_args(argv)
+    server = MockLLMServer(host=args.host, port=args.port, delay=args.delay)
+    print(f"Mock LLM server on {server.url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""Shared HTTP transport for the LLM providers of :mod:`texthumanize.ai_backend`.
+
+``urllib.request.urlopen`` opens a new TCP (and TLS) connection for
+every request. Against a local or on-prem Ollama, or for the many short
+calls of sentence-level rewriting, connection setup costs more than the
+request itself. :class:`HTTPTransport` keeps idle HTTP/1.1 connections
+per host and reuses them. It bounds the number of concurrent requests
+per host and in total, and retries a request once on a fresh connection
+when a pooled connection turns out to be closed by the server.
+
+Requests that have to go through a proxy (``HTTP(S)_PROXY``
+environment variables) are sent with ``urllib`` as before.
+
+Usage:
+    from texthumanize.llm_transport import get_transport
+
+    data = get_transport().post_json(
+        "http://localhost:11434/api/chat",
+        {"model": "llama3.2", "messages": [...], "stream": False},
+        timeout=120.0,
+    )
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import logging
+import ssl
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any
+
+from texthumanize.exceptions import AIBackendError, AIBackendUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# Errors of a pooled connection that the server has already closed
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class HTTPStatusError(AIBackendError):
+    """HTTP error status returned by an LLM endpoint."""
+
+    def __init__(self, code: int, body: str = "") -> None:
+        self.code = code
+        self.body = body
+        super().__init__(f"HTTP {code}: {body[:200]}")
+
+
+_HostKey = tuple[str, str, int]
+
+
+class HTTPTransport:
+    """Keep-alive connection pool with bounded concurrency.
+
+    Thread-safe: one instance is meant to be shared by all providers
+    (see :func:`get_transport`).
+
+    Args:
+        max_per_host: Concurrent requests (and pooled connections) per host.
+        max_total: Concurrent requests over all hosts.
+    """
+
+    def __init__(self, max_per_host: int = 4, max_total: int = 16) -> None:
+        if max_per_host < 1 or max_total < 1:
+            raise ValueError("Transport limits must be >= 1")
+        self.max_per_host = max_per_host
+        self.max_total = max_total
+        self._lock = threading.Lock()
+        self._idle: dict[_HostKey, list[http.client.HTTPConnection]] = {}
+        self._host_slots: dict[_HostKey, threading.BoundedSemaphore] = {}
+        self._total_slots = threading.BoundedSemaphore(max_total)
+        self._ssl_context: ssl.SSLContext | None = None
+        self.connections_opened = 0
+
+    # ── public ─────────────────────────────────────
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        payload: Any = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 30.0,
+    ) -> tuple[int, bytes]:
+        """Send one request; return ``(status, body)``.
+
+        Raises:
+            AIBackendUnavailableError: Connection failed or timed out.
+        """
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url!r}")
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        hdrs = {"Content-Type": "application/json", **(headers or {})}
+        if _proxy_for(scheme, parts.hostname):
+            return _urllib_request(method, url, body, hdrs, timeout)
+
+        port = parts.port or (443 if scheme == "https" else 80)
+        key: _HostKey = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        with self._total_slots, self._slots(key):
+            conn, reused = self._checkout(key, timeout)
+            try:
+                status, data, keep = _send(conn, method, path, body, hdrs)
+            except _STALE_ERRORS:
+                conn.close()
+                if not reused:
+                    raise _unavailable(url, "connection closed by server") from None
+                # Server closed the idle connection: retry once on a new one
+                logger.debug("Pooled connection to %s was closed, reconnecting", parts.netloc)
+                conn, reused = self._connect(key, timeout), False
+                try:
+                    status, data, keep = _send(conn, method, path, body, hdrs)
+                except (OSError, http.client.HTTPException) as exc:
+                    conn.close()
+                    raise _unavailable(url, exc) from exc
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                raise _unavailable(url, exc) from exc
+            if keep:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+        return status, data
+
+    def post_json(
+        self,
+        url: str,
+        payload: Any,
+        headers: dict[str, str] | None = None,
+        timeout: float = 30.0,
+    ) -> Any:
+        """POST ``payload`` as JSON and decode the JSON reply.
+
+        Raises:
+            HTTPStatusError: The endpoint answered with status >= 400.
+            AIBackendUnavailableError: Connection failed or timed out.
+            ValueError: The reply is not valid JSON.
+        """
+        return _decode(*self.request("POST", url, payload, headers, timeout))
+
+    def get_json(self, url: str, timeout: float = 5.0) -> Any:
+        """GET ``url`` and decode the JSON reply (errors as in :meth:`post_json`)."""
+        return _decode(*self.request("GET", url, None, None, timeout))
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def idle_connections(self) -> int:
+        """Number of pooled idle connections (all hosts)."""
+        with self._lock:
+            return sum(len(c) for c in self._idle.values())
+
+    # ── pool ───────────────────────────────────────
+
+    def _slots(self, key: _HostKey) -> threading.BoundedSemaphore:
+        with self._lock:
+            slots = self._host_slots.get(key)
+            if slots is None:
+                slots = self._host_slots[key] = threading.BoundedSemaphore(
+                    self.max_per_host,
+                )
+            return slots
+
+    def _checkout(
+        self, key: _HostKey, timeout: float,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            return self._connect(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _checkin(self, key: _HostKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _connect(self, key: _HostKey, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        with self._lock:
+            self.connections_opened += 1
+            if scheme == "https" and self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+        if scheme == "https":
+            return http.client.HTTPSConnection(
+                host, port, timeout=timeout, context=self._ssl_context,
+            )
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+def _send(
+    conn: http.client.HTTPConnection,
+    method: str,
+    path: str,
+    body: bytes | None,
+    headers: dict[str, str],
+) -> tuple[int, bytes, bool]:
+    conn.request(method, path, body=body, headers=headers)
+    resp = conn.getresponse()
+    data = resp.read()
+    return resp.status, data, not resp.will_close
+
+
+def _decode(status: int, data: bytes) -> Any:
+    text = data.decode("utf-8", "replace")
+    if status >= 400:
+        raise HTTPStatusError(status, text)
+    return json.loads(text)
+
+
+def _unavailable(url: str, reason: Any) -> AIBackendUnavailableError:
+    host = urllib.parse.urlsplit(url).netloc
+    return AIBackendUnavailableError(f"{host}: {reason}")
+
+
+def _proxy_for(scheme: str, host: str) -> bool:
+    proxies = urllib.request.getproxies()
+    return scheme in proxies and not urllib.request.proxy_bypass(host)
+
+
+def _urllib_request(
+    method: str,
+    url: str,
+    body: bytes | None,
+    headers: dict[str, str],
+    timeout: float,
+) -> tuple[int, bytes]:
+    """One request through ``urllib`` (honours proxy settings, no pooling)."""
+    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as exc:
+        try:
+            return exc.code, exc.read()
+        except Exception:
+            return exc.code, b""
+    except (OSError, http.client.HTTPException) as exc:
+        raise _unavailable(url, getattr(exc, "reason", exc)) from exc
+
+
+_transport: HTTPTransport | None = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HTTPTransport:
+    """Process-wide transport shared by all providers."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+    return _transport
@@ -11,7 +11,11 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Iterable
+
+from texthumanize.cache import memo_cache
 
 logger = logging.getLogger(__name__)
 
@@ -205,10 +209,64 @@ _DE_NOUN_ENDINGS = {
 }
 
 
+_DE_NOUN_SUFFIXES = (
+    "ung", "heit", "keit", "schaft", "tion",
+    "nis", "tum", "ment", "ität",
+)
+_DE_NOUN_SUFFIXES_BY_LEN = tuple(sorted(_DE_NOUN_SUFFIXES, key=len, reverse=True))
+
+
+# ═══════════════════════════════════════════════════════════════
+#  СУФФИКСНЫЕ ИНДЕКСЫ
+# ═══════════════════════════════════════════════════════════════
+
+class _SuffixIndex:
+    """Таблица окончаний, разложенная по длине (от длинных к коротким).
+
+    ``match(word, min_stem)`` возвращает самое длинное окончание слова,
+    после отсечения которого остаётся основа длиннее ``min_stem`` —
+    то же, что перебор таблицы, отсортированной по длине окончаний, но
+    за несколько обращений к словарю вместо ``endswith`` на каждое
+    окончание.
+    """
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self, table: dict[str, str]) -> None:
+        buckets: dict[int, dict[str, str]] = {}
+        for ending, base in table.items():
+            buckets.setdefault(len(ending), {})[ending] = base
+        self._buckets = tuple(sorted(buckets.items(), reverse=True))
+
+    def match(self, word: str, min_stem: int = 0) -> tuple[str, str] | None:
+        """(окончание, замена) для самого длинного подходящего окончания."""
+        n = len(word)
+        for size, endings in self._buckets:
+            if n - size > min_stem:
+                ending = word[n - size:]
+                base = endings.get(ending)
+                if base is not None:
+                    return ending, base
+        return None
+
+
+_RU_ADJ_INDEX = _SuffixIndex(_RU_ADJ_ENDINGS)
+_RU_VERB_INDEX = _SuffixIndex(_RU_VERB_ENDINGS)
+_UK_ADJ_INDEX = _SuffixIndex(_UK_ADJ_ENDINGS)
+_DE_ADJ_INDEX = _SuffixIndex(_DE_ADJ_ENDINGS)
+_DE_VERB_INDEX = _SuffixIndex(_DE_VERB_ENDINGS)
+
+
 # ═══════════════════════════════════════════════════════════════
 #  ПУБЛИЧНЫЙ API
 # ═══════════════════════════════════════════════════════════════
 
+# Общие для всех движков кэши: ключ (lang, слово, ...).
+_LEMMA_CACHE = memo_cache("morphology.lemma", max_entries=50_000)
+_FORMS_CACHE = memo_cache("morphology.forms", max_entries=20_000)
+_SYNONYM_FORM_CACHE = memo_cache("morphology.synonym_form", max_entries=50_000)
+
+
 class MorphologyEngine:
     """Rule-based морфологический движок.
 
@@ -218,7 +276,6 @@ class MorphologyEngine:
 
     def __init__(self, lang: str = "ru"):
         self.lang = lang
-        self._lemma_cache: dict[str, str] = {}
 
     def lemmatize(self, word: str) -> str:
         """Привести слово к лемме (начальной форме).
@@ -230,12 +287,33 @@ class MorphologyEngine:
             Лемма (начальная форма) слова.
         """
         lower = word.lower().strip()
-        if lower in self._lemma_cache:
-            return self._lemma_cache[lower]
+        return _LEMMA_CACHE.get_or_compute(
+            (self.lang, lower), lambda: self._do_lemmatize(lower),
+        )
+
+    def lemmatize_many(self, tokens: Iterable[str]) -> list[str]:
+        """Лемматизировать последовательность слов.
+
+        Каждое уникальное слово (без учёта регистра) лемматизируется один
+        раз; результат — список лемм в порядке ``tokens``.
+
+        Args:
+            tokens: Слова в любой форме.
 
-        lemma = self._do_lemmatize(lower)
-        self._lemma_cache[lower] = lemma
-        return lemma
+        Returns:
+            Список лемм той же длины.
+        """
+        seen: dict[str, str] = {}
+        lemmas: list[str] = []
+        for token in tokens:
+            lower = token.lower().strip()
+            lemma = seen.get(lower)
+            if lemma is None:
+                lemma = seen[lower] = _LEMMA_CACHE.get_or_compute(
+                    (self.lang, lower), functools.partial(self._do_lemmatize, lower),
+                )
+            lemmas.append(lemma)
+        return lemmas
 
     def _do_lemmatize(self, word: str) -> str:
         """Внутренняя лемматизация."""
@@ -258,6 +336,12 @@ class MorphologyEngine:
         Returns:
             Список словоформ, включая саму лемму.
         """
+        return list(_FORMS_CACHE.get_or_compute(
+            (self.lang, lemma), lambda: tuple(self._do_generate_forms(lemma)),
+        ))
+
+    def _do_generate_forms(self, lemma: str) -> list[str]:
+        """Внутренняя генерация словоформ."""
         if self.lang == "en":
             return self._generate_forms_en(lemma)
         elif self.lang == "ru":
@@ -282,6 +366,13 @@ class MorphologyEngine:
         Returns:
             Синоним в форме, соответствующей оригиналу.
         """
+        return _SYNONYM_FORM_CACHE.get_or_compute(
+            (self.lang, original_word, synonym_lemma),
+            lambda: self._do_find_synonym_form(original_word, synonym_lemma),
+        )
+
+    def _do_find_synonym_form(self, original_word: str, synonym_lemma: str) -> str:
+        """Внутренний подбор формы синонима."""
         if self.lang == "en":
             return self._match_form_en(original_word, synonym_lemma)
         elif self.lang in ("ru", "uk"):
@@ -316,21 +407,13 @@ class MorphologyEngine:
             return word
 
         # Прилагательные: ищем по окончаниям (от длинных к коротким)
-        for ending, base_ending in sorted(
-            _RU_ADJ_ENDINGS.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            if word.endswith(ending) and len(word) > len(ending) + 2:
-                stem = word[:-len(ending)]
-                candidate = stem + base_ending
-                return candidate
-
-        # Глаголы: окончания → -ть
-        for ending, base in sorted(
-            _RU_VERB_ENDINGS.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            if word.endswith(ending) and len(word) > len(ending) + 2:
-                stem = word[:-len(ending)]
-                return stem + base
+        found = _RU_ADJ_INDEX.match(word, 2)
+        if found is None:
+            # Глаголы: окончания → -ть
+            found = _RU_VERB_INDEX.match(word, 2)
+        if found is not None:
+            ending, base = found
+            return word[:-len(ending)] + base
 
         return word
 
@@ -388,20 +471,13 @@ class MorphologyEngine:
             return word
 
         # Прилагательные
-        for ending, base_ending in sorted(
-            _UK_ADJ_ENDINGS.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            if word.endswith(ending) and len(word) > len(ending) + 2:
-                stem = word[:-len(ending)]
-                return stem + base_ending
-
-        # Используем русские правила для глаголов (славянская группа)
-        for ending, base in sorted(
-            _RU_VERB_ENDINGS.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            if word.endswith(ending) and len(word) > len(ending) + 2:
-                stem = word[:-len(ending)]
-                return stem + base
+        found = _UK_ADJ_INDEX.match(word, 2)
+        if found is None:
+            # Используем русские правила для глаголов (славянская группа)
+            found = _RU_VERB_INDEX.match(word, 2)
+        if found is not None:
+            ending, base = found
+            return word[:-len(ending)] + base
 
         return word
 
@@ -720,19 +796,14 @@ class MorphologyEngine:
             return word
 
         # Прилагательные
-        for ending, _base in sorted(
-            _DE_ADJ_ENDINGS.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            if word.endswith(ending) and len(word) > len(ending) + 3:
-                return word[:-len(ending)]
+        found = _DE_ADJ_INDEX.match(word, 3)
+        if found is not None:
+            return word[:-len(found[0])]
 
         # Глаголы
-        for ending, _base in sorted(
-            _DE_VERB_ENDINGS.items(), key=lambda x: len(x[0]), reverse=True
-        ):
-            if word.endswith(ending) and len(word) > len(ending) + 2:
-                stem = word[:-len(ending)]
-                return stem + "en"
+        found = _DE_VERB_INDEX.match(word, 2)
+        if found is not None:
+            return word[:-len(found[0])] + "en"
 
         return word
 
@@ -770,18 +841,14 @@ class MorphologyEngine:
         orig_lower = original.lower()
         syn_lower = synonym_lemma.lower()
 
-        _de_noun_suffixes = (
-            "ung", "heit", "keit", "schaft", "tion",
-            "nis", "tum", "ment", "ität",
-        )
         # Detect noun: by capitalization OR by noun suffix
         orig_is_noun = (
             (original[0].isupper() if original else False)
-            or any(orig_lower.endswith(s) for s in _de_noun_suffixes)
+            or orig_lower.endswith(_DE_NOUN_SUFFIXES)
         )
         syn_is_verb = (
             syn_lower.endswith(("en", "ern", "eln"))
-            and not any(syn_lower.endswith(s) for s in _de_noun_suffixes)
+            and not syn_lower.endswith(_DE_NOUN_SUFFIXES)
         )
 
         # ── Nouns ──
@@ -790,7 +857,7 @@ class MorphologyEngine:
                 # Verb synonym for a noun original → try to derive noun form.
                 # e.g., "beachten" → "Beachtung" (stem + "ung")
                 # Find which noun suffix the original has and apply it.
-                for suffix in sorted(_de_noun_suffixes, key=len, reverse=True):
+                for suffix in _DE_NOUN_SUFFIXES_BY_LEN:
                     if orig_lower.endswith(suffix):
                         # Try to derive: verb stem + noun suffix
                         if syn_lower.endswith("en"):
@@ -810,16 +877,16 @@ class MorphologyEngine:
 
         # ── Adjectives (lowercase, not verb infinitive) ──
         _noun_like = ("ung", "heit", "keit", "schaft", "tion", "nis", "tum")
-        if not syn_lower.endswith(_noun_like):
-            for ending in sorted(_DE_ADJ_ENDINGS.keys(), key=len, reverse=True):
-                if orig_lower.endswith(ending) and not orig_is_noun:
-                    return synonym_lemma + ending
+        if not syn_lower.endswith(_noun_like) and not orig_is_noun:
+            found = _DE_ADJ_INDEX.match(orig_lower, -1)
+            if found is not None:
+                return synonym_lemma + found[0]
 
         # ── Verbs ──
-        for ending in sorted(_DE_VERB_ENDINGS.keys(), key=len, reverse=True):
-            if orig_lower.endswith(ending) and syn_lower.endswith("en"):
-                stem = synonym_lemma[:-2]
-                return stem + ending
+        if syn_lower.endswith("en"):
+            found = _DE_VERB_INDEX.match(orig_lower, -1)
+            if found is not None:
+                return synonym_lemma[:-2] + found[0]
 
         return synonym_lemma
 
@@ -848,6 +915,11 @@ class MorphologyEngine:
         "а":   ["а",   "и",   "і",   "у",   "ою",   "і"],
         "я":   ["я",   "і",   "і",   "ю",   "ею",   "і"],
     }
+    # Классы склонения от длинных окончаний к коротким
+    _NOUN_DECL_ORDER: dict[str, tuple[str, ...]] = {
+        "ru": tuple(sorted(_RU_NOUN_DECL, key=len, reverse=True)),
+        "uk": tuple(sorted(_UK_NOUN_DECL, key=len, reverse=True)),
+    }
 
     def _match_form_slavic(self, original: str, synonym_lemma: str) -> str:
         """Подобрать форму синонима под оригинал (RU/UK)."""
@@ -859,25 +931,23 @@ class MorphologyEngine:
         if orig_lower.endswith(_adverb_suffixes) and not synonym_lemma.endswith(("ый", "ий", "ій")):
             return synonym_lemma
 
-        endings_map = _RU_ADJ_ENDINGS if self.lang == "ru" else _UK_ADJ_ENDINGS
+        adj_index = _RU_ADJ_INDEX if self.lang == "ru" else _UK_ADJ_INDEX
 
         # Прилагательные: определяем окончание оригинала
-        for ending in sorted(endings_map.keys(), key=len, reverse=True):
-            if orig_lower.endswith(ending) and len(orig_lower) > len(ending) + 2:
-                # Определяем, на что заканчивается лемма синонима
-                for base in ("ый", "ий", "ій"):
-                    if synonym_lemma.endswith(base):
-                        stem = synonym_lemma[:-len(base)]
-                        return stem + ending
-                break
+        found = adj_index.match(orig_lower, 2)
+        if found is not None:
+            ending = found[0]
+            # Определяем, на что заканчивается лемма синонима
+            for base in ("ый", "ий", "ій"):
+                if synonym_lemma.endswith(base):
+                    stem = synonym_lemma[:-len(base)]
+                    return stem + ending
 
         # Глаголы: определяем окончание
-        for ending in sorted(_RU_VERB_ENDINGS.keys(), key=len, reverse=True):
-            if orig_lower.endswith(ending) and len(orig_lower) > len(ending) + 2:
-                if synonym_lemma.endswith("ть") or synonym_lemma.endswith("ти"):
-                    stem = synonym_lemma[:-2]
-                    return stem + ending
-                break
+        found = _RU_VERB_INDEX.match(orig_lower, 2)
+        if found is not None:
+            if synonym_lemma.endswith("ть") or synonym_lemma.endswith("ти"):
+                return synonym_lemma[:-2] + found[0]
 
         # Существительные: определяем падеж оригинала и склоняем синоним
         result = self._transfer_noun_case(orig_lower, synonym_lemma)
@@ -893,6 +963,7 @@ class MorphologyEngine:
         the same case ending to the synonym stem.
         """
         decl = self._RU_NOUN_DECL if self.lang == "ru" else self._UK_NOUN_DECL
+        order = self._NOUN_DECL_ORDER["ru" if self.lang == "ru" else "uk"]
         syn_lower = synonym_lemma.lower()
 
         # Step 1: Find original's declension class and case index.
@@ -901,7 +972,7 @@ class MorphologyEngine:
         orig_case_idx: int | None = None
         best_len = 0
 
-        for cls in sorted(decl.keys(), key=len, reverse=True):
+        for cls in order:
             forms = decl[cls]
             for case_idx, ending in enumerate(forms):
                 if (orig_lower.endswith(ending)
@@ -918,7 +989,7 @@ class MorphologyEngine:
 
         # Step 2: Find synonym's declension class (by its nominative ending)
         syn_class: str | None = None
-        for cls in sorted(decl.keys(), key=len, reverse=True):
+        for cls in order:
             nom = decl[cls][0]  # nominative form ending
             if syn_lower.endswith(nom) and len(syn_lower) > len(nom) + 2:
                 syn_class = cls
@@ -38,19 +38,12 @@ from __future__ import annotations
 import logging
 import random
 import re
+import threading
 from collections import Counter
 
-from texthumanize._replacement_data import (
-    EN_EXTRA,
-    RU_BOOSTERS_EXTRA,
-    RU_EXPANDED,
-    RU_PHRASE_EXTRA,
-    UK_BOOSTERS_EXTRA,
-    UK_EXPANDED,
-    UK_PHRASE_EXTRA,
-)
 from texthumanize.collocation_engine import CollocEngine
 from texthumanize.decancel import _is_replacement_safe
+from texthumanize.rule_sets import compiled, word_pattern
 from texthumanize.segmenter import has_placeholder, skip_placeholder_sentence
 from texthumanize.sentence_split import split_sentences
 
@@ -297,8 +290,6 @@ _AI_WORD_REPLACEMENTS = {
         "rigorous": ["strict", "tough", "thorough"],
         "protocols": ["rules", "steps", "procedures"],
     },
-    "ru": RU_EXPANDED,
-    "uk": UK_EXPANDED,
     "de": {
         "implementieren": ["umsetzen", "einführen", "einrichten"],
         "Implementierung": ["Umsetzung", "Einführung"],
@@ -445,9 +436,6 @@ _AI_WORD_REPLACEMENTS = {
     },
 }
 
-# Merge expanded dictionaries from _replacement_data module
-_AI_WORD_REPLACEMENTS["en"].update(EN_EXTRA)
-
 # Фразовые паттерны AI (для замены целиком)
 _AI_PHRASE_PATTERNS = {
     "en": {
@@ -655,10 +643,6 @@ _AI_PHRASE_PATTERNS = {
     },
 }
 
-# Merge expanded phrase patterns
-_AI_PHRASE_PATTERNS["ru"].update(RU_PHRASE_EXTRA)
-_AI_PHRASE_PATTERNS["uk"].update(UK_PHRASE_EXTRA)
-
 # Вставки для повышения перплексии (естественные «человеческие» конструкции)
 _PERPLEXITY_BOOSTERS = {
     "en": {
@@ -941,16 +925,39 @@ _PERPLEXITY_BOOSTERS = {
     },
 }
 
-# Merge expanded perplexity boosters for RU/UK
-for _category, _items in RU_BOOSTERS_EXTRA.items():
-    _PERPLEXITY_BOOSTERS["ru"].setdefault(_category, []).extend(_items)
-for _category, _items in UK_BOOSTERS_EXTRA.items():
-    _PERPLEXITY_BOOSTERS["uk"].setdefault(_category, []).extend(_items)
 # De-duplicate lists
 for _lang_data in _PERPLEXITY_BOOSTERS.values():
     for _cat in _lang_data:
         _lang_data[_cat] = list(dict.fromkeys(_lang_data[_cat]))
 
+# Расширенные словари EN/RU/UK лежат в _replacement_data (~77 КБ
+# литералов) и вливаются в таблицы выше при создании первого
+# натурализатора для языка, а не при импорте модуля.
+_EXTRA_LANGS = frozenset({"en", "ru", "uk"})
+_extras_loaded: set[str] = set()
+_extras_lock = threading.Lock()
+
+
+def _load_extras(lang: str) -> None:
+    """Влить расширенные словари языка из _replacement_data (один раз)."""
+    if lang not in _EXTRA_LANGS or lang in _extras_loaded:
+        return
+    with _extras_lock:
+        if lang in _extras_loaded:
+            return
+        from texthumanize import _replacement_data as data
+
+        if lang == "en":
+            _AI_WORD_REPLACEMENTS["en"].update(data.EN_EXTRA)
+        else:
+            prefix = lang.upper()
+            _AI_WORD_REPLACEMENTS[lang] = getattr(data, f"{prefix}_EXPANDED")
+            _AI_PHRASE_PATTERNS[lang].update(getattr(data, f"{prefix}_PHRASE_EXTRA"))
+            boosters = _PERPLEXITY_BOOSTERS[lang]
+            for category, items in getattr(data, f"{prefix}_BOOSTERS_EXTRA").items():
+                boosters[category] = list(dict.fromkeys([*boosters.get(category, []), *items]))
+        _extras_loaded.add(lang)
+
 # ─── Semantic Intensity Clusters ────────────────────────────────
 # Замена «very/really + adj» → одно ёмкое слово.
 # Это уменьшает word-count и повышает лексическую плотность — признак
@@ -1128,6 +1135,7 @@ class TextNaturalizer:
         self._morph = get_morphology(lang)
 
         # Загружаем данные для языка (или пустые)
+        _load_extras(lang)
         self._replacements = _AI_WORD_REPLACEMENTS.get(lang, {})
         self._phrase_patterns = _AI_PHRASE_PATTERNS.get(lang, {})
         self._boosters = _PERPLEXITY_BOOSTERS.get(lang, {})
@@ -1289,7 +1297,7 @@ class TextNaturalizer:
             if self.rng.random() > prob:
                 continue
 
-            pattern = re.compile(re.escape(phrase), re.IGNORECASE)
+            pattern = compiled(re.escape(phrase), re.IGNORECASE)
             matches = list(pattern.finditer(text))
 
             for match in reversed(matches):
@@ -1336,7 +1344,7 @@ class TextNaturalizer:
             if self.rng.random() > min(0.95, prob * 1.1):
                 continue
 
-            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+            pattern = word_pattern(word)
             matches = list(pattern.finditer(text))
 
             if not matches:
@@ -2422,7 +2430,7 @@ class TextNaturalizer:
             if replaced >= max_replacements:
                 break
 
-            pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+            pattern = word_pattern(word)
             m = pattern.search(text)
             if not m:
                 continue
@@ -2904,7 +2912,7 @@ class TextNaturalizer:
             if self.rng.random() > prob * 0.8:
                 continue
 
-            pattern = re.compile(r'\b' + re.escape(long_word) + r'\b', re.IGNORECASE)
+            pattern = word_pattern(long_word)
             m = pattern.search(text)
             if m:
                 original = m.group(0)
@@ -3263,7 +3271,7 @@ class TextNaturalizer:
             if longest_word.isupper():
                 replacement = replacement.upper()
 
-            pattern = re.compile(r'\b' + re.escape(longest_word) + r'\b')
+            pattern = word_pattern(longest_word, 0)
             text, n = pattern.subn(replacement, text, count=1)
             skipped.add(longest_word.lower())
 
@@ -3443,7 +3451,7 @@ class TextNaturalizer:
             if self.rng.random() > prob * 0.7:
                 continue
 
-            pattern = re.compile(r'\b' + re.escape(full) + r'\b', re.IGNORECASE)
+            pattern = word_pattern(full)
             matches = list(pattern.finditer(text))
             for match in reversed(matches):
                 if self.rng.random() > prob:
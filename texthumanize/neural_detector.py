@@ -217,6 +217,10 @@ _VOWELS_UK = set("аеіїоуєюяАЕІЇОУЄЮЯ")
 _VOWELS_DE = set("aeiouyäöüAEIOUYÄÖÜ")
 _VOWELS_FR = set("aeiouyàâéèêëîïôùûüÿæœAEIOUYÀÂÉÈÊËÎÏÔÙÛÜŸÆŒ")
 _VOWELS_ES = set("aeiouyáéíóúüAEIOUYÁÉÍÓÚÜ")
+_VOWELS_MAP = {
+    "en": _VOWELS_EN, "ru": _VOWELS_RU, "uk": _VOWELS_UK,
+    "de": _VOWELS_DE, "fr": _VOWELS_FR, "es": _VOWELS_ES,
+}
 
 _AI_PATTERNS_DE: list[str] = [
     "darüber hinaus", "es ist wichtig zu beachten", "zusammenfassend lässt sich sagen",
@@ -650,10 +654,6 @@ def extract_features(text: str, lang: str = "en") -> Vec:
         zipf_res = 0.0
 
     # 30, 31. Readability
-    _VOWELS_MAP = {
-        "en": _VOWELS_EN, "ru": _VOWELS_RU, "uk": _VOWELS_UK,
-        "de": _VOWELS_DE, "fr": _VOWELS_FR, "es": _VOWELS_ES,
-    }
     vowels = _VOWELS_MAP.get(lang, _VOWELS_EN)
     syllables = [_count_syllables(t, vowels) for t in tokens]
     avg_syl = _safe_mean([float(s) for s in syllables])
@@ -906,6 +906,29 @@ def _get_network() -> FeedForwardNet:
     return _DETECTOR_NET
 
 
+# Transformer v2 lookup result: None = not tried yet, False = unavailable
+_TRANSFORMER: Any = None
+
+
+def _get_transformer() -> Any:
+    """Loaded transformer v2 detector, or None (looked up once per process)."""
+    global _TRANSFORMER
+    if _TRANSFORMER is None:
+        _TRANSFORMER = False
+        try:
+            from texthumanize.transformer_detector import get_transformer_detector
+            tdet = get_transformer_detector()
+            if tdet.loaded:
+                _TRANSFORMER = tdet
+                logger.info(
+                    "NeuralAIDetector: transformer v2 loaded (%d params)",
+                    tdet.param_count,
+                )
+        except Exception as e:
+            logger.debug("Transformer v2 not available: %s", e)
+    return _TRANSFORMER or None
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -935,22 +958,9 @@ class NeuralAIDetector:
     def __init__(self) -> None:
         self._net = _get_network()
         self._trained = _DETECTOR_TRAINED
-        self._transformer = None
-        self._has_transformer = False
-
-        # Try to load transformer v2 weights
-        try:
-            from texthumanize.transformer_detector import get_transformer_detector
-            tdet = get_transformer_detector()
-            if tdet.loaded:
-                self._transformer = tdet
-                self._has_transformer = True
-                logger.info(
-                    "NeuralAIDetector: transformer v2 loaded (%d params)",
-                    tdet.param_count,
-                )
-        except Exception as e:
-            logger.debug("Transformer v2 not available: %s", e)
+        # Transformer v2 weights, if available
+        self._transformer = _get_transformer()
+        self._has_transformer = self._transformer is not None
 
     def extract_features(self, text: str, lang: str = "en") -> dict[str, float]:
         """Extract and return named features (for debugging/explainability)."""
@@ -970,7 +980,12 @@ class NeuralAIDetector:
         """
         raw_features = extract_features(text, lang)
         normed = normalize_features(raw_features, lang=lang)
+        return self._detect_normed(text, normed, lang)
 
+    def _detect_normed(
+        self, text: str, normed: list[float], lang: str, mlp_out: Vec | None = None,
+    ) -> dict[str, Any]:
+        """:meth:`detect` from normalized features (``mlp_out``: precomputed MLP output)."""
         # Use transformer v2 if available
         if self._has_transformer and self._transformer is not None:
             try:
@@ -985,13 +1000,13 @@ class NeuralAIDetector:
 
         # Legacy MLP detection
         # Forward pass through MLP
+        out = mlp_out if mlp_out is not None else self._net.forward(normed)
         if self._trained:
             # Trained weights: positive logit = AI, sigmoid gives P(AI) directly
-            score = self._net.predict_proba(normed)
+            score = self._net._proba(out)
         else:
             # Heuristic weights: positive logit = human, negate for P(AI)
-            logit = self._net.forward(normed)
-            score = _sigmoid(-logit[0])
+            score = _sigmoid(-out[0])
 
         # Short text dampening
         tokens = _WORD_RE.findall(text)
@@ -1050,9 +1065,29 @@ class NeuralAIDetector:
             "top_features": top_features,
         }
 
-    def detect_batch(self, texts: list[str], lang: str = "en") -> list[dict[str, Any]]:
-        """Detect AI for multiple texts."""
-        return [self.detect(text, lang) for text in texts]
+    def detect_batch(
+        self,
+        texts: list[str],
+        lang: str = "en",
+        normed: list[list[float]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Detect AI for multiple texts.
+
+        The MLP runs once over the whole batch
+        (:meth:`FeedForwardNet.forward_batch`); the transformer, when
+        loaded, still scores text by text. ``normed`` — features already
+        computed by :func:`normalize_features` (e.g. in worker processes),
+        one per text.
+        """
+        if normed is None:
+            normed = [normalize_features(extract_features(t, lang), lang=lang) for t in texts]
+        outs: list[Vec | None] = [None] * len(texts)
+        if not self._has_transformer:
+            outs = list(self._net.forward_batch(normed))
+        return [
+            self._detect_normed(text, feats, lang, out)
+            for text, feats, out in zip(texts, normed, outs)
+        ]
 
     def detect_sentences(
         self, text: str, lang: str = "en"
@@ -20,6 +20,7 @@ import math
 import operator
 import struct
 import zlib
+from array import array
 from collections.abc import Sequence
 from typing import Any, Callable, Optional
 
@@ -49,6 +50,33 @@ Mat = list[list[float]]
 _mul = operator.mul
 
 
+def _pack_vector(v: Vec) -> Any:
+    """Copy ``v`` into one contiguous buffer.
+
+    float32 ``ndarray`` with NumPy (the dtype its forward paths use), else
+    ``array('d')`` (same doubles as the list). Unlike a list of Python
+    floats, reading it does not touch per-number refcounts, so the pages
+    stay shared after ``fork()``.
+    """
+    if _HAS_NUMPY:
+        return np.ascontiguousarray(v, dtype=np.float32)
+    return array("d", v)
+
+
+def _pack_matrix(m: Mat) -> Any:
+    """Matrix counterpart of :func:`_pack_vector` (rows of ``array('d')``)."""
+    if _HAS_NUMPY:
+        return np.ascontiguousarray(m, dtype=np.float32)
+    return [array("d", row) for row in m]
+
+
+def _to_list(x: Any) -> Any:
+    """Packed buffer (or plain list) back to nested lists for JSON."""
+    if hasattr(x, "tolist"):
+        return x.tolist()
+    return [v.tolist() if hasattr(v, "tolist") else v for v in x]
+
+
 def _dot(a: Vec, b: Vec) -> float:
     """Dot product of two vectors (optimized)."""
     return float(sum(map(_mul, a, b)))
@@ -181,6 +209,19 @@ def _layer_norm(v: Vec, eps: float = 1e-5) -> Vec:
     return [(x - mean) / std for x in v]
 
 
+def _activate_np(out: Any, name: str) -> Any:
+    """Element-wise activation of a numpy array (vector or batch)."""
+    if name == "relu":
+        return np.maximum(out, 0.0)
+    if name == "sigmoid":
+        return 1.0 / (1.0 + np.exp(-np.clip(out, -88, 88)))
+    if name == "tanh":
+        return np.tanh(out)
+    if name == "gelu":
+        return 0.5 * out * (1.0 + np.tanh(np.sqrt(2.0 / np.pi) * (out + 0.044715 * out ** 3)))
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Feedforward Neural Network
 # ---------------------------------------------------------------------------
@@ -221,20 +262,27 @@ class DenseLayer:
             mean = out.mean()
             std = np.sqrt(out.var() + 1e-5)
             out = (out - mean) / std
-        act = self.activation
-        if act == "relu":
-            out = np.maximum(out, 0.0)
-        elif act == "sigmoid":
-            out = 1.0 / (1.0 + np.exp(-np.clip(out, -88, 88)))
-        elif act == "tanh":
-            out = np.tanh(out)
-        elif act == "gelu":
-            out = 0.5 * out * (1.0 + np.tanh(np.sqrt(2.0 / np.pi) * (out + 0.044715 * out ** 3)))
-        return out.tolist()
+        return _activate_np(out, self.activation).tolist()
+
+    def _forward_np_rows(self, a: Any) -> Any:
+        """numpy forward pass for a (batch × in_features) matrix."""
+        w = np.asarray(self.weights, dtype=np.float32)
+        b = np.asarray(self.bias, dtype=np.float32)
+        out = a @ w.T + b
+        if self.use_layer_norm:
+            mean = out.mean(axis=1, keepdims=True)
+            std = np.sqrt(out.var(axis=1, keepdims=True) + 1e-5)
+            out = (out - mean) / std
+        return _activate_np(out, self.activation)
+
+    def pack(self) -> None:
+        """Store weights and bias in contiguous buffers (see :func:`_pack_matrix`)."""
+        self.weights = _pack_matrix(self.weights)
+        self.bias = _pack_vector(self.bias)
 
     @property
     def in_features(self) -> int:
-        return len(self.weights[0]) if self.weights else 0
+        return len(self.weights[0]) if len(self.weights) else 0
 
     @property
     def out_features(self) -> int:
@@ -265,9 +313,35 @@ class FeedForwardNet:
             x = layer.forward(x)
         return x
 
+    def pack(self) -> None:
+        """Pack every layer's weights for sharing across forked workers."""
+        for layer in self.layers:
+            layer.pack()
+
+    def forward_batch(self, xs: Sequence[Vec]) -> list[Vec]:
+        """Forward pass for many inputs at once.
+
+        With numpy every layer is a single (batch × in) @ (in × out)
+        product instead of one matrix-vector product per input; without
+        numpy this is a loop over :meth:`forward`.
+        """
+        if not _HAS_NUMPY or not xs:
+            return [self.forward(x) for x in xs]
+        a = np.asarray(xs, dtype=np.float32)
+        for layer in self.layers:
+            a = layer._forward_np_rows(a)
+        return a.tolist()
+
     def predict_proba(self, x: Vec) -> float:
         """Run forward pass and return sigmoid probability (for binary classification)."""
-        out = self.forward(x)
+        return self._proba(self.forward(x))
+
+    def predict_proba_batch(self, xs: Sequence[Vec]) -> list[float]:
+        """:meth:`predict_proba` for many inputs (see :meth:`forward_batch`)."""
+        return [self._proba(out) for out in self.forward_batch(xs)]
+
+    @staticmethod
+    def _proba(out: Vec) -> float:
         if len(out) == 1:
             return _sigmoid(out[0])
         return _softmax(out)[1]  # probability of class 1
@@ -305,8 +379,8 @@ class FeedForwardNet:
             "name": self._name,
             "layers": [
                 {
-                    "weights": layer.weights,
-                    "bias": layer.bias,
+                    "weights": _to_list(layer.weights),
+                    "bias": _to_list(layer.bias),
                     "activation": layer.activation,
                     "layer_norm": layer.use_layer_norm,
                 }
@@ -464,6 +538,13 @@ class LSTMCell:
 
         return h_new, c_new
 
+    def pack(self) -> None:
+        """Store gate weights in contiguous buffers (see :func:`_pack_matrix`)."""
+        for name in ("wf", "wi", "wg", "wo"):
+            setattr(self, name, _pack_matrix(getattr(self, name)))
+        for name in ("bf", "bi", "bg", "bo"):
+            setattr(self, name, _pack_vector(getattr(self, name)))
+
     @property
     def param_count(self) -> int:
         combined_size = self.hidden_size + self.input_size
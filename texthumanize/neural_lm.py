@@ -34,6 +34,8 @@ from texthumanize.neural_engine import (
     Vec,
     _he_init,
     _log_softmax,
+    _pack_matrix,
+    _pack_vector,
     _zeros,
 )
 
@@ -64,6 +66,9 @@ _UNK_IDX = 0  # space as fallback
 _EMBED_DIM = 32
 _HIDDEN_DIM = 64
 
+# Sequences stepped together by perplexity_batch()
+_LM_BATCH = 64
+
 
 def _char_idx(ch: str) -> int:
     """Get character index, fallback to UNK."""
@@ -280,6 +285,13 @@ class NeuralPerplexity:
             _VOCAB_SIZE, _EMBED_DIM, _HIDDEN_DIM, loaded,
         )
 
+    def pack(self) -> None:
+        """Move all weights into contiguous buffers (pre-fork warmup)."""
+        self._embed.W = _pack_matrix(self._embed.W)
+        self._lstm.pack()
+        self._proj.W = _pack_matrix(self._proj.W)
+        self._proj.b = _pack_vector(self._proj.b)
+
     def _forward_sequence(self, text: str, max_chars: int = 2000) -> list[float]:
         """Run LSTM over text, return per-character log-probabilities."""
         if len(text) > max_chars:
@@ -332,6 +344,75 @@ class NeuralPerplexity:
         bpc = self.cross_entropy(text, max_chars)
         return float(2.0 ** bpc)
 
+    def perplexity_batch(self, texts: list[str], max_chars: int = 2000) -> list[float]:
+        """:meth:`perplexity` for many texts, in input order.
+
+        With numpy the texts advance through the LSTM together: each step
+        is one (batch × hidden) gate product and one projection for all
+        of them, instead of a matrix-vector product per text. Texts are
+        sorted by length before batching, so little work is spent on
+        padding. Results agree with :meth:`perplexity` up to float32
+        rounding. Without numpy this is a loop over :meth:`perplexity`.
+        """
+        if not _HAS_NP:
+            return [self.perplexity(t, max_chars) for t in texts]
+
+        out = [float(2.0 ** 3.0)] * len(texts)  # cross_entropy() default
+        todo = sorted(
+            (i for i, t in enumerate(texts) if len(t) >= 10),
+            key=lambda i: min(len(texts[i]), max_chars),
+        )
+        for start in range(0, len(todo), _LM_BATCH):
+            idx = todo[start:start + _LM_BATCH]
+            bpcs = self._cross_entropy_rows([texts[i][:max_chars] for i in idx])
+            for i, bpc in zip(idx, bpcs):
+                out[i] = float(2.0 ** bpc)
+        return out
+
+    def _cross_entropy_rows(self, texts: list[str]) -> list[float]:
+        """Bits per character of several texts (len >= 2), stepped together."""
+        np = _np
+        n = len(texts)
+        lengths = np.array([len(t) for t in texts])
+        ids = np.zeros((n, int(lengths.max())), dtype=np.intp)
+        for row, text in enumerate(texts):
+            ids[row, :len(text)] = [_char_idx(ch) for ch in text]
+
+        lstm = self._lstm
+        hs = self._hidden_dim
+        embed = np.asarray(self._embed.W, dtype=np.float32)
+        w_gates = np.concatenate([
+            np.asarray(w, dtype=np.float32) for w in (lstm.wf, lstm.wi, lstm.wg, lstm.wo)
+        ]).T
+        b_gates = np.concatenate([
+            np.asarray(b, dtype=np.float32) for b in (lstm.bf, lstm.bi, lstm.bg, lstm.bo)
+        ])
+        w_proj = np.asarray(self._proj.W, dtype=np.float32).T
+        b_proj = np.asarray(self._proj.b, dtype=np.float32)
+
+        h = np.zeros((n, hs), dtype=np.float32)
+        c = np.zeros((n, hs), dtype=np.float32)
+        rows = np.arange(n)
+        total = np.zeros(n)
+        for step in range(int(lengths.max()) - 1):
+            z = np.concatenate([h, embed[ids[:, step]]], axis=1) @ w_gates + b_gates
+            f_gate = 1.0 / (1.0 + np.exp(-np.clip(z[:, :hs], -88, 88)))
+            i_gate = 1.0 / (1.0 + np.exp(-np.clip(z[:, hs:2 * hs], -88, 88)))
+            g_gate = np.tanh(z[:, 2 * hs:3 * hs])
+            o_gate = 1.0 / (1.0 + np.exp(-np.clip(z[:, 3 * hs:], -88, 88)))
+            c = f_gate * c + i_gate * g_gate
+            h = o_gate * np.tanh(c)
+
+            logits = h @ w_proj + b_proj
+            m = logits.max(axis=1)
+            lse = m + np.log(np.exp(logits - m[:, None]).sum(axis=1))
+            log_p = logits[rows, ids[:, step + 1]] - lse
+            # Finished (padded) rows keep stepping but are not counted
+            total += np.where(step < lengths - 1, log_p, 0.0)
+
+        avg_nll = -total / (lengths - 1)
+        return (avg_nll / math.log(2)).tolist()
+
     def perplexity_score(self, text: str, max_chars: int = 2000) -> float:
         """Compute AI detection score based on perplexity.
 
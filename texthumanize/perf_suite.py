@@ -0,0 +1,757 @@
+"""Performance regression suite for TextHumanize.
+
+Measures latency, not quality (see :mod:`texthumanize.benchmark_suite`
+for that), on a fixed, deterministic multilingual corpus:
+
+- per-API wall time (``humanize``, ``detect_ai``, ``analyze``,
+  ``detect_ai_sentences``) for every language and size;
+- per-stage pipeline time (the ``stage_timings`` of ``humanize``);
+- peak traced memory of each API call;
+- ``import texthumanize`` / ``texthumanize.core`` time in a fresh
+  interpreter;
+- ``detect_ai`` throughput with N worker processes.
+
+Every measurement keeps its raw samples, and a run is saved as a JSON
+baseline. ``compare`` flags a regression when the median got worse by
+more than ``threshold`` *and* a permutation test on the samples says
+the difference is significant (``p < alpha``), so noisy single runs
+do not fail a release.
+
+Usage::
+
+    python -m texthumanize.perf_suite run -o baseline.json
+    python -m texthumanize.perf_suite run --profile full -o full.json
+    python -m texthumanize.perf_suite run --langs en,ru,zh --sizes 100,10000
+    python -m texthumanize.perf_suite compare baseline.json current.json
+
+    from texthumanize.perf_suite import build_corpus, compare, run_suite
+    report = run_suite(langs=["en"], sizes=[100], apis=["detect_ai"])
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+# ─────────────────────────────────────────────────────────────
+#  Corpus
+# ─────────────────────────────────────────────────────────────
+
+# One paragraph per supported language: formal, AI-like sentences
+# mixed with plain ones, so that detectors and pipeline stages fire.
+_SEEDS: dict[str, str] = {
+    "en": (
+        "Furthermore, it is important to note that the implementation of "
+        "comprehensive strategies facilitates optimal outcomes. I walked to "
+        "the station in the rain and missed the train anyway. Moreover, the "
+        "utilization of innovative methodologies ensures significant "
+        "improvements in overall efficiency. My neighbour laughed when she "
+        "saw my wet shoes."
+    ),
+    "ru": (
+        "Необходимо отметить, что осуществление комплексных мероприятий "
+        "способствует оптимизации рабочих процессов. Вчера я опоздал на "
+        "автобус и пошёл пешком под дождём. Кроме того, данный подход "
+        "является безусловно важным для достижения стратегических целей. "
+        "Соседка смеялась, глядя на мои мокрые ботинки."
+    ),
+    "uk": (
+        "Варто зазначити, що впровадження комплексних заходів сприяє "
+        "оптимізації робочих процесів. Учора я запізнився на автобус і "
+        "пішов пішки під дощем. Крім того, цей підхід є надзвичайно "
+        "важливим для досягнення стратегічних цілей. Сусідка сміялася з "
+        "моїх мокрих черевиків."
+    ),
+    "de": (
+        "Darüber hinaus ist hervorzuheben, dass die Implementierung "
+        "umfassender Strategien optimale Ergebnisse ermöglicht. Gestern "
+        "habe ich den Bus verpasst und bin im Regen gelaufen. Zudem "
+        "gewährleistet der Einsatz innovativer Methoden eine erhebliche "
+        "Steigerung der Effizienz. Meine Nachbarin lachte über meine "
+        "nassen Schuhe."
+    ),
+    "fr": (
+        "Par ailleurs, il convient de souligner que la mise en œuvre de "
+        "stratégies globales favorise des résultats optimaux. Hier, j'ai "
+        "raté le bus et je suis rentré à pied sous la pluie. De plus, "
+        "l'utilisation de méthodologies innovantes garantit une nette "
+        "amélioration de l'efficacité. Ma voisine a ri en voyant mes "
+        "chaussures trempées."
+    ),
+    "es": (
+        "Además, cabe destacar que la implementación de estrategias "
+        "integrales facilita resultados óptimos. Ayer perdí el autobús y "
+        "volví a casa caminando bajo la lluvia. Asimismo, la utilización "
+        "de metodologías innovadoras garantiza mejoras significativas en "
+        "la eficiencia. Mi vecina se rió al ver mis zapatos mojados."
+    ),
+    "it": (
+        "Inoltre, è importante sottolineare che l'implementazione di "
+        "strategie complete favorisce risultati ottimali. Ieri ho perso "
+        "l'autobus e sono tornato a piedi sotto la pioggia. Per di più, "
+        "l'utilizzo di metodologie innovative garantisce un notevole "
+        "miglioramento dell'efficienza. La mia vicina ha riso delle mie "
+        "scarpe bagnate."
+    ),
+    "pl": (
+        "Ponadto należy podkreślić, że wdrożenie kompleksowych strategii "
+        "sprzyja osiąganiu optymalnych wyników. Wczoraj spóźniłem się na "
+        "autobus i wróciłem pieszo w deszczu. Co więcej, wykorzystanie "
+        "innowacyjnych metod zapewnia znaczną poprawę efektywności. "
+        "Sąsiadka śmiała się z moich mokrych butów."
+    ),
+    "pt": (
+        "Além disso, é importante salientar que a implementação de "
+        "estratégias abrangentes facilita resultados ótimos. Ontem perdi o "
+        "ônibus e voltei a pé debaixo de chuva. Ademais, a utilização de "
+        "metodologias inovadoras garante melhorias significativas na "
+        "eficiência. A minha vizinha riu dos meus sapatos molhados."
+    ),
+    "nl": (
+        "Bovendien is het belangrijk op te merken dat de implementatie van "
+        "alomvattende strategieën optimale resultaten bevordert. Gisteren "
+        "miste ik de bus en liep ik in de regen naar huis. Daarnaast "
+        "zorgt het gebruik van innovatieve methoden voor een aanzienlijke "
+        "verbetering van de efficiëntie. Mijn buurvrouw lachte om mijn "
+        "natte schoenen."
+    ),
+    "sv": (
+        "Dessutom är det viktigt att notera att implementeringen av "
+        "omfattande strategier främjar optimala resultat. Igår missade jag "
+        "bussen och gick hem i regnet. Vidare säkerställer användningen av "
+        "innovativa metoder betydande förbättringar av effektiviteten. "
+        "Min granne skrattade åt mina blöta skor."
+    ),
+    "cs": (
+        "Kromě toho je důležité poznamenat, že zavedení komplexních "
+        "strategií podporuje optimální výsledky. Včera mi ujel autobus a "
+        "šel jsem domů pěšky v dešti. Navíc využití inovativních metod "
+        "zajišťuje výrazné zlepšení efektivity. Sousedka se smála mým "
+        "mokrým botám."
+    ),
+    "ro": (
+        "Mai mult, este important de menționat că implementarea unor "
+        "strategii cuprinzătoare facilitează rezultate optime. Ieri am "
+        "pierdut autobuzul și am mers pe jos prin ploaie. De asemenea, "
+        "utilizarea unor metodologii inovatoare asigură îmbunătățiri "
+        "semnificative ale eficienței. Vecina a râs de pantofii mei uzi."
+    ),
+    "hu": (
+        "Továbbá fontos megjegyezni, hogy az átfogó stratégiák bevezetése "
+        "elősegíti az optimális eredményeket. Tegnap lekéstem a buszt, és "
+        "gyalog mentem haza az esőben. Ezenkívül az innovatív módszerek "
+        "alkalmazása jelentős hatékonyságjavulást biztosít. A szomszédom "
+        "nevetett a vizes cipőmön."
+    ),
+    "da": (
+        "Desuden er det vigtigt at bemærke, at implementeringen af "
+        "omfattende strategier fremmer optimale resultater. I går kom jeg "
+        "for sent til bussen og gik hjem i regnen. Derudover sikrer brugen "
+        "af innovative metoder betydelige forbedringer af effektiviteten. "
+        "Min nabo grinede af mine våde sko."
+    ),
+    "ar": (
+        "علاوة على ذلك، تجدر الإشارة إلى أن تنفيذ الاستراتيجيات الشاملة "
+        "يسهم في تحقيق نتائج مثلى. بالأمس فاتتني الحافلة فعدت إلى البيت "
+        "مشيًا تحت المطر. بالإضافة إلى ذلك، يضمن استخدام المنهجيات "
+        "المبتكرة تحسينات كبيرة في الكفاءة. ضحكت جارتي عندما رأت حذائي المبلل."
+    ),
+    "zh": (
+        "此外，值得注意的是，全面战略的实施有助于实现最佳成果。昨天我错过了"
+        "公交车，只好冒雨走回家。而且，创新方法的运用确保了整体效率的显著"
+        "提升。邻居看到我湿透的鞋子笑了起来。"
+    ),
+    "ja": (
+        "さらに、包括的な戦略の実施が最適な成果を促進することは重要である。"
+        "昨日はバスに乗り遅れて、雨の中を歩いて帰った。また、革新的な手法の"
+        "活用により、全体的な効率が大幅に向上する。隣の人は私の濡れた靴を"
+        "見て笑った。"
+    ),
+    "ko": (
+        "또한 포괄적인 전략의 실행이 최적의 성과를 촉진한다는 점에 주목할 "
+        "필요가 있다. 어제 나는 버스를 놓쳐서 비를 맞으며 걸어서 집에 갔다. "
+        "더불어 혁신적인 방법론의 활용은 전반적인 효율성의 상당한 향상을 "
+        "보장한다. 이웃은 내 젖은 신발을 보고 웃었다."
+    ),
+    "tr": (
+        "Ayrıca, kapsamlı stratejilerin uygulanmasının en iyi sonuçları "
+        "kolaylaştırdığını belirtmek önemlidir. Dün otobüsü kaçırdım ve "
+        "yağmurda yürüyerek eve döndüm. Bunun yanı sıra, yenilikçi "
+        "yöntemlerin kullanılması verimlilikte önemli iyileşmeler sağlar. "
+        "Komşum ıslak ayakkabılarıma güldü."
+    ),
+    "hi": (
+        "इसके अतिरिक्त, यह ध्यान देना महत्वपूर्ण है कि व्यापक रणनीतियों का "
+        "कार्यान्वयन इष्टतम परिणामों को सुगम बनाता है। कल मेरी बस छूट गई और "
+        "मैं बारिश में पैदल घर गया। इसके अलावा, नवीन पद्धतियों का उपयोग "
+        "दक्षता में महत्वपूर्ण सुधार सुनिश्चित करता है। मेरी पड़ोसन मेरे गीले "
+        "जूते देखकर हँस पड़ी।"
+    ),
+    "vi": (
+        "Hơn nữa, điều quan trọng cần lưu ý là việc triển khai các chiến "
+        "lược toàn diện giúp đạt được kết quả tối ưu. Hôm qua tôi lỡ xe "
+        "buýt và phải đi bộ về nhà dưới mưa. Ngoài ra, việc sử dụng các "
+        "phương pháp đổi mới đảm bảo hiệu quả được cải thiện đáng kể. Chị "
+        "hàng xóm bật cười khi thấy đôi giày ướt của tôi."
+    ),
+    "th": (
+        "นอกจากนี้ เป็นสิ่งสำคัญที่ต้องทราบว่าการดำเนินกลยุทธ์ที่ครอบคลุม"
+        "ช่วยให้ได้ผลลัพธ์ที่ดีที่สุด เมื่อวานฉันพลาดรถเมล์และต้องเดินกลับบ้าน"
+        "กลางสายฝน ยิ่งไปกว่านั้น การใช้วิธีการที่เป็นนวัตกรรมช่วยเพิ่ม"
+        "ประสิทธิภาพได้อย่างมาก เพื่อนบ้านหัวเราะเมื่อเห็นรองเท้าเปียกของฉัน"
+    ),
+    "id": (
+        "Selain itu, penting untuk dicatat bahwa penerapan strategi yang "
+        "komprehensif memfasilitasi hasil yang optimal. Kemarin saya "
+        "ketinggalan bus dan berjalan pulang di tengah hujan. Lebih lanjut, "
+        "pemanfaatan metodologi inovatif menjamin peningkatan efisiensi "
+        "yang signifikan. Tetangga saya tertawa melihat sepatu saya yang basah."
+    ),
+    "he": (
+        "יתר על כן, חשוב לציין כי יישום אסטרטגיות מקיפות מקדם תוצאות "
+        "מיטביות. אתמול פספסתי את האוטובוס והלכתי הביתה ברגל בגשם. "
+        "בנוסף, השימוש במתודולוגיות חדשניות מבטיח שיפור משמעותי ביעילות. "
+        "השכנה צחקה כשראתה את הנעליים הרטובות שלי."
+    ),
+}
+
+LANGS: tuple[str, ...] = tuple(_SEEDS)
+SIZES: tuple[int, ...] = (100, 1_000, 10_000, 50_000)
+APIS: tuple[str, ...] = ("humanize", "detect_ai", "analyze", "detect_ai_sentences")
+
+# Scripts written without spaces: "words" are estimated from characters
+_CHARS_PER_WORD = {"zh": 1.5, "ja": 2.0, "th": 5.0}
+
+PROFILES: dict[str, dict[str, Any]] = {
+    "quick": {
+        "langs": ("en", "ru", "de", "ar", "zh", "ja"),
+        "sizes": (100, 1_000),
+        "repeat": 5,
+        "workers": (1, 2),
+    },
+    "full": {
+        "langs": LANGS,
+        "sizes": SIZES,
+        "repeat": 5,
+        "workers": (1, 2, 4),
+    },
+}
+
+
+def word_count(text: str, lang: str) -> int:
+    """Approximate number of words (characters for CJK/Thai)."""
+    if lang in _CHARS_PER_WORD:
+        chars = sum(1 for ch in text if not ch.isspace())
+        return int(chars / _CHARS_PER_WORD[lang])
+    return len(text.split())
+
+
+# Sentence ends of the seed paragraphs (Thai separates sentences by spaces)
+_SENT_END = re.compile(r'(?<=[.!?。！？।])\s*')
+
+
+def _sentences(seed: str, lang: str) -> list[str]:
+    parts = seed.split(" ") if lang == "th" else _SENT_END.split(seed)
+    return [s.strip() for s in parts if s.strip()]
+
+
+def build_document(lang: str, words: int) -> str:
+    """Deterministic document of about ``words`` words in ``lang``.
+
+    Seed sentences are shuffled with a fixed RNG and grouped into
+    paragraphs of five sentences.
+    """
+    if lang not in _SEEDS:
+        raise ValueError(f"No perf corpus for language {lang!r}")
+    sentences = _sentences(_SEEDS[lang], lang)
+    rng = random.Random(f"{lang}:{words}")
+    joiner = "" if lang in ("zh", "ja") else " "
+    paragraphs: list[str] = []
+    current: list[str] = []
+    count = 0
+    while count < words:
+        batch = sentences[:]
+        rng.shuffle(batch)
+        for sent in batch:
+            current.append(sent)
+            count += word_count(sent, lang)
+            if len(current) == 5 or count >= words:
+                paragraphs.append(joiner.join(current))
+                current = []
+            if count >= words:
+                break
+    return "\n\n".join(paragraphs)
+
+
+def build_corpus(
+    langs: Sequence[str] = LANGS,
+    sizes: Sequence[int] = SIZES,
+) -> dict[tuple[str, int], str]:
+    """Documents keyed by ``(lang, size)``."""
+    return {(lang, size): build_document(lang, size) for lang in langs for size in sizes}
+
+
+# ─────────────────────────────────────────────────────────────
+#  Measurements
+# ─────────────────────────────────────────────────────────────
+
+@dataclass
+class Measurement:
+    """Raw samples of one metric."""
+
+    samples: list[float]
+    unit: str = "s"
+    better: str = "lower"  # or "higher"
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+
+@dataclass
+class PerfReport:
+    """Results of one suite run (serialisable to a JSON baseline)."""
+
+    meta: dict[str, Any] = field(default_factory=dict)
+    results: dict[str, Measurement] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "meta": self.meta,
+            "results": {
+                key: {"samples": m.samples, "unit": m.unit, "better": m.better,
+                      "median": m.median}
+                for key, m in sorted(self.results.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PerfReport:
+        return cls(
+            meta=dict(data.get("meta", {})),
+            results={
+                key: Measurement(
+                    samples=[float(x) for x in m["samples"]],
+                    unit=m.get("unit", "s"),
+                    better=m.get("better", "lower"),
+                )
+                for key, m in data.get("results", {}).items()
+            },
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh, indent=1)
+
+    @classmethod
+    def load(cls, path: str) -> PerfReport:
+        with open(path, encoding="utf-8") as fh:
+            return cls.from_dict(json.load(fh))
+
+
+def _api(name: str) -> Callable[[str, str], Any]:
+    from texthumanize import core
+
+    if name == "humanize":
+        return lambda text, lang: core.humanize(text, lang=lang, seed=42)
+    if name in ("detect_ai", "analyze", "detect_ai_sentences"):
+        fn = getattr(core, name)
+        return lambda text, lang: fn(text, lang=lang)
+    raise ValueError(f"Unknown API {name!r}, expected one of {APIS}")
+
+
+def _cold() -> None:
+    """Drop memoized results so every sample does the full work."""
+    from texthumanize.cache import clear_all
+
+    clear_all()
+
+
+def measure_import(repeat: int = 5, module: str = "texthumanize") -> Measurement:
+    """``import module`` time in a fresh interpreter."""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)"
+    )
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return Measurement(samples)
+
+
+def _detect_one(text: str) -> float:
+    from texthumanize.core import detect_ai
+
+    return float(detect_ai(text, lang="en")["score"])
+
+
+def measure_throughput(
+    workers: int, docs: Sequence[str], repeat: int = 3,
+) -> Measurement:
+    """``detect_ai`` documents per second with ``workers`` processes.
+
+    The pool is started (and workers have imported the library) before
+    the clock starts.
+    """
+    samples = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_detect_one, docs[:workers]))  # warm every worker
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            list(pool.map(_detect_one, docs))
+            samples.append(len(docs) / (time.perf_counter() - t0))
+    return Measurement(samples, unit="docs/s", better="higher")
+
+
+def _measure_api(
+    results: dict[str, Measurement],
+    api_name: str,
+    lang: str,
+    size: int,
+    text: str,
+    *,
+    repeat: int,
+    memory: bool,
+) -> None:
+    fn = _api(api_name)
+    _cold()
+    fn(text, lang)  # warm-up: lazy imports and models
+    times: list[float] = []
+    stages: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        _cold()
+        t0 = time.perf_counter()
+        out = fn(text, lang)
+        times.append(time.perf_counter() - t0)
+        if api_name == "humanize":
+            for stage, secs in out.metrics_after.get("stage_timings", {}).items():
+                stages.setdefault(stage, []).append(float(secs))
+    results[f"api/{api_name}/{lang}/{size}"] = Measurement(times)
+    for stage, secs in stages.items():
+        results[f"stage/{lang}/{size}/{stage}"] = Measurement(secs)
+    if memory:
+        _cold()
+        tracemalloc.start()
+        try:
+            fn(text, lang)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        results[f"memory/{api_name}/{lang}/{size}"] = Measurement(
+            [float(peak)], unit="bytes",
+        )
+
+
+def run_suite(
+    *,
+    langs: Sequence[str] = PROFILES["quick"]["langs"],
+    sizes: Sequence[int] = PROFILES["quick"]["sizes"],
+    apis: Sequence[str] = APIS,
+    repeat: int = 5,
+    workers: Sequence[int] = (),
+    import_time: bool = False,
+    memory: bool = True,
+    progress: Callable[[str], None] | None = None,
+) -> PerfReport:
+    """Run the suite and return a :class:`PerfReport`.
+
+    Keys of :attr:`PerfReport.results`:
+
+    - ``api/<api>/<lang>/<size>`` — wall time per call (s);
+    - ``stage/<lang>/<size>/<stage>`` — pipeline stage time (s);
+    - ``memory/<api>/<lang>/<size>`` — peak traced memory (bytes);
+    - ``import/<module>`` — import time of ``texthumanize`` and
+      ``texthumanize.core`` (s);
+    - ``throughput/detect_ai/workers=<n>`` — documents per second.
+
+    Measurements that raise (e.g. the pipeline timeout on very large
+    inputs) are listed in ``meta["errors"]`` instead.
+    """
+    from texthumanize import __version__
+
+    report = PerfReport(meta={
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": repeat,
+    })
+    results = report.results
+    say = progress or (lambda msg: None)
+
+    if import_time:
+        for module in ("texthumanize", "texthumanize.core"):
+            say(f"import {module}")
+            results[f"import/{module}"] = measure_import(repeat, module)
+
+    corpus = build_corpus(langs, sizes)
+    errors: dict[str, str] = {}
+    for api_name, (lang, size) in itertools.product(apis, corpus):
+        key = f"{api_name}/{lang}/{size}"
+        say(key)
+        try:
+            _measure_api(results, api_name, lang, size, corpus[(lang, size)],
+                         repeat=repeat, memory=memory)
+        except Exception as exc:  # e.g. pipeline timeout on huge inputs
+            errors[key] = f"{type(exc).__name__}: {exc}"
+    if errors:
+        report.meta["errors"] = errors
+
+    if workers:
+        docs = [build_document("en", 1_000)] * (4 * max(workers))
+        for n in workers:
+            say(f"throughput workers={n}")
+            results[f"throughput/detect_ai/workers={n}"] = measure_throughput(
+                n, docs, repeat=repeat,
+            )
+    return report
+
+
+# ─────────────────────────────────────────────────────────────
+#  Comparison
+# ─────────────────────────────────────────────────────────────
+
+def permutation_pvalue(
+    a: Sequence[float], b: Sequence[float], *, rounds: int = 10_000,
+) -> float:
+    """Two-sided permutation test on the difference of means.
+
+    Exact for small samples (all splits enumerated), otherwise
+    ``rounds`` random splits with a fixed seed.
+    """
+    pooled = list(a) + list(b)
+    n = len(a)
+    observed = abs(statistics.fmean(a) - statistics.fmean(b))
+    total = sum(pooled)
+    size = len(pooled)
+
+    def _diff(idx: Sequence[int]) -> float:
+        first = sum(pooled[i] for i in idx)
+        return abs(first / n - (total - first) / (size - n))
+
+    eps = 1e-12 * max(1.0, observed)
+    splits = _n_choose_k(size, n)
+    if splits <= rounds:
+        hits = sum(
+            1 for idx in itertools.combinations(range(size), n)
+            if _diff(idx) >= observed - eps
+        )
+        return hits / splits
+    rng = random.Random(0)
+    indices = list(range(size))
+    hits = sum(
+        1 for _ in range(rounds) if _diff(rng.sample(indices, n)) >= observed - eps
+    )
+    return (hits + 1) / (rounds + 1)
+
+
+def _n_choose_k(n: int, k: int) -> int:
+    from math import comb
+
+    return comb(n, k)
+
+
+def min_pvalue(n_a: int, n_b: int) -> float:
+    """Smallest p :func:`permutation_pvalue` can return for these sizes.
+
+    Only the observed split (and, for equal sizes, its mirror) is that
+    extreme, so with 3 samples per side p is never below 2/20 = 0.1 and
+    no difference can be significant at ``alpha = 0.05``.
+    """
+    return (2 if n_a == n_b else 1) / _n_choose_k(n_a + n_b, n_a)
+
+
+# Smallest --repeat whose samples can reach p < 0.05 (2/C(8, 4) ≈ 0.029)
+MIN_REPEAT = 4
+
+
+@dataclass
+class Comparison:
+    """Change of one metric between a baseline and a candidate run."""
+
+    key: str
+    base: float
+    new: float
+    change: float  # relative change of the median, + = worse
+    p_value: float | None
+    regression: bool
+    improvement: bool
+    insufficient: bool = False  # too few samples to ever reach p < alpha
+
+
+def compare(
+    base: PerfReport,
+    new: PerfReport,
+    *,
+    threshold: float = 0.10,
+    alpha: float = 0.05,
+) -> list[Comparison]:
+    """Compare the metrics present in both reports.
+
+    A metric regresses when its median got worse by more than
+    ``threshold`` and, with at least two samples on each side, the
+    permutation test gives ``p < alpha``. Single-sample metrics
+    (memory) are judged on the threshold alone. Metrics whose sample
+    counts cannot reach ``p < alpha`` at all (see :func:`min_pvalue`)
+    are marked ``insufficient`` instead of passing as unchanged.
+    """
+    out: list[Comparison] = []
+    for key in sorted(set(base.results) & set(new.results)):
+        b, n = base.results[key], new.results[key]
+        if not b.median:
+            continue
+        change = (n.median - b.median) / b.median
+        if b.better == "higher":
+            change = -change
+        p_value = None
+        significant = True
+        insufficient = False
+        if len(b.samples) > 1 and len(n.samples) > 1:
+            p_value = permutation_pvalue(b.samples, n.samples)
+            significant = p_value < alpha
+            insufficient = min_pvalue(len(b.samples), len(n.samples)) >= alpha
+        out.append(Comparison(
+            key=key,
+            base=b.median,
+            new=n.median,
+            change=change,
+            p_value=p_value,
+            regression=significant and change > threshold,
+            improvement=significant and change < -threshold,
+            insufficient=insufficient,
+        ))
+    return out
+
+
+def format_comparison(rows: Sequence[Comparison], *, only_changes: bool = False) -> str:
+    lines = [f"{'metric':<52} {'base':>11} {'new':>11} {'change':>8} {'p':>6}"]
+    for r in rows:
+        if only_changes and not (r.regression or r.improvement or r.insufficient):
+            continue
+        mark = (
+            "REGRESSION" if r.regression else
+            "improved" if r.improvement else
+            "insufficient samples" if r.insufficient else ""
+        )
+        p = "-" if r.p_value is None else f"{r.p_value:.3f}"
+        lines.append(
+            f"{r.key:<52} {r.base:>11.4g} {r.new:>11.4g} {r.change:>+7.1%} {p:>6}  {mark}"
+        )
+    regressions = sum(r.regression for r in rows)
+    improvements = sum(r.improvement for r in rows)
+    lines.append(
+        f"\n{len(rows)} metrics compared: {regressions} regressions, "
+        f"{improvements} improvements"
+    )
+    insufficient = sum(r.insufficient for r in rows)
+    if insufficient:
+        lines.append(
+            f"{insufficient} metrics have too few samples for the permutation "
+            f"test to reach significance; re-run with --repeat {MIN_REPEAT} or more"
+        )
+    return "\n".join(lines)
+
+
+# ─────────────────────────────────────────────────────────────
+#  CLI
+# ─────────────────────────────────────────────────────────────
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m texthumanize.perf_suite",
+        description="TextHumanize performance regression suite",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run the suite and save a JSON baseline")
+    run.add_argument("-o", "--output", help="Save results to this JSON file")
+    run.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    run.add_argument("--langs", type=_csv, help="Comma-separated languages")
+    run.add_argument("--sizes", type=lambda v: [int(x) for x in _csv(v)],
+                     help="Comma-separated sizes in words")
+    run.add_argument("--apis", type=_csv, help=f"Comma-separated APIs ({', '.join(APIS)})")
+    run.add_argument("--repeat", type=int,
+                     help=f"Samples per measurement (at least {MIN_REPEAT})")
+    run.add_argument("--workers", type=lambda v: [int(x) for x in _csv(v)],
+                     help="Worker counts for the throughput test (0 = skip)")
+    run.add_argument("--no-import", action="store_true", help="Skip the import-time test")
+    run.add_argument("--no-memory", action="store_true", help="Skip peak-memory runs")
+
+    cmp_ = sub.add_parser("compare", help="Compare two JSON baselines")
+    cmp_.add_argument("base")
+    cmp_.add_argument("new")
+    cmp_.add_argument("--threshold", type=float, default=0.10,
+                      help="Relative change of the median to flag (default: 0.10)")
+    cmp_.add_argument("--alpha", type=float, default=0.05,
+                      help="Significance level (default: 0.05)")
+    cmp_.add_argument("--all", action="store_true", help="List unchanged metrics too")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        base, new = PerfReport.load(args.base), PerfReport.load(args.new)
+        rows = compare(base, new, threshold=args.threshold, alpha=args.alpha)
+        print(format_comparison(rows, only_changes=not args.all))
+        missing = sorted(set(base.results) - set(new.results))
+        if missing:
+            print(f"{len(missing)} baseline metrics missing from {args.new}: "
+                  + ", ".join(missing[:10]) + (" ..." if len(missing) > 10 else ""))
+        return 1 if any(r.regression for r in rows) else 0
+
+    profile = PROFILES[args.profile]
+    if args.repeat is not None and args.repeat < MIN_REPEAT:
+        parser.error(
+            f"--repeat {args.repeat} is too few samples for the permutation "
+            f"test to reach p < 0.05; use at least {MIN_REPEAT}"
+        )
+    for api in args.apis or ():
+        if api not in APIS:
+            parser.error(f"unknown API {api!r}")
+    for lang in args.langs or ():
+        if lang not in LANGS:
+            parser.error(f"unknown language {lang!r}")
+    workers = args.workers if args.workers is not None else profile["workers"]
+    report = run_suite(
+        langs=args.langs or profile["langs"],
+        sizes=args.sizes or profile["sizes"],
+        apis=args.apis or APIS,
+        repeat=args.repeat or profile["repeat"],
+        workers=[w for w in workers if w > 0],
+        import_time=not args.no_import,
+        memory=not args.no_memory,
+        progress=lambda msg: print(f"  {msg}", file=sys.stderr, flush=True),
+    )
+    for key, m in sorted(report.results.items()):
+        if not key.startswith("stage/"):
+            print(f"{key:<52} {m.median:>11.4g} {m.unit}")
+    if args.output:
+        report.save(args.output)
+        print(f"\nSaved {len(report.results)} metrics to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,7 +31,7 @@ from texthumanize._human_profiles import (
     get_human_profile,
 )
 from texthumanize.sentence_split import split_sentences
-from texthumanize.word_lm import WordLanguageModel
+from texthumanize.word_lm import get_word_lm
 
 logger = logging.getLogger(__name__)
 
@@ -223,7 +223,7 @@ class PerplexitySculptor:
         self.lang = lang
         self.seed = seed
         self._rng = random.Random(seed)
-        self._lm = WordLanguageModel(lang)
+        self._lm = get_word_lm(lang)
         self._human = get_human_profile(lang)
         self._ai = get_ai_profile(lang)
         self._synonyms = _SURPRISE_SYNONYMS.get(lang, _SURPRISE_SYNONYMS["en"])
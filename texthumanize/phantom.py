@@ -18,7 +18,7 @@ from __future__ import annotations
 import logging
 import random
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from texthumanize.neural_detector import (
     _FEATURE_MEAN,
@@ -38,6 +38,9 @@ from texthumanize.neural_engine import (
 )
 from texthumanize.sentence_split import split_sentences
 
+if TYPE_CHECKING:
+    from texthumanize.budget import ComputeBudget
+
 logger = logging.getLogger(__name__)
 
 _WORD_RE = re.compile(r'[a-zA-Zа-яА-ЯёЁіїєґІЇЄҐüöäßÜÖÄ\']+')
@@ -2637,10 +2640,15 @@ class Forge:
         self._seed = seed
         self._use_combined = use_combined_score
 
-    def _get_score(self, text: str, lang: str) -> float:
+    def _get_score(
+        self, text: str, lang: str,
+        compute_budget: ComputeBudget | None = None,
+    ) -> float:
         """Get the relevant detection score."""
         if self._use_combined:
             from texthumanize.core import detect_ai
+            if compute_budget is not None:
+                compute_budget.charge("detector_calls")
             det = detect_ai(text, lang=lang)
             return det.get("combined_score", det.get("score", 0.5))
         else:
@@ -2650,6 +2658,8 @@ class Forge:
     def optimize(
         self, text: str, lang: str = "en",
         budget: float = 1.0,
+        *,
+        compute_budget: ComputeBudget | None = None,
     ) -> ForgeResult:
         """Run iterative optimization.
 
@@ -2657,6 +2667,9 @@ class Forge:
             text: Input text (AI-generated)
             lang: Language code
             budget: Aggressiveness (0.0-1.0)
+            compute_budget: Shared compute allowance; iterations stop
+                (returning the best text so far) once a detector call
+                no longer fits.
 
         Returns:
             ForgeResult with optimized text and trace
@@ -2664,6 +2677,20 @@ class Forge:
         rng = random.Random(self._seed)
         surgeon = Surgeon(rng=rng, lang=lang)
 
+        # Scores by text: the final re-score of best_text is free when
+        # cleanup leaves it unchanged.
+        scored: dict[str, float] = {}
+
+        def _score(t: str) -> float:
+            if t not in scored:
+                scored[t] = self._get_score(t, lang, compute_budget)
+            return scored[t]
+
+        def _affordable() -> bool:
+            if compute_budget is None or not self._use_combined:
+                return True
+            return compute_budget.can_afford(detector_calls=1)
+
         best_text = text
         best_score = float("inf")
         trace: list[ForgeStep] = []
@@ -2673,12 +2700,17 @@ class Forge:
         orig_word_count = len(_WORD_RE.findall(text))
 
         for iteration in range(self._max_iter):
+            # The first evaluation always runs so that a score exists.
+            if iteration > 0 and current_text not in scored and not _affordable():
+                logger.info("FORGE: compute budget spent, stopping")
+                break
+
             # 1. ORACLE analysis (gradient guide)
             report = self._oracle.analyze(current_text, lang)
             neural_score = report.score
 
             # 2. Get the score we're trying to beat
-            combined_score = self._get_score(current_text, lang)
+            combined_score = _score(current_text) if self._use_combined else neural_score
             score = combined_score if self._use_combined else neural_score
 
             logger.info(
@@ -2754,7 +2786,12 @@ class Forge:
 
         # Get final score
         final_report = self._oracle.analyze(best_text, lang)
-        final_combined = self._get_score(best_text, lang) if self._use_combined else final_report.score
+        if not self._use_combined:
+            final_combined = final_report.score
+        elif best_text in scored or _affordable():
+            final_combined = _score(best_text)
+        else:
+            final_combined = best_score
 
         return ForgeResult(
             original_text=text,
@@ -2870,6 +2907,7 @@ class PhantomEngine:
         target_score: float = 0.30,
         budget: float = 1.0,
         seed: int | None = None,
+        compute_budget: ComputeBudget | None = None,
     ) -> ForgeResult:
         """Run PHANTOM™ optimization on text.
 
@@ -2880,6 +2918,8 @@ class PhantomEngine:
             target_score: Stop when score drops below this
             budget: Aggressiveness (0.0 = minimal changes, 1.0 = max)
             seed: Random seed for reproducibility
+            compute_budget: Shared compute allowance (see
+                :class:`~texthumanize.budget.ComputeBudget`)
 
         Returns:
             ForgeResult with optimized text and diagnostics
@@ -2890,7 +2930,9 @@ class PhantomEngine:
             target_score=target_score,
             seed=seed,
         )
-        return forge.optimize(text, lang=lang, budget=budget)
+        return forge.optimize(
+            text, lang=lang, budget=budget, compute_budget=compute_budget,
+        )
 
     def gradient_report(self, text: str, lang: str = "en") -> str:
         """Human-readable gradient report for debugging."""
@@ -2924,6 +2966,7 @@ def phantom_optimize(
     target_score: float = 0.30,
     budget: float = 1.0,
     seed: int | None = None,
+    compute_budget: ComputeBudget | None = None,
 ) -> ForgeResult:
     """Convenience function: run PHANTOM™ optimization.
 
@@ -2937,4 +2980,5 @@ def phantom_optimize(
     return engine.optimize(
         text, lang, max_iterations=max_iterations,
         target_score=target_score, budget=budget, seed=seed,
+        compute_budget=compute_budget,
     )
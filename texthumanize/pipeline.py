@@ -4,16 +4,23 @@ from __future__ import annotations
 
 import logging
 import os
+import re
+import threading
 import time
-from difflib import SequenceMatcher
-from typing import Callable, Protocol
+from collections.abc import Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Protocol
 
 from texthumanize.analyzer import TextAnalyzer
+from texthumanize.budget import ComputeBudget
+from texthumanize.chunk_planner import ChunkContext
 from texthumanize.cjk_segmenter import CJKSegmenter, is_cjk_text
 from texthumanize.coherence_repair import CoherenceRepairer
-from texthumanize.content_classifier import ContentType
+from texthumanize.content_classifier import ContentProfile, ContentType
 from texthumanize.content_classifier import classify as classify_content
 from texthumanize.decancel import Debureaucratizer
+from texthumanize.diff_engine import change_exceeds, change_ratio
 from texthumanize.fingerprint_randomizer import FingerprintRandomizer
 from texthumanize.grammar_fix import GrammarCorrector
 from texthumanize.lang import get_language_tier
@@ -23,7 +30,9 @@ from texthumanize.normalizer import TypographyNormalizer
 from texthumanize.paraphraser_ext import SemanticParaphraser
 from texthumanize.readability_opt import ReadabilityOptimizer
 from texthumanize.repetitions import RepetitionReducer
-from texthumanize.segmenter import Segmenter
+from texthumanize.rule_sets import Rule, RuleSet
+from texthumanize.segmenter import SegmentedText, Segmenter
+from texthumanize.sentence_graph import SentenceGraph
 from texthumanize.sentence_validator import SentenceValidator
 from texthumanize.structure import StructureDiversifier
 from texthumanize.stylistic import StylisticAnalyzer, StylisticFingerprint
@@ -33,10 +42,80 @@ from texthumanize.universal import UniversalProcessor
 from texthumanize.utils import AnalysisReport, HumanizeOptions, HumanizeResult
 from texthumanize.validator import QualityValidator
 from texthumanize.watermark import WatermarkDetector
-from texthumanize.word_lm import WordLanguageModel
+from texthumanize.word_lm import get_word_lm
+
+if TYPE_CHECKING:
+    from texthumanize.ai_backend import AIBackend, SpanRewrite
 
 logger = logging.getLogger(__name__)
 
+_PARA_SEP_RE = re.compile(r'\n\s*\n')
+
+# ── Compiled cleanup cascades (shared by all Pipeline instances) ──
+# The conjunction lists are multilingual, so one rule set serves every
+# language; each set skips clean text after a single gate scan.
+
+# Pipeline.run: final sentence-level sanitization
+_FINAL_SANITIZE = RuleSet([
+    #  Double conjunctions: "and and", "и и"
+    Rule(
+        "double_conj",
+        r'\b(and|but|or|yet|so|и|і|а|але|но|und|oder|aber'
+        r'|et|ou|mais|y|o|pero)\s+\1\b',
+        r'\1', re.IGNORECASE,
+    ),
+    #  Dangling conjunction before punctuation: "and." "and,"
+    Rule(
+        "dangling_conj",
+        r',?\s*\b(and|but|or|и|і|а|але|но)\b\s*([.!?;])',
+        r'\2', re.IGNORECASE,
+    ),
+    #  Conjunction chain residue: ", and, but,"
+    Rule(
+        "conj_chain",
+        r'(?:,\s*\b(?:and|but|or|however|moreover|also)\b\s*){2,}',
+        ', ', re.IGNORECASE,
+    ),
+])
+
+# _run_pipeline 13a¼: late cleanup after readability/grammar/coherence
+_LATE_CLEANUP = RuleSet([
+    #  (a) Double conjunctions: "and and", "и и", "but but"
+    Rule(
+        "double_conj",
+        r'\b(and|but|or|yet|so|и|і|а|але|но|und|oder|aber|et|ou|mais|y|o|pero)\s+\1\b',
+        r'\1', re.IGNORECASE,
+    ),
+    #  (b) Garbled conjunction chains left over: ", and, but, however, and"
+    Rule(
+        "conj_chain",
+        r'(?:,\s*(?:and|but|or|however|moreover|also|and)\s*){2,}',
+        ', ', re.IGNORECASE,
+    ),
+])
+
+# _strip_fragment_chains, pass 0 (per paragraph)
+_FRAGMENT_CHAINS = RuleSet([
+    # Garbled conjunction/connector chains within sentences
+    Rule(
+        "conj_chain_en",
+        r'(?:,\s*(?:and|but|or|yet|so|however|granted|moreover|furthermore|also|thus|hence)'
+        r'(?:\s*,\s*|\s+)){2,}',
+        ', ', re.IGNORECASE,
+    ),
+    # Russian/Ukrainian connector stacking
+    Rule(
+        "conj_chain_ru_uk",
+        r'(?:,?\s*(?:и|а|но|однако|также|ещё|ще|причём|причому|крім того|кроме того)'
+        r'(?:\s*,\s*|\s+)){2,}',
+        ', ', re.IGNORECASE,
+    ),
+    # Double conjunctions: "и и", "and and"
+    Rule("double_conj", r'\b(и|і|and|und|et|y|e)\s+\1\b', r'\1', re.IGNORECASE),
+])
+_FRAGMENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-ZА-ЯІЇЄҐ])')
+_DOUBLE_DASH_RE = re.compile(r'\u2014\s*\u2014')
+
 class StagePlugin(Protocol):
     """Protocol for custom pipeline stage plugins."""
 
@@ -47,6 +126,92 @@ class StagePlugin(Protocol):
 # Тип хука: функция (text, lang) -> text
 HookFn = Callable[[str, str], str]
 
+
+@dataclass(frozen=True)
+class _PreparedInput:
+    """Seed-independent output of the watermark → typography stages."""
+
+    text: str
+    segmented: SegmentedText
+    watermark_changes: tuple[dict, ...]
+    typography_changes: tuple[dict, ...]
+    cleaned: str  # text after watermark cleaning, before segmentation
+
+
+class SharedContext:
+    """Seed-independent state shared between pipeline runs over one input.
+
+    Memoizes the deterministic prefix of a pass (input analysis, content
+    classification, watermark cleaning, segmentation, typography) and the
+    detector scores, so that graduated retries, detection loops and the
+    per-seed runs of ``humanize_variants`` compute them only once.
+
+    Thread-safe: concurrent requests for the same key wait for the first
+    computation instead of repeating it. Picklable: completed entries are
+    carried over, so a primed context can be shipped to worker processes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._memo: dict[tuple, Future] = {}
+
+    def memo(self, key: tuple, build: Callable[[], Any]) -> Any:
+        """Return the cached value for *key*, building it on first use."""
+        with self._lock:
+            fut = self._memo.get(key)
+            owner = fut is None
+            if fut is None:
+                fut = Future()
+                self._memo[key] = fut
+        if owner:
+            try:
+                fut.set_result(build())
+            except BaseException as exc:
+                with self._lock:
+                    self._memo.pop(key, None)
+                fut.set_exception(exc)
+                raise
+        return fut.result()
+
+    def detect(
+        self,
+        text: str,
+        lang: str,
+        *,
+        full: bool = True,
+        budget: ComputeBudget | None = None,
+    ) -> dict:
+        """Memoized ``detect_ai`` (``full=True``) or ``detect_ai_fast``.
+
+        Only cache misses are charged to *budget*.
+        """
+        def _build() -> dict:
+            if budget is not None:
+                budget.charge("detector_calls")
+            from texthumanize.core import detect_ai, detect_ai_fast
+
+            detect: Callable[[str, str], Mapping[str, Any]] = (
+                detect_ai if full else detect_ai_fast
+            )
+            return dict(detect(text, lang))
+        return self.memo(("detect", text, lang, full), _build)  # type: ignore[no-any-return]
+
+    def __getstate__(self) -> dict:
+        with self._lock:
+            done = {
+                k: f.result() for k, f in self._memo.items()
+                if f.done() and f.exception() is None
+            }
+        return {"values": done}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()  # type: ignore[misc]
+        for key, value in state["values"].items():
+            fut: Future = Future()
+            fut.set_result(value)
+            self._memo[key] = fut
+
+
 class Pipeline:
     """Оркестратор пайплайна гуманизации текста.
 
@@ -96,6 +261,9 @@ class Pipeline:
         self._plugins_after = {k: list(v) for k, v in self._class_plugins_after.items()}
         self._hooks_before = {k: list(v) for k, v in self._class_hooks_before.items()}
         self._hooks_after = {k: list(v) for k, v in self._class_hooks_after.items()}
+        self._shared: SharedContext | None = None
+        self._budget: ComputeBudget | None = None
+        self._context: ChunkContext | None = None
 
     # ─── Plugin API ───────────────────────────────────────────
 
@@ -218,12 +386,47 @@ class Pipeline:
     # Can be overridden via TEXTHUMANIZE_TIMEOUT env var (useful for CI with coverage).
     PIPELINE_TIMEOUT: float = float(os.environ.get("TEXTHUMANIZE_TIMEOUT", "30"))
 
-    def run(self, text: str, lang: str) -> HumanizeResult:
+    # Detector-loop passes on long documents rewrite only the sentences
+    # whose sliding-window score is still AI-like (see sentence_graph).
+    # Each flagged run is its own pass, costed as INCREMENTAL_RUN_COST
+    # sentences of fixed overhead plus its sentences; when that exceeds
+    # INCREMENTAL_MAX_COST of the document, a full pass is used instead.
+    # Disable with constraints={"incremental_loop": False}.
+    INCREMENTAL_MIN_SENTENCES = 24
+    INCREMENTAL_THRESHOLD = 0.65  # detect_sentences() "ai" label
+    INCREMENTAL_RUN_COST = 12
+    INCREMENTAL_MAX_COST = 0.6
+
+    # LLM evasion on documents of at least this many sentences sends
+    # only the flagged sentence runs (AIBackend.rewrite_flagged).
+    # Disable with constraints={"llm_span_mode": False}.
+    LLM_SPAN_MIN_SENTENCES = 12
+    LLM_SPAN_THRESHOLD = 0.65
+
+    def run(
+        self,
+        text: str,
+        lang: str,
+        *,
+        shared: SharedContext | None = None,
+        compute_budget: ComputeBudget | None = None,
+        context: ChunkContext | None = None,
+    ) -> HumanizeResult:
         """Запустить пайплайн обработки.
 
         Args:
             text: Текст для обработки.
             lang: Код языка.
+            shared: Общий контекст для нескольких прогонов по одному тексту
+                (например, разные сиды в ``humanize_variants``). Если не
+                задан, создаётся собственный контекст на время вызова.
+            compute_budget: Общий бюджет вычислений. Первый проход
+                выполняется всегда; повторы, детектор-петля, LLM и
+                regression guard запускаются только пока бюджет позволяет.
+            context: Контекст фрагмента документа (``humanize_chunked``):
+                детектор оценивает текст вместе с соседним окном, а
+                адаптивная интенсивность и тип контента берутся из
+                метрик всего документа. Сам контекст не выводится.
 
         Returns:
             HumanizeResult с обработанным текстом и метаданными.
@@ -249,6 +452,13 @@ class Pipeline:
                 )
 
         self._check_deadline = _check_deadline
+        _shared = shared if shared is not None else SharedContext()
+        self._shared = _shared
+        self._budget = compute_budget
+        self._context = context
+
+        def _affords(**cost: int) -> bool:
+            return compute_budget is None or compute_budget.can_afford(**cost)
 
         result = self._run_pipeline(text, lang, intensity_factor=1.0)
         _check_deadline()
@@ -258,6 +468,8 @@ class Pipeline:
         if result.change_ratio > max_change:
             for factor in (0.4, 0.20, 0.10, 0.05):
                 _check_deadline()
+                if not _affords(pipeline_passes=1):
+                    break
                 retry = self._run_pipeline(text, lang, intensity_factor=factor)
                 if retry.change_ratio <= max_change:
                     result = retry
@@ -267,31 +479,20 @@ class Pipeline:
 
         # ── Per-run detection cache ────────────────────────────
         # Avoids recomputing detect_ai() for the same text within a single
-        # run() invocation. The regression guard often re-detects text that
-        # was already scored in the detector-in-the-loop.
-        # Use text itself as key (not hash()) to avoid hash collisions.
-        _detect_cache: dict[str, dict] = {}
-
+        # run() invocation (or across runs sharing a SharedContext). The
+        # regression guard often re-detects text that was already scored
+        # in the detector-in-the-loop.
         def _cached_detect(txt: str, *, lang: str) -> dict:  # type: ignore[type-arg]
-            """Detect AI with per-run memoization.
+            """Detect AI with memoization in the shared context.
 
             Uses fast MLP-only detection for the in-the-loop passes
             (~3-5x faster than full detection). Full detection is used
-            only for the very first call to get accurate baseline.
+            only for the input text to get an accurate baseline.
             """
-            cached = _detect_cache.get(txt)
-            if cached is not None:
-                return cached
-            if len(_detect_cache) == 0:
-                # First call: full detection for accurate baseline
-                from texthumanize.core import detect_ai as _full_detect
-                result_d: dict = _full_detect(txt, lang=lang)  # type: ignore[assignment]
-            else:
-                # Subsequent calls (in-the-loop): fast MLP-only
-                from texthumanize.core import detect_ai_fast as _fast_detect
-                result_d = _fast_detect(txt, lang=lang)
-            _detect_cache[txt] = result_d
-            return result_d
+            window = context.window(txt) if context is not None else txt
+            return _shared.detect(
+                window, lang, full=(txt == text), budget=compute_budget,
+            )
 
         # ── Detector-in-the-loop ──────────────────────────────
         # After humanization, check if the AI detector still flags
@@ -299,23 +500,32 @@ class Pipeline:
         # on the already-processed text to push it further from AI.
         target_ai = self.options.constraints.get("target_ai_score", 0.20)
         max_loops = self.options.constraints.get("max_detection_loops", 3)
-        ai_before = result.metrics_before.get("artificiality_score", 0)
+        ai_before = (
+            context.document.metrics.artificiality_score
+            if context is not None and context.document is not None
+            else result.metrics_before.get("artificiality_score", 0)
+        )
 
         # Also check the full combined detection score on the original text.
         # The heuristic analyzer (artificiality_score) may underestimate AI
         # probability for texts the neural MLP detector catches. Use the
         # higher of the two signals to decide whether to loop.
-        _full_before = _cached_detect(text, lang=lang).get("combined_score", 0.0)
+        _full_before = (
+            _cached_detect(text, lang=lang).get("combined_score", 0.0)
+            if _affords(detector_calls=1) else 0.0
+        )
         _trigger = ai_before > 40 or _full_before > 0.50
 
         # Only loop if original text was actually AI-like
-        if max_loops > 0 and _trigger:
+        if max_loops > 0 and _trigger and _affords(detector_calls=1):
             best_result = result
             detect_result = _cached_detect(result.text, lang=lang)
             best_score = detect_result.get("combined_score", 1.0)
 
             for loop_i in range(max_loops):
                 _check_deadline()
+                if not _affords(pipeline_passes=1, detector_calls=1):
+                    break  # Budget spent — keep the best result so far
 
                 if best_score <= target_ai:
                     break  # Successfully humanized below threshold
@@ -370,11 +580,20 @@ class Pipeline:
                 )
                 loop_pipeline = Pipeline(loop_opts)
                 loop_pipeline._check_deadline = _check_deadline
+                loop_pipeline._shared = _shared
+                loop_pipeline._budget = compute_budget
+                loop_pipeline._context = context
 
                 try:
-                    loop_result = loop_pipeline._run_pipeline(
-                        best_result.text, lang, intensity_factor=1.0,
-                    )
+                    loop_result = None
+                    if self.options.constraints.get("incremental_loop", True):
+                        loop_result = self._incremental_loop_pass(
+                            loop_pipeline, best_result.text, lang,
+                        )
+                    if loop_result is None:
+                        loop_result = loop_pipeline._run_pipeline(
+                            best_result.text, lang, intensity_factor=1.0,
+                        )
                 except (TimeoutError, Exception):
                     break
 
@@ -382,8 +601,7 @@ class Pipeline:
                 detect_result = _cached_detect(loop_result.text, lang=lang)
                 loop_score = detect_result.get("combined_score", 1.0)
                 if loop_score < best_score:
-                    total_change = self._calc_change_ratio(text, loop_result.text)
-                    if total_change <= _max_total:
+                    if not change_exceeds(text, loop_result.text, _max_total):
                         best_result = HumanizeResult(
                             original=text,
                             text=loop_result.text,
@@ -414,7 +632,7 @@ class Pipeline:
         # above the target after local transforms, use the LLM to
         # rewrite the text at sentence level for deeper evasion.
         _api_key = self.options.openai_api_key
-        if _api_key:
+        if _api_key and _affords(detector_calls=1):
             try:
                 _check_deadline()
                 llm_score = _cached_detect(result.text, lang=lang).get(
@@ -442,43 +660,47 @@ class Pipeline:
         # graduated fallback with decreasing intensity factors.
         # This replaces the old binary 0.05× fallback which was too
         # aggressive and returned near-original (high AI) text.
-        try:
-            score_after = _cached_detect(result.text, lang=lang).get(
-                "combined_score", 0.0,
-            )
-            # Compare like-for-like: full ensemble before vs. after
-            score_before_full = _cached_detect(text, lang=lang).get(
-                "combined_score", 0.0,
-            )
-            if score_after > score_before_full + 0.01:  # Worsened by >1%
-                # Graduated fallback: try decreasing intensity factors,
-                # keep the best result (lowest AI score)
-                best_fallback = result
-                best_fb_score = score_after
-                for fb_factor in (0.5, 0.3, 0.15, 0.08):
-                    _check_deadline()
-                    fb_result = self._run_pipeline(
-                        text, lang, intensity_factor=fb_factor,
-                    )
-                    fb_score = _cached_detect(fb_result.text, lang=lang).get(
-                        "combined_score", 0.0,
-                    )
-                    if fb_score < best_fb_score:
-                        best_fallback = fb_result
-                        best_fb_score = fb_score
-                    # If we found something better than original, stop
-                    if fb_score <= score_before_full:
-                        break
-                result = best_fallback
-                result.changes.append({
-                    "type": "regression_guard",
-                    "description": (
-                        f"Откат: AI {score_before_full:.0%}→{score_after:.0%} "
-                        f"(graduated fallback → {best_fb_score:.0%})"
-                    ),
-                })
-        except Exception:
-            pass  # Guard is advisory, never blocks return
+        # Skipped entirely once the compute budget is spent.
+        if _affords():
+            try:
+                score_after = _cached_detect(result.text, lang=lang).get(
+                    "combined_score", 0.0,
+                )
+                # Compare like-for-like: full ensemble before vs. after
+                score_before_full = _cached_detect(text, lang=lang).get(
+                    "combined_score", 0.0,
+                )
+                if score_after > score_before_full + 0.01:  # Worsened by >1%
+                    # Graduated fallback: try decreasing intensity factors,
+                    # keep the best result (lowest AI score)
+                    best_fallback = result
+                    best_fb_score = score_after
+                    for fb_factor in (0.5, 0.3, 0.15, 0.08):
+                        _check_deadline()
+                        if not _affords(pipeline_passes=1, detector_calls=1):
+                            break
+                        fb_result = self._run_pipeline(
+                            text, lang, intensity_factor=fb_factor,
+                        )
+                        fb_score = _cached_detect(fb_result.text, lang=lang).get(
+                            "combined_score", 0.0,
+                        )
+                        if fb_score < best_fb_score:
+                            best_fallback = fb_result
+                            best_fb_score = fb_score
+                        # If we found something better than original, stop
+                        if fb_score <= score_before_full:
+                            break
+                    result = best_fallback
+                    result.changes.append({
+                        "type": "regression_guard",
+                        "description": (
+                            f"Откат: AI {score_before_full:.0%}→{score_after:.0%} "
+                            f"(graduated fallback → {best_fb_score:.0%})"
+                        ),
+                    })
+            except Exception:
+                pass  # Guard is advisory, never blocks return
 
         # ── Hard constraint enforcement ────────────────────────
         # If the user set max_change_ratio explicitly, guarantee the final
@@ -496,24 +718,7 @@ class Pipeline:
         # After all pipeline passes (graduated retry, detection loops,
         # regression guard), clean up any remaining artifacts that
         # were introduced by late passes or cross-pass interactions.
-        import re as _re_final
-        _final_text = result.text
-        #  Double conjunctions: "and and", "и и"
-        _final_text = _re_final.sub(
-            r'\b(and|but|or|yet|so|и|і|а|але|но|und|oder|aber'
-            r'|et|ou|mais|y|o|pero)\s+\1\b',
-            r'\1', _final_text, flags=_re_final.IGNORECASE,
-        )
-        #  Dangling conjunction before punctuation: "and." "and,"
-        _final_text = _re_final.sub(
-            r',?\s*\b(and|but|or|и|і|а|але|но)\b\s*([.!?;])',
-            r'\2', _final_text, flags=_re_final.IGNORECASE,
-        )
-        #  Conjunction chain residue: ", and, but,"
-        _final_text = _re_final.sub(
-            r'(?:,\s*\b(?:and|but|or|however|moreover|also)\b\s*){2,}',
-            ', ', _final_text, flags=_re_final.IGNORECASE,
-        )
+        _final_text = _FINAL_SANITIZE.apply(result.text)
         if _final_text != result.text:
             result = HumanizeResult(
                 original=result.original,
@@ -548,6 +753,82 @@ class Pipeline:
         "Only output the rewritten text, nothing else."
     )
 
+    def _incremental_loop_pass(
+        self, loop_pipeline: Pipeline, text: str, lang: str,
+    ) -> HumanizeResult | None:
+        """Detector-loop pass over the still-flagged sentences only.
+
+        Flagged sentences are grouped into runs of neighbours inside a
+        paragraph; each run goes through ``_run_pipeline`` on its own and
+        is spliced back, the rest of the text is kept byte-for-byte.
+        Returns None when a full pass should be used instead.
+        """
+        graph = SentenceGraph(text, lang)
+        if len(graph) < self.INCREMENTAL_MIN_SENTENCES:
+            return None
+        flagged = [
+            i for i in graph.flagged(self.INCREMENTAL_THRESHOLD)
+            if not _PARA_SEP_RE.search(graph.nodes[i].text)
+        ]
+        if not flagged:
+            return None
+        runs = graph.segments(flagged)
+        cost = len(runs) * self.INCREMENTAL_RUN_COST + len(flagged)
+        if cost > len(graph) * self.INCREMENTAL_MAX_COST:
+            return None  # a full pass is about as cheap
+
+        # The runs together are billed as one pipeline pass.
+        budget = loop_pipeline._budget
+        if budget is not None:
+            budget.charge("pipeline_passes")
+        loop_pipeline._budget = None
+        replacements: dict[tuple[int, int], str] = {}
+        sub_changes: list[dict] = []
+        try:
+            for run in runs:
+                sub = loop_pipeline._run_pipeline(
+                    graph.segment_text(run), lang, intensity_factor=1.0,
+                )
+                if sub.text.strip():
+                    replacements[run] = sub.text.strip()
+                    sub_changes.extend(sub.changes)
+        finally:
+            loop_pipeline._budget = budget
+
+        new_text = graph.replace(replacements)
+        shared = self._shared if self._shared is not None else SharedContext()
+        metrics_after: AnalysisReport = shared.memo(
+            ("analysis", new_text, lang),
+            lambda: TextAnalyzer(lang=lang).analyze(new_text),
+        )
+        return HumanizeResult(
+            original=text,
+            text=new_text,
+            lang=lang,
+            profile=self.options.profile,
+            intensity=self.options.intensity,
+            changes=[
+                {
+                    "type": "incremental_loop",
+                    "description": (
+                        f"Rewrote {len(flagged)}/{len(graph)} flagged sentences "
+                        f"in {len(runs)} runs"
+                    ),
+                },
+                *sub_changes,
+            ],
+            metrics_after={
+                "artificiality_score": metrics_after.artificiality_score,
+                "avg_sentence_length": metrics_after.avg_sentence_length,
+                "bureaucratic_ratio": metrics_after.bureaucratic_ratio,
+                "connector_ratio": metrics_after.connector_ratio,
+                "repetition_score": metrics_after.repetition_score,
+                "typography_score": metrics_after.typography_score,
+                "predictability_score": metrics_after.predictability_score,
+                "vocabulary_richness": metrics_after.vocabulary_richness,
+            },
+        )
+
     def _llm_assisted_rewrite(
         self,
         original: str,
@@ -564,7 +845,7 @@ class Pipeline:
 
         Returns an improved HumanizeResult or None if LLM didn't help.
         """
-        from texthumanize.ai_backend import AIBackend
+        from texthumanize.ai_backend import AIBackend, fan_out
 
         check_deadline()
 
@@ -574,27 +855,36 @@ class Pipeline:
                 openai_model=model,
                 prefer="openai",
             )
-            # Rewrite the already-humanized text for deeper evasion
-            rewritten = ai.paraphrase(
-                current.text, lang=lang, style=self.options.profile,
-            )
         except Exception:
             return None
 
-        if not rewritten or not rewritten.strip():
-            return None
+        span = self._llm_span_rewrite(ai, current.text, lang)
+        if span is not None:
+            # Long document: only the flagged sentence runs were sent
+            if span.text == current.text:
+                return None
+            candidates = [span.text]
+        else:
+            # Rewrite the already-humanized text for deeper evasion, and
+            # try improve_naturalness for a second variant (both in parallel)
+            rewritten, natural = fan_out([
+                lambda: ai.paraphrase(
+                    current.text, lang=lang, style=self.options.profile,
+                ),
+                lambda: ai.improve_naturalness(current.text, lang=lang),
+            ])
+            if isinstance(rewritten, Exception):
+                return None
+            if isinstance(natural, Exception):
+                natural = None
 
-        # Also try improve_naturalness for a second variant
-        try:
-            check_deadline()
-            natural = ai.improve_naturalness(current.text, lang=lang)
-        except Exception:
-            natural = None
+            if not rewritten or not rewritten.strip():
+                return None
 
-        # Evaluate both variants, pick the best
-        candidates = [rewritten]
-        if natural and natural.strip() and natural != rewritten:
-            candidates.append(natural)
+            # Evaluate both variants, pick the best
+            candidates = [rewritten]
+            if natural and natural.strip() and natural != rewritten:
+                candidates.append(natural)
 
         best_text: str | None = None
         pre_score = detect_fn(current.text, lang=lang).get("combined_score", 1.0)
@@ -614,6 +904,15 @@ class Pipeline:
         if best_text is None:
             return None
 
+        description = f"LLM rewrite ({model}): AI {pre_score:.0%}→{best_score:.0%}"
+        if span is not None:
+            description += (
+                f", {span.spans} spans / {span.flagged} of {span.sentences} "
+                f"sentences in {span.batches} batches"
+            )
+            if span.fallback_spans:
+                description += f", {span.fallback_spans} via builtin"
+
         # Build result
         return HumanizeResult(
             original=original,
@@ -625,27 +924,33 @@ class Pipeline:
                 *current.changes,
                 {
                     "type": "llm_evasion",
-                    "description": (
-                        f"LLM rewrite ({model}): "
-                        f"AI {pre_score:.0%}→{best_score:.0%}"
-                    ),
+                    "description": description,
                 },
             ],
             metrics_before=current.metrics_before,
             metrics_after=current.metrics_after,
         )
 
+    def _llm_span_rewrite(
+        self, ai: AIBackend, text: str, lang: str,
+    ) -> SpanRewrite | None:
+        """Span-mode LLM rewrite of a long document (None = use document mode)."""
+        if not self.options.constraints.get("llm_span_mode", True):
+            return None
+        try:
+            graph = SentenceGraph(text, lang)
+            if len(graph) < self.LLM_SPAN_MIN_SENTENCES:
+                return None
+            return ai.rewrite_flagged(
+                text, lang, threshold=self.LLM_SPAN_THRESHOLD, graph=graph,
+            )
+        except Exception:
+            return None
+
     @staticmethod
     def _calc_change_ratio(original: str, current: str) -> float:
-        """Вычислить текущий change_ratio (SequenceMatcher-based)."""
-        if not original:
-            return 0.0
-        orig_words = original.split()
-        curr_words = current.split()
-        if not orig_words:
-            return 0.0
-        matcher = SequenceMatcher(None, orig_words, curr_words)
-        return min(1.0 - matcher.ratio(), 1.0)
+        """Вычислить текущий change_ratio (memoized, см. ``diff_engine``)."""
+        return change_ratio(original, current)
 
     def _typography_only(
         self,
@@ -772,8 +1077,6 @@ class Pipeline:
 
         Preserves paragraph boundaries (\\n\\n).
         """
-        import re as _re
-
         # Process each paragraph independently to preserve boundaries.
         paragraphs = text.split('\n\n')
         cleaned_paras: list[str] = []
@@ -783,23 +1086,12 @@ class Pipeline:
                 cleaned_paras.append(para)
                 continue
 
-            # Pass 0: Clean garbled conjunction/connector chains within sentences.
-            para = _re.sub(
-                r'(?:,\s*(?:and|but|or|yet|so|however|granted|moreover|furthermore|also|thus|hence)'
-                r'(?:\s*,\s*|\s+)){2,}',
-                ', ', para, flags=_re.IGNORECASE,
-            )
-            # Russian/Ukrainian connector stacking
-            para = _re.sub(
-                r'(?:,?\s*(?:и|а|но|однако|также|ещё|ще|причём|причому|крім того|кроме того)'
-                r'(?:\s*,\s*|\s+)){2,}',
-                ', ', para, flags=_re.IGNORECASE,
-            )
-            # Double conjunctions: "и и", "and and"
-            para = _re.sub(r'\b(и|і|and|und|et|y|e)\s+\1\b', r'\1', para, flags=_re.IGNORECASE)
+            # Pass 0: Clean garbled conjunction/connector chains and
+            # double conjunctions within sentences.
+            para = _FRAGMENT_CHAINS.apply(para)
 
             # Pass 1: Split into sentences and remove consecutive short fragments.
-            parts = _re.split(r'(?<=[.!?])\s+(?=[A-ZА-ЯІЇЄҐ])', para)
+            parts = _FRAGMENT_SPLIT_RE.split(para)
             if len(parts) < 4:
                 cleaned_paras.append(para)
                 continue
@@ -837,6 +1129,113 @@ class Pipeline:
 
         return '\n\n'.join(cleaned_paras)
 
+    def _has_prefix_plugins(self) -> bool:
+        """True if plugins/hooks are attached to the memoized prefix stages."""
+        return any(
+            reg.get(stage)
+            for stage in ("watermark", "typography")
+            for reg in (
+                self._plugins_before, self._plugins_after,
+                self._hooks_before, self._hooks_after,
+            )
+        )
+
+    def _preserve_config(self) -> dict:
+        """Segmenter settings: ``options.preserve`` plus keep_keywords."""
+        preserve_config = dict(self.options.preserve)
+        # Добавляем keep_keywords в protect
+        keep_kw = self.options.constraints.get("keep_keywords", [])
+        if keep_kw:
+            preserve_config["keep_keywords"] = keep_kw
+        return preserve_config
+
+    def _prepared_input(
+        self,
+        text: str,
+        lang: str,
+        preserve_config: dict,
+        shared: SharedContext,
+        stage_timings: dict[str, float],
+    ) -> _PreparedInput:
+        """Stages 0-2, memoized in *shared* when no plugins hook into them."""
+        def _build() -> _PreparedInput:
+            return self._prepare_input(text, lang, preserve_config, stage_timings)
+
+        if self._has_prefix_plugins():
+            return _build()
+        key = (
+            "prepare", text, lang, self.options.profile,
+            repr(sorted(preserve_config.items())),
+        )
+        return shared.memo(key, _build)  # type: ignore[no-any-return]
+
+    def prime(self, text: str, lang: str, shared: SharedContext) -> None:
+        """Fill *shared* with the seed-independent prefix for *text*.
+
+        Lets callers that fan out several runs over the same input
+        (threads or worker processes) compute the prefix once up front.
+        """
+        analyzer = TextAnalyzer(lang=lang)
+        shared.memo(("analysis", text, lang), lambda: analyzer.analyze(text))
+        shared.memo(
+            ("content", text, lang), lambda: classify_content(text, lang=lang),
+        )
+        self._prepared_input(text, lang, self._preserve_config(), shared, {})
+
+    def _prepare_input(
+        self,
+        text: str,
+        lang: str,
+        preserve_config: dict,
+        stage_timings: dict[str, float],
+    ) -> _PreparedInput:
+        """Stages 0-2: watermark cleaning, segmentation, typography."""
+        # ── 0. Очистка водяных знаков ─────────────────────────
+        _t0 = time.perf_counter()
+        wm_changes: list[dict] = []
+        text = self._run_plugins("watermark", text, lang, is_before=True)
+        wm_detector = WatermarkDetector(lang=lang)
+        wm_report = wm_detector.detect(text)
+        if wm_report.has_watermarks:
+            text = wm_report.cleaned_text
+            wm_changes.append({
+                "type": "watermark_cleaning",
+                "description": (
+                    f"Водяные знаки: {', '.join(wm_report.watermark_types)} "
+                    f"(удалено {wm_report.characters_removed} символов, "
+                    f"уверенность {wm_report.confidence:.0%})"
+                ),
+            })
+        text = self._run_plugins("watermark", text, lang, is_before=False)
+        cleaned = text
+        stage_timings["watermark"] = time.perf_counter() - _t0
+
+        # 1. Сегментация — защита неизменяемых блоков
+        _t0 = time.perf_counter()
+        segmenter = Segmenter(preserve=preserve_config)
+        segmented = segmenter.segment(text)
+        text = segmented.text
+        stage_timings["segmentation"] = time.perf_counter() - _t0
+
+        # 2. Нормализация типографики
+        _t0 = time.perf_counter()
+        text = self._run_plugins("typography", text, lang, is_before=True)
+        normalizer = TypographyNormalizer(
+            profile=self.options.profile,
+            lang=lang,
+        )
+        text = normalizer.normalize(text)
+        text = self._run_plugins("typography", text, lang, is_before=False)
+        stage_timings["typography"] = time.perf_counter() - _t0
+
+        return _PreparedInput(
+            text=text,
+            segmented=segmented,
+            watermark_changes=tuple(wm_changes),
+            typography_changes=tuple(normalizer.changes),
+            cleaned=cleaned,
+        )
+
     def _run_pipeline(
         self, text: str, lang: str, *, intensity_factor: float = 1.0,
     ) -> HumanizeResult:
@@ -847,6 +1246,8 @@ class Pipeline:
             lang: Код языка.
             intensity_factor: Множитель интенсивности (0-1) для graduated retry.
         """
+        if self._budget is not None:
+            self._budget.charge("pipeline_passes")
         original = text
         all_changes: list[dict] = []
         stage_timings: dict[str, float] = {}
@@ -858,13 +1259,27 @@ class Pipeline:
         # against their pre-stage versions and reverts broken ones.
         _sv = SentenceValidator(lang=lang)
 
+        # Seed-independent prefix (analysis, classification, watermark,
+        # segmentation, typography) is memoized across runs over one input.
+        shared = self._shared if self._shared is not None else SharedContext()
+
         # Анализ до обработки
         analyzer = TextAnalyzer(lang=lang)
-        metrics_before = analyzer.analyze(text)
+        metrics_before: AnalysisReport = shared.memo(
+            ("analysis", text, lang), lambda: analyzer.analyze(text),
+        )
+
+        # Document-level statistics when processing one chunk of a
+        # larger text (computed once by humanize_chunked).
+        document = self._context.document if self._context is not None else None
 
         # ── Stage 0: Content type classification ──────────────
         _t0 = time.perf_counter()
-        content_profile = classify_content(text, lang=lang)
+        content_profile: ContentProfile = (
+            document.content if document is not None else shared.memo(
+                ("content", text, lang), lambda: classify_content(text, lang=lang),
+            )
+        )
         stage_timings["content_classify"] = time.perf_counter() - _t0
         all_changes.append({
             "type": "content_classification",
@@ -880,7 +1295,9 @@ class Pipeline:
         # - Низкий AI-скор (<25) → мягко ослабляем, но гарантируем не менее
         #   50% от запрошенной intensity (монотонность)
         effective_options = self.options
-        ai_score = metrics_before.artificiality_score
+        ai_score = (
+            document.metrics if document is not None else metrics_before
+        ).artificiality_score
         base_intensity = self.options.intensity
 
         # Применяем graduated retry factor
@@ -937,25 +1354,16 @@ class Pipeline:
             })
 
         # 1. Сегментация — защита неизменяемых блоков
-        preserve_config = dict(self.options.preserve)
+        keep_kw = self.options.constraints.get("keep_keywords", [])
+        preserve_config = self._preserve_config()
 
-        # ── 0. Очистка водяных знаков ─────────────────────────
-        _t0 = time.perf_counter()
-        text = self._run_plugins("watermark", text, lang, is_before=True)
-        wm_detector = WatermarkDetector(lang=lang)
-        wm_report = wm_detector.detect(text)
-        if wm_report.has_watermarks:
-            text = wm_report.cleaned_text
-            all_changes.append({
-                "type": "watermark_cleaning",
-                "description": (
-                    f"Водяные знаки: {', '.join(wm_report.watermark_types)} "
-                    f"(удалено {wm_report.characters_removed} символов, "
-                    f"уверенность {wm_report.confidence:.0%})"
-                ),
-            })
-        text = self._run_plugins("watermark", text, lang, is_before=False)
-        stage_timings["watermark"] = time.perf_counter() - _t0
+        # ── 0-2. Водяные знаки → сегментация → типографика ────
+        # Deterministic for a given (text, lang, profile, preserve), so the
+        # result is shared across retries and seeds unless plugins hook in.
+        prepared = self._prepared_input(
+            text, lang, preserve_config, shared, stage_timings,
+        )
+        all_changes.extend(dict(c) for c in prepared.watermark_changes)
 
         # ── Стилистический отпечаток ──────────────────────────
         # Если задан target_style, анализируем текущий стиль
@@ -968,7 +1376,7 @@ class Pipeline:
             target_fp = STYLE_PRESETS.get(target_fp)
         if target_fp is not None and isinstance(target_fp, StylisticFingerprint):
             style_analyzer = StylisticAnalyzer(lang=lang)
-            source_fp = style_analyzer.extract(text)
+            source_fp = style_analyzer.extract(prepared.cleaned)
             style_similarity = source_fp.similarity(target_fp)
             style_meta = {
                 "style_similarity_before": round(style_similarity, 3),
@@ -982,34 +1390,17 @@ class Pipeline:
                     f"Целевая длина предложений: {target_fp.sentence_length_mean:.0f} слов"
                 ),
             })
-        # Добавляем keep_keywords в protect
-        keep_kw = self.options.constraints.get("keep_keywords", [])
-        if keep_kw:
-            preserve_config.setdefault("keep_keywords", [])
-            preserve_config["keep_keywords"] = keep_kw
 
-        _t0 = time.perf_counter()
-        segmenter = Segmenter(preserve=preserve_config)
-        segmented = segmenter.segment(text)
-        text = segmented.text
-        stage_timings["segmentation"] = time.perf_counter() - _t0
-
-        # 2. Нормализация типографики
-        _t0 = time.perf_counter()
-        text = self._run_plugins("typography", text, lang, is_before=True)
-        normalizer = TypographyNormalizer(
-            profile=self.options.profile,
-            lang=lang,
-        )
-        text = normalizer.normalize(text)
-        all_changes.extend(normalizer.changes)
-        text = self._run_plugins("typography", text, lang, is_before=False)
+        segmented = prepared.segmented
+        text = prepared.text
+        all_changes.extend(dict(c) for c in prepared.typography_changes)
 
         # 2b. Пользовательский словарь замен (custom_dict)
         if self.options.custom_dict:
+            _t0 = time.perf_counter()
             text, cd_changes = self._apply_custom_dict(text)
             all_changes.extend(cd_changes)
-        stage_timings["typography"] = time.perf_counter() - _t0
+            stage_timings["custom_dict"] = time.perf_counter() - _t0
 
         # 2c. CJK pre-segmentation — inject word boundaries for CJK text
         # so downstream word-level stages (regex \b, splits) work correctly.
@@ -1286,7 +1677,7 @@ class Pipeline:
         # values are advisory until language model data is expanded.
         _t0 = time.perf_counter()
         try:
-            _wlm = WordLanguageModel(lang=lang)
+            _wlm = get_word_lm(lang)
             _pp_before = _wlm.perplexity(checkpoints[-2][1] if len(checkpoints) >= 2 else original)
             _pp_after = _wlm.perplexity(text)
             if _pp_before > 0 and _pp_after > 0:
@@ -1426,18 +1817,9 @@ class Pipeline:
         # 13a¼. Final sentence-level cleanup
         # Late stages (readability, grammar, coherence, entropy_final) can
         # re-introduce artifacts that _strip_fragment_chains already cleaned.
-        # Apply targeted fixes:
-        import re as _re_late
-        #  (a) Double conjunctions: "and and", "и и", "but but"
-        text = _re_late.sub(
-            r'\b(and|but|or|yet|so|и|і|а|але|но|und|oder|aber|et|ou|mais|y|o|pero)\s+\1\b',
-            r'\1', text, flags=_re_late.IGNORECASE,
-        )
-        #  (b) Garbled conjunction chains left over: ", and, but, however, and"
-        text = _re_late.sub(
-            r'(?:,\s*(?:and|but|or|however|moreover|also|and)\s*){2,}',
-            ', ', text, flags=_re_late.IGNORECASE,
-        )
+        # Apply targeted fixes (see _LATE_CLEANUP): double conjunctions
+        # and leftover garbled conjunction chains.
+        text = _LATE_CLEANUP.apply(text)
 
         # 13a½. Sentence-level validation summary
         if _sv.total_reverts > 0:
@@ -1462,8 +1844,7 @@ class Pipeline:
         stage_timings["restore"] = time.perf_counter() - _t0
 
         # ── Safety: collapse overlapping em-dash asides ──
-        import re as _re_dash
-        text = _re_dash.sub(r'\u2014\s*\u2014', '\u2014', text)
+        text = _DOUBLE_DASH_RE.sub('\u2014', text)
 
         # 15. Валидация
         _t0 = time.perf_counter()
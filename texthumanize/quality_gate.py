@@ -10,6 +10,15 @@ CLI (standalone / pre-commit / GitHub Action)::
     # с порогами
     python -m texthumanize.quality_gate --ai-threshold 20 --readability-threshold 50
 
+    # 8 процессов, кеш результатов, построчный JSON по мере готовности
+    python -m texthumanize.quality_gate docs/ --jobs 8 \
+        --cache ~/.cache/texthumanize/gate.json --format jsonl
+
+С ``--cache FILE`` результаты кешируются по ключу (SHA-256 содержимого,
+пороги, версия библиотеки): неизменённые файлы повторно не
+анализируются. По умолчанию кеш не пишется и пул процессов не
+запускается (``--jobs 1``).
+
 Exit codes:
     0 — все файлы прошли проверку
     1 — хотя бы один файл не прошёл
@@ -20,15 +29,21 @@ from __future__ import annotations
 
 import argparse
 import glob
+import hashlib
+import json
 import logging
 import os
 import subprocess
 import sys
-from collections.abc import Sequence
-from dataclasses import dataclass, field
+import tempfile
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
 
 from texthumanize.core import analyze, detect_ai, detect_watermarks
+from texthumanize.lang_detect import detect_language
 
 logger = logging.getLogger(__name__)
 
@@ -55,40 +70,122 @@ class GateConfig:
     max_file_size: int = 500_000  # 500 KB
     extensions: tuple[str, ...] = (".md", ".txt", ".rst", ".html", ".adoc")
 
+    def fingerprint(self) -> str:
+        """Short hash of the thresholds (part of the cache key)."""
+        raw = json.dumps(asdict(self), sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+class GateCache:
+    """Persistent gate results keyed by (content hash, config, version).
+
+    Stored as one JSON file; entries of another library version are
+    dropped on load. Call :meth:`save` to write changes back (atomic
+    replace, so an interrupted run never leaves a broken file).
+    """
+
+    def __init__(self, path: str) -> None:
+        from texthumanize import __version__
+
+        self.path = path
+        self.version = __version__
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.version:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    @staticmethod
+    def key(content: bytes, config: GateConfig) -> str:
+        return f"{hashlib.sha256(content).hexdigest()}:{config.fingerprint()}"
+
+    def get(self, key: str, path: str) -> GateResult | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return GateResult(path=path, **entry)
+
+    def put(self, key: str, result: GateResult) -> None:
+        entry = asdict(result)
+        del entry["path"]
+        self._entries[key] = entry
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump({"version": self.version, "entries": self._entries}, fh)
+            os.replace(tmp, self.path)
+        except OSError:
+            logger.warning("quality-gate: cannot write cache %s", self.path)
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            return
+        self._dirty = False
+
 # ─────────────────────────────────────────────────────────────
 #  Core logic
 # ─────────────────────────────────────────────────────────────
 
-def check_file(path: str, config: GateConfig | None = None) -> GateResult:
-    """Check a single text file against quality thresholds.
+def _read(path: str, cfg: GateConfig) -> tuple[GateResult | None, bytes]:
+    """Read a file; return a final result instead when it is not checked."""
+    result = GateResult(path=path)
+    p = Path(path)
+    if not p.exists():
+        result.passed = False
+        result.issues.append("File not found")
+        return result, b""
+
+    size = p.stat().st_size
+    if size > cfg.max_file_size:
+        result.issues.append(f"File too large ({size:,} bytes), skipped")
+        return result, b""
+
+    content = p.read_bytes()
+    if not content.strip():
+        return result, content  # empty file is OK
+    return None, content
+
+def check_text(text: str, config: GateConfig | None = None, path: str = "") -> GateResult:
+    """Check text against quality thresholds.
+
+    Only language detection is shared: it runs once and its result is
+    passed to the AI, readability and watermark checks, which still
+    analyse the text independently (no shared sentence/feature pass).
 
     Args:
-        path: File path.
+        text: Text to check.
         config: Gate thresholds (uses defaults if ``None``).
+        path: Path reported in the result.
 
     Returns:
         ``GateResult`` with pass/fail and details.
     """
     cfg = config or GateConfig()
     result = GateResult(path=path)
-
-    p = Path(path)
-    if not p.exists():
-        result.passed = False
-        result.issues.append("File not found")
-        return result
-
-    if p.stat().st_size > cfg.max_file_size:
-        result.issues.append(f"File too large ({p.stat().st_size:,} bytes), skipped")
+    if not text.strip():
         return result
 
-    text = p.read_text(encoding="utf-8", errors="replace")
-    if not text.strip():
-        return result  # empty file is OK
+    try:
+        lang = detect_language(text)
+    except Exception:
+        lang = "auto"
 
     # 1) AI score
     try:
-        ai = detect_ai(text, lang="auto")
+        ai = detect_ai(text, lang=lang)
         result.ai_score = float(ai.get("ai_score", 0))  # type: ignore[arg-type]
         if result.ai_score > cfg.ai_threshold:
             result.passed = False
@@ -100,7 +197,7 @@ def check_file(path: str, config: GateConfig | None = None) -> GateResult:
 
     # 2) Readability
     try:
-        report = analyze(text, lang="auto")
+        report = analyze(text, lang=lang)
         # Use a basic readability proxy from report
         result.readability = 100.0 - getattr(report, "artificiality_score", 0.0) * 100
         if result.readability < cfg.readability_threshold:
@@ -115,7 +212,7 @@ def check_file(path: str, config: GateConfig | None = None) -> GateResult:
     # 3) Watermarks
     if cfg.watermark_zero:
         try:
-            wm = detect_watermarks(text)
+            wm = detect_watermarks(text, lang=lang)
             result.watermark_count = len(wm.get("watermark_types", []))
             if result.watermark_count > 0:
                 result.passed = False
@@ -127,20 +224,111 @@ def check_file(path: str, config: GateConfig | None = None) -> GateResult:
 
     return result
 
+def _check_content(path: str, content: bytes, cfg: GateConfig) -> GateResult:
+    # Same text as Path.read_text(): universal newlines
+    text = content.decode("utf-8", errors="replace")
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return check_text(text, cfg, path)
+
+def check_file(path: str, config: GateConfig | None = None) -> GateResult:
+    """Check a single text file against quality thresholds.
+
+    Args:
+        path: File path.
+        config: Gate thresholds (uses defaults if ``None``).
+
+    Returns:
+        ``GateResult`` with pass/fail and details.
+    """
+    cfg = config or GateConfig()
+    skipped, content = _read(path, cfg)
+    if skipped is not None:
+        return skipped
+    return _check_content(path, content, cfg)
+
+def iter_check_files(
+    paths: Sequence[str],
+    config: GateConfig | None = None,
+    *,
+    workers: int | None = 1,
+    cache: GateCache | None = None,
+) -> Iterator[GateResult]:
+    """Check files and yield each result as soon as it is ready.
+
+    Cached and skipped files come first, then the analysed files in
+    completion order. New results are added to ``cache`` and the
+    cache is saved once all files are done.
+
+    Args:
+        paths: File paths.
+        config: Gate thresholds.
+        workers: Worker processes (``None`` = CPU count, 1 = inline).
+        cache: Persistent results cache.
+    """
+    cfg = config or GateConfig()
+    todo: list[tuple[str, bytes, str]] = []
+    for path in paths:
+        skipped, content = _read(path, cfg)
+        if skipped is not None:
+            yield skipped
+            continue
+        key = GateCache.key(content, cfg) if cache is not None else ""
+        hit = cache.get(key, path) if cache is not None else None
+        if hit is not None:
+            yield hit
+        else:
+            todo.append((path, content, key))
+
+    jobs = workers if workers is not None else (os.cpu_count() or 1)
+    try:
+        if jobs < 2 or len(todo) < 2:
+            for path, content, key in todo:
+                result = _check_content(path, content, cfg)
+                if cache is not None:
+                    cache.put(key, result)
+                yield result
+            return
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            futures = {
+                pool.submit(_check_content, path, content, cfg): key
+                for path, content, key in todo
+            }
+            try:
+                for fut in as_completed(futures):
+                    result = fut.result()
+                    if cache is not None:
+                        cache.put(futures[fut], result)
+                    yield result
+            finally:
+                for fut in futures:
+                    fut.cancel()
+    finally:
+        if cache is not None:
+            cache.save()
+
 def check_files(
     paths: Sequence[str],
     config: GateConfig | None = None,
+    *,
+    workers: int | None = 1,
+    cache: GateCache | None = None,
 ) -> list[GateResult]:
     """Check multiple files.
 
     Args:
         paths: List of file paths.
         config: Gate thresholds.
+        workers: Worker processes (``None`` = CPU count, 1 = inline).
+        cache: Persistent results cache (see :class:`GateCache`).
 
     Returns:
-        List of ``GateResult`` objects.
+        List of ``GateResult`` objects, in the order of ``paths``.
     """
-    return [check_file(p, config) for p in paths]
+    by_path = {
+        r.path: r
+        for r in iter_check_files(paths, config, workers=workers, cache=cache)
+    }
+    return [by_path[p] for p in paths]
 
 # ─────────────────────────────────────────────────────────────
 #  Git helpers
@@ -187,6 +375,16 @@ def _find_files(patterns: list[str], extensions: tuple[str, ...]) -> list[str]:
             result.extend(glob.glob(pat, recursive=True))
     return sorted(set(result))
 
+def _as_dict(r: GateResult) -> dict[str, Any]:
+    return {
+        "path": r.path,
+        "passed": r.passed,
+        "ai_score": r.ai_score,
+        "readability": r.readability,
+        "watermarks": r.watermark_count,
+        "issues": r.issues,
+    }
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entry point for the quality gate.
 
@@ -218,8 +416,16 @@ def main(argv: list[str] | None = None) -> int:
         help="Fail on any watermarks (default: true)",
     )
     parser.add_argument(
-        "--format", choices=["text", "json"], default="text",
-        help="Output format",
+        "--format", choices=["text", "json", "jsonl"], default="text",
+        help="Output format (text and jsonl are printed as files finish)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Worker processes (default: 1 = no pool, 0 = CPU count)",
+    )
+    parser.add_argument(
+        "--cache", metavar="FILE",
+        help="Results cache file (default: no cache)",
     )
 
     args = parser.parse_args(argv)
@@ -243,30 +449,25 @@ def main(argv: list[str] | None = None) -> int:
         print("quality-gate: no files to check")
         return 0
 
-    # Check
-    results = check_files(files, config)
-
-    # Report
-    if args.format == "json":
-        import json
-        data = [
-            {
-                "path": r.path,
-                "passed": r.passed,
-                "ai_score": r.ai_score,
-                "readability": r.readability,
-                "watermarks": r.watermark_count,
-                "issues": r.issues,
-            }
-            for r in results
-        ]
-        print(json.dumps(data, indent=2))
-    else:
-        for r in results:
+    # Check (results are streamed as files finish)
+    cache = GateCache(args.cache) if args.cache else None
+    stream = iter_check_files(files, config, workers=args.jobs or None, cache=cache)
+    results: list[GateResult] = []
+    for r in stream:
+        results.append(r)
+        if args.format == "jsonl":
+            print(json.dumps(_as_dict(r), ensure_ascii=False), flush=True)
+        elif args.format == "text":
             status = "✅ PASS" if r.passed else "❌ FAIL"
             print(f"{status}  {r.path}")
             for issue in r.issues:
                 print(f"       ⚠ {issue}")
+            sys.stdout.flush()
+
+    if args.format == "json":
+        order = {path: i for i, path in enumerate(files)}
+        results.sort(key=lambda r: order[r.path])
+        print(json.dumps([_as_dict(r) for r in results], indent=2))
 
     failed = sum(1 for r in results if not r.passed)
     if failed:
@@ -10,8 +10,9 @@ from collections import Counter
 from texthumanize.context import ContextualSynonyms
 from texthumanize.lang import get_lang_pack
 from texthumanize.morphology import get_morphology
+from texthumanize.rule_sets import word_pattern
 from texthumanize.segmenter import has_placeholder
-from texthumanize.sentence_split import split_sentences
+from texthumanize.sentence_split import split_sentences_with_spans
 from texthumanize.utils import coin_flip, get_profile, intensity_probability
 
 logger = logging.getLogger(__name__)
@@ -75,7 +76,8 @@ class RepetitionReducer:
 
     def _reduce_word_repetitions(self, text: str, prob: float) -> str:
         """Заменить повторяющиеся слова синонимами."""
-        sentences = split_sentences(text, lang=self.lang)
+        spans = split_sentences_with_spans(text, lang=self.lang)
+        sentences = [sp.text for sp in spans]
         if len(sentences) < 2:
             return text
 
@@ -131,7 +133,7 @@ class RepetitionReducer:
                 synonym = self._morph.find_synonym_form(word, synonym)
 
                 # Паттерн: целое слово
-                pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+                pattern = word_pattern(word)
                 matches = list(pattern.finditer(sentences[i]))
 
                 # Заменяем последнее вхождение в предложении
@@ -159,9 +161,21 @@ class RepetitionReducer:
                     })
                     break  # Одна замена за предложение
 
-        if modified:
-            return ' '.join(sentences)
-        return text
+        if not modified:
+            return text
+        # Пересобираем по позициям предложений: пробелы и абзацы сохраняются
+        parts: list[str] = []
+        pos = 0
+        for sp, sent in zip(spans, sentences):
+            if sent == sp.text:
+                continue
+            raw = text[sp.start:sp.end]
+            start = sp.start + len(raw) - len(raw.lstrip())
+            parts.append(text[pos:start])
+            parts.append(sent)
+            pos = start + len(sp.text)
+        parts.append(text[pos:])
+        return ''.join(parts)
 
     def _reduce_bigram_repetitions(self, text: str, prob: float) -> str:
         """Уменьшить повторение биграмм."""
@@ -197,7 +211,7 @@ class RepetitionReducer:
                 if synonyms:
                     synonym = self.rng.choice(synonyms)
                     # Ищем второе вхождение слова
-                    pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
+                    pattern = word_pattern(word)
                     matches = list(pattern.finditer(text))
                     if len(matches) >= 2:
                         match = matches[1]  # Второе вхождение
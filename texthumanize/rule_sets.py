@@ -0,0 +1,223 @@
+"""Compiled regex rule sets with a single-scan gate.
+
+Several stages clean text with a cascade of ``re.sub`` calls (final
+sanitization in :meth:`Pipeline.run`, late cleanup in
+``_run_pipeline``, fragment-chain stripping) or test a sentence against
+a handful of patterns (:class:`SentenceValidator`). On clean text —
+the common case — every pattern scans the whole string and finds
+nothing, and most of them scan it case-insensitively, which is the slow
+path of the ``re`` engine.
+
+A :class:`RuleSet` compiles its rules once and joins them into one
+alternation, the *gate*:
+
+- case-insensitive rules are gated case-sensitively on
+  ``text.lower()`` (their patterns must be written in lowercase), which
+  is several times faster than ``re.IGNORECASE`` matching. Text with one
+  of the few characters whose regex case fold differs from ``lower()``
+  (``ſ``, ``ı``, ``İ``, ...) is gated with ``re.IGNORECASE`` instead;
+- case-sensitive rules get a gate of their own over the original text.
+
+If the gate misses, no rule matches. :meth:`RuleSet.apply` runs the
+substitutions in their original order, exactly like the cascade they
+replace (a later rule may only match after an earlier substitution, so
+they are not fused into one pass), but probes each case-insensitive
+rule on the lowered text first and skips its ``sub`` when it cannot
+match. :meth:`RuleSet.first` maps the gate's ``lastgroup`` back to the
+rule with the leftmost match.
+
+Rule sets are meant to be module-level constants or per-language
+singletons, shared by every ``Pipeline`` instance.
+
+Stages that build patterns from lexicon entries (``\\bword\\b`` for each
+bureaucratic word, connector or AI marker) use :func:`word_pattern` and
+:func:`compiled`: one pipeline pass builds more such patterns than the
+``re`` module caches, so every pass used to compile them all again.
+
+Usage:
+    >>> import re
+    >>> from texthumanize.rule_sets import Rule, RuleSet
+    >>> rules = RuleSet([
+    ...     Rule("double_and", r"\\b(and)\\s+\\1\\b", r"\\1", re.IGNORECASE),
+    ... ])
+    >>> rules.apply("this And and that")
+    'this And that'
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Backreferences (or an escaped backslash) inside a rule pattern.
+_BACKREF_RE = re.compile(r'\\(\\|\d+)')
+
+# Escapes and group names, ignored when checking that a pattern is lowercase.
+_NOT_LITERAL_RE = re.compile(r'\\.|\(\?P[<=]\w+')
+
+# Characters that ``re.IGNORECASE`` folds differently from ``str.lower()``
+# (or that change length, or lower by context like final ``Σ``): with these
+# the folded gate could miss a match, so such text is gated with
+# ``re.IGNORECASE``.
+_FOLD_MISMATCH_RE = re.compile('[ıİſµͅΣςϐϑϕϖϰϱϵι\u1c80-\u1c88]')
+
+# Flags that can be scoped to one alternative as ``(?flags:...)``.
+_SCOPED_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
+
+@lru_cache(maxsize=65536)
+def compiled(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """``re.compile`` with a process-wide cache larger than the ``re`` one."""
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=65536)
+def word_pattern(word: str, flags: int = re.IGNORECASE) -> re.Pattern[str]:
+    """Compiled ``\\b<word>\\b`` for a literal word or phrase."""
+    return re.compile(r'\b' + re.escape(word) + r'\b', flags)
+
+
+def folds_like_lower(text: str) -> bool:
+    """True if ``re.IGNORECASE`` matching on ``text`` agrees with ``str.lower()``.
+
+    When it does, a case-insensitive literal can only match if its
+    lowercase form is a substring of ``text.lower()``.
+    """
+    return _FOLD_MISMATCH_RE.search(text) is None
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One regex rule; ``repl=None`` marks a check-only rule."""
+
+    name: str
+    pattern: str
+    repl: str | None = None
+    flags: int = 0
+
+
+def _scoped(pattern: str, flags: int) -> str:
+    letters = ""
+    rest = flags
+    for flag, letter in _SCOPED_FLAGS:
+        if flags & flag:
+            letters += letter
+            rest &= ~flag
+    if rest & ~re.UNICODE:
+        raise ValueError(f"Unsupported rule flags: {flags!r}")
+    return f"(?{letters}:{pattern})" if letters else pattern
+
+
+def _renumber(pattern: str, offset: int) -> str:
+    """Shift numeric backreferences by ``offset`` groups."""
+    def _shift(m: re.Match[str]) -> str:
+        ref = m.group(1)
+        if ref == "\\":
+            return m.group()
+        return f"\\{int(ref) + offset}"
+    return _BACKREF_RE.sub(_shift, pattern)
+
+
+def _alternation(
+    rules: Iterable[tuple[str, Rule, int]],
+) -> re.Pattern[str] | None:
+    """One pattern with each rule wrapped in its own named group."""
+    parts: list[str] = []
+    groups = 0
+    for key, rule, flags in rules:
+        # The wrapper group shifts the rule's own groups by one more.
+        body = _scoped(_renumber(rule.pattern, groups + 1), flags)
+        parts.append(f"(?P<{key}>{body})")
+        groups += re.compile(rule.pattern, flags).groups + 1
+    return re.compile("|".join(parts)) if parts else None
+
+
+class RuleSet:
+    """Ordered regex rules compiled once, gated by one combined scan."""
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules: tuple[Rule, ...] = tuple(rules)
+        if not self.rules:
+            raise ValueError("RuleSet needs at least one rule")
+        self._compiled: dict[str, re.Pattern[str]] = {}
+        # (pattern, replacement, probe on lowered text or None)
+        self._subs: list[tuple[re.Pattern[str], str, re.Pattern[str] | None]] = []
+        self._dispatch: dict[str, str] = {}
+        keyed: list[tuple[str, Rule]] = []
+        for i, rule in enumerate(self.rules):
+            if rule.name in self._compiled:
+                raise ValueError(f"Duplicate rule name: {rule.name!r}")
+            compiled = re.compile(rule.pattern, rule.flags)
+            self._compiled[rule.name] = compiled
+            probe = None
+            if rule.flags & re.IGNORECASE:
+                literal = _NOT_LITERAL_RE.sub("", rule.pattern)
+                if literal != literal.lower():
+                    raise ValueError(
+                        f"Case-insensitive rule {rule.name!r} must be written in lowercase"
+                    )
+                probe = re.compile(rule.pattern, rule.flags & ~re.IGNORECASE)
+            if rule.repl is not None:
+                self._subs.append((compiled, rule.repl, probe))
+            key = f"_r{i}"
+            self._dispatch[key] = rule.name
+            keyed.append((key, rule))
+
+        # Exact gate: every rule with its own flags (dispatch, fallback).
+        self.gate: re.Pattern[str] = _alternation(
+            (key, rule, rule.flags) for key, rule in keyed
+        )  # type: ignore[assignment]
+        self._folded_gate = _alternation(
+            (key, rule, rule.flags & ~re.IGNORECASE)
+            for key, rule in keyed if rule.flags & re.IGNORECASE
+        )
+        self._exact_gate = _alternation(
+            (key, rule, rule.flags)
+            for key, rule in keyed if not rule.flags & re.IGNORECASE
+        )
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def pattern(self, name: str) -> re.Pattern[str]:
+        """Compiled pattern of one rule."""
+        return self._compiled[name]
+
+    def matches(self, text: str) -> bool:
+        """True if at least one rule matches somewhere in ``text``."""
+        if self._folded_gate is not None:
+            if _FOLD_MISMATCH_RE.search(text):
+                return self.gate.search(text) is not None
+            if self._folded_gate.search(text.lower()):
+                return True
+        return self._exact_gate is not None and self._exact_gate.search(text) is not None
+
+    def first(self, text: str) -> str | None:
+        """Name of the rule with the leftmost match (ties: rule order)."""
+        m = self.gate.search(text)
+        return self._dispatch[m.lastgroup] if m and m.lastgroup else None
+
+    def apply(self, text: str) -> str:
+        """Run the substitution rules in order, skipping those that cannot match."""
+        if _FOLD_MISMATCH_RE.search(text):
+            for compiled, repl, _probe in self._subs:
+                text = compiled.sub(repl, text)
+            return text
+        lowered: str | None = None
+        for compiled, repl, probe in self._subs:
+            if probe is not None:
+                if lowered is None:
+                    lowered = text.lower()
+                if not probe.search(lowered):
+                    continue
+            new = compiled.sub(repl, text)
+            if new != text:
+                text, lowered = new, None
+        return text
@@ -0,0 +1,156 @@
+"""Sentence graph: a document as a sequence of addressable sentences.
+
+Used by the detector-in-the-loop in :meth:`Pipeline.run` to reprocess
+only the sentences that still read as AI-generated instead of running
+the whole pipeline over the whole document again.
+
+- Every sentence gets a stable ID (content hash + occurrence number), so
+  a graph rebuilt after an edit (``previous=``) knows which sentences
+  are new — those are marked ``dirty``.
+- Per-sentence AI scores come from
+  :meth:`AIDetector.sentence_window_probability` — the same sliding
+  window as :meth:`AIDetector.detect_sentences` — which memoizes each
+  window, so an edit only rescores the windows it touches.
+- Flagged sentences are grouped into runs of neighbours inside one
+  paragraph (:meth:`SentenceGraph.segments`); each run can be rewritten
+  as a unit and spliced back with :meth:`SentenceGraph.replace`, which
+  keeps all text between the runs byte-for-byte.
+
+Usage:
+    >>> from texthumanize.sentence_graph import SentenceGraph
+    >>> graph = SentenceGraph(text, "en")
+    >>> runs = graph.segments(graph.flagged(0.40))
+    >>> rewritten = {run: rewrite(graph.segment_text(run)) for run in runs}
+    >>> new_text = graph.replace(rewritten)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from texthumanize.sentence_split import split_sentences_with_spans
+
+_PARA_SEP = re.compile(r'\n\s*\n')
+
+# Sentence runs are (first, last) node indices, inclusive.
+Segment = tuple[int, int]
+
+
+@dataclass
+class SentenceNode:
+    """One sentence of the document (``start``/``end`` exclude whitespace)."""
+
+    id: str
+    text: str
+    start: int
+    end: int
+    paragraph: int
+    dirty: bool = True
+    score: float | None = None
+
+
+def _sentence_id(text: str, occurrence: int) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=8)
+    return f"{digest.hexdigest()}:{occurrence}"
+
+
+class SentenceGraph:
+    """Sentences of a text with stable IDs, dirty flags and cached scores."""
+
+    def __init__(
+        self,
+        text: str,
+        lang: str,
+        *,
+        previous: SentenceGraph | None = None,
+    ) -> None:
+        self.text = text
+        self.lang = lang
+        self._by_id: dict[str, SentenceNode] = {}
+        para_ends = [m.start() for m in _PARA_SEP.finditer(text)]
+        known = previous._by_id if previous is not None else {}
+        seen: dict[str, int] = {}
+        self.nodes: list[SentenceNode] = []
+        for span in split_sentences_with_spans(text, lang=lang):
+            raw = text[span.start:span.end]
+            start = span.start + len(raw) - len(raw.lstrip())
+            occurrence = seen.get(span.text, 0)
+            seen[span.text] = occurrence + 1
+            node_id = _sentence_id(span.text, occurrence)
+            old = known.get(node_id)
+            self.nodes.append(SentenceNode(
+                id=node_id,
+                text=span.text,
+                start=start,
+                end=start + len(span.text),
+                paragraph=bisect_right(para_ends, start),
+                dirty=old is None,
+            ))
+        self._by_id = {node.id: node for node in self.nodes}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    @property
+    def dirty(self) -> list[int]:
+        """Indices of sentences that are new since ``previous``."""
+        return [i for i, node in enumerate(self.nodes) if node.dirty]
+
+    def scores(self, *, window: int = 3) -> list[float]:
+        """Per-sentence AI probability (sliding window, memoized)."""
+        from texthumanize.detectors import AIDetector
+
+        texts = [node.text for node in self.nodes]
+        if len(texts) < 2:
+            for node in self.nodes:
+                node.score = 0.5
+            return [0.5] * len(texts)
+        detector = AIDetector(lang=self.lang)
+        half = max(window // 2, 1)
+        for i, node in enumerate(self.nodes):
+            window_sents = texts[max(0, i - half):i + half + 1]
+            node.score = detector.sentence_window_probability(window_sents, self.lang)
+        return [node.score for node in self.nodes]  # type: ignore[misc]
+
+    def flagged(self, threshold: float, *, window: int = 3) -> list[int]:
+        """Indices of sentences scoring at or above ``threshold``."""
+        return [
+            i for i, score in enumerate(self.scores(window=window))
+            if score >= threshold
+        ]
+
+    def segments(self, indices: Iterable[int]) -> list[Segment]:
+        """Group sentence indices into runs of neighbours in one paragraph."""
+        runs: list[Segment] = []
+        for i in sorted(set(indices)):
+            if runs:
+                first, last = runs[-1]
+                if i == last + 1 and self.nodes[i].paragraph == self.nodes[last].paragraph:
+                    runs[-1] = (first, i)
+                    continue
+            runs.append((i, i))
+        return runs
+
+    def segment_text(self, segment: Segment) -> str:
+        """Source text of a run, including the whitespace inside it."""
+        first, last = segment
+        return self.text[self.nodes[first].start:self.nodes[last].end]
+
+    def replace(self, replacements: dict[Segment, str]) -> str:
+        """Text with each run replaced; everything else is kept as is."""
+        parts: list[str] = []
+        pos = 0
+        for (first, last), new in sorted(replacements.items()):
+            start, end = self.nodes[first].start, self.nodes[last].end
+            parts.append(self.text[pos:start])
+            parts.append(new)
+            pos = end
+        parts.append(self.text[pos:])
+        return "".join(parts)
@@ -8,19 +8,100 @@
 - URL и email внутри предложений
 - Многоточие (...)
 - Вложенные кавычки и скобки
+
+Шаблоны скомпилированы один раз, защищённые зоны сливаются в
+отсортированный список (проверка позиции — двоичный поиск), а разрывы
+групп абзацев кэшируются по хешу, поэтому после локальной правки
+повторный разбор затрагивает только изменённые абзацы.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
-from functools import lru_cache
 
-from texthumanize.lang import get_lang_pack
+from texthumanize.cache import memo_cache
+from texthumanize.lang import get_compiled_pack
 
 logger = logging.getLogger(__name__)
 
+# ─── Скомпилированные шаблоны ────────────────────────────────
+_CANDIDATE_RE = re.compile(r'([.!?…][\"\'\»\"\)\]]*)\s+')
+_PLACEHOLDER_RE = re.compile(r'\x00THZ_[A-Z_]+_\d+\x00')
+_QUOTE_RE = re.compile(r'"[^"]*"')
+_GUILLEMET_RE = re.compile(r'«[^»]*»')
+_PAREN_RE = re.compile(r'\([^)]*\)')
+_ELLIPSIS_RE = re.compile(r'\.\.\.(?!\s+[A-ZА-ЯЁІЇЄҐ])')
+_DIGIT_RE = re.compile(r'\d')
+_NUMBER_ZONE_RES = (
+    # Десятичные числа (3.14, 2.5, 0.001)
+    re.compile(r'\d+\.\d+'),
+    # Числа с единицами (3.5 млн, 1.2 тыс., $1.5M, 2.0x)
+    re.compile(
+        r'\d+\.\d+\s*(?:млн|млрд|тыс|мільйонів|тис|Mio|Mrd|'
+        r'M|B|K|x|%|km|m|kg|g|l|ml|GB|MB|TB)\b',
+        re.IGNORECASE,
+    ),
+    # Порядковые числительные с точкой (нем/пл: 1., 2., 15.)
+    re.compile(r'\b\d{1,4}\.(?=\s+[a-zа-яёіїєґüöäß])'),
+    # IP-адреса (192.168.0.1)
+    re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'),
+    # Версии (v2.3.1, 3.11.0)
+    re.compile(r'\b[vV]?\d+\.\d+(?:\.\d+)*\b'),
+)
+_DOTTED_ABBREV_RE = re.compile(
+    r'(?:т\.д|т\.п|т\.е|и т\.д|и т\.п|т\.к|т\.н|т\.ін|і т\.д|і т\.п'
+    r'|e\.g|i\.e|a\.m|p\.m|vs|p\.s|P\.S'
+    r'|к\.т\.н|д\.т\.н|Ph\.D|M\.D|B\.A|M\.A'
+    r'|St\.|Mt\.|Ft\.|Ltd\.|Corp\.|Bros'
+    r'|тис\.|грн\.|руб\.|коп\.|млн\.|млрд'
+    r'|r\.r\.|n\.e\.|p\.n\.e'
+    r'|S\.p\.A|S\.r\.l|S\.A|S\.L'
+    r'|z\.B|d\.h|u\.a|bzw|ggf|inkl|bzgl)\.',
+    re.IGNORECASE,
+)
+# Граница абзацев: пробельный промежуток минимум с двумя переводами строки
+_PARA_SEP_RE = re.compile(r'\s*\n\s*\n\s*(?=\S)')
+_MAX_POS = sys.maxsize
+# Группы короче этого разбираются без кэша (хеш дороже разбора)
+_PARA_CACHE_MIN = 64
+
+
+def _merge_zones(zones: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Отсортировать и слить перекрывающиеся интервалы."""
+    if len(zones) < 2:
+        return zones
+    zones.sort()
+    merged = [zones[0]]
+    for start, end in zones[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end:
+            if end > last_end:
+                merged[-1] = (last_start, end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _self_contained(chunk: str) -> bool:
+    """Все кавычки и скобки фрагмента закрываются внутри него.
+
+    Тогда защищённые зоны не пересекают его границу, и фрагмент можно
+    разбирать (и кэшировать) отдельно от остального текста.
+    """
+    if chunk.count('"') % 2:
+        return False
+    for opener, closer in (('«', '»'), ('(', ')')):
+        i = chunk.rfind(opener)
+        if i >= 0 and chunk.rfind(closer) < i:
+            return False
+    return True
+
+
 @dataclass
 class SentenceSpan:
     """Предложение с позициями в исходном тексте."""
@@ -55,12 +136,9 @@ class SentenceSplitter:
 
     def __init__(self, lang: str = "en"):
         self.lang = lang
-        lang_pack = get_lang_pack(lang)
         # Собираем все аббревиатуры: из lang pack + универсальные
-        pack_abbrevs = lang_pack.get("abbreviations", [])
         self._abbreviations = (
-            {a.lower().rstrip('.') for a in pack_abbrevs}
-            | self._UNIVERSAL_ABBREVS
+            get_compiled_pack(lang).abbreviations | self._UNIVERSAL_ABBREVS
         )
 
     def split(self, text: str) -> list[str]:
@@ -120,35 +198,78 @@ class SentenceSplitter:
         return sentences
 
     def _find_breaks(self, text: str) -> list[int]:
-        """Найти позиции разрыва предложений."""
-        breaks = []
+        """Найти позиции разрыва предложений.
 
-        # Размечаем «защищённые» зоны (не-разрыв)
-        protected = self._build_protected_zones(text)
+        Текст с абзацами (пустая строка между ними) разбивается
+        по группам абзацев; разрывы каждой группы кэшируются по хешу,
+        так что после правки пары предложений пересчитываются только
+        затронутые абзацы. Результат совпадает с разбором всего текста.
+        """
+        if '\n' not in text:
+            return self._scan_breaks(text)
+        seps = list(_PARA_SEP_RE.finditer(text))
+        if not seps:
+            return self._scan_breaks(text)
+
+        breaks: list[int] = []
+        # Группа разбирается вместе с предшествующим разделителем (для
+        # проверок на начало строки) и первым символом следующего абзаца
+        # (для решения о разрыве на границе).
+        unit_start = group_start = 0
+        for sep in seps:
+            if not _self_contained(text[group_start:sep.start()]):
+                continue  # зона (кавычки/скобки) выходит за абзац — копим
+            unit = text[unit_start:sep.end() + 1]
+            breaks.extend(unit_start + b for b in self._unit_breaks(unit))
+            unit_start, group_start = sep.start(), sep.end()
+        tail = text[unit_start:]
+        breaks.extend(unit_start + b for b in self._unit_breaks(tail))
+        return breaks
+
+    def _unit_breaks(self, unit: str) -> tuple[int, ...]:
+        """Разрывы одной группы абзацев (кэш по хешу текста)."""
+        if len(unit) < _PARA_CACHE_MIN:
+            return tuple(self._scan_breaks(unit))
+        key = (
+            self.lang,
+            hashlib.blake2b(
+                unit.encode("utf-8", "surrogatepass"), digest_size=16,
+            ).digest(),
+        )
+        return _para_cache.get_or_compute(
+            key, lambda: tuple(self._scan_breaks(unit)),
+        )
+
+    def _scan_breaks(self, text: str) -> list[int]:
+        """Разбор одного фрагмента: кандидаты → проверки."""
+        breaks = []
+        n = len(text)
+        abbreviations = self._abbreviations
+        # Защищённые зоны строятся лениво — только если дошло до проверки
+        protected: list[tuple[int, int]] | None = None
 
         # Находим все потенциальные концы предложений
         # Паттерн: .!? + опциональные закрывающие + пробел + Заглавная
-        for m in re.finditer(
-            r'([.!?…][\"\'\»\"\)\]]*)\s+',
-            text,
-        ):
+        for m in _CANDIDATE_RE.finditer(text):
             pos = m.end()  # Позиция начала следующего предложения
             dot_pos = m.start()  # Позиция пунктуации
 
-            # Проверяем, не в защищённой зоне ли
-            if self._in_protected(dot_pos, protected):
-                continue
-
             # Проверяем, что после пробела идёт заглавная или кавычка
-            if pos < len(text):
+            if pos < n:
                 next_char = text[pos]
                 if not (next_char.isupper() or next_char in '"\'«"(—\x00'):
                     continue
 
+            # Проверяем, не в защищённой зоне ли
+            if protected is None:
+                protected = self._build_protected_zones(text)
+            if protected and self._in_protected(dot_pos, protected):
+                continue
+
             # Проверяем, что это не аббревиатура
             if text[dot_pos] == '.':
                 word_before = self._get_word_before_dot(text, dot_pos)
-                if word_before and word_before.lower() in self._abbreviations:
+                if word_before and word_before.lower() in abbreviations:
                     continue
 
                 # Проверяем инициалы (одна буква перед точкой)
@@ -157,76 +278,63 @@ class SentenceSplitter:
 
             breaks.append(pos)
 
-        return sorted(set(breaks))
+        return breaks
 
     def _build_protected_zones(self, text: str) -> list[tuple[int, int]]:
-        """Построить список «защищённых» зон (не разбивать внутри)."""
+        """Построить «защищённые» зоны (не разбивать внутри).
+
+        Returns:
+            Отсортированный список непересекающихся интервалов
+            ``[start, end)`` — перекрывающиеся зоны слиты.
+        """
         zones: list[tuple[int, int]] = []
 
         # Placeholders от segmenter (\x00THZ_...\x00)
-        for m in re.finditer(r'\x00THZ_[A-Z_]+_\d+\x00', text):
-            zones.append((m.start(), m.end()))
-
-        # Кавычки-блоки (прямая речь)
-        for m in re.finditer(r'"[^"]*"', text):
-            if len(m.group()) < 500:  # Не слишком длинные
-                zones.append((m.start(), m.end()))
-        for m in re.finditer(r'«[^»]*»', text):
-            if len(m.group()) < 500:
-                zones.append((m.start(), m.end()))
+        if '\x00' in text:
+            zones.extend(m.span() for m in _PLACEHOLDER_RE.finditer(text))
+
+        # Кавычки-блоки (прямая речь), не слишком длинные
+        if '"' in text:
+            zones.extend(
+                m.span() for m in _QUOTE_RE.finditer(text)
+                if m.end() - m.start() < 500
+            )
+        if '«' in text:
+            zones.extend(
+                m.span() for m in _GUILLEMET_RE.finditer(text)
+                if m.end() - m.start() < 500
+            )
 
         # Скобки
-        for m in re.finditer(r'\([^)]*\)', text):
-            if len(m.group()) < 300:
-                zones.append((m.start(), m.end()))
+        if '(' in text:
+            zones.extend(
+                m.span() for m in _PAREN_RE.finditer(text)
+                if m.end() - m.start() < 300
+            )
 
         # Многоточие как часть предложения (не конец)
-        for m in re.finditer(r'\.\.\.(?!\s+[A-ZА-ЯЁІЇЄҐ])', text):
-            zones.append((m.start(), m.end()))
-
-        # Десятичные числа (3.14, 2.5, 0.001)
-        for m in re.finditer(r'\d+\.\d+', text):
-            zones.append((m.start(), m.end()))
+        if '...' in text:
+            zones.extend(m.span() for m in _ELLIPSIS_RE.finditer(text))
 
-        # Числа с единицами (3.5 млн, 1.2 тыс., $1.5M, 2.0x)
-        for m in re.finditer(
-            r'\d+\.\d+\s*(?:млн|млрд|тыс|мільйонів|тис|Mio|Mrd|'
-            r'M|B|K|x|%|km|m|kg|g|l|ml|GB|MB|TB)\b',
-            text, re.IGNORECASE,
-        ):
-            zones.append((m.start(), m.end()))
-
-        # Порядковые числительные с точкой (нем/пл: 1., 2., 15.)
-        for m in re.finditer(r'\b\d{1,4}\.(?=\s+[a-zа-яёіїєґüöäß])', text):
-            zones.append((m.start(), m.end()))
-
-        # IP-адреса (192.168.0.1)
-        for m in re.finditer(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', text):
-            zones.append((m.start(), m.end()))
-
-        # Версии (v2.3.1, 3.11.0)
-        for m in re.finditer(r'\b[vV]?\d+\.\d+(?:\.\d+)*\b', text):
-            zones.append((m.start(), m.end()))
+        if _DIGIT_RE.search(text):
+            # Десятичные, числа с единицами, порядковые, IP, версии
+            for rx in _NUMBER_ZONE_RES:
+                zones.extend(m.span() for m in rx.finditer(text))
 
         # Сокращения с точками: т.д., т.п., т.е., etc.
-        for m in re.finditer(
-            r'(?:т\.д|т\.п|т\.е|и т\.д|и т\.п|т\.к|т\.н|т\.ін|і т\.д|і т\.п'
-            r'|e\.g|i\.e|a\.m|p\.m|vs|p\.s|P\.S'
-            r'|к\.т\.н|д\.т\.н|Ph\.D|M\.D|B\.A|M\.A'
-            r'|St\.|Mt\.|Ft\.|Ltd\.|Corp\.|Bros'
-            r'|тис\.|грн\.|руб\.|коп\.|млн\.|млрд'
-            r'|r\.r\.|n\.e\.|p\.n\.e'
-            r'|S\.p\.A|S\.r\.l|S\.A|S\.L'
-            r'|z\.B|d\.h|u\.a|bzw|ggf|inkl|bzgl)\.',
-            text, re.IGNORECASE,
-        ):
-            zones.append((m.start(), m.end()))
+        zones.extend(m.span() for m in _DOTTED_ABBREV_RE.finditer(text))
 
-        return zones
+        return _merge_zones(zones)
 
-    def _in_protected(self, pos: int, zones: list[tuple[int, int]]) -> bool:
-        """Проверить, попадает ли позиция в защищённую зону."""
-        return any(start <= pos < end for start, end in zones)
+    @staticmethod
+    def _in_protected(pos: int, zones: list[tuple[int, int]]) -> bool:
+        """Проверить, попадает ли позиция в защищённую зону.
+
+        ``zones`` — отсортированные непересекающиеся интервалы
+        (как возвращает ``_build_protected_zones``); поиск двоичный.
+        """
+        i = bisect_right(zones, (pos, _MAX_POS)) - 1
+        return i >= 0 and pos < zones[i][1]
 
     def _get_word_before_dot(self, text: str, dot_pos: int) -> str:
         """Извлечь слово перед точкой."""
@@ -290,22 +398,25 @@ class SentenceSplitter:
 
 
 # ─── Кэш для сплиттеров по языкам ────────────────────────────
-_splitter_cache: dict[str, SentenceSplitter] = {}
+_splitter_cache = memo_cache("sentence_split.splitter", max_entries=32)
+# Результаты split_sentences: ключ (lang, text), ограничен и по объёму.
+_split_cache = memo_cache(
+    "sentence_split.split", max_entries=1024, max_bytes=16 * 1024 * 1024,
+)
+# Разрывы групп абзацев: ключ (lang, blake2b(группа)).
+_para_cache = memo_cache("sentence_split.paragraph", max_entries=8192)
 
 
 def _get_splitter(lang: str) -> SentenceSplitter:
     """Получить или создать кэшированный сплиттер для языка."""
-    if lang not in _splitter_cache:
-        _splitter_cache[lang] = SentenceSplitter(lang=lang)
-    return _splitter_cache[lang]
+    return _splitter_cache.get_or_compute(lang, lambda: SentenceSplitter(lang=lang))
 
 
-# LRU-кэш для результатов split_sentences (до 256 уникальных текстов)
-@lru_cache(maxsize=256)
 def _cached_split(text: str, lang: str) -> tuple[str, ...]:
     """Кэшированная версия split для одинаковых текстов."""
-    splitter = _get_splitter(lang)
-    return tuple(splitter.split(text))
+    return _split_cache.get_or_compute(
+        (lang, text), lambda: tuple(_get_splitter(lang).split(text)),
+    )
 
 
 def split_sentences(text: str, lang: str = "en") -> list[str]:
@@ -24,6 +24,9 @@ import logging
 import re
 from dataclasses import dataclass, field
 
+from texthumanize.rule_sets import Rule, RuleSet
+from texthumanize.sentence_split import split_sentences
+
 logger = logging.getLogger(__name__)
 
 # ── Compiled patterns ─────────────────────────────────────────
@@ -105,6 +108,53 @@ _SHORT_OK: dict[str, frozenset[str]] = {
 
 _WORD_RE = re.compile(r'[a-zA-Zа-яА-ЯёЁіїєґІЇЄҐüöäßÜÖÄ\'-]+')
 
+_TRIPLE_OK = frozenset({'brrr', 'shhh', 'zzz', 'mmm'})
+
+# Valid duplicates: "very very", "had had"
+_VALID_DUPS = frozenset({
+    'very', 'had', 'that', 'so', 'no', 'bye',
+    'го', 'ну', 'да', 'ой', 'ах',
+})
+
+# "die Beachten" pattern: article + infinitive as noun
+_DE_ARTICLE_VERB = (
+    r'\b(der|die|das|dem|den|des)\s+'
+    r'[A-ZÄÖÜ][a-zäöüß]*(?:en|ern|eln)\b'
+)
+_DE_NOUN_SUFFIXES = (
+    'ung', 'heit', 'keit', 'schaft', 'tion',
+    'nis', 'tum', 'ment', 'ität',
+)
+
+# Article followed directly by a preposition (missing content noun)
+_ART_PREP = r'\b(the|a|an)\s+(of|in|on|at|by|from|for|with|to)\b'
+
+_DUP_CONJ = (
+    r'\b(and|but|or|yet|so|и|і|а|але|но|und|oder|aber'
+    r'|et|ou|mais|y|o|pero)\s+\1\b'
+)
+
+# Regex checks per language, compiled once and shared by all validators.
+_rule_sets: dict[str, RuleSet] = {}
+
+
+def _rules_for(lang: str) -> RuleSet:
+    """Regex checks of ``_check_sentence`` for ``lang`` behind one gate."""
+    rules = _rule_sets.get(lang)
+    if rules is None:
+        chain = _CONJ_CHAINS.get(lang, _CONJ_CHAIN_EN)
+        specs = [
+            Rule("triple_char", _TRIPLE_LETTER.pattern, flags=re.IGNORECASE),
+            Rule("conjunction_chain", chain.pattern, flags=re.IGNORECASE),
+        ]
+        if lang == 'de':
+            specs.append(Rule("de_article_verb", _DE_ARTICLE_VERB))
+        if lang == 'en':
+            specs.append(Rule("missing_noun", _ART_PREP, flags=re.IGNORECASE))
+        specs.append(Rule("double_conj", _DUP_CONJ, flags=re.IGNORECASE))
+        rules = _rule_sets.setdefault(lang, RuleSet(specs))
+    return rules
+
 
 # ── Result ────────────────────────────────────────────────────
 
@@ -181,8 +231,13 @@ class SentenceValidator:
                 continue
 
             # Split paragraph into sentences
-            b_sents = self._split_sents(bp)
             a_sents = self._split_sents(ap)
+            if bp == ap:
+                # Untouched by the stage: nothing to revert to
+                self.last_result.sentences_checked += len(a_sents)
+                result_paras.append(' '.join(a_sents))
+                continue
+            b_sents = self._split_sents(bp)
 
             # If sentence count differs moderately, try alignment;
             # if too different, accept the output paragraph as-is.
@@ -239,21 +294,27 @@ class SentenceValidator:
         if not words:
             return None
 
+        # One scan over the combined regex checks (steps 1, 4, 8-10):
+        # if the gate misses, none of them can fire.
+        rules = _rules_for(self.lang)
+        gated = rules.matches(sent)
+
         # ── 1. Triple repeated characters ─────────────────────
-        for word in words:
-            if _TRIPLE_LETTER.search(word):
-                # Allow valid words with triple letters (very rare)
-                if word.lower() not in ('brrr', 'shhh', 'zzz', 'mmm'):
-                    return f"triple_char: «{word}»"
+        if gated:
+            for word in words:
+                if _TRIPLE_LETTER.search(word):
+                    # Allow valid words with triple letters (very rare)
+                    if word.lower() not in _TRIPLE_OK:
+                        return f"triple_char: «{word}»"
 
         # ── 2. Truncated words ────────────────────────────────
         # If a word disappeared from the middle (stem got cut)
         if original:
             orig_words = set(w.lower() for w in _WORD_RE.findall(original))
+            # Skip known short words
+            short_ok = _SHORT_OK.get(self.lang, _SHORT_OK.get('en', frozenset()))
             for word in words:
                 wl = word.lower()
-                # Skip known short words
-                short_ok = _SHORT_OK.get(self.lang, _SHORT_OK.get('en', frozenset()))
                 if wl in short_ok or len(wl) > 2:
                     continue
                 # Single letter that wasn't in original and isn't a known word
@@ -267,8 +328,7 @@ class SentenceValidator:
                     return f"en_leak: «{word}»"
 
         # ── 4. Garbled conjunction chains ─────────────────────
-        chain_re = _CONJ_CHAINS.get(self.lang, _CONJ_CHAIN_EN)
-        if chain_re.search(sent):
+        if gated and rules.pattern("conjunction_chain").search(sent):
             return "conjunction_chain"
 
         # ── 5. Duplicate adjacent words ───────────────────────
@@ -276,11 +336,7 @@ class SentenceValidator:
             w1, w2 = words[i].lower(), words[i + 1].lower()
             if w1 == w2 and len(w1) > 1:
                 # Allow some valid duplicates: "very very", "had had"
-                _valid_dups = frozenset({
-                    'very', 'had', 'that', 'so', 'no', 'bye',
-                    'го', 'ну', 'да', 'ой', 'ах',
-                })
-                if w1 not in _valid_dups:
+                if w1 not in _VALID_DUPS:
                     return f"duplicate: «{words[i]} {words[i+1]}»"
 
         # ── 6. Severe truncation ──────────────────────────────
@@ -297,54 +353,35 @@ class SentenceValidator:
         if abs(open_parens) > 1:
             return "unmatched_parens"
 
+        if not gated:
+            return None
+
         # ── 8. Article-noun splits (DE) ──────────────────────
         if self.lang == 'de':
             # "die Beachten" pattern: article + infinitive as noun
-            _de_article_verb = re.compile(
-                r'\b(der|die|das|dem|den|des)\s+'
-                r'[A-ZÄÖÜ][a-zäöüß]*(?:en|ern|eln)\b'
-            )
-            if _de_article_verb.search(sent):
+            m = rules.pattern("de_article_verb").search(sent)
+            if m:
                 # Check if the "noun" is actually a verb infinitive
-                m = _de_article_verb.search(sent)
-                if m:
-                    candidate = m.group().split()[-1].lower()
-                    _noun_suffixes = (
-                        'ung', 'heit', 'keit', 'schaft', 'tion',
-                        'nis', 'tum', 'ment', 'ität',
-                    )
-                    if not any(candidate.endswith(s) for s in _noun_suffixes):
-                        return f"de_article_verb: «{m.group()}»"
+                candidate = m.group().split()[-1].lower()
+                if not candidate.endswith(_DE_NOUN_SUFFIXES):
+                    return f"de_article_verb: «{m.group()}»"
 
         # ── 9. Missing noun: "the of", "the in" ─────────────
         # Article followed directly by a preposition (missing content noun)
         if self.lang == 'en':
-            _art_prep = re.compile(
-                r'\b(the|a|an)\s+(of|in|on|at|by|from|for|with|to)\b',
-                re.IGNORECASE,
-            )
-            if _art_prep.search(sent):
-                return f"missing_noun: «{_art_prep.search(sent).group()}»"
+            m = rules.pattern("missing_noun").search(sent)
+            if m:
+                return f"missing_noun: «{m.group()}»"
 
         # ── 10. Double conjunction ("and and", "but but") ────
-        _dup_conj = re.compile(
-            r'\b(and|but|or|yet|so|и|і|а|але|но|und|oder|aber'
-            r'|et|ou|mais|y|o|pero)\s+\1\b',
-            re.IGNORECASE,
-        )
-        if _dup_conj.search(sent):
-            return f"double_conj: «{_dup_conj.search(sent).group()}»"
+        m = rules.pattern("double_conj").search(sent)
+        if m:
+            return f"double_conj: «{m.group()}»"
 
         return None
 
-    @staticmethod
-    def _split_sents(text: str) -> list[str]:
-        """Split text into sentences (fast regex-based)."""
+    def _split_sents(self, text: str) -> list[str]:
+        """Split text into sentences (shared cached splitter)."""
         if not text.strip():
             return [text]
-        # Use a universal sentence-boundary pattern
-        parts = re.split(
-            r'(?<=[.!?»"])\s+(?=[A-ZА-ЯІЇЄҐÜÖÄÉÈÊÀÂ«"])',
-            text,
-        )
-        return [p for p in parts if p.strip()]
+        return split_sentences(text, lang=self.lang)
@@ -35,7 +35,7 @@ from texthumanize._human_profiles import (
     signature_distance,
 )
 from texthumanize.sentence_split import split_sentences
-from texthumanize.word_lm import WordLanguageModel
+from texthumanize.word_lm import get_word_lm
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +99,7 @@ class SignatureTransfer:
         self.lang = lang
         self.seed = seed
         self._rng = random.Random(seed)
-        self._lm = WordLanguageModel(lang)
+        self._lm = get_word_lm(lang)
         self._profile = get_human_profile(lang)
 
     # ── Public API ──
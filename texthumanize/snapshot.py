@@ -0,0 +1,268 @@
+"""Warm data snapshot: prepared data structures cached on disk.
+
+Several tables are derived from the shipped data on every process
+start: the ranked synonym database (seconds), decoded model weights
+(base85 + zlib + JSON), the cluster embeddings and the word-LM
+probability tables. :func:`cached` runs such a builder once, pickles
+its result into the snapshot directory and loads it on later starts,
+so a cold start costs a file read instead of the recomputation.
+
+An entry is only used when its header matches: snapshot format,
+Python version and a hash of every source file the data was derived
+from (the builder module and its data files). Anything else — a new
+release, edited data, a corrupt file — silently rebuilds it.
+
+The snapshot is opt-in: it is used when ``$TEXTHUMANIZE_SNAPSHOT_DIR``
+is set, or once ``texthumanize snapshot build`` has run for the default
+directory ``$XDG_CACHE_HOME/texthumanize/snapshot`` (``~/.cache/...``);
+``snapshot clear`` turns the latter off again. ``TEXTHUMANIZE_SNAPSHOT=0``
+disables it in any case. Entries are pickles, so the directory must
+only be writable by trusted users.
+
+Prebuild at image build time::
+
+    texthumanize snapshot build          # or: python -m texthumanize.snapshot build
+    texthumanize snapshot info
+    texthumanize snapshot clear
+
+    # Dockerfile
+    ENV TEXTHUMANIZE_SNAPSHOT_DIR=/opt/texthumanize-snapshot
+    RUN texthumanize snapshot build
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+FORMAT = 1
+ENV_DIR = "TEXTHUMANIZE_SNAPSHOT_DIR"
+ENV_ENABLED = "TEXTHUMANIZE_SNAPSHOT"
+_SUFFIX = ".snapshot"
+_MARKER = ".enabled"  # written by `snapshot build` into the directory
+
+# Snapshot name → ``module:function`` that loads (and so snapshots) it.
+TARGETS: dict[str, str] = {
+    "synonyms": "texthumanize._synonym_db:SynonymDB",
+    "weights": "texthumanize.weight_loader:load_all_weights",
+    "embeddings": "texthumanize.word_embeddings:_get_embeddings",
+    "word_lm": "texthumanize.word_lm:_warm_tables",
+}
+
+_hash_lock = threading.Lock()
+_file_hashes: dict[str, str] = {}
+
+
+def snapshot_dir() -> str:
+    """Directory holding the snapshot files."""
+    path = os.environ.get(ENV_DIR)
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache",
+    )
+    return os.path.join(base, "texthumanize", "snapshot")
+
+
+def _switched_off() -> bool:
+    return os.environ.get(ENV_ENABLED, "1").strip().lower() in ("0", "false", "off", "no")
+
+
+def enabled() -> bool:
+    """``True`` when ``TEXTHUMANIZE_SNAPSHOT_DIR`` is set or ``snapshot
+    build`` has run, unless ``TEXTHUMANIZE_SNAPSHOT`` is ``0``/``false``/``off``.
+    """
+    if _switched_off():
+        return False
+    return bool(os.environ.get(ENV_DIR)) or os.path.exists(
+        os.path.join(snapshot_dir(), _MARKER),
+    )
+
+
+def _file_hash(path: str) -> str:
+    with _hash_lock:
+        digest = _file_hashes.get(path)
+    if digest is None:
+        try:
+            with open(path, "rb") as fh:
+                digest = hashlib.sha256(fh.read()).hexdigest()[:16]
+        except OSError:
+            digest = "missing"
+        with _hash_lock:
+            _file_hashes[path] = digest
+    return digest
+
+
+def fingerprint(name: str, sources: Iterable[str]) -> dict:
+    """Header an entry must match to be loaded."""
+    return {
+        "format": FORMAT,
+        "name": name,
+        "python": f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}",
+        "sources": {
+            os.path.basename(p): _file_hash(p) for p in sorted(set(sources))
+        },
+    }
+
+
+def _path(name: str, directory: str | None = None) -> str:
+    return os.path.join(directory or snapshot_dir(), name + _SUFFIX)
+
+
+def _read(path: str, header: dict) -> tuple[bool, Any]:
+    try:
+        with open(path, "rb") as fh:
+            if json.loads(fh.readline()) != header:
+                return False, None
+            return True, pickle.load(fh)
+    except FileNotFoundError:
+        return False, None
+    except Exception as e:  # corrupt or truncated: rebuild
+        logger.debug("snapshot %s unreadable: %s", path, e)
+        return False, None
+
+
+def _write(path: str, header: dict, value: Any) -> None:
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(json.dumps(header, sort_keys=True).encode("utf-8") + b"\n")
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            # mkstemp creates 0600; images are often built as root and
+            # run as another user.
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception as e:  # read-only home, full disk: just run cold
+        logger.debug("snapshot %s not written: %s", path, e)
+
+
+def cached(name: str, build: Callable[[], T], sources: Sequence[str] = ()) -> T:
+    """Result of ``build()``, from the snapshot when it is valid.
+
+    Args:
+        name: Entry name (file name in the snapshot directory).
+        build: Deterministic builder; its result must pickle.
+        sources: Files the result is derived from — the builder module
+            and its data files. A change to any of them rebuilds.
+    """
+    if not enabled():
+        return build()
+    path = _path(name)
+    header = json.loads(json.dumps(fingerprint(name, sources), sort_keys=True))
+    hit, value = _read(path, header)
+    if hit:
+        return value
+    value = build()
+    _write(path, header, value)
+    return value
+
+
+def prebuild(names: Sequence[str] | None = None) -> dict[str, float]:
+    """Build (or validate) snapshot entries; returns seconds per target.
+
+    Targets already loaded in this process are not rewritten, so run it
+    in a fresh interpreter (as ``texthumanize snapshot build`` does).
+    """
+    timings: dict[str, float] = {}
+    for name in names or list(TARGETS):
+        module, func = TARGETS[name].split(":")
+        start = time.perf_counter()
+        getattr(importlib.import_module(module), func)()
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def info(directory: str | None = None) -> list[dict]:
+    """Entries in the snapshot directory: file name, size, header."""
+    directory = directory or snapshot_dir()
+    try:
+        names = sorted(n for n in os.listdir(directory) if n.endswith(_SUFFIX))
+    except FileNotFoundError:
+        return []
+    entries = []
+    for file_name in names:
+        path = os.path.join(directory, file_name)
+        try:
+            with open(path, "rb") as fh:
+                header = json.loads(fh.readline())
+        except Exception:
+            header = None
+        entries.append({"file": file_name, "bytes": os.path.getsize(path), "header": header})
+    return entries
+
+
+def clear(directory: str | None = None) -> int:
+    """Delete all entries and the build marker; returns how many entries
+    were removed.
+    """
+    directory = directory or snapshot_dir()
+    entries = info(directory)
+    for file_name in [e["file"] for e in entries] + [_MARKER]:
+        try:
+            os.unlink(os.path.join(directory, file_name))
+        except FileNotFoundError:
+            pass
+    return len(entries)
+
+
+def main(argv: list[str] | None = None, prog: str = "python -m texthumanize.snapshot") -> int:
+    parser = argparse.ArgumentParser(
+        prog=prog, description="Build, inspect or clear the warm data snapshot",
+    )
+    parser.add_argument("action", choices=["build", "info", "clear"])
+    parser.add_argument("--dir", help=f"Snapshot directory (default: ${ENV_DIR} or ~/.cache)")
+    parser.add_argument("--only", help=f"Comma-separated targets: {', '.join(TARGETS)}")
+    args = parser.parse_args(argv)
+
+    if args.dir:
+        os.environ[ENV_DIR] = args.dir
+    directory = snapshot_dir()
+    if args.action == "build":
+        names = args.only.split(",") if args.only else None
+        unknown = sorted(set(names or ()) - set(TARGETS))
+        if unknown:
+            parser.error(f"unknown target(s): {', '.join(unknown)}")
+        if _switched_off():
+            parser.error(f"snapshot disabled by {ENV_ENABLED}")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, _MARKER), "w", encoding="utf-8"):
+                pass
+        except OSError as e:
+            parser.error(f"cannot write {directory}: {e}")
+        for name, seconds in prebuild(names).items():
+            print(f"  {name:<12} {seconds:7.2f}s")
+    elif args.action == "clear":
+        print(f"removed {clear()} entries from {directory}")
+        return 0
+    entries = info()
+    for entry in entries:
+        print(f"  {entry['file']:<46} {entry['bytes'] / 1024:9.0f} KB")
+    print(f"{len(entries)} entries, "
+          f"{sum(e['bytes'] for e in entries) / 1024 / 1024:.1f} MB in {directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
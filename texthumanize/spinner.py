@@ -17,6 +17,8 @@ from texthumanize.morphology import get_morphology
 
 logger = logging.getLogger(__name__)
 
+_SPINTAX_GROUP = re.compile(r'\{([^{}]+)\}')
+
 @dataclass
 class SpinResult:
     """Результат спиннинга."""
@@ -305,6 +307,7 @@ class ContentSpinner:
             Список уникальных версий.
         """
         spintax = self._generate_spintax(text)
+        template = self._compile_spintax(spintax)
         variants: list[str] = []
         seen: set[str] = set()
 
@@ -312,7 +315,13 @@ class ContentSpinner:
         for _ in range(max_attempts):
             if len(variants) >= count:
                 break
-            variant = self._resolve_spintax(spintax)
+            if template is None:
+                variant = self._resolve_spintax(spintax)
+            else:
+                variant = "".join(
+                    part if isinstance(part, str) else self.rng.choice(part)
+                    for part in template
+                )
             if variant not in seen:
                 seen.add(variant)
                 variants.append(variant)
@@ -381,6 +390,25 @@ class ContentSpinner:
 
         return " ".join(result)
 
+    @staticmethod
+    def _compile_spintax(spintax: str) -> list[str | list[str]] | None:
+        """Разобрать плоский spintax в список литералов и групп вариантов.
+
+        Разбор выполняется один раз на текст, после чего каждый вариант
+        лишь выбирает элементы групп (тем же порядком вызовов RNG, что и
+        _resolve_spintax). Для вложенного spintax возвращает None.
+        """
+        parts: list[str | list[str]] = []
+        pos = 0
+        for m in _SPINTAX_GROUP.finditer(spintax):
+            parts.append(spintax[pos:m.start()])
+            parts.append(m.group(1).split("|"))
+            pos = m.end()
+        parts.append(spintax[pos:])
+        if any(isinstance(p, str) and ("{" in p or "}" in p) for p in parts):
+            return None
+        return parts
+
     def _resolve_spintax(self, spintax: str) -> str:
         """Развернуть spintax, выбирая случайные варианты."""
         def resolve_match(m: re.Match) -> str:
@@ -461,7 +489,8 @@ def generate_variants(
     count: int = 5,
     lang: str = "en",
     intensity: float = 0.5,
+    seed: int | None = None,
 ) -> list[str]:
     """Сгенерировать несколько уникальных версий текста."""
-    spinner = ContentSpinner(lang=lang, intensity=intensity)
+    spinner = ContentSpinner(lang=lang, seed=seed, intensity=intensity)
     return spinner.generate_variants(text, count=count)
@@ -0,0 +1,401 @@
+"""Incremental humanization of large or unbounded text sources.
+
+``humanize_stream`` used to read the whole input, detect its language,
+build the full chunk list and only then start yielding. The
+:class:`StreamHumanizer` consumes a string, an iterable of strings or a
+file-like object, segments paragraphs as data arrives, humanizes chunks
+in a bounded worker pool and yields them in input order as soon as the
+head of the queue completes. Memory stays proportional to
+``chunk_size × max_pending`` rather than to the input size.
+
+State carried across chunks:
+
+- the language decision (detected once, on the first chunk);
+- the seed schedule (chunk *i* uses ``seed + i``, as before);
+- the sentence starter at each chunk boundary — a chunk whose first
+  sentence opens with the same word as the previous chunk's last
+  sentence gets it varied, the same way ``StructureDiversifier`` does
+  within a chunk.
+
+Usage:
+    >>> from texthumanize.streaming import StreamHumanizer
+    >>> with open("book.txt", encoding="utf-8") as f:
+    ...     for part in StreamHumanizer(lang="en", max_workers=4).stream(f):
+    ...         out.write(part["chunk"] + "\\n\\n")
+"""
+
+from __future__ import annotations
+
+import codecs
+import logging
+import os
+import random
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import IO, Any, Union
+
+from texthumanize.exceptions import ConfigError
+
+logger = logging.getLogger(__name__)
+
+Source = Union[str, Iterable[str], IO[str], IO[bytes]]
+
+_PARA_SEP = re.compile(r'\n\s*\n')
+_TRAILING_WS = re.compile(r'\s*\Z')
+_READ_BLOCK = 64 * 1024
+_EXECUTORS = ("thread", "process")
+
+
+def _iter_pieces(source: Source) -> Iterator[str]:
+    """Yield text pieces from a string, file-like object or iterable."""
+    if isinstance(source, str):
+        yield source
+        return
+    read = getattr(source, "read", None)
+    if callable(read):
+        decoder = None
+        while True:
+            block = read(_READ_BLOCK)
+            if not block:
+                break
+            if isinstance(block, bytes):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                block = decoder.decode(block)
+            yield block
+        if decoder is not None:
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+        return
+    for piece in source:
+        if isinstance(piece, bytes):
+            piece = piece.decode("utf-8")
+        yield piece
+
+
+def _iter_paragraphs(
+    pieces: Iterable[str], max_buffer: int,
+) -> Iterator[tuple[str, str]]:
+    """Split a stream of pieces into ``(paragraph, separator)`` pairs.
+
+    Splits on blank lines like ``re.split(r'\\n\\s*\\n', text)`` does,
+    without ever holding more than one paragraph (or *max_buffer*
+    characters) at a time. A separator followed only by whitespace may
+    still grow, so it is only consumed once more data arrives.
+
+    A paragraph longer than *max_buffer* is cut at its last line break
+    (or, failing that, sentence end); the pieces keep their original
+    separator.
+    """
+    buf = ""
+    for piece in pieces:
+        buf += piece
+        pos = 0
+        while True:
+            m = _PARA_SEP.search(buf, pos)
+            # Whitespace up to the end could still grow the separator.
+            if m is None or _TRAILING_WS.match(buf, m.end()):
+                break
+            yield buf[pos:m.start()], "\n\n"
+            pos = m.end()
+        buf = buf[pos:]
+        while len(buf) > max_buffer:
+            for sep in ("\n", ". "):
+                cut = buf.rfind(sep, 0, max_buffer)
+                if cut > 0:
+                    break
+            else:
+                break
+            yield buf[:cut + len(sep) - 1], sep[-1]
+            buf = buf[cut + len(sep):]
+    # Trailing separator: same result as re.split (an empty last item).
+    m = _PARA_SEP.search(buf)
+    while m is not None:
+        yield buf[:m.start()], "\n\n"
+        buf = buf[m.end():]
+        m = _PARA_SEP.search(buf)
+    yield buf, ""
+
+
+def _iter_chunks(
+    paragraphs: Iterable[tuple[str, str]], chunk_size: int,
+) -> Iterator[str]:
+    """Group paragraphs into chunks of roughly *chunk_size* characters."""
+    parts: list[str] = []
+    size = 0
+    for para, sep in paragraphs:
+        parts.append(para)
+        size += len(para)
+        if size >= chunk_size:
+            yield "".join(parts)
+            parts, size = [], 0
+        else:
+            parts.append(sep)
+    if parts:
+        parts.pop()  # separator after the last paragraph
+        yield "".join(parts)
+
+
+def _source_size(source: Source) -> tuple[int | None, str | None]:
+    """Best-effort input size (None if unknown) and the encoding it is in.
+
+    Strings are measured in characters (encoding None). Files are
+    measured in bytes, so consumed text has to be encoded with the
+    returned encoding (the file's own, UTF-8 for binary files) to
+    compare against the size.
+    """
+    if isinstance(source, str):
+        return len(source), None
+    fileno = getattr(source, "fileno", None)
+    if callable(fileno):
+        try:
+            size = os.fstat(fileno()).st_size
+        except (OSError, ValueError):
+            return None, None
+        return size or None, getattr(source, "encoding", None) or "utf-8"
+    return None, None
+
+
+def _humanize_chunk(
+    chunk: str,
+    lang: str,
+    profile: str,
+    intensity: int,
+    preserve: dict | None,
+    seed: int | None,
+) -> tuple[str, float]:
+    """Humanize one chunk (worker entry point, picklable)."""
+    from texthumanize.core import humanize
+
+    result = humanize(
+        chunk, lang=lang, profile=profile, intensity=intensity,
+        preserve=preserve, seed=seed,
+    )
+    return result.text, result.change_ratio
+
+
+class BoundarySmoother:
+    """Vary sentence starters repeated across chunk boundaries.
+
+    Chunks are fed in output order. A chunk whose first word equals the
+    starter of the previous chunk's last sentence gets it replaced by
+    one of the language pack's ``sentence_starters`` alternatives, the
+    same way ``StructureDiversifier`` does within a chunk. Used by
+    :class:`StreamHumanizer` and ``humanize_chunked``.
+
+    Args:
+        lang: Language code of the chunks.
+        seed: Seed for the choice of replacement.
+    """
+
+    def __init__(self, lang: str, seed: int | None = None) -> None:
+        from texthumanize.lang import get_lang_pack
+
+        self.lang = lang
+        self.rng = random.Random(seed)
+        self.starters: dict[str, list[str]] = get_lang_pack(lang).get(
+            "sentence_starters", {},
+        )
+        self.last_starter = ""
+
+    def smooth(self, text: str) -> str:
+        """Return *text* with a repeated boundary starter varied."""
+        body = text.lstrip()
+        lead = text[:len(text) - len(body)]
+        words = body.split(" ", 1)
+        first = words[0].rstrip(",.;:")
+        if (
+            first and first == self.last_starter
+            and first in self.starters and len(words) == 2
+        ):
+            text = lead + self.rng.choice(self.starters[first]) + " " + words[1]
+        self.last_starter = _last_starter(text, self.lang)
+        return text
+
+
+@dataclass
+class _StreamState:
+    """Cross-chunk state carried through one stream."""
+
+    lang: str
+    seed: int | None
+    seams: BoundarySmoother
+    index: int = 0
+
+    def seed_for(self, index: int) -> int | None:
+        return self.seed + index if self.seed is not None else None
+
+
+def _last_starter(text: str, lang: str) -> str:
+    from texthumanize.sentence_split import split_sentences
+
+    tail = text[-2000:]
+    sentences = split_sentences(tail, lang=lang)
+    if not sentences:
+        return ""
+    words = sentences[-1].split()
+    return words[0].rstrip(",.;:") if words else ""
+
+
+class StreamHumanizer:
+    """Humanize a text stream chunk by chunk with bounded memory.
+
+    Args:
+        lang: Language code ('auto' = detect once, on the first chunk).
+        profile: Processing profile.
+        intensity: Processing intensity (0-100).
+        preserve: Preservation settings.
+        seed: Base seed; chunk *i* uses ``seed + i``.
+        chunk_size: Approximate characters per chunk.
+        max_workers: Parallel workers (None/1 = process inline).
+        max_pending: Chunks segmented ahead of the output (defaults to
+            ``2 × max_workers``); bounds memory together with
+            *chunk_size*.
+        executor: ``"thread"`` (default) or ``"process"``.
+    """
+
+    def __init__(
+        self,
+        lang: str = "auto",
+        *,
+        profile: str = "web",
+        intensity: int = 60,
+        preserve: dict | None = None,
+        seed: int | None = None,
+        chunk_size: int = 500,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        executor: str = "thread",
+    ) -> None:
+        if executor not in _EXECUTORS:
+            raise ConfigError(
+                f"executor must be one of {_EXECUTORS}, got {executor!r}"
+            )
+        if chunk_size <= 0:
+            raise ConfigError(f"chunk_size must be > 0, got {chunk_size!r}")
+        self.lang = lang
+        self.profile = profile
+        self.intensity = intensity
+        self.preserve = preserve
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor = executor
+
+    def _state(self, first_chunk: str) -> _StreamState:
+        lang = self.lang
+        if lang == "auto":
+            from texthumanize.lang_detect import detect_language
+            lang = detect_language(first_chunk)
+        return _StreamState(
+            lang=lang, seed=self.seed, seams=BoundarySmoother(lang, self.seed),
+        )
+
+    def stream(self, source: Source) -> Iterator[dict[str, Any]]:
+        """Yield humanized chunks of *source* in input order.
+
+        Yields:
+            Dict with: chunk, original_chunk, chunk_index, total_chunks
+            (None until the last chunk for unsized sources), is_last,
+            progress (0.0-1.0, or None when the source size is unknown),
+            change_ratio, lang.
+        """
+        total_size, encoding = _source_size(source)
+        chunks = self._chunks(source)
+        first = next(chunks, None)
+        if first is None:
+            return
+        state = self._state(first)
+
+        def _all() -> Iterator[str]:
+            yield first
+            yield from chunks
+
+        # Count up front only when the whole input is already in memory.
+        total_chunks: int | None = None
+        if isinstance(source, str):
+            total_chunks = sum(1 for _ in self._chunks(source))
+
+        done = 0
+        for original, (text, ratio), is_last in self._ordered(_all(), state):
+            if encoding is None:
+                done += len(original)
+            else:
+                done += len(original.encode(encoding, "replace"))
+            idx = state.index
+            state.index += 1
+            if is_last:
+                total_chunks = idx + 1
+                progress: float | None = 1.0
+            elif total_size:
+                progress = min(1.0, done / total_size)
+            else:
+                progress = None
+            chunk = state.seams.smooth(text)
+            if chunk != text:
+                from texthumanize.diff_engine import change_ratio
+                ratio = change_ratio(original, chunk)
+            yield {
+                "chunk": chunk,
+                "chunk_index": idx,
+                "total_chunks": total_chunks,
+                "is_last": is_last,
+                "progress": progress,
+                "original_chunk": original,
+                "change_ratio": round(ratio, 4),
+                "lang": state.lang,
+            }
+
+    def _chunks(self, source: Source) -> Iterator[str]:
+        max_buffer = max(4 * self.chunk_size, 8192)
+        return _iter_chunks(
+            _iter_paragraphs(_iter_pieces(source), max_buffer),
+            self.chunk_size,
+        )
+
+    def _ordered(
+        self, chunks: Iterator[str], state: _StreamState,
+    ) -> Iterator[tuple[str, tuple[str, float], bool]]:
+        """Run chunks (inline or pooled) and yield results in order.
+
+        One chunk of look-ahead is kept so that ``is_last`` is known.
+        """
+        args = (state.lang, self.profile, self.intensity, self.preserve)
+        workers = self.max_workers or 1
+        nxt = next(chunks, None)
+        i = 0
+
+        if workers < 2:
+            while nxt is not None:
+                cur, nxt = nxt, next(chunks, None)
+                yield cur, _humanize_chunk(cur, *args, state.seed_for(i)), nxt is None
+                i += 1
+            return
+
+        limit = max(self.max_pending or 2 * workers, workers)
+        pool_cls: type[Executor] = (
+            ProcessPoolExecutor if self.executor == "process"
+            else ThreadPoolExecutor
+        )
+        pending: deque[tuple[str, Future]] = deque()
+        with pool_cls(max_workers=workers) as pool:
+            try:
+                while nxt is not None or pending:
+                    # Keep the window full, then wait only on the head.
+                    while nxt is not None and len(pending) < limit:
+                        fut = pool.submit(
+                            _humanize_chunk, nxt, *args, state.seed_for(i),
+                        )
+                        pending.append((nxt, fut))
+                        nxt = next(chunks, None)
+                        i += 1
+                    cur, fut = pending.popleft()
+                    yield cur, fut.result(), nxt is None and not pending
+            finally:
+                for _, fut in pending:
+                    fut.cancel()
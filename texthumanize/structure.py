@@ -6,7 +6,8 @@ import logging
 import random
 import re
 
-from texthumanize.lang import get_lang_pack
+from texthumanize.lang import compile_pack, get_lang_pack
+from texthumanize.rule_sets import compiled, word_pattern
 from texthumanize.segmenter import has_placeholder, skip_placeholder_sentence
 from texthumanize.sentence_split import split_sentences
 from texthumanize.utils import coin_flip, get_profile, intensity_probability
@@ -92,17 +93,22 @@ class StructureDiversifier:
 
     def _replace_ai_connectors(self, text: str, prob: float) -> str:
         """Заменить типичные ИИ-связки."""
-        connectors = self.lang_pack.get("ai_connectors", {})
+        connectors = compile_pack(self.lang_pack).ai_connectors
         replaced_count = 0
         max_replacements = max(3, len(connectors) // 2)
 
-        for connector, replacements in connectors.items():
+        for entry in connectors:
             if replaced_count >= max_replacements:
                 break
 
+            # Оба паттерна ниже регистрозависимы: без подстроки нет и совпадений
+            connector, replacements = entry.text, entry.replacements
+            if connector not in text:
+                continue
+
             # Ищем в начале предложения (после точки/начала текста)
             # Паттерн: начало строки или после .!? и пробела
-            pattern = re.compile(
+            pattern = compiled(
                 r'(?:^|(?<=[.!?]\s))' + re.escape(connector) + r'(?=[\s,])',
                 re.MULTILINE | re.UNICODE,
             )
@@ -110,10 +116,7 @@ class StructureDiversifier:
             matches = list(pattern.finditer(text))
             if not matches:
                 # Попробуем менее строгий паттерн
-                pattern = re.compile(
-                    r'\b' + re.escape(connector) + r'\b',
-                    re.UNICODE,
-                )
+                pattern = word_pattern(connector, re.UNICODE)
                 matches = list(pattern.finditer(text))
 
             if not matches:
@@ -26,6 +26,7 @@ import re
 from typing import Optional
 
 from texthumanize.pos_tagger import POSTagger
+from texthumanize.rule_sets import compiled
 
 logger = logging.getLogger(__name__)
 
@@ -1902,7 +1903,7 @@ class SyntaxRewriter:
         for conj in sorted(
             conjunctions, key=len, reverse=True,
         ):
-            patt = re.compile(
+            patt = compiled(
                 r'^(.+?),\s*'
                 + re.escape(conj)
                 + r'\s+(.+)$',
@@ -1929,7 +1930,7 @@ class SyntaxRewriter:
         for conj in sorted(
             conjunctions, key=len, reverse=True,
         ):
-            patt = re.compile(
+            patt = compiled(
                 r'^(.+?)\s+'
                 + re.escape(conj)
                 + r'\s+(.+)$',
@@ -2151,7 +2152,7 @@ class SyntaxRewriter:
 
         # Pattern: <nominalization> + genitive object
         for nom, verb in _RU_NOMINALIZATION.items():
-            pat = re.compile(
+            pat = compiled(
                 r'\b' + re.escape(nom) + r'\s+(\S+)',
                 re.IGNORECASE,
             )
@@ -2205,7 +2206,7 @@ class SyntaxRewriter:
         )
 
         for nom, verb in _UK_NOMINALIZATION.items():
-            pat = re.compile(
+            pat = compiled(
                 r'\b' + re.escape(nom) + r'\s+(\S+)',
                 re.IGNORECASE,
             )
@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 import random
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
 from typing import Any, TypedDict
 
 logger = logging.getLogger(__name__)
@@ -74,17 +73,13 @@ class HumanizeResult:
     def change_ratio(self) -> float:
         """Доля изменений в тексте (0..1).
 
-        Использует SequenceMatcher для корректного сравнения —
-        вставка/удаление одного слова не сдвигает все позиции.
+        Пословный diff (см. ``diff_engine``) — вставка/удаление одного
+        слова не сдвигает все позиции. Результат кэшируется по паре
+        текстов, повторные обращения бесплатны.
         """
-        if not self.original:
-            return 0.0
-        orig_words = self.original.split()
-        new_words = self.text.split()
-        if not orig_words:
-            return 0.0
-        matcher = SequenceMatcher(None, orig_words, new_words)
-        return min(1.0 - matcher.ratio(), 1.0)
+        from texthumanize.diff_engine import change_ratio
+
+        return change_ratio(self.original, self.text)
 
     @property
     def similarity(self) -> float:
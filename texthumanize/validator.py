@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import logging
 import re
-from difflib import SequenceMatcher
 
 from texthumanize.analyzer import TextAnalyzer
+from texthumanize.diff_engine import change_ratio
 from texthumanize.utils import AnalysisReport
 
 logger = logging.getLogger(__name__)
@@ -134,15 +134,8 @@ class QualityValidator:
             )
 
     def _calc_change_ratio(self, original: str, processed: str) -> float:
-        """Вычислить долю изменений (SequenceMatcher-based)."""
-        if not original:
-            return 0.0
-        orig_words = original.split()
-        proc_words = processed.split()
-        if not orig_words:
-            return 0.0
-        matcher = SequenceMatcher(None, orig_words, proc_words)
-        return min(1.0 - matcher.ratio(), 1.0)
+        """Вычислить долю изменений (memoized, см. ``diff_engine``)."""
+        return change_ratio(original, processed)
 
     def _extract_numbers(self, text: str) -> set[str]:
         """Извлечь числовые значения из текста."""
@@ -0,0 +1,218 @@
+"""Variant engine — several humanizations of one text for the price of ~one.
+
+``humanize_variants`` used to call the full ``humanize()`` plus a separate
+``detect_ai`` once per seed. Most of that work does not depend on the seed:
+input analysis, content classification, watermark cleaning, segmentation,
+typography and the baseline detection of the original text. The engine
+computes that prefix once in a :class:`~texthumanize.pipeline.SharedContext`,
+forks only the randomized stages per seed, and scores the variants through
+the same context.
+
+Usage:
+    >>> from texthumanize.variant_engine import VariantEngine
+    >>> engine = VariantEngine(lang="en", max_workers=4)
+    >>> best = engine.generate(text, variants=5, seed=1,
+    ...                        target_score=0.35, first_k=2)
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any
+
+from texthumanize.exceptions import ConfigError
+from texthumanize.pipeline import Pipeline, SharedContext
+from texthumanize.utils import HumanizeOptions, HumanizeResult
+
+logger = logging.getLogger(__name__)
+
+# Prime offset between variant seeds (kept for reproducibility of
+# seeds produced by earlier versions of humanize_variants).
+SEED_STEP = 7919
+
+_EXECUTORS = ("thread", "process")
+
+
+def _run_variant(
+    text: str,
+    lang: str,
+    options: HumanizeOptions,
+    shared: SharedContext,
+) -> tuple[HumanizeResult, float]:
+    """Humanize *text* with one seed and score it (worker entry point).
+
+    Module-level so that it can be pickled for process pools.
+    """
+    from texthumanize.core import _fix_slavic_grammar
+
+    result = Pipeline(options=options).run(text, lang, shared=shared)
+    result = _fix_slavic_grammar(result, lang)
+    score = shared.detect(result.text, lang, full=True).get("score", 0.0)
+    return result, float(score)
+
+
+class VariantEngine:
+    """Generate and rank humanization variants of a single text.
+
+    Args:
+        lang: Language code ('auto' detects once per text).
+        profile: Processing profile.
+        intensity: Processing intensity (0-100).
+        preserve: Preservation settings.
+        max_workers: Parallel workers (None/1 = sequential).
+        executor: ``"thread"`` (default; shares the context in memory) or
+            ``"process"`` (the primed context is pickled to each worker).
+    """
+
+    def __init__(
+        self,
+        lang: str = "auto",
+        profile: str = "web",
+        intensity: int = 60,
+        preserve: dict | None = None,
+        *,
+        max_workers: int | None = None,
+        executor: str = "thread",
+    ) -> None:
+        if executor not in _EXECUTORS:
+            raise ConfigError(
+                f"executor must be one of {_EXECUTORS}, got {executor!r}"
+            )
+        self.lang = lang
+        self.profile = profile
+        self.intensity = intensity
+        self.preserve = preserve
+        self.max_workers = max_workers
+        self.executor = executor
+
+    def _options(self, lang: str, seed: int) -> HumanizeOptions:
+        options = HumanizeOptions(
+            lang=lang, profile=self.profile,
+            intensity=self.intensity, seed=seed,
+        )
+        if self.preserve:
+            options.preserve.update(self.preserve)
+        return options
+
+    def generate(
+        self,
+        text: str,
+        *,
+        variants: int = 3,
+        seed: int | None = None,
+        target_score: float | None = None,
+        first_k: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Generate up to *variants* humanizations, best first.
+
+        Args:
+            text: Input text.
+            variants: Number of seeds to try (1-10).
+            seed: Base seed; variant *i* uses ``seed + i * SEED_STEP``.
+            target_score: AI score a variant must reach to count as a hit.
+            first_k: Stop as soon as this many variants are at or below
+                *target_score* (requires *target_score*). Pending seeds
+                are not run.
+
+        Returns:
+            List of dicts sorted by (ai_score, -quality_score), each with:
+            text, variant_id, seed_used, change_ratio, quality_score,
+            ai_score, changes_count, metrics_after.
+        """
+        from texthumanize.core import _check_humanize_input, _empty_humanize_result
+
+        variants = max(1, min(variants, 10))
+        if first_k is not None and target_score is None:
+            raise ConfigError("first_k requires target_score")
+
+        base_seed = seed if seed is not None else random.randint(0, 2**31)
+        seeds = [base_seed + i * SEED_STEP for i in range(variants)]
+
+        # Same input contract as humanize(); blank text comes back as is.
+        if not _check_humanize_input(text):
+            empty = _empty_humanize_result(text, self.lang, self.profile, self.intensity)
+            return self._rank({idx: (empty, 0.0) for idx in range(variants)}, seeds)
+
+        lang = self.lang
+        if lang == "auto":
+            from texthumanize.lang_detect import detect_language
+            lang = detect_language(text)
+
+        # Seed-independent prefix + baseline detection, computed once.
+        shared = SharedContext()
+        Pipeline(options=self._options(lang, base_seed)).prime(text, lang, shared)
+        shared.detect(text, lang, full=True)
+
+        scored: dict[int, tuple[HumanizeResult, float]] = {}
+        hits = 0
+
+        def _done(idx: int, item: tuple[HumanizeResult, float]) -> bool:
+            nonlocal hits
+            scored[idx] = item
+            if target_score is not None and item[1] <= target_score:
+                hits += 1
+            return first_k is not None and hits >= first_k
+
+        workers = self.max_workers or 1
+        if workers < 2 or variants == 1:
+            for idx, s in enumerate(seeds):
+                if _done(idx, _run_variant(text, lang, self._options(lang, s), shared)):
+                    break
+        else:
+            pool_cls: type[Executor] = (
+                ProcessPoolExecutor if self.executor == "process"
+                else ThreadPoolExecutor
+            )
+            with pool_cls(max_workers=workers) as pool:
+                # Sliding window: at most `workers` seeds in flight, so an
+                # early stop leaves the remaining seeds unstarted.
+                pending: dict[Future, int] = {}
+                queue = list(enumerate(seeds))
+                stop = False
+                while (queue or pending) and not stop:
+                    while queue and len(pending) < workers:
+                        idx, s = queue.pop(0)
+                        fut = pool.submit(
+                            _run_variant, text, lang, self._options(lang, s), shared,
+                        )
+                        pending[fut] = idx
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        idx = pending.pop(fut)
+                        if _done(idx, fut.result()):
+                            stop = True
+                for fut in pending:
+                    fut.cancel()
+
+        return self._rank(scored, seeds)
+
+    @staticmethod
+    def _rank(
+        scored: dict[int, tuple[HumanizeResult, float]], seeds: list[int],
+    ) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        for idx in sorted(scored):
+            result, score = scored[idx]
+            results.append({
+                "text": result.text,
+                "variant_id": idx + 1,
+                "seed_used": seeds[idx],
+                "change_ratio": round(result.change_ratio, 4),
+                "quality_score": round(result.quality_score, 4),
+                "ai_score": round(score, 4),
+                "changes_count": len(result.changes),
+                "metrics_after": result.metrics_after,
+            })
+
+        # Sort by quality: low AI score + high quality score
+        results.sort(key=lambda r: (r["ai_score"], -r["quality_score"]))
+        return results
@@ -21,6 +21,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
+from texthumanize.sentence_split import split_sentences
+
 __all__ = [
     "TextVisualizer",
     "VisualizationResult",
@@ -75,10 +77,9 @@ def _c(color: str, text: str, use_color: bool = True) -> str:
 #  УТИЛИТЫ
 # ═══════════════════════════════════════════════════════════════
 
-def _split_sentences(text: str) -> list[str]:
-    """Базовое разбиение на предложения."""
-    parts = re.split(r'(?<=[.!?])\s+', text.strip())
-    return [p for p in parts if p.strip()]
+def _split_sentences(text: str, lang: str = "en") -> list[str]:
+    """Разбиение на предложения общим (кэшируемым) сплиттером."""
+    return split_sentences(text, lang=lang)
 
 
 def _tokenize(text: str) -> list[str]:
@@ -182,7 +183,7 @@ def perplexity_chart(
     """
     # Попробуем использовать PerplexitySculptor для реальных значений
     per_sentence_ppls: list[float] = []
-    sentences = _split_sentences(text)
+    sentences = _split_sentences(text, lang)
 
     try:
         from texthumanize.perplexity_sculptor import PerplexitySculptor
@@ -279,7 +280,7 @@ def detection_heatmap(
     Каждому предложению присваивается score 0.0-1.0 и отображается как
     символ интенсивности. Высокие score = больше AI-характеристик.
     """
-    sentences = _split_sentences(text)
+    sentences = _split_sentences(text, lang)
     if not sentences:
         return VisualizationResult(text=text, chart="(текст пустой)", data={})
 
@@ -373,6 +374,7 @@ def detection_heatmap(
 def sentence_length_chart(
     text: str,
     *,
+    lang: str = "en",
     width: int = 50,
     use_color: bool = False,
 ) -> VisualizationResult:
@@ -381,7 +383,7 @@ def sentence_length_chart(
 
     AI-тексты часто имеют малую вариацию длин.
     """
-    sentences = _split_sentences(text)
+    sentences = _split_sentences(text, lang)
     if not sentences:
         return VisualizationResult(text=text, chart="(текст пустой)", data={})
 
@@ -579,8 +581,8 @@ def comparison_chart(
     lines.append("")
 
     # Перплексия
-    sent_before = _split_sentences(text_before)
-    sent_after = _split_sentences(text_after)
+    sent_before = _split_sentences(text_before, lang)
+    sent_after = _split_sentences(text_after, lang)
     ppl_b = [_word_perplexity(s) for s in sent_before]
     ppl_a = [_word_perplexity(s) for s in sent_after]
 
@@ -714,7 +716,7 @@ def dashboard(
     lines.append(f"  ╚{'═' * 62}╝")
     lines.append("")
 
-    sentences = _split_sentences(text)
+    sentences = _split_sentences(text, lang)
     tokens = _tokenize(text)
 
     # Базовая статистика
@@ -828,7 +830,7 @@ class TextVisualizer:
     def lengths(self, text: str, **kw: Any) -> VisualizationResult:
         """Распределение длин предложений."""
         return sentence_length_chart(
-            text, use_color=self.use_color, **kw
+            text, lang=self.lang, use_color=self.use_color, **kw
         )
 
     def diversity(self, text: str, **kw: Any) -> VisualizationResult:
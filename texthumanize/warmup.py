@@ -0,0 +1,195 @@
+"""Pre-fork warmup for multi-worker servers.
+
+Models and tables are lazy per-process singletons (detector MLP, char
+LSTM, transformer detector, word vectors, HMM taggers, synonym
+database, language packs). A server that forks workers — the built-in
+API server with ``workers > 1``, gunicorn with ``preload_app``, uWSGI
+without ``lazy-apps`` — should build them once in the parent, so the
+pages are shared copy-on-write and no worker pays first-request
+latency.
+
+:func:`warmup` loads the requested components and then:
+
+- packs the large numeric weights into contiguous buffers (float32
+  NumPy arrays, or ``array('d')`` rows without NumPy). A weight kept
+  as a list of Python floats is one refcounted object per number, and
+  merely reading it in a worker writes to (and so copies) its page;
+- calls :func:`gc.freeze`, so collections in the workers never touch
+  the parent's objects. The collector is paused while loading, so the
+  frozen heap has no freed holes for workers to fill.
+
+Usage::
+
+    import texthumanize
+    texthumanize.warmup(langs=["en", "ru"])
+
+    # gunicorn.conf.py
+    preload_app = True
+
+    def on_starting(server):
+        import texthumanize
+        texthumanize.warmup(langs=["en", "ru"])
+
+Shared vs private memory per worker:
+``python benchmarks/prefork_memory.py --workers 4``.
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from texthumanize.exceptions import ConfigError
+
+logger = logging.getLogger(__name__)
+
+_MODULES = (
+    "texthumanize.core",
+    "texthumanize.pipeline",
+    "texthumanize.analyzer",
+    "texthumanize.detectors",
+    "texthumanize.statistical_detector",
+    "texthumanize.neural_detector",
+    "texthumanize.neural_lm",
+)
+
+
+def _load_modules(langs: Sequence[str]) -> None:
+    for name in _MODULES:
+        importlib.import_module(name)
+
+
+def _load_lang(langs: Sequence[str]) -> None:
+    from texthumanize.lang import get_lang_pack
+
+    for lang in langs:
+        get_lang_pack(lang)
+
+
+def _load_word_lm(langs: Sequence[str]) -> None:
+    from texthumanize.word_lm import get_word_lm
+
+    for lang in langs:
+        get_word_lm(lang)
+
+
+def _load_detector(langs: Sequence[str]) -> None:
+    from texthumanize.neural_detector import _get_network
+
+    _get_network().pack()
+
+
+def _load_lm(langs: Sequence[str]) -> None:
+    from texthumanize.neural_lm import get_neural_lm
+
+    get_neural_lm().pack()
+
+
+def _load_transformer(langs: Sequence[str]) -> None:
+    # Requires NumPy; its weights already are contiguous arrays.
+    from texthumanize.transformer_detector import get_transformer_detector
+
+    get_transformer_detector()
+
+
+def _load_word_vec(langs: Sequence[str]) -> None:
+    from texthumanize.word_embeddings import get_word_vec
+
+    get_word_vec()
+
+
+def _load_hmm(langs: Sequence[str]) -> None:
+    from texthumanize.hmm_tagger import get_hmm_tagger
+
+    for lang in langs:
+        get_hmm_tagger(lang)
+
+
+def _load_synonyms(langs: Sequence[str]) -> None:
+    from texthumanize._synonym_db import SynonymDB
+
+    SynonymDB()
+
+
+COMPONENTS: dict[str, Callable[[Sequence[str]], None]] = {
+    "modules": _load_modules,
+    "lang": _load_lang,
+    "word_lm": _load_word_lm,
+    "detector": _load_detector,
+    "lm": _load_lm,
+    "transformer": _load_transformer,
+    "word_vec": _load_word_vec,
+    "hmm": _load_hmm,
+    "synonyms": _load_synonyms,
+}
+
+
+@dataclass
+class WarmupReport:
+    """What :func:`warmup` loaded and how long each component took."""
+
+    seconds: dict[str, float] = field(default_factory=dict)
+    skipped: dict[str, str] = field(default_factory=dict)
+    frozen: int = 0
+
+    @property
+    def total(self) -> float:
+        return sum(self.seconds.values())
+
+
+def warmup(
+    langs: Sequence[str] = ("en",),
+    components: Sequence[str] | None = None,
+    *,
+    freeze: bool = True,
+) -> WarmupReport:
+    """Load models and tables into this process before forking workers.
+
+    Args:
+        langs: Languages whose packs, word LMs and HMM taggers to load.
+        components: Subset of :data:`COMPONENTS` (default: all).
+        freeze: Move everything into the permanent GC generation
+            (:func:`gc.freeze`). Call it only in the parent, right
+            before forking.
+
+    Returns:
+        Per-component load time; components whose optional dependency
+        is missing (``transformer`` needs NumPy) are listed in
+        ``skipped`` instead of failing the warmup.
+    """
+    names = list(COMPONENTS) if components is None else list(components)
+    unknown = sorted(set(names) - set(COMPONENTS))
+    if unknown:
+        raise ConfigError(
+            f"unknown warmup component(s): {', '.join(unknown)}; "
+            f"available: {', '.join(COMPONENTS)}"
+        )
+
+    report = WarmupReport()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for name in names:
+            start = time.perf_counter()
+            try:
+                COMPONENTS[name](langs)
+            except ImportError as e:
+                report.skipped[name] = str(e)
+                logger.info("warmup: %s skipped (%s)", name, e)
+                continue
+            report.seconds[name] = time.perf_counter() - start
+    finally:
+        if was_enabled:
+            gc.enable()
+    if freeze:
+        gc.freeze()
+        report.frozen = gc.get_freeze_count()
+    logger.info(
+        "warmup: %d components in %.2fs, %d objects frozen",
+        len(report.seconds), report.total, report.frozen,
+    )
+    return report
@@ -13,7 +13,9 @@ import logging
 import math
 import re
 import unicodedata
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +110,59 @@ _TYPOGRAPHY_NORMALIZE = {
 }
 
 
+_ZW_RE = re.compile('[' + ''.join(sorted(_ZERO_WIDTH_CHARS)) + ']')
+
+# Позиции, которые вообще могут что-то изменить: всё не-ASCII плюс (для
+# кириллического текста) латинские двойники кириллицы. Чистый ASCII-текст
+# на латинице сканировать не нужно.
+_SCAN_LATIN_TEXT = re.compile(r'[^\x00-\x7f]')
+_SCAN_CYRILLIC_TEXT = re.compile(
+    r'[^\x00-\x7f]|[' + ''.join(sorted(_LATIN_TO_CYRILLIC)) + ']'
+)
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+@lru_cache(maxsize=8192)
+def _is_format_char(ch: str) -> bool:
+    return unicodedata.category(ch) == 'Cf'
+
+
+def _in_script(ch: str, script: str) -> bool:
+    """Check if the Unicode name of *ch* mentions *script*."""
+    if not ch or ch.isspace():
+        return False
+    try:
+        return script in unicodedata.name(ch, '')
+    except (ValueError, TypeError):
+        return False
+
+
+@lru_cache(maxsize=8192)
+def _char_is_cyrillic(ch: str) -> bool:
+    return _in_script(ch, 'CYRILLIC')
+
+
+@lru_cache(maxsize=8192)
+def _char_is_latin(ch: str) -> bool:
+    return _in_script(ch, 'LATIN')
+
+
+@lru_cache(maxsize=16384)
+def _token_seed(token: str) -> int:
+    return int(hashlib.sha256(token.encode("utf-8")).hexdigest()[:8], 16)
+
+
+# Kirchenbauer verdicts are shared across documents (bulk scans repeat
+# the same bigrams over and over).
+@lru_cache(maxsize=131072)
+def _green(prev_token: str, token: str, gamma: float) -> bool:
+    """Kirchenbauer partition: is *token* green after *prev_token*?"""
+    combined = f"{_token_seed(prev_token)}:{token}"
+    h = int(hashlib.sha256(combined.encode("utf-8")).hexdigest()[:8], 16)
+    return (h % 10000) / 10000.0 < gamma
+
+
 class WatermarkDetector:
     """Обнаружение и удаление водяных знаков."""
 
@@ -126,26 +181,21 @@ class WatermarkDetector:
         report = WatermarkReport()
         report.cleaned_text = text
 
-        # 1. Zero-width characters
-        self._detect_zero_width(text, report)
-
-        # 2. Homoglyphs
-        self._detect_homoglyphs(text, report)
-
-        # 3. Invisible Unicode characters
-        self._detect_invisible(text, report)
+        # 1-3. Zero-width, homoglyphs, invisible Unicode — one scan
+        self._scan_characters(text, report)
 
         # 4. Unusual spacing patterns
         self._detect_spacing_anomalies(text, report)
 
         # 5. Statistical watermark patterns
-        self._detect_statistical_watermarks(text, report)
+        words = _WORD_RE.findall(text.lower())
+        self._detect_statistical_watermarks(text, report, words)
 
         # 6. C2PA / IPTC metadata markers
         self._detect_metadata_markers(text, report)
 
         # 7. Kirchenbauer-style green-list watermark (statistical z-test)
-        self._detect_kirchenbauer(text, report)
+        self._detect_kirchenbauer(text, report, words)
 
         # Determine overall result
         report.has_watermarks = len(report.watermark_types) > 0
@@ -172,79 +222,62 @@ class WatermarkDetector:
         return report.cleaned_text
 
     # ───────────────────────────────────────────────────────────
-    #  ZERO-WIDTH
+    #  CHARACTER SCAN (zero-width, homoglyphs, invisible)
     # ───────────────────────────────────────────────────────────
 
-    def _detect_zero_width(self, text: str, report: WatermarkReport) -> None:
-        count = 0
-        cleaned = []
+    def _scan_characters(self, text: str, report: WatermarkReport) -> None:
+        """Zero-width, homoglyph and invisible-character checks in one scan.
 
-        for ch in text:
-            if ch in _ZERO_WIDTH_CHARS:
-                count += 1
-            else:
-                cleaned.append(ch)
-
-        if count > 0:
+        Zero-width characters are dropped first (one regex ``subn``);
+        only positions that can change anything (see ``_SCAN_*``) are
+        then visited. Positions in ``homoglyphs_found`` and the
+        neighbour context refer to the text without zero-width
+        characters, and a neighbour already substituted counts in its
+        substituted form.
+        """
+        chars, zw_count = _ZW_RE.subn('', text)
+        if zw_count:
             report.watermark_types.append("zero_width_characters")
             report.details.append(
-                f"Found {count} zero-width/invisible characters"
+                f"Found {zw_count} zero-width/invisible characters"
             )
-            report.zero_width_count = count
-            report.characters_removed += count
-            report.cleaned_text = "".join(cleaned)
+            report.zero_width_count = zw_count
+            report.characters_removed += zw_count
 
-    # ───────────────────────────────────────────────────────────
-    #  HOMOGLYPHS
-    # ───────────────────────────────────────────────────────────
-
-    def _detect_homoglyphs(self, text: str, report: WatermarkReport) -> None:
-        # Determine expected script
         is_cyrillic = self.lang in ("ru", "uk")
+        if is_cyrillic:
+            lookalikes, in_script = _LATIN_TO_CYRILLIC, _char_is_cyrillic
+            scan = _SCAN_CYRILLIC_TEXT
+        else:
+            lookalikes, in_script = _CYRILLIC_TO_LATIN, _char_is_latin
+            scan = _SCAN_LATIN_TEXT
 
         homoglyphs: list[tuple[str, str, int]] = []
-        typography_normalized = 0
-        chars = list(report.cleaned_text)
-
-        for i, ch in enumerate(chars):
-            if is_cyrillic:
-                # В кириллическом тексте ищем латинские подмены
-                if ch in _LATIN_TO_CYRILLIC:
-                    # Проверяем контекст: если соседи — кириллица, то это подмена
-                    left = chars[i - 1] if i > 0 else ' '
-                    right = chars[i + 1] if i < len(chars) - 1 else ' '
-                    if self._is_cyrillic(left) or self._is_cyrillic(right):
-                        expected = _LATIN_TO_CYRILLIC[ch]
-                        homoglyphs.append((ch, expected, i))
-                        chars[i] = expected
-            else:
-                # В латинском тексте ищем кириллические подмены
-                if ch in _CYRILLIC_TO_LATIN:
-                    left = chars[i - 1] if i > 0 else ' '
-                    right = chars[i + 1] if i < len(chars) - 1 else ' '
-                    if self._is_latin(left) or self._is_latin(right):
-                        expected = _CYRILLIC_TO_LATIN[ch]
-                        homoglyphs.append((ch, expected, i))
-                        chars[i] = expected
-
-            # Suspicious homoglyphs (fullwidth, math, etc.) → count as watermark
-            if ch in _SPECIAL_HOMOGLYPHS:
-                expected = _SPECIAL_HOMOGLYPHS[ch]
-                if ch != expected:
+        replaced: dict[int, str] = {}
+        dropped: list[int] = []
+        last = len(chars) - 1
+
+        for m in scan.finditer(chars):
+            i = m.start()
+            ch = chars[i]
+            if ch in lookalikes:
+                # Подмена, если сосед — буква ожидаемого алфавита
+                left = replaced.get(i - 1, chars[i - 1]) if i > 0 else ' '
+                right = chars[i + 1] if i < last else ' '
+                if in_script(left) or in_script(right):
+                    expected = lookalikes[ch]
                     homoglyphs.append((ch, expected, i))
-                    chars[i] = expected
-
-            # Typography normalization (curly quotes, dashes, spaces) → clean only
-            if ch in _TYPOGRAPHY_NORMALIZE:
-                expected = _TYPOGRAPHY_NORMALIZE[ch]
-                if ch != expected:
-                    typography_normalized += 1
-                    chars[i] = expected
-
-        # Always normalize the text (typography + real homoglyphs)
-        report.cleaned_text = "".join(chars)
+                    replaced[i] = expected
+            elif ch in _SPECIAL_HOMOGLYPHS:
+                expected = _SPECIAL_HOMOGLYPHS[ch]
+                homoglyphs.append((ch, expected, i))
+                replaced[i] = expected
+            elif ch in _TYPOGRAPHY_NORMALIZE:
+                # Typography normalization → clean only, not evidence
+                replaced[i] = _TYPOGRAPHY_NORMALIZE[ch]
+            elif _is_format_char(ch):
+                dropped.append(i)
 
-        # Only flag as watermark if actual suspicious homoglyphs found
         if homoglyphs:
             report.watermark_types.append("homoglyph_substitution")
             report.homoglyphs_found = homoglyphs
@@ -253,34 +286,21 @@ class WatermarkDetector:
             )
             report.characters_removed += len(homoglyphs)
 
-    # ───────────────────────────────────────────────────────────
-    #  INVISIBLE UNICODE
-    # ───────────────────────────────────────────────────────────
-
-    def _detect_invisible(self, text: str, report: WatermarkReport) -> None:
-        """Detect invisible Unicode characters by category."""
-        count = 0
-        cleaned = []
-
-        for ch in report.cleaned_text:
-            cat = unicodedata.category(ch)
-            # Allow normal whitespace and newlines
-            if ch in ('\n', '\r', '\t', ' '):
-                cleaned.append(ch)
-                continue
-            # Detect format characters (Cf) that aren't zero-width (already handled)
-            if cat in ('Cf',) and ch not in _ZERO_WIDTH_CHARS:
-                count += 1
-            else:
-                cleaned.append(ch)
-
-        if count > 0:
+        if dropped:
             report.watermark_types.append("invisible_unicode")
             report.details.append(
-                f"Found {count} invisible Unicode format characters"
+                f"Found {len(dropped)} invisible Unicode format characters"
             )
-            report.characters_removed += count
-            report.cleaned_text = "".join(cleaned)
+            report.characters_removed += len(dropped)
+
+        if replaced or dropped:
+            out = list(chars)
+            for i, new in replaced.items():
+                out[i] = new
+            for i in dropped:
+                out[i] = ''
+            chars = ''.join(out)
+        report.cleaned_text = chars
 
     # ───────────────────────────────────────────────────────────
     #  SPACING ANOMALIES
@@ -325,14 +345,16 @@ class WatermarkDetector:
     # ───────────────────────────────────────────────────────────
 
     def _detect_statistical_watermarks(
-        self, text: str, report: WatermarkReport
+        self, text: str, report: WatermarkReport,
+        words: list[str] | None = None,
     ) -> None:
         """Detect statistical watermark patterns used by AI systems.
 
         Some AI watermarking schemes bias token selection toward
         "green list" tokens. This manifests as unusual bigram distributions.
         """
-        words = re.findall(r'\b\w+\b', text.lower())
+        if words is None:
+            words = _WORD_RE.findall(text.lower())
         if len(words) < 50:
             return
 
@@ -343,7 +365,6 @@ class WatermarkDetector:
         # 1. Check if word endings are suspiciously uniform
         endings_2 = [w[-2:] for w in words if len(w) > 3]
         if endings_2:
-            from collections import Counter
             ending_counts = Counter(endings_2)
             total = len(endings_2)
             # If any 2-char ending appears in >15% of words (unusual)
@@ -442,6 +463,7 @@ class WatermarkDetector:
 
     def _detect_kirchenbauer(
         self, text: str, report: WatermarkReport,
+        words: list[str] | None = None,
     ) -> None:
         """Detect Kirchenbauer-style LLM watermarks via green-list z-test.
 
@@ -455,8 +477,12 @@ class WatermarkDetector:
         This implementation is model-agnostic: it uses word-level tokens
         and a universal hash, so it catches *any* green-list scheme
         regardless of the specific LLM that generated the text.
+
+        Each distinct bigram is hashed once; the green/red verdict is
+        memoized across documents.
         """
-        words = re.findall(r'\b\w+\b', text.lower())
+        if words is None:
+            words = _WORD_RE.findall(text.lower())
         n_tokens = len(words)
         if n_tokens < 30:
             return
@@ -464,23 +490,9 @@ class WatermarkDetector:
         gamma = self._GREEN_GAMMA
         green_count = 0
 
-        for i in range(1, n_tokens):
-            prev_token = words[i - 1]
-            curr_token = words[i]
-            # Hash previous token to get a seed for the partition
-            seed = int(
-                hashlib.sha256(prev_token.encode("utf-8")).hexdigest()[:8],
-                16,
-            )
-            # Hash current token with the seed to determine green/red
-            combined = f"{seed}:{curr_token}"
-            h = int(
-                hashlib.sha256(combined.encode("utf-8")).hexdigest()[:8],
-                16,
-            )
-            # Token is "green" if hash falls in the lower γ fraction
-            if (h % 10000) / 10000.0 < gamma:
-                green_count += 1
+        for (prev_token, curr_token), n in Counter(zip(words, words[1:])).items():
+            if _green(prev_token, curr_token, gamma):
+                green_count += n
 
         total = n_tokens - 1  # we skip the first token
         if total < 1:
@@ -514,24 +526,12 @@ class WatermarkDetector:
     @staticmethod
     def _is_cyrillic(ch: str) -> bool:
         """Check if character is Cyrillic."""
-        if not ch or ch.isspace():
-            return False
-        try:
-            name = unicodedata.name(ch, '')
-            return 'CYRILLIC' in name
-        except (ValueError, TypeError):
-            return False
+        return _in_script(ch, 'CYRILLIC')
 
     @staticmethod
     def _is_latin(ch: str) -> bool:
         """Check if character is Latin."""
-        if not ch or ch.isspace():
-            return False
-        try:
-            name = unicodedata.name(ch, '')
-            return 'LATIN' in name
-        except (ValueError, TypeError):
-            return False
+        return _in_script(ch, 'LATIN')
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -34,12 +34,6 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-from texthumanize._word_freq_data import (
-    get_en_uni,
-    get_ru_uni,
-    get_uk_uni,
-)
-
 logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════
@@ -434,6 +428,8 @@ class WatermarkForensics:
 
     def _load_vocab(self, lang: str) -> set[str]:
         """Load vocabulary for the language."""
+        from texthumanize._word_freq_data import get_en_uni, get_ru_uni, get_uk_uni
+
         loaders = {
             "en": get_en_uni,
             "ru": get_ru_uni,
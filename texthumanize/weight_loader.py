@@ -23,16 +23,27 @@ def _load_weight_file(name: str) -> Any | None:
         logger.debug("Weight file not found: %s", path)
         return None
     try:
-        with open(path) as f:
-            blob = f.read()
-        data = decompress_weights(blob)
-        logger.info("Loaded weights from %s (%d bytes)", name, len(blob))
-        return data
+        from texthumanize import neural_engine
+        from texthumanize.snapshot import cached
+
+        # Decoding (base85 + zlib + JSON) dominates a cold start.
+        return cached(
+            f"weights-{name}", lambda: _decode_weight_file(path),
+            sources=[path, __file__, neural_engine.__file__],
+        )
     except Exception as e:
         logger.warning("Failed to load weights %s: %s", name, e)
         return None
 
 
+def _decode_weight_file(path: str) -> Any:
+    with open(path) as f:
+        blob = f.read()
+    data = decompress_weights(blob)
+    logger.info("Loaded weights from %s (%d bytes)", os.path.basename(path), len(blob))
+    return data
+
+
 def load_detector_weights() -> Any | None:
     """Load pre-trained MLP detector weights."""
     return _load_weight_file("detector_weights.json.zb85")
@@ -41,3 +52,9 @@ def load_detector_weights() -> Any | None:
 def load_lm_weights() -> Any | None:
     """Load pre-trained LSTM language model weights."""
     return _load_weight_file("lm_weights.json.zb85")
+
+
+def load_all_weights() -> dict[str, Any]:
+    """Load every compressed weight file (used to prebuild the snapshot)."""
+    names = sorted(n for n in os.listdir(_WEIGHTS_DIR) if n.endswith(".zb85"))
+    return {name: _load_weight_file(name) for name in names}
@@ -13,6 +13,8 @@ Architecture:
     - Hash-based embedding with collision resolution
     - 50-dim vectors with frequency-weighted averaging
     - Cosine similarity for text comparison
+    - NumPy matrix ops when available (pure-Python fallback); hash
+      vectors of unknown words are memoized
 
 Usage::
 
@@ -26,13 +28,23 @@ from __future__ import annotations
 
 import logging
 import math
+import operator
 import re
+from collections import Counter
 from typing import Any
 
+from texthumanize.cache import memo_cache
 from texthumanize.sentence_split import split_sentences
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+    np = None  # type: ignore[assignment]
+
 _WORD_RE = re.compile(r'[a-zA-Zа-яА-ЯёЁіїєґІЇЄҐ]+')
 _DIM = 50
 
@@ -58,8 +70,26 @@ def _simple_hash(s: str, seed: int = 0) -> int:
     return h
 
 
+_HASH_VECTORS = memo_cache("word_embeddings.hash_vector", max_entries=20_000)
+
+# semantic_preservation: each original sentence is matched against the
+# modified sentences near its relative position (±max(MIN, FRAC·m)).
+_BAND_MIN = 5
+_BAND_FRAC = 0.25
+
+
 def _hash_vector(word: str, dim: int = _DIM) -> list[float]:
     """Generate a deterministic pseudo-random vector for a word."""
+    return list(_cached_hash_vector(word, dim))
+
+
+def _cached_hash_vector(word: str, dim: int = _DIM) -> tuple[float, ...]:
+    return _HASH_VECTORS.get_or_compute(
+        (word, dim), lambda: tuple(_build_hash_vector(word, dim)),
+    )
+
+
+def _build_hash_vector(word: str, dim: int) -> list[float]:
     vec = []
     base_hash = _simple_hash(word, seed=42)
     for i in range(dim):
@@ -197,14 +227,18 @@ def _build_cluster_embeddings() -> dict[str, list[float]]:
     return embeddings
 
 
-# Built at module load (fast — small set, pure computation)
+# Built on first use and kept in the warm snapshot (texthumanize.snapshot)
 _CLUSTER_EMBEDDINGS: dict[str, list[float]] | None = None
 
 
 def _get_embeddings() -> dict[str, list[float]]:
     global _CLUSTER_EMBEDDINGS
     if _CLUSTER_EMBEDDINGS is None:
-        _CLUSTER_EMBEDDINGS = _build_cluster_embeddings()
+        from texthumanize.snapshot import cached
+
+        _CLUSTER_EMBEDDINGS = cached(
+            "embeddings", _build_cluster_embeddings, sources=[__file__],
+        )
     return _CLUSTER_EMBEDDINGS
 
 
@@ -242,6 +276,21 @@ class WordVec:
             return vec
         return _hash_vector(w, self._dim)
 
+    def _vector(self, token: str) -> list[float] | tuple[float, ...]:
+        """Read-only vector of a lower-cased token (no copy)."""
+        vec = self._embeddings.get(token)
+        return vec if vec is not None else _cached_hash_vector(token, self._dim)
+
+    def _weight(self, token: str, use_idf: bool) -> float:
+        if not use_idf:
+            return 1.0
+        # Known common words get lower weight
+        weight = 0.5 if token in self._embeddings else 1.0
+        # Very short words (articles, etc.) get low weight
+        if len(token) <= 2:
+            weight *= 0.3
+        return weight
+
     def word_similarity(self, word1: str, word2: str) -> float:
         """Cosine similarity between two words."""
         return _cosine_sim(self.word_vector(word1), self.word_vector(word2))
@@ -257,34 +306,26 @@ class WordVec:
         if not tokens:
             return [0.0] * self._dim
 
-        # IDF proxy: rare words (not in top embeddings) get higher weight
-        vectors: list[tuple[float, list[float]]] = []
-        for token in tokens:
-            vec = self.word_vector(token)
-            if use_idf:
-                # Known common words get lower weight
-                if token in self._embeddings:
-                    weight = 0.5  # Known = likely common
-                else:
-                    weight = 1.0  # Unknown = likely distinctive
-                # Very short words (articles, etc.) get low weight
-                if len(token) <= 2:
-                    weight *= 0.3
-            else:
-                weight = 1.0
-            vectors.append((weight, vec))
-
-        # Weighted average
-        avg = [0.0] * self._dim
-        total_weight = sum(w for w, _ in vectors)
+        # IDF proxy: rare words (not in top embeddings) get higher weight;
+        # repeated tokens are weighted once by their count.
+        counts = Counter(tokens)
+        weights = [self._weight(t, use_idf) * n for t, n in counts.items()]
+        total_weight = sum(weights)
         if total_weight == 0:
-            return avg
+            return [0.0] * self._dim
 
-        for weight, vec in vectors:
-            for d in range(self._dim):
-                avg[d] += weight * vec[d]
-        for d in range(self._dim):
-            avg[d] /= total_weight
+        if _HAS_NUMPY:
+            mat = np.array([self._vector(t) for t in counts])
+            avg_arr = np.asarray(weights) @ mat / total_weight
+            norm = float(np.linalg.norm(avg_arr))
+            if norm > 0:
+                avg_arr /= norm
+            return avg_arr.tolist()
+
+        avg = [0.0] * self._dim
+        for weight, token in zip(weights, counts):
+            avg = [a + weight * v for a, v in zip(avg, self._vector(token))]
+        avg = [a / total_weight for a in avg]
 
         # Normalize
         norm = math.sqrt(sum(v * v for v in avg))
@@ -316,15 +357,10 @@ class WordVec:
         orig_sents = split_sentences(original.strip())
         mod_sents = split_sentences(modified.strip())
 
-        sent_sims: list[float] = []
-        for os in orig_sents:
-            if len(os.strip()) < 5:
-                continue
-            best_sim = max(
-                (self.sentence_similarity(os, ms) for ms in mod_sents if len(ms.strip()) > 5),
-                default=0.0,
-            )
-            sent_sims.append(best_sim)
+        sent_sims = self._best_matches(
+            [s for s in orig_sents if len(s.strip()) >= 5],
+            [s for s in mod_sents if len(s.strip()) > 5],
+        )
 
         avg_sent_sim = sum(sent_sims) / len(sent_sims) if sent_sims else 0.0
         min_sent_sim = min(sent_sims) if sent_sims else 0.0
@@ -348,6 +384,42 @@ class WordVec:
             "n_sentences_modified": len(mod_sents),
         }
 
+    def _best_matches(self, originals: list[str], modified: list[str]) -> list[float]:
+        """Best similarity of each original sentence to a modified one.
+
+        Sentence vectors are computed once each; the search for a
+        match is limited to a band around the sentence's relative
+        position, since humanization keeps sentence order (it only
+        merges/splits neighbours). Short texts are searched fully.
+        """
+        n, m = len(originals), len(modified)
+        if not n:
+            return []
+        if not m:
+            return [0.0] * n
+        vecs = {s: self.sentence_vector(s) for s in {*originals, *modified}}
+        half = max(_BAND_MIN, math.ceil(m * _BAND_FRAC))
+        bands = []
+        for i in range(n):
+            center = round(i * (m - 1) / max(n - 1, 1))
+            bands.append((max(0, center - half), min(m, center + half + 1)))
+
+        if _HAS_NUMPY:
+            sims = (
+                np.array([vecs[s] for s in originals])
+                @ np.array([vecs[s] for s in modified]).T
+            )
+            return [float(sims[i, lo:hi].max()) for i, (lo, hi) in enumerate(bands)]
+
+        mod_vecs = [vecs[s] for s in modified]
+        return [
+            max(
+                sum(map(operator.mul, vecs[s], mod_vecs[j]))
+                for j in range(lo, hi)
+            )
+            for s, (lo, hi) in zip(originals, bands)
+        ]
+
     def ai_vocabulary_score(self, text: str) -> float:
         """Score text for AI-characteristic vocabulary.
 
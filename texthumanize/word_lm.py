@@ -8,11 +8,16 @@ Major languages (EN, RU, DE, FR, ES) use expanded frequency
 data (EN: 10K+ unigrams, 237 bigrams) from compressed
 data module for better perplexity estimation.
 
+Probabilities are precomputed once per language (interned vocabulary,
+smoothed unigram and log-probability tables) and shared by every
+model instance; ``get_word_lm()`` returns a shared model per language.
+
 Usage:
     from texthumanize.word_lm import WordLanguageModel
 
     lm = WordLanguageModel(lang="en")
     pp = lm.perplexity("The quick brown fox jumps")
+    pps = lm.perplexities(["First sentence.", "Second one here."])
     score = lm.naturalness_score("Some text here")
 """
 
@@ -20,20 +25,13 @@ from __future__ import annotations
 
 import logging
 import math
+import os
 import re
+from array import array
+from functools import cached_property
 from typing import Any
 
-from texthumanize._word_freq_data import (
-    get_de_uni,
-    get_en_bi,
-    get_en_uni,
-    get_es_uni,
-    get_fr_uni,
-    get_ru_bi,
-    get_ru_uni,
-    get_uk_bi,
-    get_uk_uni,
-)
+from texthumanize.cache import memo_cache
 from texthumanize.sentence_split import split_sentences
 
 logger = logging.getLogger(__name__)
@@ -195,22 +193,48 @@ _TR_UNI: dict[str, float] = {
 }
 
 # ── Language model registry ───────────────────────────────
-# EN, RU, DE, FR, ES use expanded compressed data (10K+ EN, 379+ others).
+# EN, RU, UK, DE, FR, ES use expanded compressed data (10K+ EN, 379+
+# others) from ``_word_freq_data``. That module is ~120 KB of literals,
+# so it is imported, and each table decoded, on first use of the
+# language rather than at import time.
 # Remaining languages use compact inline dicts above.
-_UNIGRAMS: dict[str, dict[str, float]] = {
-    "en": get_en_uni(), "ru": get_ru_uni(), "uk": get_uk_uni(),
-    "de": get_de_uni(), "fr": get_fr_uni(), "es": get_es_uni(),
+_EXPANDED_UNI = {
+    "en": "get_en_uni", "ru": "get_ru_uni", "uk": "get_uk_uni",
+    "de": "get_de_uni", "fr": "get_fr_uni", "es": "get_es_uni",
+}
+_EXPANDED_BI = {"en": "get_en_bi", "ru": "get_ru_bi", "uk": "get_uk_bi"}
+
+_INLINE_UNI: dict[str, dict[str, float]] = {
     "it": _IT_UNI, "pl": _PL_UNI, "pt": _PT_UNI,
     "ar": _AR_UNI, "zh": _ZH_UNI, "ja": _JA_UNI,
     "ko": _KO_UNI, "tr": _TR_UNI,
 }
 
-_BIGRAMS: dict[str, dict[tuple[str, str], float]] = {
-    "en": get_en_bi(), "ru": get_ru_bi(), "uk": get_uk_bi(),
-}
+_LM_LANGUAGES = frozenset(_EXPANDED_UNI) | frozenset(_INLINE_UNI)
+
+
+def _unigrams(lang: str) -> dict[str, float]:
+    """Unigram table of a supported language."""
+    if lang in _EXPANDED_UNI:
+        from texthumanize import _word_freq_data
+        return getattr(_word_freq_data, _EXPANDED_UNI[lang])()
+    return _INLINE_UNI[lang]
+
+
+def _bigrams(lang: str) -> dict[tuple[str, str], float]:
+    """Bigram table of a language (empty when there is none)."""
+    if lang in _EXPANDED_BI:
+        from texthumanize import _word_freq_data
+        return getattr(_word_freq_data, _EXPANDED_BI[lang])()
+    return {}
+
 
 _LAMBDA = 0.4  # bigram interpolation weight
 _SMOOTH = 1e-8  # Laplace smoothing floor
+_P_FLOOR = 1e-20  # probability floor before log
+
+# Sentence perplexities, keyed by (lang, sentence)
+_SENT_PP_CACHE = memo_cache("word_lm.sentence_perplexity", max_entries=20_000)
 
 _TOK_RE = re.compile(r"[\w'']+", re.UNICODE)
 
@@ -218,6 +242,135 @@ def _tokenize(text: str) -> list[str]:
     """Lowercase word tokenization."""
     return [w.lower() for w in _TOK_RE.findall(text)]
 
+
+class _LMTables:
+    """Precomputed probabilities of one language, shared by all models.
+
+    Every word of the unigram and bigram tables is interned to an
+    integer ID; all unknown words share the last ID (``oov``). Arrays
+    indexed by ID hold the smoothed unigram probability and the
+    interpolation terms, and ``pair_logp`` holds the log-probability of
+    every known bigram (key ``id1 * size + id2``). Values are computed
+    with the same expressions as :meth:`WordLanguageModel._p_interp`,
+    so perplexities do not change.
+    """
+
+    def __init__(self, lang: str) -> None:
+        uni = _unigrams(lang)
+        bi = _bigrams(lang)
+        self.uni_total = sum(uni.values())
+        self.bi_total = sum(bi.values()) or 1.0
+        self.vocab_size = len(uni) + 1
+
+        words = list(uni)
+        ids = {w: i for i, w in enumerate(words)}
+        for w1, w2 in bi:
+            for w in (w1, w2):
+                if w not in ids:
+                    ids[w] = len(words)
+                    words.append(w)
+        self.ids = ids
+        self.oov = len(words)
+        self.size = len(words) + 1
+
+        uni_denom = self.uni_total + _SMOOTH * self.vocab_size
+        freqs = [uni.get(w, 0.0) for w in words] + [0.0]
+        self.p_uni = array("d", [(f + _SMOOTH) / uni_denom for f in freqs])
+        # P(w) share of the interpolation: (1 - λ) · P_uni(w)
+        self.uni_part = array("d", [(1 - _LAMBDA) * p for p in self.p_uni])
+
+        self.solo_logp: array | None = None
+        self.pair_logp: dict[int, float] = {}
+        if not bi:
+            # No bigrams: P_bi(w1, w2) falls back to P_uni(w2)
+            self.solo_logp = array("d", [
+                math.log(max(_LAMBDA * p + (1 - _LAMBDA) * p, _P_FLOOR))
+                for p in self.p_uni
+            ])
+            self.bi_floor = array("d")
+            return
+
+        # Bigram normaliser per previous word: freq(w1) + smoothing
+        w1_dens = [uni.get(w, _SMOOTH) + _SMOOTH * self.vocab_size for w in words]
+        w1_dens.append(_SMOOTH + _SMOOTH * self.vocab_size)
+        # λ · P_bi(w1, ·) of an unseen pair
+        self.bi_floor = array("d", [_LAMBDA * ((0.0 + _SMOOTH) / d) for d in w1_dens])
+        size = self.size
+        for (w1, w2), freq in bi.items():
+            i1, i2 = ids[w1], ids[w2]
+            p = _LAMBDA * ((freq + _SMOOTH) / w1_dens[i1]) + self.uni_part[i2]
+            self.pair_logp[i1 * size + i2] = math.log(max(p, _P_FLOOR))
+
+    def encode(self, tokens: list[str]) -> list[int]:
+        """Token IDs (unknown words → ``oov``)."""
+        get, oov = self.ids.get, self.oov
+        return [get(t, oov) for t in tokens]
+
+    def log_probs(self, ids: list[int]) -> list[float]:
+        """Interpolated log-probability of every token after the first."""
+        solo = self.solo_logp
+        if solo is not None:
+            return [solo[i] for i in ids[1:]]
+        pair_get = self.pair_logp.get
+        floor, uni_part, size, log = self.bi_floor, self.uni_part, self.size, math.log
+        out: list[float] = []
+        prev = ids[0]
+        for cur in ids[1:]:
+            lp = pair_get(prev * size + cur)
+            if lp is None:
+                lp = log(max(floor[prev] + uni_part[cur], _P_FLOOR))
+            out.append(lp)
+            prev = cur
+        return out
+
+    def perplexity(self, tokens: list[str]) -> float:
+        if len(tokens) < 2:
+            return 0.0
+        log_sum = 0.0
+        for lp in self.log_probs(self.encode(tokens)):
+            log_sum += lp
+        n = len(tokens) - 1
+        return math.exp(-log_sum / n)
+
+
+_tables: dict[str, _LMTables] = {}
+
+_SNAPSHOT_SOURCES = (
+    __file__,
+    os.path.join(os.path.dirname(__file__), "_word_freq_data.py"),
+)
+
+
+def _tables_for(lang: str) -> _LMTables:
+    tables = _tables.get(lang)
+    if tables is None:
+        from texthumanize.snapshot import cached
+
+        tables = _tables.setdefault(lang, cached(
+            f"word_lm-{lang}", lambda: _LMTables(lang), sources=_SNAPSHOT_SOURCES,
+        ))
+    return tables
+
+
+def _warm_tables() -> None:
+    """Build the tables of every language (snapshot prebuild)."""
+    for lang in sorted(_LM_LANGUAGES):
+        _tables_for(lang)
+
+
+def _variation(pps: list[float]) -> float:
+    """Coefficient of variation of sentence perplexities."""
+    if len(pps) < 2:
+        return 0.0
+    mean_pp = sum(pps) / len(pps)
+    if mean_pp == 0:
+        return 0.0
+    variance = sum(
+        (p - mean_pp) ** 2 for p in pps
+    ) / len(pps)
+    return math.sqrt(variance) / max(mean_pp, 1e-10)
+
+
 class WordLanguageModel:
     """Word-level unigram/bigram language model.
 
@@ -226,13 +379,22 @@ class WordLanguageModel:
     """
 
     def __init__(self, lang: str = "en") -> None:
-        self.lang = lang if lang in _UNIGRAMS else "en"
-        self._uni = _UNIGRAMS[self.lang]
-        self._bi = _BIGRAMS.get(self.lang, {})
+        self.lang = lang if lang in _LM_LANGUAGES else "en"
+        self._tables = _tables_for(self.lang)
         # total mass for normalization
-        self._uni_total = sum(self._uni.values())
-        self._bi_total = sum(self._bi.values()) or 1.0
-        self._vocab_size = len(self._uni) + 1
+        self._uni_total = self._tables.uni_total
+        self._bi_total = self._tables.bi_total
+        self._vocab_size = self._tables.vocab_size
+
+    # Raw frequency tables, only needed by the reference ``_p_*``
+    # methods; perplexity goes through ``_tables``.
+    @cached_property
+    def _uni(self) -> dict[str, float]:
+        return _unigrams(self.lang)
+
+    @cached_property
+    def _bi(self) -> dict[tuple[str, str], float]:
+        return _bigrams(self.lang)
 
     # ── Core probability ──────────────────────────────────
 
@@ -269,19 +431,17 @@ class WordLanguageModel:
         Lower values = more predictable (AI-like).
         Typical human: 50-200, AI: 20-60.
         """
-        tokens = _tokenize(text)
-        if len(tokens) < 2:
-            return 0.0
-        log_sum = 0.0
-        for i in range(1, len(tokens)):
-            p = self._p_interp(tokens[i - 1], tokens[i])
-            log_sum += math.log(max(p, 1e-20))
-        n = len(tokens) - 1
-        return math.exp(-log_sum / n) if n > 0 else 0.0
+        return self._tables.perplexity(_tokenize(text))
 
     def sentence_perplexity(self, sentence: str) -> float:
         """Perplexity for a single sentence."""
-        return self.perplexity(sentence)
+        return _SENT_PP_CACHE.get_or_compute(
+            (self.lang, sentence), lambda: self.perplexity(sentence),
+        )
+
+    def perplexities(self, sentences: list[str]) -> list[float]:
+        """Perplexity of each sentence (repeated sentences scored once)."""
+        return [self.sentence_perplexity(s) for s in sentences]
 
     def per_word_surprise(
         self, text: str,
@@ -295,7 +455,7 @@ class WordLanguageModel:
         ]
         for i in range(1, len(tokens)):
             p = self._p_interp(tokens[i - 1], tokens[i])
-            bits = -math.log2(max(p, 1e-20))
+            bits = -math.log2(max(p, _P_FLOOR))
             result.append((tokens[i], bits))
         return result
 
@@ -306,19 +466,17 @@ class WordLanguageModel:
 
         Higher = more human-like variation.
         """
-        sents = split_sentences(text.strip())
-        sents = [s for s in sents if len(s.split()) >= 3]
+        sents = self._scored_sentences(text)
         if len(sents) < 2:
             return 0.0
-        pps = [self.sentence_perplexity(s) for s in sents]
-        mean_pp = sum(pps) / len(pps)
-        if mean_pp == 0:
-            return 0.0
-        variance = sum(
-            (p - mean_pp) ** 2 for p in pps
-        ) / len(pps)
         # Coefficient of variation
-        return math.sqrt(variance) / max(mean_pp, 1e-10)
+        return _variation(self.perplexities(sents))
+
+    @staticmethod
+    def _scored_sentences(text: str) -> list[str]:
+        """Sentences long enough for a perplexity estimate."""
+        sents = split_sentences(text.strip())
+        return [s for s in sents if len(s.split()) >= 3]
 
     # ── Naturalness score ─────────────────────────────────
 
@@ -339,16 +497,13 @@ class WordLanguageModel:
                 "verdict": "unknown",
             }
 
-        pp = self.perplexity(text)
-        burst = self.burstiness(text)
+        pp = self._tables.perplexity(tokens)
 
-        # Sentence perplexities for variance
-        sents = split_sentences(text.strip())
-        sents = [s for s in sents if len(s.split()) >= 3]
+        # Sentence perplexities (burstiness, variance, low-PP windows)
+        sents = self._scored_sentences(text)
+        pps = self.perplexities(sents)
+        burst = _variation(pps)
         if len(sents) >= 2:
-            pps = [
-                self.sentence_perplexity(s) for s in sents
-            ]
             mean_pp = sum(pps) / len(pps)
             var = sum(
                 (p - mean_pp) ** 2 for p in pps
@@ -386,14 +541,10 @@ class WordLanguageModel:
 
         # No extremely low PP windows: +15
         if sents and len(sents) >= 2:
-            pps_list = [
-                self.sentence_perplexity(s)
-                for s in sents
-            ]
             low_count = sum(
-                1 for p in pps_list if p < 15
+                1 for p in pps if p < 15
             )
-            ratio = low_count / len(pps_list)
+            ratio = low_count / len(pps)
             if ratio < 0.1:
                 score += 15
             elif ratio < 0.3:
@@ -418,18 +569,30 @@ class WordLanguageModel:
             "verdict": verdict,
         }
 
+# ── Shared models ─────────────────────────────────────────
+
+_models: dict[str, WordLanguageModel] = {}
+
+
+def get_word_lm(lang: str) -> WordLanguageModel:
+    """Shared model instance for a language."""
+    model = _models.get(lang)
+    if model is None:
+        model = _models.setdefault(lang, WordLanguageModel(lang=lang))
+    return model
+
 # ── Convenience functions ─────────────────────────────────
 
 def word_perplexity(
     text: str, lang: str = "en",
 ) -> float:
     """Compute word-level perplexity."""
-    return WordLanguageModel(lang=lang).perplexity(text)
+    return get_word_lm(lang).perplexity(text)
 
 def word_naturalness(
     text: str, lang: str = "en",
 ) -> dict[str, Any]:
     """Full naturalness analysis."""
-    return WordLanguageModel(lang=lang).naturalness_score(
+    return get_word_lm(lang).naturalness_score(
         text,
     )